@@ -0,0 +1,5 @@
+"""
+Performance benchmarks for the NexDex Python SDK.
+
+Run with `python -m benchmarks` (or `make bench`); see `benchmarks/README.md`.
+"""
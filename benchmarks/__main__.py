@@ -0,0 +1,82 @@
+"""
+Run the benchmark suite.
+
+    python -m benchmarks                          # all benchmarks, table on stdout
+    python -m benchmarks -k signing -o out.json   # filter by substring, write JSON report
+    python -m benchmarks --compare baseline.json  # fail if any median regressed > 10%
+"""
+
+import argparse
+import json
+import sys
+
+from benchmarks import (  # noqa: F401
+    bench_http,
+    bench_import,
+    bench_keystore,
+    bench_messages,
+    bench_signing,
+    bench_ws_dispatch,
+)
+from benchmarks.harness import BENCHMARKS, build_report, compare_reports, format_duration, run_benchmark
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="NexDex SDK benchmarks")
+    parser.add_argument("-k", "--filter", action="append", default=[], help="Only run benchmarks containing text")
+    parser.add_argument("-o", "--output", help="Write the JSON report to this file ('-' for stdout)")
+    parser.add_argument("--rounds", type=int, default=5, help="Timed rounds per benchmark (default: 5)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="Minimum seconds per round (default: 0.2)")
+    parser.add_argument("--compare", help="Baseline JSON report to compare medians against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.10,
+        help="Allowed slowdown vs --compare baseline as a fraction (default: 0.10)",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    selected = [b for name, b in BENCHMARKS.items() if not args.filter or any(f in name for f in args.filter)]
+
+    if args.list:
+        for bench in selected:
+            print(bench.name)
+        return 0
+
+    # Human-readable progress goes to stderr so `-o -` stays machine-readable
+    results = []
+    for bench in selected:
+        result = run_benchmark(bench, rounds=args.rounds, min_time=args.min_time)
+        row = result.to_dict()
+        print(
+            f"{bench.name:<45} median {format_duration(row['median']):>10}  {row['ops_per_sec']:>12,.0f} ops/s",
+            file=sys.stderr,
+        )
+        results.append(result)
+
+    report = build_report(results)
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    elif args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare_reports(baseline, report, args.max_regression)
+        for row in rows:
+            flag = "REGRESSED" if row["regressed"] else ""
+            print(f"{row['name']:<45} {row['change']:>+8.1%} {flag}", file=sys.stderr)
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""`HttpClient.request` overhead against an in-memory `httpx.MockTransport`."""
+
+import httpx
+
+from benchmarks import fixtures
+from benchmarks.harness import benchmark
+from nexdex_py.api.http_client import HttpClient, HttpMethod
+
+API_URL = "https://bench.nexdex.local/v1"
+RESPONSE_BODY = {"results": [{"market": "BTC-USD-PERP", "bid": "65000.4", "ask": "65000.5"}]}
+
+
+def _transport() -> httpx.MockTransport:
+    return httpx.MockTransport(lambda request: httpx.Response(200, json=RESPONSE_BODY))
+
+
+@benchmark("http")
+def httpx_get_baseline():
+    """Raw httpx cost, to separate SDK overhead from transport overhead."""
+    client = httpx.Client(transport=_transport())
+    return lambda: client.get(f"{API_URL}/bbo/BTC-USD-PERP").json()
+
+
+@benchmark("http")
+def request_get():
+    client = HttpClient(http_client=httpx.Client(transport=_transport()))
+    return lambda: client.request(f"{API_URL}/bbo/BTC-USD-PERP", HttpMethod.GET, headers=client.client.headers)
+
+
+@benchmark("http")
+def request_post_order():
+    client = HttpClient(http_client=httpx.Client(transport=_transport()))
+    client.client.headers["Authorization"] = "Bearer bench"
+    payload = fixtures.limit_order().dump_to_dict()
+    return lambda: client.request(f"{API_URL}/orders", HttpMethod.POST, payload=payload, headers=client.client.headers)
@@ -0,0 +1,28 @@
+"""Cold import time of the SDK, measured in a fresh interpreter per round."""
+
+import subprocess
+import sys
+
+from benchmarks.harness import benchmark
+
+_IMPORT_SNIPPET = "import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+
+
+def _make_import(module: str):
+    def setup():
+        def run() -> float:
+            out = subprocess.run(  # noqa: S603
+                [sys.executable, "-c", _IMPORT_SNIPPET.format(module=module)],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            return float(out.stdout.strip())
+
+        return run
+
+    return setup
+
+
+for _module in ("nexdex_py", "nexdex_py.api.ws_client", "nexdex_py.account.account"):
+    benchmark("import", name=f"import.{_module}", self_timed=True)(_make_import(_module))
@@ -0,0 +1,36 @@
+"""Account creation from an L1 key, with and without a cached L2 key."""
+
+import atexit
+import shutil
+import tempfile
+
+from benchmarks import fixtures
+from benchmarks.harness import benchmark
+from nexdex_py.account.account import NexDexAccount
+from nexdex_py.account.keystore import L2KeyStore
+
+# Throwaway key used only to exercise the derivation
+L1_PRIVATE_KEY = "0xf8e4d1d772cdd44e5e77615ad11cc071c94e4c06dc21150d903f28e6aa6abdff"
+
+
+def _account(keystore: L2KeyStore | None = None) -> NexDexAccount:
+    return NexDexAccount(
+        config=fixtures.system_config(),
+        l1_address=fixtures.L1_ADDRESS,
+        l1_private_key=L1_PRIVATE_KEY,
+        keystore=keystore,
+    )
+
+
+@benchmark("keystore")
+def account_from_l1_key():
+    return _account
+
+
+@benchmark("keystore")
+def account_from_l1_key_cached():
+    path = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, path, ignore_errors=True)
+    keystore = L2KeyStore(password="benchmark", path=path)  # noqa: S106
+    _account(keystore)
+    return lambda: _account(keystore)
@@ -0,0 +1,54 @@
+"""Typed data message construction and hashing."""
+
+from starknet_py.common import int_from_bytes
+
+from benchmarks import fixtures
+from benchmarks.harness import benchmark
+from nexdex_py.account.utils import typed_data_to_message_hash
+from nexdex_py.message.auth import build_auth_message
+from nexdex_py.message.block_trades import build_block_trade_message
+from nexdex_py.message.order import build_modify_order_message, build_order_message
+
+CHAIN_ID = int_from_bytes(b"PRIVATE_SN_POTC_SEPOLIA")
+ADDRESS = 0x129C135ED63DF9353885E292BE4426B8ED6122B13C6C0E1BB787288A1F5ADFA
+
+
+@benchmark("messages")
+def build_order():
+    order = fixtures.limit_order()
+    return lambda: build_order_message(CHAIN_ID, order)
+
+
+@benchmark("messages")
+def build_modify_order():
+    order = fixtures.limit_order(order_id="1700000000000201709104000000")
+    return lambda: build_modify_order_message(CHAIN_ID, order)
+
+
+@benchmark("messages")
+def build_block_trade_10():
+    block_trade = fixtures.block_trade(10)
+    return lambda: build_block_trade_message(CHAIN_ID, block_trade)
+
+
+@benchmark("messages")
+def build_auth():
+    return lambda: build_auth_message(CHAIN_ID, 1_700_000_000, 1_700_086_400)
+
+
+@benchmark("messages")
+def hash_order():
+    message = build_order_message(CHAIN_ID, fixtures.limit_order())
+    return lambda: typed_data_to_message_hash(message, ADDRESS)
+
+
+@benchmark("messages")
+def hash_block_trade_1():
+    message = build_block_trade_message(CHAIN_ID, fixtures.block_trade(1))
+    return lambda: typed_data_to_message_hash(message, ADDRESS)
+
+
+@benchmark("messages")
+def hash_block_trade_10():
+    message = build_block_trade_message(CHAIN_ID, fixtures.block_trade(10))
+    return lambda: typed_data_to_message_hash(message, ADDRESS)
@@ -0,0 +1,32 @@
+"""Order and block trade signing throughput."""
+
+from benchmarks import fixtures
+from benchmarks.harness import benchmark
+
+
+@benchmark("signing")
+def sign_order():
+    account = fixtures.account()
+    order = fixtures.limit_order()
+    return lambda: account.sign_order(order)
+
+
+@benchmark("signing")
+def sign_modify_order():
+    account = fixtures.account()
+    order = fixtures.limit_order(order_id="1700000000000201709104000000")
+    return lambda: account.sign_order(order)
+
+
+@benchmark("signing")
+def sign_block_trade_1():
+    account = fixtures.account()
+    block_trade = fixtures.block_trade(1)
+    return lambda: account.sign_block_trade(block_trade)
+
+
+@benchmark("signing")
+def sign_block_trade_10():
+    account = fixtures.account()
+    block_trade = fixtures.block_trade(10)
+    return lambda: account.sign_block_trade(block_trade)
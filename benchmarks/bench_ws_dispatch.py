@@ -0,0 +1,29 @@
+"""`NexDexWebsocketClient._process_message` dispatch rate per channel type."""
+
+import logging
+
+from benchmarks import fixtures
+from benchmarks.harness import benchmark
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+
+
+def _make_dispatch(channel_name: str):
+    def setup():
+        logger = logging.getLogger("benchmarks.ws_dispatch")
+        logger.setLevel(logging.WARNING)
+        client = NexDexWebsocketClient(env="testnet", logger=logger, auto_start_reader=False)
+
+        async def on_message(ws_channel, message):
+            pass
+
+        client.callbacks[channel_name] = on_message
+        raw = fixtures.WS_MESSAGES[channel_name]
+        return lambda: client._process_message(raw)
+
+    return setup
+
+
+for _channel_name in fixtures.WS_MESSAGES:
+    benchmark("ws_dispatch", name=f"ws_dispatch.{_channel_name.split('.')[0]}", is_async=True)(
+        _make_dispatch(_channel_name)
+    )
@@ -0,0 +1,190 @@
+"""Shared, network-free inputs for the benchmarks."""
+
+import json
+from decimal import Decimal
+
+from nexdex_py.account.account import NexDexAccount
+from nexdex_py.api.models import SystemConfig, SystemConfigSchema
+from nexdex_py.common.order import Order, OrderSide, OrderType
+from nexdex_py.message.block_trades import BlockTrade, Trade
+from nexdex_py.simulator import DEFAULT_SYSTEM_CONFIG
+
+# Throwaway key used only to produce signatures of realistic cost
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+L2_PRIVATE_KEY = "0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815"
+SIGNATURE_TIMESTAMP = 1_700_000_000_000
+
+
+def system_config() -> SystemConfig:
+    return SystemConfigSchema().load(DEFAULT_SYSTEM_CONFIG)
+
+
+def account() -> NexDexAccount:
+    return NexDexAccount(config=system_config(), l1_address=L1_ADDRESS, l2_private_key=L2_PRIVATE_KEY)
+
+
+def limit_order(order_id: str | None = None) -> Order:
+    return Order(
+        market="BTC-USD-PERP",
+        order_type=OrderType.Limit,
+        order_side=OrderSide.Buy,
+        size=Decimal("0.125"),
+        limit_price=Decimal("65000.5"),
+        signature_timestamp=SIGNATURE_TIMESTAMP,
+        order_id=order_id,
+    )
+
+
+def block_trade(num_trades: int) -> BlockTrade:
+    trades = []
+    for i in range(num_trades):
+        maker = Order(
+            market="ETH-USD-PERP",
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Buy,
+            size=Decimal("1.5"),
+            limit_price=Decimal(3000 + i),
+            signature_timestamp=SIGNATURE_TIMESTAMP + i,
+        )
+        taker = Order(
+            market="ETH-USD-PERP",
+            order_type=OrderType.Limit,
+            order_side=OrderSide.Sell,
+            size=Decimal("1.5"),
+            limit_price=Decimal(3000 + i),
+            signature_timestamp=SIGNATURE_TIMESTAMP + i,
+        )
+        trades.append(Trade(price=Decimal(3000 + i), size=Decimal("1.5"), maker_order=maker, taker_order=taker))
+    return BlockTrade(version="1.0", trades=trades)
+
+
+def _subscription(channel: str, data: dict) -> str:
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+_ORDER = {
+    "id": "1700000000000201709104000000",
+    "account": "0x129c135ed63df9353885e292be4426b8ed6122b13c6c0e1bb787288a1f5adfa",
+    "market": "BTC-USD-PERP",
+    "side": "BUY",
+    "type": "LIMIT",
+    "size": "0.125",
+    "remaining_size": "0.125",
+    "price": "65000.5",
+    "status": "OPEN",
+    "created_at": 1700000000000,
+    "last_updated_at": 1700000000000,
+    "timestamp": 1700000000000,
+    "cancel_reason": "",
+    "client_id": "",
+    "instruction": "GTC",
+    "avg_fill_price": "",
+    "stp": "EXPIRE_TAKER",
+    "flags": [],
+}
+
+# Representative raw frames for each channel type, keyed by subscribed channel name
+WS_MESSAGES: dict[str, str] = {
+    "bbo.BTC-USD-PERP": _subscription(
+        "bbo.BTC-USD-PERP",
+        {
+            "market": "BTC-USD-PERP",
+            "bid": "65000.4",
+            "bid_size": "1.25",
+            "ask": "65000.5",
+            "ask_size": "0.8",
+            "last_updated_at": 1700000000000,
+        },
+    ),
+    "order_book.BTC-USD-PERP.snapshot@15@50ms@0.1": _subscription(
+        "order_book.BTC-USD-PERP.snapshot@15@50ms@0.1",
+        {
+            "seq_no": 1,
+            "market": "BTC-USD-PERP",
+            "last_updated_at": 1700000000000,
+            "update_type": "s",
+            "inserts": [
+                {"side": side, "price": str(65000 + (i if side == "SELL" else -i)), "size": "0.5"}
+                for side in ("BUY", "SELL")
+                for i in range(1, 16)
+            ],
+            "updates": [],
+            "deletes": [],
+        },
+    ),
+    "trades.BTC-USD-PERP": _subscription(
+        "trades.BTC-USD-PERP",
+        {
+            "id": "1700000000000201709104000001",
+            "market": "BTC-USD-PERP",
+            "side": "BUY",
+            "size": "0.01",
+            "price": "65000.5",
+            "created_at": 1700000000000,
+            "trade_type": "FILL",
+        },
+    ),
+    "fills.BTC-USD-PERP": _subscription(
+        "fills.BTC-USD-PERP",
+        {
+            "id": "1700000000000201709104000002",
+            "order_id": _ORDER["id"],
+            "account": _ORDER["account"],
+            "market": "BTC-USD-PERP",
+            "side": "BUY",
+            "size": "0.125",
+            "price": "65000.5",
+            "fee": "0.406",
+            "fee_currency": "USDC",
+            "liquidity": "MAKER",
+            "fill_type": "FILL",
+            "created_at": 1700000000000,
+        },
+    ),
+    "orders.BTC-USD-PERP": _subscription("orders.BTC-USD-PERP", _ORDER),
+    "positions": _subscription(
+        "positions",
+        {
+            "id": "1",
+            "account": _ORDER["account"],
+            "market": "BTC-USD-PERP",
+            "status": "OPEN",
+            "side": "LONG",
+            "size": "0.125",
+            "average_entry_price": "65000.5",
+            "unrealized_pnl": "0",
+            "realized_positional_pnl": "0",
+            "cost": "8125.06",
+            "last_updated_at": 1700000000000,
+        },
+    ),
+    "markets_summary.ALL": _subscription(
+        "markets_summary.ALL",
+        {
+            "symbol": "BTC-USD-PERP",
+            "mark_price": "65000.45",
+            "last_traded_price": "65000.5",
+            "bid": "65000.4",
+            "ask": "65000.5",
+            "volume_24h": "123456.7",
+            "open_interest": "1234.5",
+            "funding_rate": "0.0001",
+            "created_at": 1700000000000,
+        },
+    ),
+    "account": _subscription(
+        "account",
+        {
+            "account": _ORDER["account"],
+            "account_value": "100000",
+            "free_collateral": "90000",
+            "initial_margin_requirement": "10000",
+            "maintenance_margin_requirement": "5000",
+            "margin_cushion": "95000",
+            "settlement_asset": "USDC",
+            "status": "ACTIVE",
+            "total_collateral": "100000",
+            "updated_at": 1700000000000,
+        },
+    ),
+}
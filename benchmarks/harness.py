@@ -0,0 +1,218 @@
+"""
+Minimal benchmark harness.
+
+Benchmarks register a *setup* function with `@benchmark(group)`. The setup runs
+once, outside of the timed region, and returns the zero-argument callable (or
+coroutine function) to time. Each benchmark is calibrated so one round lasts
+at least `min_time` seconds, then timed for `rounds` rounds.
+"""
+
+import asyncio
+import importlib.metadata
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
+
+SCHEMA_VERSION = 1
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    setup: Callable[[], Callable[[], Any]]
+    is_async: bool = False
+    # Self-timed benchmarks return their own elapsed seconds per call (e.g. subprocess import time)
+    self_timed: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    rounds: int
+    iterations: int
+    # Seconds per operation, one entry per round
+    samples: list[float] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        mean = statistics.fmean(self.samples)
+        return {
+            "name": self.name,
+            "group": self.group,
+            "rounds": self.rounds,
+            "iterations": self.iterations,
+            "unit": "s",
+            "min": min(self.samples),
+            "max": max(self.samples),
+            "mean": mean,
+            "median": statistics.median(self.samples),
+            "stdev": statistics.stdev(self.samples) if len(self.samples) > 1 else 0.0,
+            "ops_per_sec": 1 / mean if mean > 0 else None,
+        }
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(group: str, name: str | None = None, is_async: bool = False, self_timed: bool = False):
+    """Register a benchmark setup function.
+
+    Args:
+        group (str): Benchmark group, e.g. "signing"
+        name (str, optional): Benchmark name. Defaults to "<group>.<function name>".
+        is_async (bool, optional): Setup returns a coroutine function. Defaults to False.
+        self_timed (bool, optional): Callable returns its own elapsed seconds. Defaults to False.
+    """
+
+    def decorator(setup: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        bench_name = name or f"{group}.{setup.__name__}"
+        if bench_name in BENCHMARKS:
+            raise ValueError(f"Duplicate benchmark name: {bench_name}")
+        BENCHMARKS[bench_name] = Benchmark(bench_name, group, setup, is_async, self_timed)
+        return setup
+
+    return decorator
+
+
+def _time_sync(fn: Callable[[], Any], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return time.perf_counter() - start
+
+
+def _time_async(loop: asyncio.AbstractEventLoop, fn: Callable[[], Any], iterations: int) -> float:
+    async def run() -> float:
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await fn()
+        return time.perf_counter() - start
+
+    return loop.run_until_complete(run())
+
+
+def run_benchmark(bench: Benchmark, rounds: int = 5, min_time: float = 0.2) -> BenchmarkResult:
+    """Run a single benchmark.
+
+    Args:
+        bench (Benchmark): Registered benchmark
+        rounds (int, optional): Number of timed rounds. Defaults to 5.
+        min_time (float, optional): Minimum duration of one round in seconds. Defaults to 0.2.
+
+    Returns:
+        BenchmarkResult: Per-operation timings of every round
+    """
+    fn = bench.setup()
+
+    if bench.self_timed:
+        samples = [fn() for _ in range(rounds)]
+        return BenchmarkResult(bench.name, bench.group, rounds, 1, samples)
+
+    loop = asyncio.new_event_loop() if bench.is_async else None
+    try:
+
+        def timer(iterations: int) -> float:
+            if loop is not None:
+                return _time_async(loop, fn, iterations)
+            return _time_sync(fn, iterations)
+
+        # Warm up caches, then calibrate iterations per round (timeit.autorange style)
+        timer(1)
+        iterations = 1
+        while True:
+            elapsed = timer(iterations)
+            if elapsed >= min_time:
+                break
+            iterations = max(iterations * 2, int(iterations * min_time / max(elapsed, 1e-9) * 1.1))
+
+        samples = [timer(iterations) / iterations for _ in range(rounds)]
+    finally:
+        if loop is not None:
+            loop.close()
+    return BenchmarkResult(bench.name, bench.group, rounds, iterations, samples)
+
+
+def _git_commit() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            timeout=5,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment_info() -> dict[str, Any]:
+    """Describe the interpreter, machine and SDK version the results were produced with."""
+    try:
+        sdk_version: str | None = importlib.metadata.version("NexDex_py")
+    except importlib.metadata.PackageNotFoundError:
+        sdk_version = None
+    return {
+        "nexdex_py": sdk_version,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "executable": sys.executable,
+    }
+
+
+def build_report(results: list[BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "environment": environment_info(),
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def compare_reports(baseline: dict[str, Any], current: dict[str, Any], max_regression: float) -> list[dict[str, Any]]:
+    """Compare median timings of two reports.
+
+    Args:
+        baseline (dict): Report produced by an earlier run
+        current (dict): Report of the current run
+        max_regression (float): Allowed slowdown as a fraction (0.1 = 10% slower)
+
+    Returns:
+        list[dict]: One row per benchmark present in both reports with
+            `name`, `baseline`, `current`, `change` and `regressed`
+    """
+    baseline_by_name = {row["name"]: row for row in baseline.get("results", [])}
+    rows = []
+    for row in current.get("results", []):
+        before = baseline_by_name.get(row["name"])
+        if before is None or not before["median"]:
+            continue
+        change = row["median"] / before["median"] - 1
+        rows.append(
+            {
+                "name": row["name"],
+                "baseline": before["median"],
+                "current": row["median"],
+                "change": change,
+                "regressed": change > max_regression,
+            }
+        )
+    return rows
+
+
+def format_duration(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.0f} ns"
@@ -1,2 +1,3 @@
 from .nexdex import *  # noqa: F403
+from .nexdex_pool import *  # noqa: F403
 from .nexdex_subkey import *  # noqa: F403
@@ -1,6 +1,6 @@
-from .account import NexDexAccount
+from .account import BatchTransferError, L2TransferChunk, NexDexAccount
 from .subkey_account import SubkeyAccount
 
-__all__ = ["NexDexAccount", "SubkeyAccount"]
+__all__ = ["BatchTransferError", "L2TransferChunk", "NexDexAccount", "SubkeyAccount"]
 
  
@@ -1,18 +1,22 @@
+import asyncio
 import json
 import logging
 import time
 import types
+from collections import OrderedDict
 from decimal import Decimal
 from enum import IntEnum
+from typing import TYPE_CHECKING, NamedTuple
  
 from httpx import AsyncClient
 from starknet_py.common import int_from_bytes, int_from_hex
-from starknet_py.hash.address import compute_address
-from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_models import ResourceBoundsMapping
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.http_client import HttpMethod
 from starknet_py.net.signer.stark_curve_signer import KeyPair
 
+from nexdex_py.account.contract_cache import ContractAbiCache
+from nexdex_py.account.keystore import DerivedL2Key, L2KeyStore, compute_account_address
 from nexdex_py.account.starknet import Account as StarknetAccount
 from nexdex_py.account.utils import derive_stark_key, derive_stark_key_from_ledger, flatten_signature
 from nexdex_py.api.models import SystemConfig
@@ -24,7 +28,13 @@ from nexdex_py.message.order import build_modify_order_message, build_order_mess
 from nexdex_py.message.stark_key import build_stark_key_message
 from nexdex_py.utils import raise_value_error
 
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
 FULLNODE_SIGNATURE_VERSION = "1.0.0"
+# Signed fullnode headers are reused for an identical payload for this many seconds
+FULLNODE_SIGNATURE_REUSE_SECONDS = 10
+FULLNODE_SIGNATURE_CACHE_SIZE = 256
 
 
 # For matching existing chainId type
@@ -34,6 +44,48 @@ class CustomStarknetChainId(IntEnum):
     PRIVATE_SN_TESTNET_SEPOLIA = int_from_bytes(b"PRIVATE_SN_POTC_SEPOLIA")
 
 
+class L2TransferChunk(NamedTuple):
+    """One transaction of a batched L2 transfer.
+
+    Attributes:
+        start (int): Index of the first transfer of the transaction
+        stop (int): Index after the last transfer of the transaction
+        tx_hash (int | None): Hash of the transaction, None if it was not sent
+        error (BaseException | None): Why sending or acceptance failed, None if accepted
+    """
+
+    start: int
+    stop: int
+    tx_hash: int | None
+    error: BaseException | None = None
+
+
+class BatchTransferError(ValueError):
+    """A batched L2 transfer failed part way; `chunks` tells which transfers went out.
+
+    Attributes:
+        chunks (list[L2TransferChunk]): Every transaction of the batch, in nonce order
+    """
+
+    def __init__(self, chunks: list[L2TransferChunk]):
+        self.chunks = chunks
+        failed = next(chunk for chunk in chunks if chunk.error is not None)
+        super().__init__(
+            f"NexDex: Batch transfer failed at transfers [{failed.start}, {failed.stop}): {failed.error!r}; "
+            f"{len(self.accepted)}/{len(chunks)} transactions accepted"
+        )
+
+    @property
+    def sent(self) -> list[L2TransferChunk]:
+        """Transactions that were broadcast, accepted or not."""
+        return [chunk for chunk in self.chunks if chunk.tx_hash is not None]
+
+    @property
+    def accepted(self) -> list[L2TransferChunk]:
+        """Transactions accepted on chain; retrying must skip their transfers."""
+        return [chunk for chunk in self.chunks if chunk.tx_hash is not None and chunk.error is None]
+
+
 class NexDexAccount:
     """Class to generate and manage NexDex account.
         Initialized along with `NexDex` class.
@@ -44,6 +96,13 @@ class NexDexAccount:
         l1_private_key (Optional[str], optional): Ethereum private key. Defaults to None.
         l2_private_key (Optional[str], optional): NexDex private key. Defaults to None.
         rpc_version (Optional[str], optional): RPC version (e.g., "v0_9"). If provided, constructs URL as {base_url}/rpc/{rpc_version}. Defaults to None.
+        fullnode_session (Optional[aiohttp.ClientSession], optional): Session reused for fullnode RPC requests,
+            e.g. shared by every account of a `NexDexAccountPool`. The caller closes it. Defaults to None
+            (starknet.py opens a session per request).
+        keystore (Optional[L2KeyStore], optional): Encrypted cache of the L2 key derived from the L1 key or
+            Ledger, skipping the derivation when a verified entry exists. Defaults to None.
+        contract_cache (Optional[ContractAbiCache], optional): Cache of resolved contract ABIs used by on-chain
+            operations such as `transfer_on_l2`. Defaults to None.
 
     Examples:
         >>> from nexdex_py import NexDex
@@ -62,8 +121,14 @@ class NexDexAccount:
         l1_private_key: str | None = None,
         l2_private_key: str | None = None,
         rpc_version: str | None = None,
+        fullnode_session: "ClientSession | None" = None,
+        keystore: L2KeyStore | None = None,
+        contract_cache: ContractAbiCache | None = None,
     ):
         self.config = config
+        self._next_nonce: int | None = None
+        self._nonce_lock = asyncio.Lock()
+        self._fullnode_headers_cache: OrderedDict[tuple[int, int, str], dict[str, str]] = OrderedDict()
 
         if l1_address is None:
             return raise_value_error("NexDex: Provide Ethereum address")
@@ -71,37 +136,59 @@ class NexDexAccount:
 
         if l1_private_key is not None:
             self.l1_private_key = int_from_hex(l1_private_key)
-            stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
-            self.l2_private_key = derive_stark_key(self.l1_private_key, stark_key_msg)
-        elif l1_private_key_from_ledger:
-            stark_key_msg = build_stark_key_message(int(config.l1_chain_id))
-            self.l2_private_key = derive_stark_key_from_ledger(l1_address, stark_key_msg)
+        if l1_private_key is not None or l1_private_key_from_ledger:
+            # The keystore only caches keys that are expensive to derive (from L1 key or Ledger)
+            key_pair = self._derive_l2_key(l1_private_key is not None, keystore)
         elif l2_private_key is not None:
             self.l2_private_key = int_from_hex(l2_private_key)
+            key_pair = KeyPair.from_private_key(self.l2_private_key)
+            self.l2_public_key = key_pair.public_key
+            self.l2_address = self._account_address()
         else:
             return raise_value_error("NexDex: Provide Ethereum or NexDex private key")
 
-        key_pair = KeyPair.from_private_key(self.l2_private_key)
-        self.l2_public_key = key_pair.public_key
-        self.l2_address = self._account_address()
-
         # Create starknet account
         if rpc_version:
             node_url = f"{config.starknet_fullnode_rpc_base_url}/rpc/{rpc_version}"
         else:
             node_url = config.starknet_fullnode_rpc_url
-        client = FullNodeClient(node_url=node_url)
+        client = FullNodeClient(node_url=node_url, session=fullnode_session)
         self.l2_chain_id = int_from_bytes(config.starknet_chain_id.encode())
         self.starknet = StarknetAccount(
             client=client,
             address=self.l2_address,
             key_pair=key_pair,
             chain=CustomStarknetChainId(self.l2_chain_id),  # type: ignore[arg-type]
+            contract_cache=contract_cache,
         )
 
         # Apply the fullnode headers patch
         self._apply_fullnode_headers_patch(client)
 
+    def _derive_l2_key(self, from_l1_private_key: bool, keystore: L2KeyStore | None) -> KeyPair:
+        """Set the L2 key and address derived from the L1 key or Ledger, from `keystore` when cached there."""
+        l1_private_key = self.l1_private_key if from_l1_private_key else None
+        cached = keystore.load(self.config, self.l1_address, l1_private_key) if keystore is not None else None
+        if cached is not None:
+            self.l2_private_key = cached.l2_private_key
+            self.l2_public_key = cached.l2_public_key
+            self.l2_address = cached.l2_address
+            # Authenticated by the keystore: the public key is not recomputed
+            return KeyPair(private_key=cached.l2_private_key, public_key=cached.l2_public_key)
+
+        stark_key_msg = build_stark_key_message(int(self.config.l1_chain_id))
+        if l1_private_key is not None:
+            self.l2_private_key = derive_stark_key(l1_private_key, stark_key_msg)
+        else:
+            self.l2_private_key = derive_stark_key_from_ledger(self.l1_address, stark_key_msg)
+        key_pair = KeyPair.from_private_key(self.l2_private_key)
+        self.l2_public_key = key_pair.public_key
+        self.l2_address = self._account_address()
+        if keystore is not None:
+            key = DerivedL2Key(self.l2_private_key, self.l2_public_key, self.l2_address)
+            keystore.save(self.config, self.l1_address, key, l1_private_key)
+        return key_pair
+
     # Monkey patch of _make_request method of starknet.py client
     # to inject http headers requested by NexDex full node:
     # - NexDex-STARKNET-ACCOUNT: account address signing the request
@@ -134,20 +221,7 @@ class NexDexAccount:
         client._client._make_request = types.MethodType(monkey_patched_make_request, client._client)
 
     def _account_address(self) -> int:
-        calldata = [
-            int_from_hex(self.config.paraclear_account_hash),
-            get_selector_from_name("initialize"),
-            2,
-            self.l2_public_key,
-            0,
-        ]
-
-        address = compute_address(
-            class_hash=int_from_hex(self.config.paraclear_account_proxy_hash),
-            constructor_calldata=calldata,
-            salt=self.l2_public_key,
-        )
-        return address
+        return compute_account_address(self.config, self.l2_public_key)
 
     def set_jwt_token(self, jwt_token: str) -> None:
         self.jwt_token = jwt_token
@@ -182,23 +256,41 @@ class NexDexAccount:
         }
 
     def fullnode_request_headers(self, account: StarknetAccount, chain_id: int, json_payload: str):
-        signature_timestamp = int(time.time())
+        """Headers authenticating a fullnode RPC request.
+
+        Signatures are reused for an identical payload within
+        `FULLNODE_SIGNATURE_REUSE_SECONDS` of their timestamp, so repeated read-only
+        calls skip the Poseidon payload hash and the signature.
+        """
+        cache_key = (account.address, chain_id, json_payload)
+        now = int(time.time())
+        cached = self._fullnode_headers_cache.get(cache_key)
+        if cached is not None:
+            if now - int(cached["NexDex-STARKNET-SIGNATURE-TIMESTAMP"]) < FULLNODE_SIGNATURE_REUSE_SECONDS:
+                self._fullnode_headers_cache.move_to_end(cache_key)
+                return dict(cached)
+            del self._fullnode_headers_cache[cache_key]
+
         account_address = hex(account.address)
         message = build_fullnode_message(
             chain_id,
             account_address,
             json_payload,
-            signature_timestamp,
+            now,
             FULLNODE_SIGNATURE_VERSION,
         )
         sig = account.sign_message(message)
-        return {
+        headers = {
             "Content-Type": "application/json",
             "NexDex-STARKNET-ACCOUNT": account_address,
             "NexDex-STARKNET-SIGNATURE": f'["{sig[0]}","{sig[1]}"]',
-            "NexDex-STARKNET-SIGNATURE-TIMESTAMP": str(signature_timestamp),
+            "NexDex-STARKNET-SIGNATURE-TIMESTAMP": str(now),
             "NexDex-STARKNET-SIGNATURE-VERSION": FULLNODE_SIGNATURE_VERSION,
         }
+        self._fullnode_headers_cache[cache_key] = headers
+        if len(self._fullnode_headers_cache) > FULLNODE_SIGNATURE_CACHE_SIZE:
+            self._fullnode_headers_cache.popitem(last=False)
+        return dict(headers)
 
     def sign_order(self, order: Order) -> str:
         if order.id:
@@ -273,3 +365,147 @@ class NexDexAccount:
             # Re-raise the exception to handle it upstream if necessary
             raise
 
+    async def _reserve_nonces(self, count: int) -> int:
+        """Reserve `count` consecutive nonces and return the first one.
+
+        Nonces are tracked locally so transactions can be sent before the previous
+        ones are accepted; the chain nonce is used when it is ahead (e.g. after
+        transactions sent from elsewhere).
+        """
+        async with self._nonce_lock:
+            chain_nonce = await self.starknet.get_nonce()
+            first = max(chain_nonce, self._next_nonce or 0)
+            self._next_nonce = first + count
+            return first
+
+    async def transfer_on_l2_batch(
+        self,
+        transfers: list[tuple[str, Decimal]],
+        max_transfers_per_tx: int = 50,
+        max_in_flight: int = 4,
+        resource_bounds: ResourceBoundsMapping | None = None,
+    ) -> list[int]:
+        """Transfer to many L2 accounts using multicall transactions.
+
+        Transfers are packed into `InvokeV3` multicalls of up to `max_transfers_per_tx`
+        calls. Transactions are signed with locally managed nonces and sent in nonce
+        order without waiting for the previous one, with at most `max_in_flight`
+        awaiting acceptance at once.
+
+        Args:
+            transfers (list[tuple[str, Decimal]]): (target L2 address, amount) pairs
+            max_transfers_per_tx (int, optional): Transfer calls per transaction. Defaults to 50.
+            max_in_flight (int, optional): Transactions awaiting acceptance at once. Defaults to 4.
+            resource_bounds (ResourceBoundsMapping, optional): Resource bounds of each transaction.
+                Defaults to None (estimated per transaction).
+
+        Returns:
+            list[int]: Hashes of the accepted transactions, in nonce order
+
+        Raises:
+            BatchTransferError: If a transaction could not be sent or was not accepted. Sending stops,
+                transactions already sent are awaited, and `chunks` lists which transfers were accepted.
+
+        Examples:
+            >>> await NexDex.account.transfer_on_l2_batch([("0x1...", Decimal("10")), ("0x2...", Decimal("5"))])
+        """
+        if max_transfers_per_tx < 1 or max_in_flight < 1:
+            return raise_value_error("NexDex: max_transfers_per_tx and max_in_flight must be positive")
+        if not transfers:
+            return []
+        try:
+            paraclear_address = int_from_hex(self.config.paraclear_address)
+            usdc_address = int_from_hex(self.config.bridged_tokens[0].l2_token_address)
+            paraclear_contract = await self.starknet.load_contract(paraclear_address, is_cairo0_contract=False)
+            account_contract = await self.starknet.load_contract(self.l2_address, is_cairo0_contract=True)
+
+            if await self.starknet.check_multisig_required(account_contract):
+                return raise_value_error("NexDex: Batch transfers are not supported for multisig accounts")
+
+            paraclear_decimals = self.config.paraclear_decimals
+            token_asset_balance = await paraclear_contract.functions["getTokenAssetBalance"].call(
+                account=self.l2_address, token_address=usdc_address
+            )
+            total = sum(amount for _, amount in transfers)
+            logging.info(f"USDC balance on Paraclear: {token_asset_balance[0] / 10**paraclear_decimals}")
+            logging.info(f"Transferring {total} to {len(transfers)} accounts")
+
+            transfer = paraclear_contract.functions["transfer"]
+            calls = [
+                transfer.prepare_invoke_v3(
+                    recipient=int_from_hex(target_l2_address),
+                    token_address=usdc_address,
+                    amount=int(amount * 10**paraclear_decimals),
+                )
+                for target_l2_address, amount in transfers
+            ]
+            step = max_transfers_per_tx
+            bounds = [(i, min(i + step, len(calls))) for i in range(0, len(calls), step)]
+            chunks = [calls[start:stop] for start, stop in bounds]
+            first_nonce = await self._reserve_nonces(len(chunks))
+
+            sent = await self._send_transfer_chunks(
+                account_contract, chunks, bounds, first_nonce, max_in_flight, resource_bounds
+            )
+            logging.info(f"{len(sent)} transactions accepted on chain.")
+            return sent
+
+        except Exception as e:
+            logging.exception(f"Error during transfer_on_l2_batch: {e}")
+            raise
+
+    async def _send_transfer_chunks(
+        self,
+        account_contract,
+        chunks: list[list],
+        bounds: list[tuple[int, int]],
+        first_nonce: int,
+        max_in_flight: int,
+        resource_bounds: ResourceBoundsMapping | None,
+    ) -> list[int]:
+        """Send one transaction per chunk with consecutive nonces and wait for all of them to be accepted.
+
+        Raises:
+            BatchTransferError: If a transaction could not be sent or was not accepted
+        """
+        # Every transaction already sent is awaited, even after a failure, so the caller learns
+        # exactly which transfers went out and the chain nonce reflects them before resyncing
+        acceptances: list[asyncio.Future] = []
+        sent: list[int] = []
+        send_error: BaseException | None = None
+        for i, chunk in enumerate(chunks):
+            pending = [future for future in acceptances if not future.done()]
+            if len(pending) >= max_in_flight:
+                await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            if any(future.done() and future.exception() is not None for future in acceptances):
+                break
+            try:
+                prepared_invoke = await self.starknet.prepare_invoke(
+                    calls=chunk,
+                    resource_bounds=resource_bounds,
+                    auto_estimate=resource_bounds is None,
+                    nonce=first_nonce + i,
+                )
+                signature = self.starknet.signer.sign_transaction(prepared_invoke)
+                invoke_result = await self.starknet.invoke(account_contract, prepared_invoke, signature)
+            except Exception as e:
+                send_error = e
+                break
+            logging.info(f"Transaction {i + 1}/{len(chunks)} sent with hash: {hex(invoke_result.hash)}")
+            sent.append(invoke_result.hash)
+            acceptances.append(asyncio.ensure_future(invoke_result.wait_for_acceptance()))
+        results = await asyncio.gather(*acceptances, return_exceptions=True)
+
+        report = [
+            L2TransferChunk(*bounds[i], sent[i], result if isinstance(result, BaseException) else None)
+            for i, result in enumerate(results)
+        ]
+        if send_error is not None or len(sent) < len(chunks) or any(chunk.error for chunk in report):
+            # Nonces of the failed and unsent transactions were not used; resync from chain next time
+            self._next_nonce = None
+            if send_error is not None:
+                report.append(L2TransferChunk(*bounds[len(report)], None, send_error))
+            report.extend(L2TransferChunk(start, stop, None) for start, stop in bounds[len(report) :])
+            raise BatchTransferError(report) from send_error
+        return sent
+
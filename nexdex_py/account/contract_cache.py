@@ -0,0 +1,216 @@
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from starknet_py.contract import Contract
+from starknet_py.net.account.base_account import BaseAccount
+from starknet_py.net.client_errors import ClientError
+from starknet_py.proxy.contract_abi_resolver import (
+    AbiNotFoundError,
+    ContractAbiResolver,
+    ProxyConfig,
+    ProxyResolutionError,
+)
+from starknet_py.proxy.proxy_check import ProxyCheck
+
+CONTRACT_CACHE_VERSION = 1
+DEFAULT_CONTRACT_CACHE_PATH = Path("~/.cache/nexdex_py/contracts")
+
+# Implementation kinds returned by proxy checks
+IMPLEMENTATION_CLASS_HASH = "class_hash"
+IMPLEMENTATION_ADDRESS = "address"
+
+
+class ContractAbiCache:
+    """Cache of resolved contract ABIs, in memory and optionally on disk.
+
+    `Contract.from_address` fetches the contract class, and for proxies runs each proxy
+    check (several RPC round trips) before fetching the implementation class. Entries
+    here are keyed by (chain id, address, class hash at address), so loading a known
+    contract costs one `getClassHashAt` call. A changed class hash is a miss. For
+    proxies, the implementation is re-read with the proxy check that resolved it and
+    the entry is dropped if it changed.
+
+    Args:
+        path (str | Path | None, optional): Directory of the persistent cache, or None to keep
+            entries in memory only. Defaults to ~/.cache/nexdex_py/contracts.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+
+    Examples:
+        >>> from nexdex_py.account.contract_cache import ContractAbiCache
+        >>> NexDex = NexDex(env=Environment.TESTNET, l1_address="0x...", l2_private_key="0x...",
+        ...                 contract_cache=ContractAbiCache())
+        >>> await NexDex.account.transfer_on_l2("0x...", Decimal("10"))
+    """
+
+    classname: str = "ContractAbiCache"
+
+    def __init__(self, path: str | Path | None = DEFAULT_CONTRACT_CACHE_PATH, logger: logging.Logger | None = None):
+        self.path = Path(path).expanduser() if path is not None else None
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: dict[tuple[int, int, int], dict[str, Any]] = {}
+
+    async def load_contract(
+        self, account: BaseAccount, chain_id: int, address: int, proxy_config: ProxyConfig | None = None
+    ) -> Contract:
+        """Load the contract at `address`, resolving its ABI only on a cache miss.
+
+        Args:
+            account (BaseAccount): Account used as the contract's provider
+            chain_id (int): Chain id of `account`, part of the cache key
+            address (int): Contract address
+            proxy_config (ProxyConfig, optional): Proxy checks to resolve the implementation with.
+                Defaults to None (no proxy resolution).
+
+        Returns:
+            Contract: Contract bound to `account`
+        """
+        client = account.client
+        class_hash = await client.get_class_hash_at(contract_address=address)
+        key = (chain_id, address, class_hash)
+
+        entry = self._get(key)
+        if entry is not None and not await self._implementation_changed(entry, address, account, proxy_config):
+            return Contract(address=address, abi=entry["abi"], provider=account, cairo_version=entry["cairo_version"])
+
+        entry = await self._resolve(address, class_hash, account, proxy_config)
+        self._put(key, entry)
+        return Contract(address=address, abi=entry["abi"], provider=account, cairo_version=entry["cairo_version"])
+
+    def clear(self) -> None:
+        self._entries.clear()
+        if self.path is not None and self.path.exists():
+            for entry_path in self.path.glob("*.json"):
+                entry_path.unlink(missing_ok=True)
+
+    async def _resolve(
+        self, address: int, class_hash: int, account: BaseAccount, proxy_config: ProxyConfig | None
+    ) -> dict[str, Any]:
+        client = account.client
+        entry: dict[str, Any] = {"version": CONTRACT_CACHE_VERSION, "implementation": None}
+        if not proxy_config:
+            contract_class = await client.get_class_by_hash(class_hash=class_hash)
+        else:
+            implementation = await self._find_implementation(address, account, proxy_config)
+            if implementation is None:
+                raise ProxyResolutionError(proxy_config.get("proxy_checks", []))
+            entry["implementation"] = implementation
+            contract_class = await client.get_class_by_hash(class_hash=implementation["class_hash"])
+
+        if contract_class.abi is None:
+            raise AbiNotFoundError()
+        entry["abi"] = ContractAbiResolver.get_abi_from_contract_class(contract_class)
+        entry["cairo_version"] = ContractAbiResolver._get_cairo_version(contract_class)
+        self.logger.info(f"{self.classname}: Resolved ABI of {hex(address)}")
+        return entry
+
+    async def _find_implementation(
+        self, address: int, account: BaseAccount, proxy_config: ProxyConfig
+    ) -> dict[str, Any] | None:
+        for proxy_check in proxy_config.get("proxy_checks", []):
+            implementation = await self._read_implementation(proxy_check, address, account)
+            if implementation is not None:
+                return implementation
+        return None
+
+    @staticmethod
+    async def _read_implementation(
+        proxy_check: ProxyCheck, address: int, account: BaseAccount
+    ) -> dict[str, Any] | None:
+        client = account.client
+        name = type(proxy_check).__name__
+        try:
+            implementation_hash = await proxy_check.implementation_hash(address=address, client=client)
+            if implementation_hash is not None:
+                return {"proxy_check": name, "kind": IMPLEMENTATION_CLASS_HASH, "class_hash": implementation_hash}
+            implementation_address = await proxy_check.implementation_address(address=address, client=client)
+            if implementation_address is not None:
+                return {
+                    "proxy_check": name,
+                    "kind": IMPLEMENTATION_ADDRESS,
+                    "address": implementation_address,
+                    "class_hash": await client.get_class_hash_at(contract_address=implementation_address),
+                }
+        except ClientError:
+            # Not this kind of proxy
+            return None
+        return None
+
+    async def _implementation_changed(
+        self, entry: dict[str, Any], address: int, account: BaseAccount, proxy_config: ProxyConfig | None
+    ) -> bool:
+        cached = entry["implementation"]
+        if not proxy_config:
+            return cached is not None
+        if cached is None:
+            return True
+        proxy_check = next(
+            (check for check in proxy_config.get("proxy_checks", []) if type(check).__name__ == cached["proxy_check"]),
+            None,
+        )
+        if proxy_check is None:
+            return True
+        current = await self._reread_implementation(proxy_check, cached, address, account)
+        if current != cached:
+            self.logger.info(f"{self.classname}: Implementation of {hex(address)} changed, resolving again")
+            return True
+        return False
+
+    async def _reread_implementation(
+        self, proxy_check: ProxyCheck, cached: dict[str, Any], address: int, account: BaseAccount
+    ) -> dict[str, Any] | None:
+        # StarkwareETHProxyCheck fetches the whole implementation class to confirm it exists;
+        # reading its `implementation` getter is enough to detect an upgrade.
+        implementation_call = getattr(proxy_check, "_get_implementation_call", None)
+        if implementation_call is None:
+            return await self._read_implementation(proxy_check, address, account)
+        client = account.client
+        try:
+            (implementation,) = await client.call_contract(call=implementation_call(address=address))
+        except ClientError:
+            return None
+        current = {**cached, cached["kind"]: implementation}
+        if cached["kind"] == IMPLEMENTATION_ADDRESS:
+            current["class_hash"] = await client.get_class_hash_at(contract_address=implementation)
+        return current
+
+    def _entry_path(self, key: tuple[int, int, int]) -> Path | None:
+        if self.path is None:
+            return None
+        digest = hashlib.sha256(":".join(hex(part) for part in key).encode()).hexdigest()
+        return self.path / f"{digest[:40]}.json"
+
+    def _get(self, key: tuple[int, int, int]) -> dict[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        entry_path = self._entry_path(key)
+        if entry_path is None:
+            return None
+        try:
+            entry = json.loads(entry_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.logger.warning(f"{self.classname}: Unreadable entry {entry_path}, ignoring")
+            return None
+        if entry.get("version") != CONTRACT_CACHE_VERSION or entry.get("key") != [hex(part) for part in key]:
+            return None
+        self._entries[key] = entry
+        return entry
+
+    def _put(self, key: tuple[int, int, int], entry: dict[str, Any]) -> None:
+        entry["key"] = [hex(part) for part in key]
+        self._entries[key] = entry
+        entry_path = self._entry_path(key)
+        if entry_path is None:
+            return
+        try:
+            entry_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = entry_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(entry))
+            tmp_path.replace(entry_path)
+        except OSError:
+            self.logger.warning(f"{self.classname}: Cannot write {entry_path}, keeping entry in memory only")
@@ -0,0 +1,218 @@
+import contextlib
+import hashlib
+import hmac
+import json
+import logging
+import os
+import secrets
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+
+from starknet_py.common import int_from_hex
+from starknet_py.hash.address import compute_address
+from starknet_py.hash.selector import get_selector_from_name
+
+from nexdex_py.api.models import SystemConfig
+
+KEYSTORE_VERSION = 2
+DEFAULT_KEYSTORE_PATH = Path("~/.cache/nexdex_py/keystore")
+# scrypt cost of entries wrapped with the password alone (Ledger accounts), where the
+# derivation being cached needs the device and is far slower than scrypt.
+DEFAULT_KDF_ITERATIONS = 2**14
+
+# Entries of accounts with an L1 private key are wrapped with a key derived from it: the
+# L1 key has full entropy, so no password stretching is needed and a hit costs two HMACs.
+SCHEME_L1_KEY = "l1-key"
+SCHEME_SCRYPT = "scrypt"
+
+
+def compute_account_address(config: SystemConfig, l2_public_key: int) -> int:
+    """Counterfactual address of the NexDex account proxy for `l2_public_key`."""
+    calldata = [
+        int_from_hex(config.paraclear_account_hash),
+        get_selector_from_name("initialize"),
+        2,
+        l2_public_key,
+        0,
+    ]
+    return compute_address(
+        class_hash=int_from_hex(config.paraclear_account_proxy_hash),
+        constructor_calldata=calldata,
+        salt=l2_public_key,
+    )
+
+
+def _hmac(key: bytes, message: bytes) -> bytes:
+    return hmac.new(key, message, hashlib.sha256).digest()
+
+
+@dataclass(frozen=True)
+class DerivedL2Key:
+    """L2 key material derived from an L1 account."""
+
+    l2_private_key: int
+    l2_public_key: int
+    l2_address: int
+
+
+class L2KeyStore:
+    """Encrypted on-disk cache of L2 keys derived from L1 accounts.
+
+    Deriving the L2 key from an L1 key (EIP-712 signature + key grinding) and the
+    account address is repeated on every process start. `L2KeyStore` keeps the private
+    key, public key and address in a file per (l1_address, l1_chain_id, account class
+    hashes). The private key is encrypted and the whole entry authenticated
+    (encrypt-then-MAC, HMAC-SHA256) with a wrapping key derived from:
+
+    - the L1 private key and `password`, for accounts created from an L1 private key. A hit
+      costs microseconds, and an entry only opens with the L1 key it was derived from.
+    - `password` with scrypt, for Ledger accounts, whose L1 key is not available.
+
+    A verified entry is used as stored, without recomputing the public key or address.
+    Anything that fails verification is treated as a miss.
+
+    Args:
+        password (str): Password encrypting the cached private keys
+        path (str | Path, optional): Keystore directory. Defaults to ~/.cache/nexdex_py/keystore.
+        kdf_iterations (int, optional): scrypt cost of password-only entries. Defaults to 2**14.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+
+    Examples:
+        >>> from nexdex_py import NexDex
+        >>> from nexdex_py.account.keystore import L2KeyStore
+        >>> keystore = L2KeyStore(password=os.environ["NEXDEX_KEYSTORE_PASSWORD"])
+        >>> NexDex = NexDex(env=Environment.TESTNET, l1_address="0x...", l1_private_key="0x...", keystore=keystore)
+    """
+
+    classname: str = "L2KeyStore"
+
+    def __init__(
+        self,
+        password: str,
+        path: str | Path = DEFAULT_KEYSTORE_PATH,
+        kdf_iterations: int = DEFAULT_KDF_ITERATIONS,
+        logger: logging.Logger | None = None,
+    ):
+        if not password:
+            raise ValueError(f"{self.classname}: password is required")
+        self.password = password
+        self.path = Path(path).expanduser()
+        self.kdf_iterations = kdf_iterations
+        self.logger = logger or logging.getLogger(__name__)
+
+    @staticmethod
+    def _cache_key(config: SystemConfig, l1_address: str) -> dict[str, str]:
+        return {
+            "l1_address": l1_address.lower(),
+            "l1_chain_id": str(config.l1_chain_id),
+            "paraclear_account_hash": config.paraclear_account_hash.lower(),
+            "paraclear_account_proxy_hash": config.paraclear_account_proxy_hash.lower(),
+        }
+
+    def entry_path(self, config: SystemConfig, l1_address: str) -> Path:
+        key = self._cache_key(config, l1_address)
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return self.path / f"{digest[:40]}.json"
+
+    def _wrapping_keys(self, entry: dict, l1_private_key: int | None) -> tuple[bytes, bytes]:
+        """(encryption key, MAC key) of an entry."""
+        salt = bytes.fromhex(entry["salt"])
+        if entry["scheme"] == SCHEME_L1_KEY:
+            if l1_private_key is None:
+                raise ValueError(f"{self.classname}: Entry requires the L1 private key")
+            secret = _hmac(l1_private_key.to_bytes(32, "big"), b"nexdex_py keystore|" + self.password.encode())
+        else:
+            secret = hashlib.scrypt(
+                self.password.encode(), salt=salt, n=entry["kdf_n"], r=8, p=1, maxmem=2**27, dklen=32
+            )
+        return _hmac(secret, b"enc|" + salt), _hmac(secret, b"mac|" + salt)
+
+    @staticmethod
+    def _mac(mac_key: bytes, entry: dict) -> str:
+        body = {name: value for name, value in entry.items() if name != "mac"}
+        return _hmac(mac_key, json.dumps(body, sort_keys=True, separators=(",", ":")).encode()).hex()
+
+    def load(self, config: SystemConfig, l1_address: str, l1_private_key: int | None = None) -> DerivedL2Key | None:
+        """Return the verified cached key for `l1_address`, or None on a miss.
+
+        Args:
+            config (SystemConfig): System config the key was derived under
+            l1_address (str): Ethereum address
+            l1_private_key (int, optional): Ethereum private key the L2 key was derived from;
+                None for Ledger accounts. Defaults to None.
+        """
+        entry_path = self.entry_path(config, l1_address)
+        try:
+            entry = json.loads(entry_path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError):
+            self.logger.warning(f"{self.classname}: Unreadable entry {entry_path}, ignoring")
+            return None
+
+        scheme = SCHEME_SCRYPT if l1_private_key is None else SCHEME_L1_KEY
+        if (
+            not isinstance(entry, dict)
+            or entry.get("version") != KEYSTORE_VERSION
+            or entry.get("scheme") != scheme
+            or entry.get("key") != self._cache_key(config, l1_address)
+        ):
+            self.logger.warning(f"{self.classname}: Entry {entry_path} does not match {l1_address}, ignoring")
+            return None
+        try:
+            enc_key, mac_key = self._wrapping_keys(entry, l1_private_key)
+            verified = hmac.compare_digest(self._mac(mac_key, entry), str(entry.get("mac", "")))
+        except (KeyError, TypeError, ValueError):
+            verified = False
+        if not verified:
+            self.logger.warning(
+                f"{self.classname}: Entry {entry_path} failed verification (wrong password or L1 key?), ignoring"
+            )
+            return None
+        # Authenticated by the MAC: used as stored
+        ciphertext = bytes.fromhex(entry["ciphertext"])
+        l2_private_key = int.from_bytes(bytes(a ^ b for a, b in zip(ciphertext, enc_key, strict=True)), "big")
+        return DerivedL2Key(l2_private_key, int(entry["l2_public_key"], 16), int(entry["l2_address"], 16))
+
+    def save(self, config: SystemConfig, l1_address: str, key: DerivedL2Key, l1_private_key: int | None = None) -> Path:
+        """Encrypt and store `key`, replacing any existing entry atomically.
+
+        Args:
+            config (SystemConfig): System config the key was derived under
+            l1_address (str): Ethereum address
+            key (DerivedL2Key): Key to store
+            l1_private_key (int, optional): Ethereum private key `key` was derived from; None for
+                Ledger accounts, whose entries are wrapped with the password alone. Defaults to None.
+        """
+        entry = {
+            "version": KEYSTORE_VERSION,
+            "key": self._cache_key(config, l1_address),
+            "scheme": SCHEME_SCRYPT if l1_private_key is None else SCHEME_L1_KEY,
+            "salt": secrets.token_bytes(16).hex(),
+            "l2_public_key": hex(key.l2_public_key),
+            "l2_address": hex(key.l2_address),
+        }
+        if l1_private_key is None:
+            entry["kdf_n"] = self.kdf_iterations
+        enc_key, mac_key = self._wrapping_keys(entry, l1_private_key)
+        private_key = key.l2_private_key.to_bytes(32, "big")
+        entry["ciphertext"] = bytes(a ^ b for a, b in zip(private_key, enc_key, strict=True)).hex()
+        entry["mac"] = self._mac(mac_key, entry)
+
+        self.path.mkdir(parents=True, exist_ok=True, mode=0o700)
+        entry_path = self.entry_path(config, l1_address)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(entry, f)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, entry_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+        return entry_path
+
+    def delete(self, config: SystemConfig, l1_address: str) -> None:
+        self.entry_path(config, l1_address).unlink(missing_ok=True)
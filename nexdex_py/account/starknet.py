@@ -2,6 +2,7 @@ import dataclasses
 import logging
 import re
 from collections.abc import Callable
+from typing import Any, cast
 
 import marshmallow_dataclass 
 from starknet_py.constants import RPC_CONTRACT_ERROR
@@ -10,14 +11,17 @@ from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.net.account.account import Account as StarknetAccount
 from starknet_py.net.client import Client
 from starknet_py.net.client_errors import ClientError
-from starknet_py.net.client_models import Call, Calls, ResourceBoundsMapping, SentTransactionResponse
-from starknet_py.net.models import Address, AddressRepresentation, InvokeV3, StarknetChainId
+from starknet_py.net.client_models import Call, Calls, ResourceBoundsMapping, SentTransactionResponse, Tag
+from starknet_py.net.full_node_client import FullNodeClient, _to_rpc_felt, get_block_identifier
+from starknet_py.net.http_client import HttpMethod
+from starknet_py.net.models import Address, AddressRepresentation, InvokeV3, StarknetChainId, parse_address
 from starknet_py.net.signer import BaseSigner
 from starknet_py.net.signer.stark_curve_signer import KeyPair
 from starknet_py.proxy.contract_abi_resolver import ProxyConfig
 from starknet_py.proxy.proxy_check import ArgentProxyCheck, OpenZeppelinProxyCheck, ProxyCheck
 from starknet_py.utils.typed_data import TypedData, TypedDataDict
 
+from .contract_cache import ContractAbiCache
 from .utils import message_signature, typed_data_to_message_hash
 
 
@@ -30,8 +34,10 @@ class Account(StarknetAccount):
         signer: BaseSigner | None = None,
         key_pair: KeyPair | None = None,
         chain: StarknetChainId | None = None,
+        contract_cache: ContractAbiCache | None = None,
     ):
         super().__init__(address=address, client=client, signer=signer, key_pair=key_pair, chain=chain)
+        self.contract_cache = contract_cache
 
     def _add_signature(self, invoke: InvokeV3, signature: list[int]) -> InvokeV3:
         return dataclasses.replace(invoke, signature=signature)
@@ -77,26 +83,99 @@ class Account(StarknetAccount):
 
     async def load_contract(self, address: AddressRepresentation, is_cairo0_contract: bool = False) -> Contract:
         try:
-            proxy_config = get_proxy_config() if is_cairo0_contract else False
-            contract = await Contract.from_address(address=address, provider=self, proxy_config=proxy_config)
+            if self.contract_cache is not None:
+                cache_proxy_config: ProxyConfig | None = get_proxy_config() if is_cairo0_contract else None
+                chain_id = int(await self._get_chain_id())
+                contract = await self.contract_cache.load_contract(
+                    self, chain_id, parse_address(address), cache_proxy_config
+                )
+            else:
+                proxy_config = get_proxy_config() if is_cairo0_contract else False
+                contract = await Contract.from_address(address=address, provider=self, proxy_config=proxy_config)
         except Exception as e:
             logging.exception(f"Error loading contract at address {hex(int(address))}: {e}")
             raise
         else:
             return contract
 
+    async def rpc_batch(self, requests: list[tuple[str, dict]]) -> list[Any]:
+        """Send several JSON-RPC requests to the full node in one HTTP request.
+
+        The batch goes through the client's `_make_request`, so it is signed once
+        as a whole by the NexDex fullnode headers patch.
+
+        Args:
+            requests: (method name without the `starknet_` prefix, params) pairs
+
+        Returns:
+            list: Result of each request, in request order
+
+        Raises:
+            ClientError: If any request returned a JSON-RPC error
+        """
+        if not requests:
+            return []
+        rpc_client = cast(FullNodeClient, self.client)._client
+        payload = [
+            {"jsonrpc": "2.0", "method": f"{rpc_client.method_prefix}_{method}", "id": i, "params": params}
+            for i, (method, params) in enumerate(requests)
+        ]
+        responses = await rpc_client.request(http_method=HttpMethod.POST, address=rpc_client.url, payload=payload)
+        if not isinstance(responses, list):
+            # Single error object, e.g. batch rejected by the node
+            rpc_client.handle_rpc_error(responses)
+        by_id = {response.get("id"): response for response in responses}
+        results = []
+        for i in range(len(payload)):
+            response = by_id.get(i) or {}
+            if "result" not in response:
+                rpc_client.handle_rpc_error(response)
+            results.append(response["result"])
+        return results
+
+    async def call_contracts(self, calls: list[Call], block_number: int | Tag | None = None) -> list[list[int]]:
+        """Execute several view calls in one batched RPC request.
+
+        Args:
+            calls: Calls to execute
+            block_number: Block number or tag. Defaults to the latest pre-confirmed block,
+                like `ContractFunction.call`.
+
+        Returns:
+            list[list[int]]: Raw felt output of each call, in call order
+        """
+        block_identifier = get_block_identifier(block_number=block_number)
+        requests = [
+            (
+                "call",
+                {
+                    "request": {
+                        "contract_address": _to_rpc_felt(call.to_addr),
+                        "entry_point_selector": _to_rpc_felt(call.selector),
+                        "calldata": [_to_rpc_felt(value) for value in call.calldata],
+                    },
+                    **block_identifier,
+                },
+            )
+            for call in calls
+        ]
+        results = await self.rpc_batch(requests)
+        return [[int(value, 16) for value in result] for result in results]
+
     async def check_multisig_required(self, contract: Contract) -> bool:
         try:
-            get_signer_call = await contract.functions["getSigner"].call()
-            current_signer = hex(get_signer_call.signer)  # type: ignore[union-attr]
+            # One signed round trip for the three getters
+            signer, guardian, guardian_backup = await self.call_contracts([
+                Call(to_addr=contract.address, selector=get_selector_from_name(name), calldata=[])
+                for name in ("getSigner", "getGuardian", "getGuardianBackup")
+            ])
+            current_signer = hex(signer[0])
             logging.info(f"Current signer: {current_signer}")
 
-            get_guardian_call = await contract.functions["getGuardian"].call()
-            current_guardian = hex(get_guardian_call.guardian)  # type: ignore[union-attr]
+            current_guardian = hex(guardian[0])
             logging.info(f"Current guardian: {current_guardian}")
 
-            get_guardian_backup_call = await contract.functions["getGuardianBackup"].call()
-            current_guardian_backup = hex(get_guardian_backup_call.guardianBackup)  # type: ignore[union-attr]
+            current_guardian_backup = hex(guardian_backup[0])
             logging.info(f"Current guardian backup: {current_guardian_backup}")
 
             need_multisig = current_guardian != "0x0" or current_guardian_backup != "0x0"
@@ -189,7 +268,7 @@ class StarkwareETHProxyCheck(ProxyCheck):
         )
 
 
-def get_proxy_config():
+def get_proxy_config() -> ProxyConfig:
     return ProxyConfig(
         proxy_checks=[StarkwareETHProxyCheck(), ArgentProxyCheck(), OpenZeppelinProxyCheck()],
     )
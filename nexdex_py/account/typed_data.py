@@ -1,9 +1,12 @@
+import functools
 from typing import cast
 
 from starknet_py.cairo.felt import encode_shortstring
+from starknet_py.hash.selector import get_selector_from_name
 from starknet_py.utils.typed_data import (
     TypeContext,
-    is_pointer, 
+    TypedDataDict,
+    is_pointer,
     parse_felt,
     strip_pointer,
 )
@@ -11,8 +14,30 @@ from starknet_py.utils.typed_data import TypedData as StarknetTypedDataDataclass
 
 from .utils import compute_hash_on_elements
 
+# Struct hashes are memoized by their encoded fields (type hash first), so re-signing a
+# message where one nested struct changed (e.g. one leg of a block trade) only rehashes
+# that struct and its parents.
+STRUCT_HASH_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=STRUCT_HASH_CACHE_SIZE)
+def _hash_struct_elements(elements: tuple[int, ...]) -> int:
+    return compute_hash_on_elements(list(elements))
+
+
+@functools.lru_cache(maxsize=256)
+def _type_hash(encoded_type: str) -> int:
+    return get_selector_from_name(encoded_type)
+
 
 class TypedData(StarknetTypedDataDataclass):
+    """Revision 0 typed data with NexDex extensions (`shortstring` fields, `Struct*` arrays)."""
+
+    @classmethod
+    def from_dict(cls, data: TypedDataDict) -> "TypedData":
+        parsed = StarknetTypedDataDataclass.from_dict(data)
+        return cls(types=parsed.types, primary_type=parsed.primary_type, domain=parsed.domain, message=parsed.message)
+
     def _encode_data(self, type_name: str, data: dict) -> list[int]:
         values = []
         for param in self.types[type_name]:
@@ -43,16 +68,17 @@ class TypedData(StarknetTypedDataDataclass):
         :param data: Data defining the struct.
         :return: Hash of the struct.
         """
-        return compute_hash_on_elements([self.type_hash(type_name), *self._encode_data(type_name, data)])
+        return _hash_struct_elements((self.type_hash(type_name), *self._encode_data(type_name, data)))
+
+    def type_hash(self, type_name: str) -> int:
+        return _type_hash(self._encode_type(type_name))
 
     def message_hash(self, account_address: int) -> int:
         message = [
             encode_shortstring("StarkNet Message"),
-            self.struct_hash("StarkNetDomain", cast(dict, self.domain)),
+            self.struct_hash(self.domain.separator_name, self.domain.to_dict()),
             account_address,
             self.struct_hash(self.primary_type, self.message),
         ]
 
         return compute_hash_on_elements(message)
-
-
@@ -95,7 +95,11 @@ def unflatten_signature(sig: str) -> list:
 
 
 def typed_data_to_message_hash(typed_data: TypedData | TypedDataDict, address: int) -> int:
-    typed_data_dataclass = TypedData.from_dict(cast(TypedDataDict, typed_data))
+    # Imported here as typed_data depends on compute_hash_on_elements below.
+    # NexDex TypedData supports `shortstring` fields (block trades) unlike starknet_py's revision 0.
+    from .typed_data import TypedData as NexDexTypedData
+
+    typed_data_dataclass = NexDexTypedData.from_dict(cast(TypedDataDict, typed_data))
     return typed_data_dataclass.message_hash(address)
 
 
@@ -1,20 +1,52 @@
 import contextlib
 import logging
 import re
+import threading
 import time
-from typing import Any, cast
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, cast
 
 import httpx
  
 from nexdex_py.account.account import NexDexAccount
 from nexdex_py.api.block_trades_api import BlockTradesMixin 
+from nexdex_py.api.generated.responses import (
+    AccountInfoResponse,
+    AccountProfileResp,
+    AskBidArray,
+    BBOResp,
+    BalanceResp,
+    FillResult,
+    FundingDataResult,
+    FundingPayment,
+    InsuranceAccountResp,
+    LiquidationResp,
+    MarketResp,
+    MarketSummaryResp,
+    OrderResp,
+    PositionResp,
+    SystemStateResponse,
+    SystemTimeResponse,
+    TradeResult,
+    TradebustResult,
+    TransactionResponse,
+    TransferResult,
+)
 from nexdex_py.api.http_client import HttpClient, HttpMethod
 from nexdex_py.api.models import AccountSummary, AccountSummarySchema, AuthSchema, SystemConfig, SystemConfigSchema
+from nexdex_py.api.parsing import load_schema
 from nexdex_py.api.protocols import AuthProvider, Signer
+from nexdex_py.api.token_refresher import JWT_REFRESH_AGE
+from nexdex_py.api.views import ModelView, ResponsePage, page, view
+from nexdex_py.common.market_constraints import MarketConstraintIndex
+from nexdex_py.common.metrics import MetricsRegistry
 from nexdex_py.common.order import Order
 from nexdex_py.environment import Environment
 from nexdex_py.utils import raise_value_error
 
+if TYPE_CHECKING:
+    from nexdex_py.api.token_refresher import TokenRefresher
+
 
 class NexDexApiClient(BlockTradesMixin, HttpClient):
     """Class to interact with NexDex REST API.
@@ -28,6 +60,10 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
         auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
         signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
+        metrics (MetricsRegistry, optional): Registry for request latency, retry and signing metrics.
+            Defaults to the injected `HttpClient`'s registry, if any.
+        market_constraints (MarketConstraintIndex, optional): Per-market constraints checked before
+            orders are signed; see `load_market_constraints`. Defaults to None (no client-side checks).
 
     Examples:
         >>> from nexdex_py import NexDex
@@ -46,6 +82,8 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         auto_auth: bool = True,
         auth_provider: AuthProvider | None = None,
         signer: Signer | None = None,
+        metrics: MetricsRegistry | None = None,
+        market_constraints: MarketConstraintIndex | None = None,
     ):
         self.env = env
         self.logger = logger or logging.getLogger(__name__)
@@ -55,13 +93,19 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
             # Extract the underlying httpx.Client if it's wrapped in HttpClient
             if hasattr(http_client, "client"):
                 # http_client is another HttpClient instance, extract the underlying client
-                underlying_client = http_client.client
+                # and keep its timeout, retry, hook and metrics configuration
+                super().__init__(
+                    http_client=http_client.client,
+                    default_timeout=getattr(http_client, "default_timeout", None),
+                    retry_strategy=getattr(http_client, "retry_strategy", None),
+                    request_hook=getattr(http_client, "request_hook", None),
+                    metrics=metrics or getattr(http_client, "metrics", None),
+                )
             else:
                 # http_client is already an httpx.Client, cast to ensure type safety
-                underlying_client = cast(httpx.Client, http_client)
-            super().__init__(http_client=underlying_client)
+                super().__init__(http_client=cast(httpx.Client, http_client), metrics=metrics)
         else:
-            super().__init__()
+            super().__init__(metrics=metrics)
 
         # Use custom base URL if provided, otherwise use default
         if api_base_url is not None:
@@ -75,9 +119,13 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         self._manual_token: str | None = None
         self.account: NexDexAccount | None = None
         self.auth_timestamp = 0
+        # Set by a running TokenRefresher; moves JWT renewal off the request path
+        self.token_refresher: TokenRefresher | None = None
+        self._auth_lock = threading.Lock()
 
         # Signing configuration
         self.signer = signer
+        self.market_constraints = market_constraints
 
     async def __aexit__(self):
         self.client.close()
@@ -98,14 +146,24 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         self.post(api_url=self.api_url, path="onboarding", headers=headers, payload=payload)
 
     def auth(self):
+        self.apply_auth_token(self.fetch_auth_token())
+
+    def fetch_auth_token(self) -> str:
+        """Sign an auth request and return a new JWT without installing it."""
         if self.account is None:
             raise ValueError("Account not initialized")
         headers = self.account.auth_headers()
         res = self.post(api_url=self.api_url, path=f"auth/{hex(self.account.l2_public_key)}", headers=headers)
-        data = AuthSchema().load(res, unknown="exclude", partial=True)
-        self.auth_timestamp = int(time.time())
-        self.account.set_jwt_token(data.jwt_token)
-        self.client.headers.update({"Authorization": f"Bearer {data.jwt_token}"})
+        data = load_schema(AuthSchema, res)
+        return data.jwt_token
+
+    def apply_auth_token(self, jwt_token: str) -> None:
+        """Install a JWT for subsequent requests; safe to call from a background thread."""
+        with self._auth_lock:
+            self.client.headers["Authorization"] = f"Bearer {jwt_token}"
+            if self.account is not None:
+                self.account.set_jwt_token(jwt_token)
+            self.auth_timestamp = int(time.time())
 
     def set_token(self, jwt: str) -> None:
         """Inject a JWT token without HTTP calls.
@@ -142,8 +200,18 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
                 return  # Skip auth if disabled and no account
             return raise_value_error(f"{self.classname}: Account not found")
 
+        self._renew_jwt_if_stale()
+
+    def _renew_jwt_if_stale(self) -> None:
+        # A running background refresher renews ahead of expiry; only block if it fell behind
+        if self.token_refresher is not None and self.token_refresher.is_running:
+            if self.token_refresher.is_token_expired():
+                self.logger.warning(f"{self.classname}: JWT expired before background refresh, re-authenticating")
+                self.auth()
+            return
+
         # Refresh JWT if it's older than 4 minutes
-        if time.time() - self.auth_timestamp > 4 * 60:
+        if time.time() - self.auth_timestamp > JWT_REFRESH_AGE:
             if self.auto_auth:
                 self.auth()
             else:
@@ -350,7 +418,7 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         Private endpoint requires authorization.
         """
         res = self._get_authorized(path="account")
-        return AccountSummarySchema().load(res, unknown="exclude", partial=True)
+        return load_schema(AccountSummarySchema, res)
 
     def fetch_account_profile(self) -> dict:
         """Fetch profile for this account.
@@ -433,44 +501,42 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         """
         return self._get_authorized(path="account/info")
 
-    def submit_order(self, order: Order, signer: Signer | None = None) -> dict:
+    def submit_order(
+        self, order: Order, signer: Signer | None = None, open_orders: Mapping[str, int] | None = None
+    ) -> dict:
         """Send order to NexDex.
             Private endpoint requires authorization.
 
         Args:
             order: Order containing all required fields.
             signer: Optional custom signer. Uses instance signer or account signer if None.
+            open_orders: Open orders per market, see `count_open_orders`. With `market_constraints`,
+                the order is rejected if it would exceed the market's `max_open_orders`.
         """
-        # Use provided signer, instance signer, or account signer
-        if signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = signer.sign_order(order_data)
-            order_payload = signed_data
-        elif self.signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = self.signer.sign_order(order_data)
-            order_payload = signed_data
-        else:
-            # Fall back to account signing
-            if self.account is None:
-                raise ValueError("Account not initialized and no signer provided")
-            order.signature = self.account.sign_order(order)
-            order_payload = order.dump_to_dict()
-
+        if self.market_constraints is not None:
+            self.market_constraints.validate(order, open_orders=open_orders)
+        order_payload = self._sign_order_payload(order, signer, "submit_order")
         return self._post_authorized(path="orders", payload=order_payload)
 
-    def submit_orders_batch(self, orders: list[Order], signer: Signer | None = None) -> dict:
+    def submit_orders_batch(
+        self, orders: list[Order], signer: Signer | None = None, open_orders: Mapping[str, int] | None = None
+    ) -> dict:
         """Send batch of orders to NexDex.
             Private endpoint requires authorization.
 
         Args:
             orders: List of orders containing all required fields.
             signer: Optional custom signer. Uses instance signer or account signer if None.
+            open_orders: Open orders per market, see `count_open_orders`. With `market_constraints`,
+                they are counted with the batch against each market's `max_open_orders`.
 
         Returns:
             orders (list): List of Orders
             errors (list): List of Errors
         """
+        if self.market_constraints is not None:
+            self.market_constraints.validate_batch(orders, open_orders)
+        sign_start = time.perf_counter_ns()
         # Use provided signer, instance signer, or account signer
         if signer is not None:
             order_data_list = [order.dump_to_dict() for order in orders]
@@ -487,6 +553,10 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
                 order.signature = self.account.sign_order(order)
                 order_payload = order.dump_to_dict()
                 order_payloads.append(order_payload)
+        if self.metrics:
+            self.metrics.observe_ns(
+                "nexdex_sign_duration_seconds", time.perf_counter_ns() - sign_start, operation="submit_orders_batch"
+            )
 
         return self._post_authorized(path="orders/batch", payload=order_payloads)
 
@@ -499,23 +569,29 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
             order: Order update
             signer: Optional custom signer. Uses instance signer or account signer if None.
         """
+        if self.market_constraints is not None:
+            self.market_constraints.validate(order)
+        order_payload = self._sign_order_payload(order, signer, "modify_order")
+        return self._put_authorized(path=f"orders/{order_id}", payload=order_payload)
+
+    def _sign_order_payload(self, order: Order, signer: Signer | None, operation: str) -> dict:
+        sign_start = time.perf_counter_ns()
         # Use provided signer, instance signer, or account signer
         if signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = signer.sign_order(order_data)
-            order_payload = signed_data
+            order_payload = signer.sign_order(order.dump_to_dict())
         elif self.signer is not None:
-            order_data = order.dump_to_dict()
-            signed_data = self.signer.sign_order(order_data)
-            order_payload = signed_data
+            order_payload = self.signer.sign_order(order.dump_to_dict())
         else:
             # Fall back to account signing
             if self.account is None:
                 raise ValueError("Account not initialized and no signer provided")
             order.signature = self.account.sign_order(order)
             order_payload = order.dump_to_dict()
-
-        return self._put_authorized(path=f"orders/{order_id}", payload=order_payload)
+        if self.metrics:
+            self.metrics.observe_ns(
+                "nexdex_sign_duration_seconds", time.perf_counter_ns() - sign_start, operation=operation
+            )
+        return order_payload
 
     def cancel_order(self, order_id: str) -> None:
         """Cancel open order previously sent to NexDex from this account.
@@ -586,7 +662,7 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         if "starknet_fullnode_rpc_base_url" not in res and "starknet_fullnode_rpc_url" in res:
             base_url = re.sub(r"/rpc/v\d+[._]\d+.*$", "", res["starknet_fullnode_rpc_url"])
             res["starknet_fullnode_rpc_base_url"] = base_url
-        config = SystemConfigSchema().load(res, unknown="exclude", partial=True)
+        config = load_schema(SystemConfigSchema, res)
         self.logger.info(f"{self.classname}: SystemConfig:{config}")
         return config
 
@@ -623,6 +699,19 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         """
         return self._get(path="markets", params=params)
 
+    def load_market_constraints(self) -> MarketConstraintIndex:
+        """Fetch all markets and check orders against their constraints before signing.
+
+        Submitting an order off the tick or increment, below `min_notional`, above
+        `max_order_size`, or above `max_open_orders` (counting the `open_orders` passed) then raises ValueError
+        without signing or sending it.
+
+        Returns:
+            MarketConstraintIndex: The index, also set as `market_constraints`
+        """
+        self.market_constraints = MarketConstraintIndex.from_response(self.fetch_markets(), logger=self.logger)
+        return self.market_constraints
+
     def fetch_markets_summary(self, params: dict | None = None) -> dict:
         """Fetch ticker information for specific market.
 
@@ -684,3 +773,101 @@ class NexDexApiClient(BlockTradesMixin, HttpClient):
         """Fetch insurance fund information"""
         return self._get(path="insurance")
 
+    # TYPED RESPONSES
+    # Same endpoints as lazily validated views over the generated response models; see `nexdex_py.api.views`
+
+    def fetch_orders_typed(self, params: dict | None = None) -> ResponsePage[OrderResp]:
+        """`fetch_orders` as a `ResponsePage` of `OrderResp` rows."""
+        return page(OrderResp, self.fetch_orders(params))
+
+    def fetch_orders_history_typed(self, params: dict | None = None) -> ResponsePage[OrderResp]:
+        """`fetch_orders_history` as a `ResponsePage` of `OrderResp` rows."""
+        return page(OrderResp, self.fetch_orders_history(params))
+
+    def fetch_order_typed(self, order_id: str) -> ModelView[OrderResp]:
+        """`fetch_order` as a `ModelView` of `OrderResp`."""
+        return view(OrderResp, self.fetch_order(order_id))
+
+    def fetch_order_by_client_id_typed(self, client_id: str) -> ModelView[OrderResp]:
+        """`fetch_order_by_client_id` as a `ModelView` of `OrderResp`."""
+        return view(OrderResp, self.fetch_order_by_client_id(client_id))
+
+    def fetch_fills_typed(self, params: dict | None = None) -> ResponsePage[FillResult]:
+        """`fetch_fills` as a `ResponsePage` of `FillResult` rows."""
+        return page(FillResult, self.fetch_fills(params))
+
+    def fetch_tradebusts_typed(self, params: dict | None = None) -> ResponsePage[TradebustResult]:
+        """`fetch_tradebusts` as a `ResponsePage` of `TradebustResult` rows."""
+        return page(TradebustResult, self.fetch_tradebusts(params))
+
+    def fetch_funding_payments_typed(self, params: dict | None = None) -> ResponsePage[FundingPayment]:
+        """`fetch_funding_payments` as a `ResponsePage` of `FundingPayment` rows."""
+        return page(FundingPayment, self.fetch_funding_payments(params))
+
+    def fetch_funding_data_typed(self, params: dict | None = None) -> ResponsePage[FundingDataResult]:
+        """`fetch_funding_data` as a `ResponsePage` of `FundingDataResult` rows."""
+        return page(FundingDataResult, self.fetch_funding_data(params))
+
+    def fetch_transactions_typed(self, params: dict | None = None) -> ResponsePage[TransactionResponse]:
+        """`fetch_transactions` as a `ResponsePage` of `TransactionResponse` rows."""
+        return page(TransactionResponse, self.fetch_transactions(params))
+
+    def fetch_transfers_typed(self, params: dict | None = None) -> ResponsePage[TransferResult]:
+        """`fetch_transfers` as a `ResponsePage` of `TransferResult` rows."""
+        return page(TransferResult, self.fetch_transfers(params))
+
+    def fetch_account_profile_typed(self) -> ModelView[AccountProfileResp]:
+        """`fetch_account_profile` as a `ModelView` of `AccountProfileResp`."""
+        return view(AccountProfileResp, self.fetch_account_profile())
+
+    def fetch_balances_typed(self) -> ResponsePage[BalanceResp]:
+        """`fetch_balances` as a `ResponsePage` of `BalanceResp` rows."""
+        return page(BalanceResp, self.fetch_balances())
+
+    def fetch_positions_typed(self) -> ResponsePage[PositionResp]:
+        """`fetch_positions` as a `ResponsePage` of `PositionResp` rows."""
+        return page(PositionResp, self.fetch_positions())
+
+    def fetch_liquidations_typed(self, params: dict | None = None) -> ResponsePage[LiquidationResp]:
+        """`fetch_liquidations` as a `ResponsePage` of `LiquidationResp` rows."""
+        return page(LiquidationResp, self.fetch_liquidations(params))
+
+    def fetch_trades_typed(self, params: dict) -> ResponsePage[TradeResult]:
+        """`fetch_trades` as a `ResponsePage` of `TradeResult` rows."""
+        return page(TradeResult, self.fetch_trades(params))
+
+    def fetch_subaccounts_typed(self) -> ResponsePage[AccountInfoResponse]:
+        """`fetch_subaccounts` as a `ResponsePage` of `AccountInfoResponse` rows."""
+        return page(AccountInfoResponse, self.fetch_subaccounts())
+
+    def fetch_account_info_typed(self) -> ModelView[AccountInfoResponse]:
+        """`fetch_account_info` as a `ModelView` of `AccountInfoResponse`."""
+        return view(AccountInfoResponse, self.fetch_account_info())
+
+    def fetch_system_state_typed(self) -> ModelView[SystemStateResponse]:
+        """`fetch_system_state` as a `ModelView` of `SystemStateResponse`."""
+        return view(SystemStateResponse, self.fetch_system_state())
+
+    def fetch_system_time_typed(self) -> ModelView[SystemTimeResponse]:
+        """`fetch_system_time` as a `ModelView` of `SystemTimeResponse`."""
+        return view(SystemTimeResponse, self.fetch_system_time())
+
+    def fetch_markets_typed(self, params: dict | None = None) -> ResponsePage[MarketResp]:
+        """`fetch_markets` as a `ResponsePage` of `MarketResp` rows."""
+        return page(MarketResp, self.fetch_markets(params))
+
+    def fetch_markets_summary_typed(self, params: dict | None = None) -> ResponsePage[MarketSummaryResp]:
+        """`fetch_markets_summary` as a `ResponsePage` of `MarketSummaryResp` rows."""
+        return page(MarketSummaryResp, self.fetch_markets_summary(params))
+
+    def fetch_orderbook_typed(self, market: str, params: dict | None = None) -> ModelView[AskBidArray]:
+        """`fetch_orderbook` as a `ModelView` of `AskBidArray`."""
+        return view(AskBidArray, self.fetch_orderbook(market, params))
+
+    def fetch_bbo_typed(self, market: str) -> ModelView[BBOResp]:
+        """`fetch_bbo` as a `ModelView` of `BBOResp`."""
+        return view(BBOResp, self.fetch_bbo(market))
+
+    def fetch_insurance_fund_typed(self) -> ModelView[InsuranceAccountResp]:
+        """`fetch_insurance_fund` as a `ModelView` of `InsuranceAccountResp`."""
+        return view(InsuranceAccountResp, self.fetch_insurance_fund())
@@ -1,18 +1,16 @@
 from typing import Any, Protocol
 
-from pydantic import TypeAdapter
-
 from nexdex_py.api.generated.requests import (
     BlockExecuteRequest,
     BlockOfferRequest,
     BlockTradeRequest,
 )
-from nexdex_py.api.generated.responses import ( 
-    ApiError,
+from nexdex_py.api.generated.responses import (
     APIResults,
     BlockTradeDetailFullResponse,
     PaginatedAPIResults,
 )
+from nexdex_py.api.parsing import ResponseFormat, check_response_format, parse, parse_results, raise_for_api_error
 
 
 class ApiClientProtocol(Protocol):
@@ -48,32 +46,20 @@ class BlockTradesMixin:
     _post_authorized: Any
     _delete_authorized: Any
 
-    def _parse_block_trade_list_response(self, response: dict) -> PaginatedAPIResults:
+    def _parse_block_trade_list_response(
+        self, response: dict, response_format: ResponseFormat = "dict"
+    ) -> PaginatedAPIResults:
         """Parse block trade list response to typed model."""
-        # Check if response contains an error
-        if "error" in response:
-            error = ApiError.model_validate(response)
-            raise ValueError(f"API Error {error.error}: {error.message}")
+        raise_for_api_error(response)
 
         try:
-            # Use TypeAdapter to validate list of BlockTradeDetailFullResponse objects
-            if response.get("results"):
-                adapter = TypeAdapter(list[BlockTradeDetailFullResponse])
-                typed_results = adapter.validate_python(response["results"])
-
-                return PaginatedAPIResults(
-                    next=response.get("next"),
-                    prev=response.get("prev"),
-                    results=[result.model_dump() for result in typed_results],
-                )
-            else:
-                return PaginatedAPIResults(
-                    next=response.get("next"),
-                    prev=response.get("prev"),
-                    results=[],
-                )
+            results = parse_results(BlockTradeDetailFullResponse, response.get("results"), response_format)
+            # Rows are already validated (or deliberately raw), so skip validating the page again
+            return PaginatedAPIResults.model_construct(
+                next=response.get("next"), prev=response.get("prev"), results=results
+            )
         except ValueError:
-            # Re-raise ValueError from error handling
+            # Re-raise ValueError from error handling and validation
             raise
         except Exception:
             # Fallback to original response if parsing fails
@@ -81,13 +67,10 @@ class BlockTradesMixin:
 
     def _parse_block_trade_response(self, response: dict) -> BlockTradeDetailFullResponse:
         """Parse single block trade response to typed model."""
-        # Check if response contains an error
-        if "error" in response:
-            error = ApiError.model_validate(response)
-            raise ValueError(f"API Error {error.error}: {error.message}")
+        raise_for_api_error(response)
 
         try:
-            return BlockTradeDetailFullResponse.model_validate(response)
+            return parse(BlockTradeDetailFullResponse, response)
         except Exception:
             # Fallback to simple response with just the ID
             block_id = response.get("id") or response.get("block_id") if isinstance(response, dict) else None
@@ -95,13 +78,10 @@ class BlockTradesMixin:
 
     def _parse_offers_response(self, response: dict) -> APIResults:
         """Parse offers list response to typed model."""
-        # Check if response contains an error
-        if "error" in response:
-            error = ApiError.model_validate(response)
-            raise ValueError(f"API Error {error.error}: {error.message}")
+        raise_for_api_error(response)
 
         try:
-            return APIResults.model_validate(response)
+            return parse(APIResults, response)
         except Exception:
             # Fallback to original response if parsing fails
             return APIResults.model_validate({"results": [response]})
@@ -110,6 +90,7 @@ class BlockTradesMixin:
         self,
         status: str | None = None,
         market: str | None = None,
+        response_format: ResponseFormat = "dict",
     ) -> PaginatedAPIResults:
         """Get a paginated list of block trades with filtering.
 
@@ -119,10 +100,13 @@ class BlockTradesMixin:
         Args:
             status: Block trade status filter (CREATED, OFFER_COLLECTION, READY_TO_EXECUTE, EXECUTING, COMPLETED, CANCELLED)
             market: Market symbol filter (e.g., BTC-USD-PERP)
+            response_format: "dict" for validated dicts, "model" for `BlockTradeDetailFullResponse`
+                models, or "raw" for the rows as received without validation. Defaults to "dict".
 
         Returns:
             Paginated list with block trade details and navigation metadata.
         """
+        check_response_format(response_format)
         params = {}
         if status:
             params["status"] = status
@@ -130,7 +114,7 @@ class BlockTradesMixin:
             params["market"] = market
 
         response = self._get_authorized(path="block-trades", params=params)
-        return self._parse_block_trade_list_response(response)
+        return self._parse_block_trade_list_response(response, response_format)
 
     def create_block_trade(self, block_trade: BlockTradeRequest) -> BlockTradeDetailFullResponse:
         """Create a parent block trade for multi-party execution.
@@ -5,9 +5,13 @@ from typing import Any
 import httpx
 
 from nexdex_py.api.models import ApiErrorSchema
+from nexdex_py.api.parsing import schema
 from nexdex_py.api.protocols import RequestHook, RetryStrategy
+from nexdex_py.common.metrics import MetricsRegistry, normalize_endpoint
 from nexdex_py.utils import raise_value_error
  
+SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "jwt", "token"})
+
 
 class HttpMethod(Enum):
     GET = "GET"
@@ -23,6 +27,7 @@ class HttpClient:
         default_timeout: float | None = None,
         retry_strategy: RetryStrategy | None = None,
         request_hook: RequestHook | None = None,
+        metrics: MetricsRegistry | None = None,
     ):
         """Initialize HTTP client with optional injection.
 
@@ -32,6 +37,7 @@ class HttpClient:
             default_timeout: Default timeout for requests in seconds.
             retry_strategy: Strategy for retrying failed requests.
             request_hook: Hook for request/response observability.
+            metrics: Registry recording per-attempt latency, end-to-end latency and retries.
         """
         if http_client is not None:
             self.client = http_client
@@ -45,6 +51,7 @@ class HttpClient:
         self.default_timeout = default_timeout
         self.retry_strategy = retry_strategy
         self.request_hook = request_hook
+        self.metrics = metrics
 
     def _prepare_request_kwargs(
         self,
@@ -73,7 +80,7 @@ class HttpClient:
         if res.status_code == 429:
             return raise_value_error("Rate limit exceeded")
         if res.status_code >= 300:
-            error = ApiErrorSchema().loads(res.text)
+            error = schema(ApiErrorSchema).loads(res.text)
             return raise_value_error(str(error))
 
         # Return successful response
@@ -94,6 +101,9 @@ class HttpClient:
     ):
         """Make HTTP request with retry logic and observability hooks.
 
+        `request_hook.on_response` is called once per attempt with the duration of
+        that attempt only; retry backoff is not included.
+
         Args:
             url: Request URL
             http_method: HTTP method
@@ -105,61 +115,72 @@ class HttpClient:
         # Use provided timeout or default
         request_timeout = timeout if timeout is not None else self.default_timeout
 
-        # Redact sensitive headers for logging
-        safe_headers = self._redact_headers(headers) if headers else None
-
-        # Call request hook
+        # Call request hook with sensitive headers redacted; skipped entirely without a hook
         if self.request_hook:
-            self.request_hook.on_request(http_method.value, url, safe_headers)
+            self.request_hook.on_request(http_method.value, url, self._redact_headers(headers) if headers else None)
 
         attempt = 0
-        start_time = time.time()
+        endpoint = normalize_endpoint(httpx.URL(url).path) if self.metrics else ""
+        call_start = time.perf_counter_ns()
 
         while True:
+            attempt_start = time.perf_counter_ns()
             try:
                 request_kwargs = self._prepare_request_kwargs(
                     http_method, url, params, payload, headers, request_timeout
                 )
                 res = self.client.request(**request_kwargs)
-
-                # Call response hook
-                if self.request_hook:
-                    duration_ms = (time.time() - start_time) * 1000
-                    self.request_hook.on_response(http_method.value, url, res.status_code, duration_ms)
-
-                # Check if we should retry
-                if self.retry_strategy and self.retry_strategy.should_retry(attempt, res, None):
-                    delay = self.retry_strategy.get_delay(attempt)
-                    time.sleep(delay)
-                    attempt += 1
-                    continue
-                else:
-                    return self._handle_response(res, url, http_method)
-
             except Exception as e:
+                self._observe("nexdex_http_request_duration_seconds", attempt_start, http_method, endpoint, "error")
                 # Check if we should retry on exception
                 if self.retry_strategy and self.retry_strategy.should_retry(attempt, None, e):
-                    delay = self.retry_strategy.get_delay(attempt)
-                    time.sleep(delay)
+                    self._sleep_before_retry(attempt, http_method, endpoint)
                     attempt += 1
                     continue
-                else:
-                    # Re-raise if no more retries
-                    raise
+                self._observe("nexdex_http_call_duration_seconds", call_start, http_method, endpoint, "error")
+                # Re-raise if no more retries
+                raise
+
+            attempt_ns = self._observe(
+                "nexdex_http_request_duration_seconds", attempt_start, http_method, endpoint, res.status_code
+            )
+
+            # Call response hook
+            if self.request_hook:
+                self.request_hook.on_response(http_method.value, url, res.status_code, attempt_ns / 1e6)
+
+            # Check if we should retry
+            if self.retry_strategy and self.retry_strategy.should_retry(attempt, res, None):
+                self._sleep_before_retry(attempt, http_method, endpoint)
+                attempt += 1
+                continue
+
+            self._observe("nexdex_http_call_duration_seconds", call_start, http_method, endpoint, res.status_code)
+            return self._handle_response(res, url, http_method)
+
+    def _observe(self, name: str, start_ns: int, http_method: HttpMethod, endpoint: str, status: int | str) -> int:
+        """Record the time elapsed since `start_ns` in histogram `name`, if metrics are enabled.
+
+        Returns:
+            int: Elapsed time in nanoseconds
+        """
+        elapsed_ns = time.perf_counter_ns() - start_ns
+        if self.metrics:
+            self.metrics.observe_ns(name, elapsed_ns, method=http_method.value, endpoint=endpoint, status=status)
+        return elapsed_ns
+
+    def _sleep_before_retry(self, attempt: int, http_method: HttpMethod, endpoint: str) -> None:
+        if self.metrics:
+            self.metrics.inc("nexdex_http_retries_total", method=http_method.value, endpoint=endpoint)
+        delay = self.retry_strategy.get_delay(attempt) if self.retry_strategy else 0
+        time.sleep(delay)
 
     def _redact_headers(self, headers: dict[str, Any]) -> dict[str, Any]:
         """Redact sensitive information from headers for logging."""
         if not headers:
             return {}
 
-        safe_headers = headers.copy()
-        sensitive_keys = ["authorization", "x-api-key", "jwt", "token"]
-
-        for key in safe_headers:
-            if key.lower() in sensitive_keys:
-                safe_headers[key] = "[REDACTED]"
-
-        return safe_headers
+        return {key: "[REDACTED]" if key.lower() in SENSITIVE_HEADERS else value for key, value in headers.items()}
 
     def get(self, api_url: str, path: str, params: dict | None = None, timeout: float | None = None) -> dict:
         return self.request(
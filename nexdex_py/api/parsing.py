@@ -0,0 +1,92 @@
+"""
+Response parsing shared by the REST clients.
+
+Validators are expensive to build: a pydantic `TypeAdapter` compiles a core schema and a
+marshmallow schema instance resolves its fields. Both are built once per type here and
+reused for every response. API errors embedded in a response body raise `ValueError`
+with the same message everywhere.
+"""
+
+import functools
+from collections.abc import Hashable
+from typing import Any, Literal, TypeVar, cast
+
+import marshmallow
+from pydantic import TypeAdapter
+
+from nexdex_py.api.generated.responses import ApiError
+
+T = TypeVar("T")
+
+# How parsed responses are returned:
+#   "dict": validated, then dumped back to dicts (the historical behaviour)
+#   "model": validated pydantic models, no dump
+#   "raw": the decoded JSON as received, not validated
+ResponseFormat = Literal["dict", "model", "raw"]
+RESPONSE_FORMATS: tuple[str, ...] = ("dict", "model", "raw")
+
+
+@functools.cache
+def type_adapter(tp: Any) -> TypeAdapter:
+    """Return the cached `TypeAdapter` of `tp`, e.g. `type_adapter(list[OrderResp])`."""
+    return TypeAdapter(tp)
+
+
+@functools.cache
+def schema(schema_cls: type[marshmallow.Schema]) -> marshmallow.Schema:
+    """Return the shared instance of a marshmallow schema class."""
+    return schema_cls()
+
+
+def load_schema(schema_cls: type[marshmallow.Schema], data: Any) -> Any:
+    """Load `data` with the shared `schema_cls` instance, ignoring unknown and missing fields."""
+    raise_for_api_error(data)
+    return schema(schema_cls).load(data, unknown=marshmallow.EXCLUDE, partial=True)
+
+
+def raise_for_api_error(response: Any) -> None:
+    """Raise ValueError if `response` is an API error body (`{"error": ..., "message": ...}`)."""
+    if isinstance(response, dict) and "error" in response:
+        error = ApiError.model_validate(response)
+        code = error.error.value if error.error is not None else response.get("error")
+        raise ValueError(f"API Error {code}: {error.message}")
+
+
+def parse(tp: type[T] | Any, data: Any) -> T:
+    """Validate `data` as `tp` with its cached adapter.
+
+    Raises:
+        ValueError: If `data` is an API error body, or a `pydantic.ValidationError` (a ValueError)
+            if it does not match `tp`
+    """
+    raise_for_api_error(data)
+    # Types are hashable; the `Any` in the annotation hides that from the cache's signature
+    return type_adapter(cast(Hashable, tp)).validate_python(data)
+
+
+def parse_results(tp: Any, results: list | None, response_format: ResponseFormat = "dict") -> list:
+    """Parse a list of result rows as `tp` in the requested `response_format`."""
+    if not results or response_format == "raw":
+        return results or []
+    models = type_adapter(list[tp]).validate_python(results)
+    if response_format == "model":
+        return models
+    return [model.model_dump() for model in models]
+
+
+def check_response_format(response_format: str) -> None:
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(f"Invalid response_format {response_format!r}, expected one of {RESPONSE_FORMATS}")
+
+
+__all__ = [
+    "RESPONSE_FORMATS",
+    "ResponseFormat",
+    "check_response_format",
+    "load_schema",
+    "parse",
+    "parse_results",
+    "raise_for_api_error",
+    "schema",
+    "type_adapter",
+]
@@ -18,7 +18,7 @@ class WebSocketConnection(Protocol):
         """Send data through the WebSocket."""
         ...
 
-    async def recv(self) -> str:
+    async def recv(self) -> str | bytes:
         """Receive data from the WebSocket."""
         ...
 
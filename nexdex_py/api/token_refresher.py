@@ -0,0 +1,159 @@
+"""
+Background JWT renewal for `NexDexApiClient`.
+
+Without a refresher, the first authorized request after the token ages past
+`JWT_REFRESH_AGE` signs and POSTs a new auth request inline. `TokenRefresher`
+renews the token on a daemon thread ahead of expiry instead, so requests only
+ever read the current `Authorization` header.
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from nexdex_py.api.api_client import NexDexApiClient
+
+# Age after which `NexDexApiClient` considers a token stale and re-authenticates inline
+JWT_REFRESH_AGE = 4 * 60
+
+
+def jwt_expiry(token: str) -> float | None:
+    """Return the `exp` claim (unix seconds) of a JWT without verifying it, or None."""
+    try:
+        payload = token.split(".")[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        exp = claims.get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+class TokenRefresher:
+    """Renew the JWT of a `NexDexApiClient` on a background thread.
+
+    The token is renewed `refresh_margin` seconds before its `exp` claim, or
+    `refresh_interval` seconds after it was issued when the token carries no
+    expiry. New tokens are swapped into the client's `Authorization` header and
+    account under a lock, then passed to every `on_refresh` callback (e.g. to
+    re-authenticate the WebSocket connection).
+
+    Args:
+        api_client (NexDexApiClient): Client whose token is renewed. Must have an account.
+        refresh_interval (float, optional): Token age in seconds that triggers renewal when the
+            expiry is unknown. Defaults to 180.
+        refresh_margin (float, optional): Seconds before `exp` to renew. Defaults to 60.
+        retry_interval (float, optional): Seconds to wait after a failed renewal. Defaults to 5.
+        on_refresh (list[Callable[[str], None]], optional): Called with each new token from the
+            refresher thread. Defaults to None.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+
+    Examples:
+        >>> from nexdex_py import NexDex
+        >>> NexDex = NexDex(env="testnet", l1_address="0x...", l2_private_key="0x...", background_auth_refresh=True)
+        >>> NexDex.token_refresher.is_running
+        True
+        >>> # Or standalone
+        >>> from nexdex_py.api.token_refresher import TokenRefresher
+        >>> refresher = TokenRefresher(NexDex.api_client)
+        >>> refresher.start()
+        >>> refresher.stop()
+    """
+
+    classname: str = "TokenRefresher"
+
+    def __init__(
+        self,
+        api_client: "NexDexApiClient",
+        refresh_interval: float = 180.0,
+        refresh_margin: float = 60.0,
+        retry_interval: float = 5.0,
+        on_refresh: list[Callable[[str], None]] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        if refresh_interval >= JWT_REFRESH_AGE:
+            raise ValueError(f"{self.classname}: refresh_interval must be below {JWT_REFRESH_AGE}s")
+        self.api_client = api_client
+        self.refresh_interval = refresh_interval
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.on_refresh: list[Callable[[str], None]] = list(on_refresh or [])
+        self.logger = logger or logging.getLogger(__name__)
+        self.last_error: Exception | None = None
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the refresher thread and register it with the api client."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.api_client.token_refresher = self
+        self._thread = threading.Thread(target=self._run, name=self.classname, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the refresher thread. Requests fall back to inline re-authentication."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        if self.api_client.token_refresher is self:
+            self.api_client.token_refresher = None
+
+    def next_refresh_at(self) -> float:
+        """Unix time at which the current token should be renewed."""
+        expiry = self._current_expiry()
+        if expiry is not None:
+            return min(expiry - self.refresh_margin, self.api_client.auth_timestamp + self.refresh_interval)
+        return self.api_client.auth_timestamp + self.refresh_interval
+
+    def is_token_expired(self) -> bool:
+        """True when the current token can no longer be used and requests must re-authenticate inline."""
+        expiry = self._current_expiry()
+        if expiry is not None:
+            return time.time() >= expiry
+        return time.time() - self.api_client.auth_timestamp > JWT_REFRESH_AGE
+
+    def refresh_now(self) -> str:
+        """Fetch a new token, swap it in and notify `on_refresh` callbacks.
+
+        Returns:
+            str: New JWT
+        """
+        token = self.api_client.fetch_auth_token()
+        self.api_client.apply_auth_token(token)
+        self.last_error = None
+        self.logger.info(f"{self.classname}: JWT renewed")
+        for callback in self.on_refresh:
+            try:
+                callback(token)
+            except Exception:
+                self.logger.exception(f"{self.classname}: on_refresh callback {callback} failed")
+        return token
+
+    def _current_expiry(self) -> float | None:
+        account = self.api_client.account
+        token = getattr(account, "jwt_token", None) if account is not None else None
+        return jwt_expiry(token) if token else None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            delay = max(0.0, self.next_refresh_at() - time.time())
+            if self._stop_event.wait(delay):
+                break
+            try:
+                self.refresh_now()
+            except Exception as e:
+                self.last_error = e
+                self.logger.exception(f"{self.classname}: JWT renewal failed, retrying in {self.retry_interval}s")
+                if self._stop_event.wait(self.retry_interval):
+                    break
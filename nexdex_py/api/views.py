@@ -0,0 +1,192 @@
+"""
+Lazily validated, read-only views over REST responses.
+
+A view keeps the decoded JSON and validates a field against its pydantic model only
+when the field is read, so a page of a thousand rows costs nothing until it is used.
+Each field's validator is built once per model and cached.
+
+Examples:
+    >>> NexDex = NexDex(env=Environment.TESTNET, l2_private_key="0x...")
+    >>> page = NexDex.api_client.fetch_orders_typed()
+    >>> page.results[0].remaining_size  # only this field of this row is validated
+    '0.5'
+    >>> page.results[0].to_model()  # full `OrderResp` when needed
+"""
+
+import functools
+from collections.abc import Iterator, Sequence
+from typing import Annotated, Any, Generic, TypeVar, overload
+
+from pydantic import BaseModel, TypeAdapter
+
+from nexdex_py.api.parsing import raise_for_api_error
+
+M = TypeVar("M", bound=BaseModel)
+
+_MISSING = object()
+
+
+@functools.cache
+def _field_adapter(model: type[BaseModel], name: str) -> TypeAdapter:
+    field = model.model_fields[name]
+    annotation: Any = Annotated[(field.annotation, *field.metadata)] if field.metadata else field.annotation
+    return TypeAdapter(annotation)
+
+
+class ModelView(Generic[M]):
+    """Read-only view of one response object as `model`, validated per field on access.
+
+    Unknown keys (the generated models allow extras) are returned as received.
+    Item access (`view["field"]`) returns the raw JSON value, as with a plain dict response.
+    """
+
+    __slots__ = ("_data", "_model", "_values")
+
+    def __init__(self, model: type[M], data: dict[str, Any]):
+        self._model = model
+        self._data = data
+        self._values: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        field = self._model.model_fields.get(name)
+        raw = self._data.get(name, _MISSING)
+        if field is None:
+            if raw is _MISSING:
+                raise AttributeError(f"{self._model.__name__} has no field {name!r}")
+            return raw
+        if raw is _MISSING:
+            value = field.get_default(call_default_factory=True)
+        else:
+            value = _field_adapter(self._model, name).validate_python(raw)
+        self._values[name] = value
+        return value
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModelView):
+            return self._model is other._model and self._data == other._data
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{self._model.__name__}View({self._data!r})"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The response object as received."""
+        return self._data
+
+    def to_model(self) -> M:
+        """Validate every field and return the full model."""
+        return self._model.model_validate(self._data)
+
+
+class ViewList(Sequence[ModelView[M]]):
+    """List of response rows, wrapped in a `ModelView` when accessed."""
+
+    __slots__ = ("_model", "_rows", "_views")
+
+    def __init__(self, model: type[M], rows: list[dict[str, Any]]):
+        self._model = model
+        self._rows = rows
+        self._views: dict[int, ModelView[M]] = {}
+
+    @overload
+    def __getitem__(self, index: int) -> ModelView[M]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[ModelView[M]]: ...
+
+    def __getitem__(self, index: int | slice) -> ModelView[M] | list[ModelView[M]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._rows)))]
+        if index < 0:
+            index += len(self._rows)
+        view = self._views.get(index)
+        if view is None:
+            view = self._views[index] = ModelView(self._model, self._rows[index])
+        return view
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[ModelView[M]]:
+        return (self[i] for i in range(len(self._rows)))
+
+    def __repr__(self) -> str:
+        return f"ViewList[{self._model.__name__}]({len(self._rows)} rows)"
+
+    @property
+    def raw(self) -> list[dict[str, Any]]:
+        """The rows as received."""
+        return self._rows
+
+    def to_models(self) -> list[M]:
+        """Validate every row and return the full models."""
+        return [self._model.model_validate(row) for row in self._rows]
+
+
+class ResponsePage(Generic[M]):
+    """List response (`results` with optional `next`/`prev` cursors) with lazily validated rows.
+
+    Item access (`page["results"]`) returns the raw JSON value, as with a plain dict response.
+    """
+
+    __slots__ = ("_data", "next", "prev", "results")
+
+    def __init__(self, model: type[M], data: dict[str, Any]):
+        self._data = data
+        self.next: str | None = data.get("next")
+        self.prev: str | None = data.get("prev")
+        self.results: ViewList[M] = ViewList(model, data.get("results") or [])
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[ModelView[M]]:
+        return iter(self.results)
+
+    def __repr__(self) -> str:
+        return f"ResponsePage(next={self.next!r}, prev={self.prev!r}, results={self.results!r})"
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The response as received."""
+        return self._data
+
+
+def view(model: type[M], data: dict[str, Any]) -> ModelView[M]:
+    """Wrap a single-object response, raising ValueError for API error bodies."""
+    raise_for_api_error(data)
+    return ModelView(model, data)
+
+
+def page(model: type[M], data: dict[str, Any]) -> ResponsePage[M]:
+    """Wrap a list response, raising ValueError for API error bodies."""
+    raise_for_api_error(data)
+    return ResponsePage(model, data)
+
+
+__all__ = ["ModelView", "ResponsePage", "ViewList", "page", "view"]
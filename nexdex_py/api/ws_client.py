@@ -4,15 +4,23 @@ import json
 import logging
 import time 
 import traceback
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sized
+from concurrent.futures import Executor
 from enum import Enum
-from typing import Any, Protocol
+from typing import Any, Protocol, cast
  
 import websockets 
 from pydantic import BaseModel
 from websockets import ClientConnection, State
 
 from nexdex_py.account.account import NexDexAccount
+from nexdex_py.api.ws_dispatch import ChannelDispatcher
+from nexdex_py.api.ws_options import WsConnectionOptions
+from nexdex_py.api.ws_reconnect import ReconnectPolicy
+from nexdex_py.api.ws_rpc import RpcCorrelator
+from nexdex_py.api.ws_structs import decode_ws_data
+from nexdex_py.common.metrics import MetricsRegistry
+from nexdex_py.common.trace_logging import ChannelTracer
 from nexdex_py.constants import WS_TIMEOUT
 from nexdex_py.environment import Environment
 
@@ -35,7 +43,7 @@ class WebSocketConnection(Protocol):
         """Send data to the connection."""
         ...
 
-    async def recv(self) -> str:
+    async def recv(self) -> str | bytes:
         """Receive data from the connection."""
         ...
 
@@ -106,6 +114,35 @@ def _get_ws_channel_from_name(message_channel: str) -> NexDexWebsocketChannel |
     return None
 
 
+# Payload fields carrying the server-side event time in milliseconds, in order of preference
+_SERVER_TIMESTAMP_FIELDS = ("last_updated_at", "updated_at", "created_at", "timestamp")
+
+
+def _server_timestamp_ms(message: dict) -> int | None:
+    data = message.get("params", {}).get("data")
+    if data is None or isinstance(data, list):
+        data = message.get("data")
+    if data is None:
+        return None
+    # Dict payloads, or typed structs when `typed_messages` is enabled
+    get = data.get if isinstance(data, dict) else lambda field: getattr(data, field, None)
+    for field in _SERVER_TIMESTAMP_FIELDS:
+        value = get(field)
+        if isinstance(value, int) and value > 0:
+            return value
+    return None
+
+
+def _recv_queue_depth(ws: Any) -> int | None:
+    """Frames buffered by the connection and not yet received, if the connection exposes it."""
+    pending = getattr(ws, "pending", None)
+    if callable(pending):
+        depth = pending()
+        return depth if isinstance(depth, int) else None
+    frames = getattr(getattr(ws, "recv_messages", None), "frames", None)
+    return len(frames) if isinstance(frames, Sized) else None
+
+
 class NexDexWebsocketClient:
     """Class to interact with NexDex WebSocket JSON-RPC API.
         Initialized along with `NexDex` class.
@@ -122,6 +159,24 @@ class NexDexWebsocketClient:
         validate_messages (bool, optional): Enable pydantic message validation. Requires pydantic. Defaults to False.
         ping_interval (float, optional): WebSocket ping interval in seconds. None uses websockets default. Defaults to None.
         disable_reconnect (bool, optional): Disable automatic reconnection for tight simulation control. Defaults to False.
+        metrics (MetricsRegistry, optional): Registry for recv-to-callback latency, server lag and queue depth.
+            Defaults to None.
+        typed_messages (bool, optional): Decode `params.data` of the BBO, order book, trades, fills, orders
+            and positions channels into the slotted structs of `ws_structs` before callbacks run.
+            Defaults to False.
+        trace_sample_every (int, optional): Log one in `trace_sample_every` messages of each channel at DEBUG.
+            0 disables per-message tracing entirely. Nothing is formatted unless DEBUG is enabled. Defaults to 1.
+        reconnect_policy (ReconnectPolicy, optional): Jittered exponential backoff between reconnect attempts.
+            Defaults to None (`ReconnectPolicy()`: 0.5s doubling up to 30s, retried until closed).
+        warm_standby (bool, optional): Keep a second connection authenticated and subscribed to every channel,
+            promoted without a reconnect when the primary connection fails. Defaults to False.
+        concurrent_callbacks (bool, optional): Run callbacks of different channels concurrently, each channel
+            in order in its own task, instead of one at a time in the reader. Defaults to False.
+        callback_queue_size (int, optional): Messages buffered per channel in concurrent mode. Defaults to 1024.
+        max_offloaded_callbacks (int, optional): Callbacks of `offload_channel` channels running at once.
+            Defaults to 4.
+        connection_options (WsConnectionOptions, optional): Compression, frame and queue limits of the connection
+            and raw bytes frame parsing. Defaults to None (`websockets` defaults).
 
     Examples:
         >>> from nexdex_py import NexDex
@@ -138,6 +193,11 @@ class NexDexWebsocketClient:
         ...                                   reader_sleep_on_error=0, reader_sleep_on_no_connection=0)
         >>> # With typed message validation
         >>> ws_client = NexDexWebsocketClient(env=Environment.TESTNET, validate_messages=True)
+        >>> # With payloads decoded to typed structs, e.g. message["params"]["data"].bid is a Decimal
+        >>> ws_client = NexDexWebsocketClient(env=Environment.TESTNET, typed_messages=True)
+        >>> # With a warm standby connection and a bounded reconnect backoff
+        >>> ws_client = NexDexWebsocketClient(env=Environment.TESTNET, warm_standby=True,
+        ...                                   reconnect_policy=ReconnectPolicy(max_delay=5.0))
     """
 
     classname: str = "NexDexWebsocketClient"
@@ -155,6 +215,15 @@ class NexDexWebsocketClient:
         validate_messages: bool = False,
         ping_interval: float | None = None,
         disable_reconnect: bool = False,
+        metrics: MetricsRegistry | None = None,
+        typed_messages: bool = False,
+        trace_sample_every: int = 1,
+        reconnect_policy: ReconnectPolicy | None = None,
+        warm_standby: bool = False,
+        concurrent_callbacks: bool = False,
+        callback_queue_size: int = 1024,
+        max_offloaded_callbacks: int = 4,
+        connection_options: WsConnectionOptions | None = None,
     ):
         self.env = env
         self.api_url = ws_url_override or f"wss://ws.api.{self.env}.NexDex.trade/v1"
@@ -174,10 +243,38 @@ class NexDexWebsocketClient:
 
         # Heartbeat and reconnection control
         self.ping_interval = ping_interval
+        self.connection_options = connection_options or WsConnectionOptions()
+        self._recv_raw = self.connection_options.raw_frames
         self.disable_reconnect = disable_reconnect
+        self.reconnect_policy = reconnect_policy or ReconnectPolicy()
+        self.warm_standby = warm_standby
+        self._reconnecting = False
+        self._closed = False
+        # Spare authenticated and subscribed connection promoted when the primary fails
+        self._standby: WebSocketConnection | ClientConnection | None = None
+        self._standby_channels: dict[str, bool] = {}
+        self._standby_task: asyncio.Task | None = None
 
         # Optional message validation
         self.validate_messages = validate_messages and TYPED_MODELS_AVAILABLE
+        self.typed_messages = typed_messages
+
+        # Per-message DEBUG tracing, sampled per channel; None when disabled
+        self._trace = ChannelTracer.create(self.logger, trace_sample_every)
+
+        self.metrics = metrics
+        self._received_ns = 0
+        # JSON-RPC ids and awaited responses
+        self._rpc = RpcCorrelator()
+
+        # Created for concurrent callbacks, or on the first `offload_channel` call
+        self._callback_queue_size = callback_queue_size
+        self._max_offloaded_callbacks = max_offloaded_callbacks
+        self._dispatcher: ChannelDispatcher | None = None
+        if concurrent_callbacks:
+            self._dispatcher = self._new_dispatcher(concurrent=True)
+        # Loop owning the connection; lets other threads schedule re-authentication
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         if auto_start_reader:
             try:
@@ -214,22 +311,10 @@ class NexDexWebsocketClient:
         """
 
         try:
+            self._loop = asyncio.get_running_loop()
+            self._closed = False
             self.subscribed_channels = {}
-            extra_headers = {}
-            if self.account:
-                extra_headers.update({"Authorization": f"Bearer {self.account.jwt_token}"})
-
-            # Use custom connector if provided, otherwise use default websockets.connect
-            if self.connector is not None:
-                self.ws = await self.connector(self.api_url, extra_headers)
-            else:
-                connect_kwargs: dict[str, Any] = {
-                    "additional_headers": extra_headers,
-                }
-                if self.ping_interval is not None:
-                    connect_kwargs["ping_interval"] = int(self.ping_interval)
-
-                self.ws = await websockets.connect(self.api_url, **connect_kwargs)
+            self.ws = await self._open_connection()
 
             self.logger.info(f"{self.classname}: Connected to {self.api_url}")
 
@@ -250,6 +335,9 @@ class NexDexWebsocketClient:
             self.logger.exception(f"{self.classname}: traceback:{traceback.format_exc()}")
             self.ws = None
 
+        if self.warm_standby and self.ws is not None:
+            self._ensure_standby()
+
         # Check connection state - handle both websockets.State and custom connection states
         is_connected = False
         if self.ws is not None:
@@ -257,6 +345,23 @@ class NexDexWebsocketClient:
 
         return is_connected
 
+    async def _open_connection(self) -> WebSocketConnection | ClientConnection:
+        """Open a new connection to `api_url`, with the JWT header if an account is set."""
+        extra_headers = {}
+        if self.account:
+            extra_headers.update({"Authorization": f"Bearer {self.account.jwt_token}"})
+
+        # Use custom connector if provided, otherwise use default websockets.connect
+        if self.connector is not None:
+            return await self.connector(self.api_url, extra_headers)
+        connect_kwargs: dict[str, Any] = {
+            "additional_headers": extra_headers,
+        }
+        if self.ping_interval is not None:
+            connect_kwargs["ping_interval"] = int(self.ping_interval)
+        connect_kwargs.update(self.connection_options.connect_kwargs())
+        return await websockets.connect(self.api_url, **connect_kwargs)
+
     async def close(self):
         """Close the WebSocket connection and clean up resources.
 
@@ -279,6 +384,11 @@ class NexDexWebsocketClient:
         await self._close_connection()
 
     async def _close_connection(self):
+        self._closed = True
+        self._rpc.fail_all(ConnectionError(f"{self.classname}: Connection closed before the response"))
+        await self._close_standby()
+        if self._dispatcher is not None:
+            await self._dispatcher.close()
         try:
             # Cancel reader task if it exists
             if self._reader_task and not self._reader_task.done():
@@ -300,22 +410,124 @@ class NexDexWebsocketClient:
         if self.disable_reconnect:
             self.logger.info(f"{self.classname}: Reconnection disabled, skipping...")
             return
+        if self._reconnecting:
+            # Reader and sender can both detect the failure; one reconnect is enough
+            return
 
+        self._reconnecting = True
         try:
             self.logger.info(f"{self.classname}: Reconnect websocket...")
-            await self._close_connection()
-            await self.connect()
-            await self._resubscribe()
+            await self._close_socket()
+            if await self._promote_standby():
+                return
+            failures = 0
+            while not self._closed:
+                if await self.connect():
+                    await self._resubscribe()
+                    return
+                failures += 1
+                if not self.reconnect_policy.should_retry(failures):
+                    self.logger.error(f"{self.classname}: Reconnect failed after {failures} attempts, giving up")
+                    return
+                delay = self.reconnect_policy.get_delay(failures - 1)
+                self.logger.warning(f"{self.classname}: Reconnect attempt {failures} failed, retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
         except Exception:
             self.logger.exception(f"{self.classname}: Reconnect failed {traceback.format_exc()}")
+        finally:
+            self._reconnecting = False
+
+    async def _close_socket(self) -> None:
+        """Close the primary connection only; the reader task keeps running and picks up the next one."""
+        ws, self.ws = self.ws, None
+        self._rpc.fail_all(ConnectionError(f"{self.classname}: Connection closed before the response"))
+        if ws is not None:
+            with contextlib.suppress(Exception):
+                await ws.close()
 
     async def _resubscribe(self):
         if self.ws and self.ws.state == State.OPEN:
-            for channel_name in self.callbacks:
-                await self._subscribe_to_channel_by_name(channel_name)
+            channel_names = list(self.callbacks)
+            await self._subscribe_all(self.ws, channel_names)
+            if channel_names:
+                self.logger.info(f"{self.classname}: Resubscribed {len(channel_names)} channels")
         else:
             self.logger.warning(f"{self.classname}: Resubscribe - No connection")
 
+    async def _subscribe_all(self, ws: WebSocketConnection | ClientConnection, channel_names: list[str]) -> None:
+        """Send every subscribe request at once without waiting for acknowledgements in between."""
+        if channel_names:
+            await asyncio.gather(*(ws.send(self._subscribe_message(name)) for name in channel_names))
+
+    def _ensure_standby(self) -> None:
+        if self._standby is None and (self._standby_task is None or self._standby_task.done()):
+            self._standby_task = asyncio.create_task(self._run_standby())
+
+    async def _run_standby(self) -> None:
+        """Open, authenticate and subscribe the standby connection, then drain it until promoted."""
+        standby = None
+        try:
+            standby = await self._open_connection()
+            if self.account:
+                await self._send_auth_id(standby, self.account.jwt_token)
+            self._standby_channels = {}
+            await self._subscribe_all(standby, list(self.callbacks))
+            self._standby = standby
+            self.logger.info(f"{self.classname}: Warm standby connected to {self.api_url}")
+            while True:
+                # Only acknowledgements matter; market data is dropped unparsed so the socket never backs up
+                frame = await standby.recv()
+                if ('"id"' not in frame) if isinstance(frame, str) else (b'"id"' not in frame):
+                    continue
+                message = json.loads(frame)
+                if "id" in message:
+                    channel = message.get("result", {}).get("channel")
+                    if channel:
+                        self._standby_channels[channel] = True
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger.warning(f"{self.classname}: Warm standby lost, it is reopened on the next reconnect")
+            if self._standby is standby:
+                self._standby = None
+            if standby is not None:
+                with contextlib.suppress(Exception):
+                    await standby.close()
+
+    async def _promote_standby(self) -> bool:
+        """Make the warm standby the primary connection; returns False if there is none."""
+        standby = self._standby
+        if standby is None:
+            return False
+        self._standby = None
+        if self._standby_task is not None:
+            self._standby_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await self._standby_task
+            self._standby_task = None
+        if not self._is_open(standby):
+            return False
+        self.ws = standby
+        self.subscribed_channels = self._standby_channels
+        self._standby_channels = {}
+        self.logger.info(f"{self.classname}: Promoted warm standby connection")
+        # Channels registered after the standby subscribed
+        missing = [name for name in self.callbacks if name not in self.subscribed_channels]
+        await self._subscribe_all(standby, missing)
+        self._ensure_standby()
+        return True
+
+    async def _close_standby(self) -> None:
+        task, self._standby_task = self._standby_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+        standby, self._standby = self._standby, None
+        if standby is not None:
+            with contextlib.suppress(Exception):
+                await standby.close()
+
     async def _send_auth_id(
         self,
         websocket: WebSocketConnection | ClientConnection,
@@ -327,7 +539,7 @@ class NexDexWebsocketClient:
         await websocket.send(
             json.dumps(
                 {
-                    "id": int(time.time() * 1_000_000),
+                    "id": self._rpc.next_id(),
                     "jsonrpc": "2.0",
                     "method": "auth",
                     "params": {"bearer": NexDex_jwt},
@@ -335,8 +547,38 @@ class NexDexWebsocketClient:
             )
         )
 
+    async def reauthenticate(self, jwt_token: str) -> bool:
+        """Send a renewed JWT over the open connection, and the warm standby, without reconnecting.
+
+        Args:
+            jwt_token (str): New JWT
+
+        Returns:
+            bool: True if the auth message was sent.
+        """
+        if self.ws is None or not self._is_connection_open():
+            return False
+        await self._send_auth_id(self.ws, jwt_token)
+        if self._standby is not None:
+            with contextlib.suppress(Exception):
+                await self._send_auth_id(self._standby, jwt_token)
+        self.logger.info(f"{self.classname}: Re-authenticated to {self.api_url}")
+        return True
+
+    def reauthenticate_threadsafe(self, jwt_token: str) -> None:
+        """Schedule `reauthenticate` on the connection's event loop from any thread.
+
+        Used as a `TokenRefresher` callback; does nothing if the client never connected
+        or its loop has stopped.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed() or not loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self.reauthenticate(jwt_token), loop)
+
     def _check_subscribed_channel(self, message: dict) -> None:
         if "id" in message:
+            self._rpc.resolve(message)
             channel_subscribed: str | None = message.get("result", {}).get("channel")
             if channel_subscribed:
                 self.logger.info(f"{self.classname}: Subscribed to channel:{channel_subscribed}")
@@ -344,24 +586,32 @@ class NexDexWebsocketClient:
 
     def _is_connection_open(self) -> bool:
         """Check if WebSocket connection is open - handle both websockets and custom connections."""
-        if not self.ws:
+        return self._is_open(self.ws)
+
+    @staticmethod
+    def _is_open(ws: WebSocketConnection | ClientConnection | None) -> bool:
+        if not ws:
             return False
 
-        if hasattr(self.ws.state, "value"):
+        if hasattr(ws.state, "value"):
             # websockets.State enum
-            return self.ws.state == State.OPEN
+            return ws.state == State.OPEN
         else:
             # Custom connection - check if state indicates open
-            state_val = getattr(self.ws.state, "value", None) if hasattr(self.ws, "state") else None
-            return state_val == "OPEN" or (state_val is None and hasattr(self.ws, "recv"))
+            state_val = getattr(ws.state, "value", None) if hasattr(ws, "state") else None
+            return state_val == "OPEN" or (state_val is None and hasattr(ws, "recv"))
 
     async def _receive_and_process_message(self) -> None:
         """Receive and process a single WebSocket message."""
         if self.ws is None:
             raise RuntimeError("WebSocket connection must be established before receiving messages")
-        response = await asyncio.wait_for(self.ws.recv(), timeout=self.ws_timeout)
-        if isinstance(response, bytes):
-            response = response.decode("utf-8")
+        response: str | bytes
+        if self._recv_raw and isinstance(self.ws, ClientConnection):
+            # Text frames as UTF-8 bytes; json.loads parses them without an intermediate str
+            response = await asyncio.wait_for(self.ws.recv(decode=False), timeout=self.ws_timeout)
+        else:
+            response = await asyncio.wait_for(self.ws.recv(), timeout=self.ws_timeout)
+        self._received_ns = time.perf_counter_ns()
         await self._process_message(response)
 
     async def _handle_message_receive_error(self, error: Exception) -> None:
@@ -397,37 +647,147 @@ class NexDexWebsocketClient:
             self.logger.exception(f"{self.classname}: Unexpected error in reader task: {traceback.format_exc()}")
             raise
 
-    async def _process_message(self, response: str) -> None:
-        """Process a single WebSocket message."""
+    async def _process_message(self, response: str | bytes) -> None:
+        """Process a single WebSocket message, text or UTF-8 bytes."""
+        received_ns = self._take_received_ns()
         message = json.loads(response)
         self._check_subscribed_channel(message)
+        trace = self._trace
         if "params" not in message:
-            self.logger.debug(f"{self.classname}: Non-actionable message:{message}")
+            if trace is not None:
+                trace.trace("", "%s: Non-actionable message:%s", self.classname, message)
         else:
             message_channel = message["params"].get("channel")
             ws_channel: NexDexWebsocketChannel | None = _get_ws_channel_from_name(message_channel)
+            if trace is not None and not trace.enabled_for(message_channel):
+                trace = None
 
             # Optional WebSocket RPC message validation
             if self.validate_messages:
-                validated_message = validate_ws_message(message)
-                if validated_message is not None:
-                    # Use validated message structure
-                    message = validated_message.model_dump() if hasattr(validated_message, "model_dump") else message
-                    self.logger.debug(f"{self.classname}: WebSocket RPC message validated")
-                else:
-                    self.logger.warning(f"{self.classname}: WebSocket RPC message validation failed")
+                self._validate_message(message, message_channel, trace)
+
+            if self.typed_messages and ws_channel is not None:
+                self._decode_data(message, message_channel)
 
             if ws_channel is None:
-                self.logger.debug(f"{self.classname}: unregistered channel:{message_channel} message:{message}")
+                if trace is not None:
+                    trace.log(
+                        message_channel,
+                        "%s: unregistered channel:%s message:%s",
+                        self.classname,
+                        message_channel,
+                        message,
+                    )
             elif message_channel in self.callbacks:
-                self.logger.debug(
-                    f"{self.classname}: channel:{message_channel}"
-                    f" callback:{self.callbacks[message_channel]}"
-                    f" message:{message}"
-                )
-                await self.callbacks[message_channel](ws_channel, message)
+                callback = self.callbacks[message_channel]
+                if trace is not None:
+                    trace.log(
+                        message_channel,
+                        "%s: channel:%s callback:%s message:%s",
+                        self.classname,
+                        message_channel,
+                        callback,
+                        message,
+                    )
+                await self._dispatch(message_channel, ws_channel, message, received_ns)
             else:
-                self.logger.info(f"{self.classname}: Non-callback channel:{message_channel}")
+                self.logger.info("%s: Non-callback channel:%s", self.classname, message_channel)
+
+    def _take_received_ns(self) -> int:
+        """Receive time of the frame being processed, 0 without metrics."""
+        if not self.metrics:
+            return 0
+        # Injected messages are timed from here
+        received_ns = self._received_ns or time.perf_counter_ns()
+        self._received_ns = 0
+        return received_ns
+
+    def _validate_message(self, message: dict, message_channel: str, trace: ChannelTracer | None) -> None:
+        # The validated model only confirms the structure; callbacks keep the decoded dict
+        if validate_ws_message(message) is None:
+            self.logger.warning(f"{self.classname}: WebSocket RPC message validation failed")
+        elif trace is not None:
+            trace.log(message_channel, "%s: WebSocket RPC message validated", self.classname)
+
+    async def _dispatch(
+        self,
+        message_channel: str,
+        ws_channel: NexDexWebsocketChannel,
+        message: dict,
+        received_ns: int,
+    ) -> None:
+        if self._dispatcher is not None:
+            if self.metrics:
+                self._record_receive_metrics(message_channel, message)
+            callback = self.callbacks[message_channel]
+            await self._dispatcher.dispatch(message_channel, callback, ws_channel, message, received_ns)
+        elif self.metrics:
+            await self._dispatch_with_metrics(message_channel, ws_channel, message, received_ns)
+        else:
+            await self.callbacks[message_channel](ws_channel, message)
+
+    def _decode_data(self, message: dict, message_channel: str) -> None:
+        params = message["params"]
+        try:
+            params["data"] = decode_ws_data(message_channel.split(".", 1)[0], params.get("data"))
+        except Exception:
+            self.logger.warning(f"{self.classname}: Cannot decode data of channel:{message_channel}, passing it raw")
+
+    async def _dispatch_with_metrics(
+        self,
+        message_channel: str,
+        ws_channel: NexDexWebsocketChannel,
+        message: dict,
+        received_ns: int,
+    ) -> None:
+        metrics = self._record_receive_metrics(message_channel, message)
+        callback_start = time.perf_counter_ns()
+        metrics.observe_ns("nexdex_ws_recv_to_callback_seconds", callback_start - received_ns, channel=message_channel)
+        await self.callbacks[message_channel](ws_channel, message)
+        metrics.observe_ns(
+            "nexdex_ws_callback_duration_seconds", time.perf_counter_ns() - callback_start, channel=message_channel
+        )
+
+    def _record_receive_metrics(self, message_channel: str, message: dict) -> MetricsRegistry:
+        metrics = cast(MetricsRegistry, self.metrics)
+        metrics.inc("nexdex_ws_messages_total", channel=message_channel)
+        server_ts = _server_timestamp_ms(message)
+        if server_ts is not None:
+            metrics.observe("nexdex_ws_server_lag_seconds", time.time() - server_ts / 1000, channel=message_channel)
+        if self.ws is not None:
+            depth = _recv_queue_depth(self.ws)
+            if depth is not None:
+                metrics.set_gauge("nexdex_ws_recv_queue_depth", depth)
+        return metrics
+
+    def _new_dispatcher(self, concurrent: bool) -> ChannelDispatcher:
+        return ChannelDispatcher(
+            logger=self.logger,
+            concurrent=concurrent,
+            queue_size=self._callback_queue_size,
+            max_in_flight=self._max_offloaded_callbacks,
+            metrics=self.metrics,
+        )
+
+    def offload_channel(self, channel_name: str, executor: Executor | None = None) -> None:
+        """Run the callback of `channel_name` in a thread or process executor instead of the event loop.
+
+        The callback must be a plain function `callback(ws_channel, message)`. In the default
+        serial mode the reader waits for it without blocking the event loop; with
+        `concurrent_callbacks=True` other channels keep being delivered meanwhile.
+
+        Args:
+            channel_name (str): Exact channel name, e.g. "trades.BTC-USD-PERP"
+            executor (Executor, optional): Executor to run in. Defaults to None (the loop's default thread pool).
+        """
+        if self._dispatcher is None:
+            self._dispatcher = self._new_dispatcher(concurrent=False)
+        self._dispatcher.offload(channel_name, executor)
+
+    async def drain_callbacks(self) -> None:
+        """Wait until every queued message has been delivered to its callback (concurrent mode)."""
+        if self._dispatcher is not None:
+            await self._dispatcher.drain()
 
     async def pump_once(self) -> bool:
         """Manually pump one message from the WebSocket connection.
@@ -447,16 +807,15 @@ class NexDexWebsocketClient:
             self.logger.exception(f"{self.classname}: Error in pump_once: {traceback.format_exc()}")
             return False
         else:
-            if isinstance(response, bytes):
-                response = response.decode("utf-8")
+            self._received_ns = time.perf_counter_ns()
             await self._process_message(response)
             return True
 
-    async def inject(self, message: str) -> None:
+    async def inject(self, message: str | bytes) -> None:
         """Inject a raw message string into the message processing pipeline.
 
         Args:
-            message: Raw JSON string to process as if received from WebSocket.
+            message: Raw JSON string or UTF-8 bytes to process as if received from WebSocket.
         """
         try:
             await self._process_message(message)
@@ -481,6 +840,7 @@ class NexDexWebsocketClient:
         channel: NexDexWebsocketChannel,
         callback: Callable,
         params: dict | None = None,
+        ack_timeout: float | None = None,
     ) -> None:
         """Subscribe to a websocket channel with optional parameters.
             Callback function is invoked when a message is received.
@@ -489,6 +849,12 @@ class NexDexWebsocketClient:
             channel (NexDexWebsocketChannel): Channel to subscribe
             callback (Callable): Callback function
             params (Optional[dict], optional): Parameters for the channel. Defaults to None.
+            ack_timeout (float, optional): Wait up to this many seconds for the subscription to be
+                acknowledged; requires the reader to be running. Defaults to None (do not wait).
+
+        Raises:
+            asyncio.TimeoutError: If `ack_timeout` is set and no acknowledgement arrives in time
+            RpcError: If the server rejects the subscription
 
         Examples:
         >>> from nexdex_py import NexDex
@@ -513,12 +879,13 @@ class NexDexWebsocketClient:
         channel_name = channel.value.format(**params)
         self.callbacks[channel_name] = callback
         self.logger.info(f"{self.classname}: Subscribe channel:{channel_name} params:{params} callback:{callback}")
-        await self._subscribe_to_channel_by_name(channel_name)
+        await self._subscribe_to_channel_by_name(channel_name, ack_timeout)
 
     async def subscribe_by_name(
         self,
         channel_name: str,
         callback: Callable | None = None,
+        ack_timeout: float | None = None,
     ) -> None:
         """Subscribe to a channel by exact name string.
 
@@ -528,12 +895,60 @@ class NexDexWebsocketClient:
         Args:
             channel_name: Exact channel name (e.g., "bbo.BTC-USD-PERP")
             callback: Optional callback function. If provided, registers the callback.
+            ack_timeout: Seconds to wait for the acknowledgement, see `subscribe`. None does not wait.
         """
         if callback is not None:
             self.callbacks[channel_name] = callback
             self.logger.info(f"{self.classname}: Subscribe by name channel:{channel_name} callback:{callback}")
 
-        await self._subscribe_to_channel_by_name(channel_name)
+        await self._subscribe_to_channel_by_name(channel_name, ack_timeout)
+
+    async def subscribe_many(
+        self,
+        channels: Mapping[str, Callable | None],
+        ack_timeout: float = 10.0,
+    ) -> dict[str, bool]:
+        """Subscribe to many channels at once and wait for all acknowledgements.
+
+        Every request is sent before any reply is awaited, so subscribing hundreds of
+        channels costs about one round trip. Replies are matched to requests by id.
+        Requires the reader to be running.
+
+        Args:
+            channels (Mapping[str, Callable | None]): Exact channel names to their callback (None keeps
+                the registered callback, if any)
+            ack_timeout (float, optional): Seconds to wait for all acknowledgements. Defaults to 10.0.
+
+        Returns:
+            dict[str, bool]: Whether each channel was acknowledged; False for rejected or timed-out channels
+
+        Examples:
+            >>> acks = await ws_client.subscribe_many({f"bbo.{m}": on_bbo for m in markets})
+            >>> missing = [channel for channel, ok in acks.items() if not ok]
+        """
+        requests: dict[str, tuple[int, asyncio.Future]] = {}
+        for channel_name, callback in channels.items():
+            if callback is not None:
+                self.callbacks[channel_name] = callback
+            request_id = self._rpc.next_id()
+            requests[channel_name] = (request_id, self._rpc.expect(request_id))
+        self.logger.info(f"{self.classname}: Subscribe {len(requests)} channels")
+        for channel_name, (request_id, _) in requests.items():
+            await self._send(self._subscribe_message(channel_name, request_id))
+        if self._standby is not None:
+            with contextlib.suppress(Exception):
+                await self._subscribe_all(self._standby, list(requests))
+
+        results = await asyncio.gather(
+            *(self._rpc.wait(request_id, reply, ack_timeout) for request_id, reply in requests.values()),
+            return_exceptions=True,
+        )
+        acks = {}
+        for channel_name, result in zip(requests, results, strict=True):
+            acks[channel_name] = not isinstance(result, BaseException)
+            if not acks[channel_name]:
+                self.logger.warning(f"{self.classname}: Subscribe channel:{channel_name} not acknowledged: {result!r}")
+        return acks
 
     async def unsubscribe_by_name(self, channel_name: str) -> None:
         """Unsubscribe from a channel by exact name string.
@@ -554,9 +969,13 @@ class NexDexWebsocketClient:
             "jsonrpc": "2.0",
             "method": "unsubscribe",
             "params": {"channel": channel_name},
-            "id": str(int(time.time() * 1_000_000)),
+            "id": self._rpc.next_id(),
         }
         await self._send(json.dumps(unsubscribe_message))
+        if self._standby is not None:
+            self._standby_channels.pop(channel_name, None)
+            with contextlib.suppress(Exception):
+                await self._standby.send(json.dumps(unsubscribe_message))
 
     def get_subscriptions(self) -> dict[str, bool]:
         """Get current subscription map.
@@ -622,15 +1041,23 @@ class NexDexWebsocketClient:
     async def _subscribe_to_channel_by_name(
         self,
         channel_name: str,
+        ack_timeout: float | None = None,
     ) -> None:
-        await self._send(
-            json.dumps(
-                {
-                    "id": int(time.time() * 1_000_000),
-                    "jsonrpc": "2.0",
-                    "method": "subscribe",
-                    "params": {"channel": channel_name},
-                }
-            )
+        request_id = self._rpc.next_id()
+        reply = self._rpc.expect(request_id) if ack_timeout is not None else None
+        await self._send(self._subscribe_message(channel_name, request_id))
+        if self._standby is not None:
+            with contextlib.suppress(Exception):
+                await self._standby.send(self._subscribe_message(channel_name))
+        if reply is not None:
+            await self._rpc.wait(request_id, reply, ack_timeout)
+
+    def _subscribe_message(self, channel_name: str, request_id: int | None = None) -> str:
+        return json.dumps(
+            {
+                "id": request_id if request_id is not None else self._rpc.next_id(),
+                "jsonrpc": "2.0",
+                "method": "subscribe",
+                "params": {"channel": channel_name},
+            }
         )
-
@@ -0,0 +1,155 @@
+"""
+Callback dispatch for `NexDexWebsocketClient`.
+
+By default callbacks run inline in the reader, one message at a time. `ChannelDispatcher`
+adds two opt-in modes:
+
+- concurrent: each channel gets a bounded queue drained by its own task, so a slow
+  `trades` callback no longer delays `orders`, while messages of one channel are still
+  delivered in order.
+- offloaded: callbacks of designated channels are plain functions run in a thread or
+  process executor, with a limit on how many run at once across all channels.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+import traceback
+from collections.abc import Callable
+from concurrent.futures import Executor
+from typing import Any
+
+from nexdex_py.common.metrics import MetricsRegistry
+
+# Queued item: callback, ws channel, message, receive time in ns (0 if untimed)
+_Item = tuple[Callable, Any, dict, int]
+
+
+class ChannelDispatcher:
+    """Runs WebSocket callbacks concurrently across channels, in order within each channel.
+
+    Args:
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        concurrent (bool, optional): Queue messages per channel and run each channel in its own task.
+            If False, callbacks run inline and only offloading applies. Defaults to True.
+        queue_size (int, optional): Messages buffered per channel; the reader waits when a channel's
+            queue is full. Defaults to 1024.
+        max_in_flight (int, optional): Offloaded callbacks running at once across all channels. Defaults to 4.
+        metrics (MetricsRegistry, optional): Records `nexdex_ws_recv_to_callback_seconds` and
+            `nexdex_ws_callback_duration_seconds`. Defaults to None.
+
+    Examples:
+        >>> ws_client = NexDexWebsocketClient(env=Environment.TESTNET, concurrent_callbacks=True)
+        >>> # `compute_signal(ws_channel, message)` is a plain function run in a worker thread
+        >>> ws_client.offload_channel("trades.BTC-USD-PERP")
+        >>> await ws_client.subscribe(NexDexWebsocketChannel.TRADES, compute_signal, {"market": "BTC-USD-PERP"})
+    """
+
+    classname: str = "ChannelDispatcher"
+
+    def __init__(
+        self,
+        logger: logging.Logger | None = None,
+        concurrent: bool = True,
+        queue_size: int = 1024,
+        max_in_flight: int = 4,
+        metrics: MetricsRegistry | None = None,
+    ):
+        if queue_size < 1 or max_in_flight < 1:
+            raise ValueError(f"queue_size and max_in_flight must be >= 1, got {queue_size}, {max_in_flight}")
+        self.logger = logger or logging.getLogger(__name__)
+        self.concurrent = concurrent
+        self.queue_size = queue_size
+        self.max_in_flight = max_in_flight
+        self.metrics = metrics
+        self._queues: dict[str, asyncio.Queue[_Item]] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        # Channel name to executor; None runs in the loop's default thread pool
+        self._offloaded: dict[str, Executor | None] = {}
+        self._in_flight: asyncio.Semaphore | None = None
+
+    def offload(self, channel_name: str, executor: Executor | None = None) -> None:
+        """Run callbacks of `channel_name` in `executor` instead of the event loop.
+
+        The callback must be a plain function `callback(ws_channel, message)`; with a
+        `ProcessPoolExecutor` it and the message must be picklable.
+
+        Args:
+            channel_name (str): Exact channel name, e.g. "trades.BTC-USD-PERP"
+            executor (Executor, optional): Executor to run in. Defaults to None (the loop's default thread pool).
+        """
+        self._offloaded[channel_name] = executor
+
+    def is_offloaded(self, channel_name: str) -> bool:
+        return channel_name in self._offloaded
+
+    async def dispatch(
+        self, channel_name: str, callback: Callable, ws_channel: Any, message: dict, received_ns: int = 0
+    ) -> None:
+        """Deliver `message` to `callback`, queued behind earlier messages of the same channel."""
+        if not self.concurrent:
+            await self._run(channel_name, (callback, ws_channel, message, received_ns))
+            return
+        queue = self._queues.get(channel_name)
+        if queue is None:
+            queue = self._queues[channel_name] = asyncio.Queue(self.queue_size)
+            self._workers[channel_name] = asyncio.create_task(self._work(channel_name, queue))
+        await queue.put((callback, ws_channel, message, received_ns))
+
+    def pending(self, channel_name: str | None = None) -> int:
+        """Messages queued but not yet delivered, for one channel or in total."""
+        if channel_name is not None:
+            queue = self._queues.get(channel_name)
+            return queue.qsize() if queue is not None else 0
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been delivered."""
+        await asyncio.gather(*(queue.join() for queue in list(self._queues.values())))
+
+    async def close(self) -> None:
+        """Stop all channel tasks; queued messages are dropped."""
+        workers = list(self._workers.values())
+        for worker in workers:
+            worker.cancel()
+        for worker in workers:
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+        self._workers.clear()
+        self._queues.clear()
+
+    async def _work(self, channel_name: str, queue: asyncio.Queue[_Item]) -> None:
+        while True:
+            item = await queue.get()
+            try:
+                await self._run(channel_name, item)
+            except Exception:
+                # A failing callback must not stop delivery of the channel's next messages
+                self.logger.exception(
+                    f"{self.classname}: Callback of channel:{channel_name} failed {traceback.format_exc()}"
+                )
+            finally:
+                queue.task_done()
+
+    async def _run(self, channel_name: str, item: _Item) -> None:
+        callback, ws_channel, message, received_ns = item
+        metrics = self.metrics
+        start = time.perf_counter_ns()
+        if metrics and received_ns:
+            metrics.observe_ns("nexdex_ws_recv_to_callback_seconds", start - received_ns, channel=channel_name)
+        if channel_name in self._offloaded:
+            if self._in_flight is None:
+                self._in_flight = asyncio.Semaphore(self.max_in_flight)
+            async with self._in_flight:
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(self._offloaded[channel_name], callback, ws_channel, message)
+        else:
+            await callback(ws_channel, message)
+        if metrics:
+            metrics.observe_ns(
+                "nexdex_ws_callback_duration_seconds", time.perf_counter_ns() - start, channel=channel_name
+            )
+
+
+__all__ = ["ChannelDispatcher"]
@@ -0,0 +1,67 @@
+"""
+Transport settings of the WebSocket connection: compression, frame and queue limits.
+
+Only settings that differ from the `websockets` defaults are passed to `websockets.connect`.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+# websockets.connect defaults
+DEFAULT_MAX_SIZE = 2**20
+DEFAULT_MAX_QUEUE = 16
+DEFAULT_WRITE_LIMIT = 2**15
+
+
+@dataclass(frozen=True, slots=True)
+class WsConnectionOptions:
+    """Transport settings of `NexDexWebsocketClient`.
+
+    Attributes:
+        compression (str | None): "deflate" negotiates permessage-deflate, None disables compression.
+        deflate_options (dict | None): Arguments of `ClientPerMessageDeflateFactory`, e.g.
+            `{"client_max_window_bits": 12, "compress_settings": {"memLevel": 4}}`; implies compression.
+        max_size (int | None): Largest incoming message in bytes, None for no limit.
+        max_queue (int | None): Incoming messages buffered before reading from the socket pauses, None for no limit.
+        write_limit (int): High-water mark of the write buffer in bytes.
+        raw_frames (bool): Receive text frames as UTF-8 bytes and parse them without decoding to `str` first.
+            Only applies to connections made by `websockets`; custom connectors are read as before.
+
+    Examples:
+        >>> # Full-depth order books on every market: larger frames, a deeper queue, no str copies
+        >>> options = WsConnectionOptions(max_size=2**24, max_queue=256, raw_frames=True)
+        >>> ws_client = NexDexWebsocketClient(env=Environment.TESTNET, connection_options=options)
+    """
+
+    compression: str | None = "deflate"
+    deflate_options: dict[str, Any] | None = None
+    max_size: int | None = DEFAULT_MAX_SIZE
+    max_queue: int | None = DEFAULT_MAX_QUEUE
+    write_limit: int = DEFAULT_WRITE_LIMIT
+    raw_frames: bool = False
+
+    def __post_init__(self):
+        if self.compression not in ("deflate", None):
+            raise ValueError(f"Unsupported compression {self.compression!r}, expected 'deflate' or None")
+
+    def connect_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments of `websockets.connect` for the settings that differ from its defaults."""
+        kwargs: dict[str, Any] = {}
+        if self.deflate_options is not None:
+            # An explicit extension replaces the default one negotiated by `compression="deflate"`
+            kwargs["extensions"] = [ClientPerMessageDeflateFactory(**self.deflate_options)]
+            kwargs["compression"] = None
+        elif self.compression != "deflate":
+            kwargs["compression"] = self.compression
+        if self.max_size != DEFAULT_MAX_SIZE:
+            kwargs["max_size"] = self.max_size
+        if self.max_queue != DEFAULT_MAX_QUEUE:
+            kwargs["max_queue"] = self.max_queue
+        if self.write_limit != DEFAULT_WRITE_LIMIT:
+            kwargs["write_limit"] = self.write_limit
+        return kwargs
+
+
+__all__ = ["WsConnectionOptions"]
@@ -0,0 +1,61 @@
+"""
+Reconnect backoff for `NexDexWebsocketClient`.
+
+Delays grow exponentially from `base_delay` up to `max_delay` and are drawn with
+"full jitter" (uniformly between 0 and the exponential delay), so many clients dropped
+by the same exchange restart do not reconnect in lockstep.
+"""
+
+import random
+
+
+class ReconnectPolicy:
+    """Exponential reconnect backoff with full jitter.
+
+    Args:
+        base_delay (float, optional): Upper bound of the first delay in seconds. Defaults to 0.5.
+        max_delay (float, optional): Cap of the exponential delay in seconds. Defaults to 30.0.
+        multiplier (float, optional): Growth of the delay per failed attempt. Defaults to 2.0.
+        jitter (bool, optional): Draw the delay uniformly in `[0, delay]`. Defaults to True.
+        max_attempts (int, optional): Give up after this many failed attempts; None retries
+            until the client is closed. Defaults to None.
+        rng (random.Random, optional): Random source, for reproducible delays. Defaults to None.
+
+    Examples:
+        >>> policy = ReconnectPolicy(base_delay=1.0, max_delay=8.0, jitter=False)
+        >>> [policy.get_delay(attempt) for attempt in range(5)]
+        [1.0, 2.0, 4.0, 8.0, 8.0]
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: bool = True,
+        max_attempts: int | None = None,
+        rng: random.Random | None = None,
+    ):
+        if base_delay < 0 or max_delay < base_delay:
+            raise ValueError(f"Invalid reconnect delays base_delay={base_delay} max_delay={max_delay}")
+        if multiplier < 1:
+            raise ValueError(f"multiplier must be >= 1, got {multiplier}")
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.max_attempts = max_attempts
+        self._rng = rng or random.Random()  # noqa: S311 - jitter, not cryptography
+
+    def should_retry(self, failures: int) -> bool:
+        """Whether to try again after `failures` failed attempts."""
+        return self.max_attempts is None or failures < self.max_attempts
+
+    def get_delay(self, attempt: int) -> float:
+        """Delay in seconds before retrying after the `attempt`-th (0-based) failure."""
+        # Exponent capped so large attempt counts cannot overflow
+        delay = min(self.base_delay * self.multiplier ** min(attempt, 64), self.max_delay)
+        return self._rng.uniform(0, delay) if self.jitter else delay
+
+
+__all__ = ["ReconnectPolicy"]
@@ -0,0 +1,83 @@
+"""
+JSON-RPC request/response correlation for `NexDexWebsocketClient`.
+
+Every request gets a unique, increasing integer id. Callers that need the reply
+register the id and await a future resolved by the reader when the response with the
+same id arrives, so acknowledgements are matched exactly instead of by channel name.
+"""
+
+import asyncio
+import itertools
+from typing import Any
+
+
+class RpcError(ValueError):
+    """JSON-RPC error response to a WebSocket request."""
+
+    def __init__(self, request_id: int, error: Any):
+        self.request_id = request_id
+        self.error = error
+        code = error.get("code") if isinstance(error, dict) else None
+        message = error.get("message") if isinstance(error, dict) else error
+        super().__init__(f"RPC Error {code}: {message} (request {request_id})")
+
+
+class RpcCorrelator:
+    """Allocates JSON-RPC ids and resolves awaited responses by id.
+
+    Examples:
+        >>> rpc = RpcCorrelator()
+        >>> request_id = rpc.next_id()
+        >>> reply = rpc.expect(request_id)
+        >>> await ws.send(json.dumps({"id": request_id, "jsonrpc": "2.0", "method": "subscribe", ...}))
+        >>> result = await rpc.wait(request_id, reply, timeout=5.0)
+    """
+
+    def __init__(self, start: int = 1):
+        self._ids = itertools.count(start)
+        self._pending: dict[int, asyncio.Future] = {}
+
+    def next_id(self) -> int:
+        return next(self._ids)
+
+    def expect(self, request_id: int) -> asyncio.Future:
+        """Register interest in the response to `request_id`; call before sending the request."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        return future
+
+    async def wait(self, request_id: int, future: asyncio.Future, timeout: float | None) -> Any:
+        """Return the `result` of the response to `request_id`.
+
+        Raises:
+            asyncio.TimeoutError: If no response arrives within `timeout` seconds
+            RpcError: If the response is an error
+        """
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    def resolve(self, message: dict) -> bool:
+        """Complete the future waiting for `message` (a response with an `id`); False if none was waiting."""
+        future = self._pending.pop(message.get("id"), None)  # type: ignore[arg-type]
+        if future is None or future.done():
+            return False
+        if "error" in message:
+            future.set_exception(RpcError(message["id"], message["error"]))
+        else:
+            future.set_result(message.get("result"))
+        return True
+
+    def fail_all(self, error: Exception) -> None:
+        """Fail every awaited response, e.g. when the connection they were sent on closes."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+
+__all__ = ["RpcCorrelator", "RpcError"]
@@ -0,0 +1,293 @@
+"""
+Compact typed payloads for the high-rate WebSocket channels.
+
+Each struct is a slotted dataclass decoded from the channel's `params.data` in a single
+pass: numeric strings become `Decimal` (empty strings become None) and no intermediate
+model is built or dumped. Enabled with `NexDexWebsocketClient(typed_messages=True)`.
+"""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, NamedTuple
+
+
+def _dec(value: Any) -> Decimal | None:
+    return Decimal(value) if value not in (None, "") else None
+
+
+@dataclass(slots=True)
+class WsBBO:
+    """Payload of `bbo.{market}`."""
+
+    market: str
+    bid: Decimal | None
+    bid_size: Decimal | None
+    ask: Decimal | None
+    ask_size: Decimal | None
+    last_updated_at: int | None
+    seq_no: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsBBO":
+        get = data.get
+        return cls(
+            data["market"],
+            _dec(get("bid")),
+            _dec(get("bid_size")),
+            _dec(get("ask")),
+            _dec(get("ask_size")),
+            get("last_updated_at"),
+            get("seq_no"),
+        )
+
+
+class WsBookLevel(NamedTuple):
+    side: str
+    price: Decimal
+    size: Decimal
+
+
+def _levels(levels: list[dict] | None) -> list[WsBookLevel]:
+    if not levels:
+        return []
+    return [WsBookLevel(level["side"], Decimal(level["price"]), Decimal(level["size"])) for level in levels]
+
+
+@dataclass(slots=True)
+class WsOrderBook:
+    """Payload of `order_book.{market}.snapshot@...`: a snapshot (`update_type` "s") or a delta."""
+
+    market: str
+    update_type: str | None
+    inserts: list[WsBookLevel]
+    updates: list[WsBookLevel]
+    deletes: list[WsBookLevel]
+    last_updated_at: int | None
+    seq_no: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsOrderBook":
+        get = data.get
+        return cls(
+            data["market"],
+            get("update_type"),
+            _levels(get("inserts")),
+            _levels(get("updates")),
+            _levels(get("deletes")),
+            get("last_updated_at"),
+            get("seq_no"),
+        )
+
+    @property
+    def is_snapshot(self) -> bool:
+        return self.update_type == "s"
+
+    def bids(self) -> list[tuple[Decimal, Decimal]]:
+        """(price, size) of inserted bids, best first."""
+        return sorted(((lvl.price, lvl.size) for lvl in self.inserts if lvl.side == "BUY"), reverse=True)
+
+    def asks(self) -> list[tuple[Decimal, Decimal]]:
+        """(price, size) of inserted asks, best first."""
+        return sorted((lvl.price, lvl.size) for lvl in self.inserts if lvl.side == "SELL")
+
+
+@dataclass(slots=True)
+class WsTrade:
+    """Payload of `trades.{market}`."""
+
+    id: str | None
+    market: str
+    side: str | None
+    price: Decimal | None
+    size: Decimal | None
+    trade_type: str | None
+    created_at: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsTrade":
+        get = data.get
+        return cls(
+            get("id"),
+            data["market"],
+            get("side"),
+            _dec(get("price")),
+            _dec(get("size")),
+            get("trade_type"),
+            get("created_at"),
+        )
+
+
+@dataclass(slots=True)
+class WsFill:
+    """Payload of `fills.{market}`."""
+
+    id: str | None
+    account: str | None
+    market: str
+    order_id: str | None
+    client_id: str | None
+    side: str | None
+    price: Decimal | None
+    size: Decimal | None
+    remaining_size: Decimal | None
+    liquidity: str | None
+    fill_type: str | None
+    fee: Decimal | None
+    fee_currency: str | None
+    realized_pnl: Decimal | None
+    realized_funding: Decimal | None
+    created_at: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsFill":
+        get = data.get
+        return cls(
+            get("id"),
+            get("account"),
+            data["market"],
+            get("order_id"),
+            get("client_id"),
+            get("side"),
+            _dec(get("price")),
+            _dec(get("size")),
+            _dec(get("remaining_size")),
+            get("liquidity"),
+            get("fill_type"),
+            _dec(get("fee")),
+            get("fee_currency"),
+            _dec(get("realized_pnl")),
+            _dec(get("realized_funding")),
+            get("created_at"),
+        )
+
+
+@dataclass(slots=True)
+class WsOrder:
+    """Payload of `orders.{market}`."""
+
+    id: str | None
+    account: str | None
+    market: str
+    side: str | None
+    type: str | None
+    size: Decimal | None
+    remaining_size: Decimal | None
+    price: Decimal | None
+    trigger_price: Decimal | None
+    avg_fill_price: Decimal | None
+    status: str | None
+    cancel_reason: str | None
+    client_id: str | None
+    instruction: str | None
+    flags: list[str] | None
+    created_at: int | None
+    last_updated_at: int | None
+    seq_no: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsOrder":
+        get = data.get
+        return cls(
+            get("id"),
+            get("account"),
+            data["market"],
+            get("side"),
+            get("type"),
+            _dec(get("size")),
+            _dec(get("remaining_size")),
+            _dec(get("price")),
+            _dec(get("trigger_price")),
+            _dec(get("avg_fill_price")),
+            get("status"),
+            get("cancel_reason"),
+            get("client_id"),
+            get("instruction"),
+            get("flags"),
+            get("created_at"),
+            get("last_updated_at"),
+            get("seq_no"),
+        )
+
+
+@dataclass(slots=True)
+class WsPosition:
+    """Payload of `positions`."""
+
+    id: str | None
+    account: str | None
+    market: str
+    side: str | None
+    status: str | None
+    size: Decimal | None
+    average_entry_price: Decimal | None
+    cost: Decimal | None
+    unrealized_pnl: Decimal | None
+    unrealized_funding_pnl: Decimal | None
+    realized_positional_pnl: Decimal | None
+    leverage: Decimal | None
+    liquidation_price: Decimal | None
+    created_at: int | None
+    last_updated_at: int | None
+    seq_no: int | None
+
+    @classmethod
+    def from_data(cls, data: dict) -> "WsPosition":
+        get = data.get
+        return cls(
+            get("id"),
+            get("account"),
+            data["market"],
+            get("side"),
+            get("status"),
+            _dec(get("size")),
+            _dec(get("average_entry_price")),
+            _dec(get("cost")),
+            _dec(get("unrealized_pnl")),
+            _dec(get("unrealized_funding_pnl")),
+            _dec(get("realized_positional_pnl")),
+            _dec(get("leverage")),
+            _dec(get("liquidation_price")),
+            get("created_at"),
+            get("last_updated_at"),
+            get("seq_no"),
+        )
+
+
+# Channel name prefix (before the first ".") to payload struct
+WS_STRUCTS: dict[str, Any] = {
+    "bbo": WsBBO,
+    "order_book": WsOrderBook,
+    "trades": WsTrade,
+    "fills": WsFill,
+    "orders": WsOrder,
+    "positions": WsPosition,
+}
+
+
+def decode_ws_data(channel_prefix: str, data: Any) -> Any:
+    """Decode a channel payload into its struct, or return it unchanged if the channel has none.
+
+    Args:
+        channel_prefix (str): Channel name up to the first ".", e.g. "bbo"
+        data (Any): `params.data` of the message
+
+    Returns:
+        Any: The struct, or `data`
+    """
+    struct = WS_STRUCTS.get(channel_prefix)
+    if struct is None or not isinstance(data, dict):
+        return data
+    return struct.from_data(data)
+
+
+__all__ = [
+    "WS_STRUCTS",
+    "WsBBO",
+    "WsBookLevel",
+    "WsFill",
+    "WsOrder",
+    "WsOrderBook",
+    "WsPosition",
+    "WsTrade",
+    "decode_ws_data",
+]
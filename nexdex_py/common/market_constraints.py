@@ -0,0 +1,248 @@
+import logging
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from nexdex_py.common.order import Order, OrderSide
+from nexdex_py.common.quantization import CHAIN_SCALE, format_chain_int, from_chain_int, to_chain_int
+
+
+@dataclass(frozen=True, slots=True)
+class MarketConstraints:
+    """Order constraints of one market, in 8-decimal chain units.
+
+    Attributes:
+        symbol (str): Market symbol
+        price_tick (int | None): `price_tick_size` in chain units
+        size_increment (int | None): `order_size_increment` in chain units
+        min_notional (int | None): `min_notional` in chain units
+        max_order_size (int | None): `max_order_size` in chain units
+        max_open_orders (int | None): `max_open_orders`
+    """
+
+    symbol: str
+    price_tick: int | None = None
+    size_increment: int | None = None
+    min_notional: int | None = None
+    max_order_size: int | None = None
+    max_open_orders: int | None = None
+
+    @classmethod
+    def from_market(cls, market: Any) -> "MarketConstraints":
+        """Build from a `MarketResp` or a market dict of `fetch_markets`."""
+        get: Callable[[str], Any] = (
+            market.get if isinstance(market, Mapping) else lambda field: getattr(market, field, None)
+        )
+
+        def units(field: str) -> int | None:
+            value = get(field)
+            return to_chain_int(value) if value not in (None, "") else None
+
+        return cls(
+            symbol=get("symbol"),
+            price_tick=units("price_tick_size") or None,
+            size_increment=units("order_size_increment") or None,
+            min_notional=units("min_notional") or None,
+            max_order_size=units("max_order_size") or None,
+            max_open_orders=get("max_open_orders"),
+        )
+
+    def check(self, order: Order, reference_price: Decimal | None = None) -> str | None:
+        """Return why `order` would be rejected, or None if it passes.
+
+        Args:
+            order (Order): Order to check
+            reference_price (Decimal, optional): Price used for the notional of market orders.
+                Defaults to None (notional of market orders not checked).
+        """
+        size = to_chain_int(order.size, strict=False)
+        if size <= 0:
+            return f"size {order.size} must be positive"
+        if self.size_increment and size % self.size_increment:
+            return f"size {order.size} not a multiple of {format_chain_int(self.size_increment)}"
+        if self.max_order_size and size > self.max_order_size:
+            return f"size {order.size} above max_order_size {format_chain_int(self.max_order_size)}"
+
+        price = None
+        if order.is_limit_type():
+            price = to_chain_int(order.limit_price, strict=False)
+            if price <= 0:
+                return f"price {order.limit_price} must be positive"
+            if self.price_tick and price % self.price_tick:
+                return f"price {order.limit_price} not a multiple of {format_chain_int(self.price_tick)}"
+        elif reference_price is not None:
+            price = to_chain_int(reference_price, strict=False)
+        # Both sides are scaled by 10**8, so the notional is scaled by 10**16
+        if self.min_notional and price is not None and size * price < self.min_notional * CHAIN_SCALE:
+            return f"notional below min_notional {format_chain_int(self.min_notional)}"
+        return None
+
+    def check_open_orders(self, count: int) -> str | None:
+        """Return why `count` open orders would be rejected, or None if within `max_open_orders`."""
+        if self.max_open_orders is not None and count > self.max_open_orders:
+            return f"exceeds max_open_orders {self.max_open_orders}"
+        return None
+
+    def round_order(self, order: Order) -> Order:
+        """Round `order` onto the market grid in place.
+
+        The size is rounded down to `order_size_increment`. Limit prices are rounded to
+        `price_tick_size` away from the spread: down for buys, up for sells.
+
+        Returns:
+            Order: `order`
+        """
+        if self.size_increment:
+            size = to_chain_int(order.size, strict=False)
+            order.size = order.remaining = from_chain_int(size - size % self.size_increment)
+        if self.price_tick and order.is_limit_type():
+            price = to_chain_int(order.limit_price, strict=False)
+            # -(-x // n) rounds up
+            ticks = price // self.price_tick if order.order_side == OrderSide.Buy else -(-price // self.price_tick)
+            order.limit_price = from_chain_int(ticks * self.price_tick)
+        return order
+
+
+class MarketConstraintIndex:
+    """Per-market order constraints for validating orders before they are signed.
+
+    Built once from `fetch_markets`; each check is a dict lookup and a few integer
+    comparisons, so invalid orders are rejected without a signature or a round trip.
+
+    Args:
+        markets (Iterable[MarketResp | dict], optional): Markets to index. Defaults to None.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+
+    Examples:
+        >>> index = MarketConstraintIndex.from_response(NexDex.api_client.fetch_markets())
+        >>> index.validate(order)
+        >>> NexDex.api_client.market_constraints = index  # checked on every submit
+    """
+
+    classname: str = "MarketConstraintIndex"
+
+    def __init__(self, markets: Iterable[Any] | None = None, logger: logging.Logger | None = None):
+        self.logger = logger or logging.getLogger(__name__)
+        self._markets: dict[str, MarketConstraints] = {}
+        if markets is not None:
+            self.update(markets)
+
+    @classmethod
+    def from_response(cls, response: dict, logger: logging.Logger | None = None) -> "MarketConstraintIndex":
+        """Build from a `fetch_markets` response."""
+        return cls(response.get("results", []), logger=logger)
+
+    def update(self, markets: Iterable[Any]) -> None:
+        """Add or replace the constraints of `markets`."""
+        for market in markets:
+            constraints = MarketConstraints.from_market(market)
+            if constraints.symbol:
+                self._markets[constraints.symbol] = constraints
+        self.logger.debug(f"{self.classname}: Indexed {len(self._markets)} markets")
+
+    def get(self, symbol: str) -> MarketConstraints | None:
+        return self._markets.get(symbol)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._markets
+
+    def __len__(self) -> int:
+        return len(self._markets)
+
+    def check(
+        self,
+        order: Order,
+        reference_price: Decimal | None = None,
+        open_orders: Mapping[str, int] | None = None,
+    ) -> str | None:
+        """Return why `order` would be rejected, or None if it passes. See `MarketConstraints.check`.
+
+        Args:
+            order (Order): Order to check
+            reference_price (Decimal, optional): Price used for the notional of market orders. Defaults to None.
+            open_orders (Mapping[str, int], optional): Open orders per market, e.g. from `count_open_orders`;
+                the order is counted against `max_open_orders` on top of them. Defaults to None (not counted).
+        """
+        constraints = self._markets.get(order.market)
+        if constraints is None:
+            return f"unknown market {order.market}"
+        error = constraints.check(order, reference_price)
+        if error is None and open_orders is not None:
+            error = constraints.check_open_orders(open_orders.get(order.market, 0) + 1)
+        return error
+
+    def validate(
+        self,
+        order: Order,
+        reference_price: Decimal | None = None,
+        open_orders: Mapping[str, int] | None = None,
+    ) -> None:
+        """Raise ValueError if `order` violates its market's constraints. See `check`."""
+        error = self.check(order, reference_price, open_orders)
+        if error is not None:
+            raise ValueError(f"{self.classname}: Invalid order {order.client_id or order.market}: {error}")
+
+    def round_order(self, order: Order) -> Order:
+        """Round `order` onto its market's grid in place. See `MarketConstraints.round_order`."""
+        constraints = self._markets.get(order.market)
+        if constraints is None:
+            raise ValueError(f"{self.classname}: Unknown market {order.market}")
+        return constraints.round_order(order)
+
+    def check_batch(
+        self,
+        orders: list[Order],
+        open_orders: Mapping[str, int] | None = None,
+        reference_prices: Mapping[str, Decimal] | None = None,
+    ) -> dict[int, str]:
+        """Check a batch of orders.
+
+        Args:
+            orders (list[Order]): Orders to check
+            open_orders (Mapping[str, int], optional): Open orders per market, counted against
+                `max_open_orders` together with the batch. Defaults to None (only the batch is counted).
+            reference_prices (Mapping[str, Decimal], optional): Per-market price for the notional
+                of market orders. Defaults to None.
+
+        Returns:
+            dict[int, str]: Errors by index in `orders`; empty if all pass
+        """
+        open_orders = open_orders or {}
+        reference_prices = reference_prices or {}
+        errors: dict[int, str] = {}
+        counts: Counter[str] = Counter()
+        for i, order in enumerate(orders):
+            error = self.check(order, reference_prices.get(order.market))
+            if error is None:
+                counts[order.market] += 1
+                constraints = self._markets[order.market]
+                error = constraints.check_open_orders(open_orders.get(order.market, 0) + counts[order.market])
+            if error is not None:
+                errors[i] = error
+        return errors
+
+    def validate_batch(
+        self,
+        orders: list[Order],
+        open_orders: Mapping[str, int] | None = None,
+        reference_prices: Mapping[str, Decimal] | None = None,
+    ) -> None:
+        """Raise ValueError listing every invalid order of the batch. See `check_batch`."""
+        errors = self.check_batch(orders, open_orders, reference_prices)
+        if errors:
+            details = "; ".join(f"[{i}] {error}" for i, error in errors.items())
+            raise ValueError(f"{self.classname}: {len(errors)} invalid orders in batch: {details}")
+
+
+def count_open_orders(response: Any) -> Counter[str]:
+    """Open orders per market of a `fetch_orders` response (dict or `ResponsePage`), for `open_orders` arguments.
+
+    Examples:
+        >>> open_orders = count_open_orders(NexDex.api_client.fetch_orders())
+        >>> NexDex.api_client.submit_order(order, open_orders=open_orders)
+        >>> open_orders[order.market] += 1
+    """
+    rows = (response.get("results") or []) if hasattr(response, "get") else response
+    return Counter(row.get("market") for row in rows if row.get("status") != "CLOSED")
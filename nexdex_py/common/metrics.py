@@ -0,0 +1,292 @@
+"""
+Latency histograms, counters and gauges for REST and WebSocket instrumentation.
+
+`MetricsRegistry` is passed to `HttpClient`, `NexDexApiClient`,
+`NexDexWebsocketClient` (or `NexDex(metrics=...)`) and collects:
+
+REST
+    nexdex_http_request_duration_seconds   one observation per attempt {method, endpoint, status}
+    nexdex_http_call_duration_seconds      whole call incl. retries and backoff {method, endpoint, status}
+    nexdex_http_retries_total              retries {method, endpoint}
+    nexdex_sign_duration_seconds           local signing before a request {operation}
+
+WebSocket
+    nexdex_ws_messages_total               frames received {channel}
+    nexdex_ws_recv_to_callback_seconds     frame received -> callback invoked {channel}
+    nexdex_ws_callback_duration_seconds    time spent inside the callback {channel}
+    nexdex_ws_server_lag_seconds           local time - server timestamp of the payload {channel}
+    nexdex_ws_recv_queue_depth             frames buffered by the connection after a recv (gauge)
+
+Snapshots are plain dicts (`snapshot()`) or Prometheus text exposition (`to_prometheus()`).
+"""
+
+import re
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+
+# Log-linear bucketing in the spirit of HdrHistogram: values below SUB_BUCKET_COUNT
+# are exact, larger values keep SUB_BUCKET_BITS - 1 bits of precision (< 1.6% error).
+SUB_BUCKET_BITS = 7
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+SUB_BUCKET_HALF = SUB_BUCKET_COUNT >> 1
+
+DEFAULT_QUANTILES = (0.5, 0.9, 0.99, 0.999)
+
+LabelsKey = tuple[tuple[str, str], ...]
+
+
+def _bucket_index(value: int) -> int:
+    if value < SUB_BUCKET_COUNT:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    return SUB_BUCKET_HALF * shift + (value >> shift)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_HALF - 1
+    sub_bucket = index - SUB_BUCKET_HALF * shift
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class LatencyHistogram:
+    """Sparse log-linear histogram of durations recorded in nanoseconds.
+
+    Recording is O(1) and memory grows with the number of distinct buckets hit,
+    not with the number of samples. Percentiles are accurate to ~1.6%.
+
+    Examples:
+        >>> hist = LatencyHistogram()
+        >>> hist.record_ns(1_500_000)
+        >>> hist.percentile(0.99)  # seconds
+    """
+
+    __slots__ = ("count", "counts", "max_ns", "min_ns", "total_ns")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_ns = 0
+        self.min_ns = 0
+        self.max_ns = 0
+
+    def record_ns(self, value_ns: int) -> None:
+        if value_ns < 0:
+            value_ns = 0
+        index = _bucket_index(value_ns)
+        counts = self.counts
+        counts[index] = counts.get(index, 0) + 1
+        if self.count == 0 or value_ns < self.min_ns:
+            self.min_ns = value_ns
+        if value_ns > self.max_ns:
+            self.max_ns = value_ns
+        self.count += 1
+        self.total_ns += value_ns
+
+    def record(self, seconds: float) -> None:
+        self.record_ns(int(seconds * 1e9))
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.count == 0:
+            return
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.min_ns = other.min_ns if self.count == 0 else min(self.min_ns, other.min_ns)
+        self.max_ns = max(self.max_ns, other.max_ns)
+        self.count += other.count
+        self.total_ns += other.total_ns
+
+    def percentile(self, quantile: float) -> float:
+        """Value in seconds at or below which `quantile` of the samples fall."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(quantile * self.count + 0.5))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(_bucket_upper_bound(index), self.max_ns) / 1e9
+        return self.max_ns / 1e9
+
+    def snapshot(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES) -> dict[str, Any]:
+        result: dict[str, Any] = {
+            "count": self.count,
+            "sum": self.total_ns / 1e9,
+            "min": self.min_ns / 1e9,
+            "max": self.max_ns / 1e9,
+            "mean": self.total_ns / self.count / 1e9 if self.count else 0.0,
+        }
+        for quantile in quantiles:
+            result[f"p{quantile * 100:g}"] = self.percentile(quantile)
+        return result
+
+
+_ID_SEGMENT = re.compile(r"^(0x[0-9a-fA-F]+|\d+|[0-9a-fA-F-]{32,})$")
+
+
+@lru_cache(maxsize=4096)
+def normalize_endpoint(path: str) -> str:
+    """Collapse identifiers in a REST path to keep label cardinality bounded.
+
+    Examples:
+        >>> normalize_endpoint("/v1/orders/1700000000000201709104000000")
+        '/v1/orders/{id}'
+        >>> normalize_endpoint("/v1/orders/by_client_id/my-order")
+        '/v1/orders/by_client_id/{client_id}'
+        >>> normalize_endpoint("/v1/bbo/BTC-USD-PERP")
+        '/v1/bbo/BTC-USD-PERP'
+    """
+    segments = path.split("/")
+    for i, segment in enumerate(segments):
+        if i > 0 and segments[i - 1] == "by_client_id":
+            segments[i] = "{client_id}"
+        elif _ID_SEGMENT.match(segment):
+            segments[i] = "{id}"
+    return "/".join(segments)
+
+
+def _labels_key(labels: dict[str, Any]) -> LabelsKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: LabelsKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label_value(value)}"' for key, value in pairs) + "}"
+
+
+class MetricsRegistry:
+    """Thread-safe collection of labelled histograms, counters and gauges.
+
+    Args:
+        quantiles (tuple[float, ...], optional): Quantiles reported by `snapshot` and
+            `to_prometheus`. Defaults to (0.5, 0.9, 0.99, 0.999).
+
+    Examples:
+        >>> from nexdex_py import NexDex
+        >>> from nexdex_py.common.metrics import MetricsRegistry
+        >>> metrics = MetricsRegistry()
+        >>> NexDex = NexDex(env="testnet", metrics=metrics)
+        >>> NexDex.api_client.fetch_markets()
+        >>> metrics.snapshot()["histograms"]["nexdex_http_request_duration_seconds"]
+        >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES):
+        self.quantiles = quantiles
+        self._lock = threading.Lock()
+        self._histograms: dict[str, dict[LabelsKey, LatencyHistogram]] = {}
+        self._counters: dict[str, dict[LabelsKey, float]] = {}
+        self._gauges: dict[str, dict[LabelsKey, float]] = {}
+
+    def observe_ns(self, name: str, value_ns: int, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = LatencyHistogram()
+            histogram.record_ns(value_ns)
+
+    def observe(self, name: str, seconds: float, **labels: Any) -> None:
+        self.observe_ns(name, int(seconds * 1e9), **labels)
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + value
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        key = _labels_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    @contextmanager
+    def time(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the `with` block."""
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.observe_ns(name, time.perf_counter_ns() - start, **labels)
+
+    def histogram(self, name: str, **labels: Any) -> LatencyHistogram | None:
+        """Histogram of one series, or None if nothing was recorded for it."""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_labels_key(labels))
+
+    def counter(self, name: str, **labels: Any) -> float:
+        with self._lock:
+            return self._counters.get(name, {}).get(_labels_key(labels), 0)
+
+    def gauge(self, name: str, **labels: Any) -> float | None:
+        with self._lock:
+            return self._gauges.get(name, {}).get(_labels_key(labels))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+            self._gauges.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Point-in-time copy of every series.
+
+        Returns:
+            histograms (dict): name -> list of {"labels": {...}, "count", "sum", "min", "max", "mean", "p50", ...}
+                in seconds
+            counters (dict): name -> list of {"labels": {...}, "value"}
+            gauges (dict): name -> list of {"labels": {...}, "value"}
+        """
+        with self._lock:
+            return {
+                "histograms": {
+                    name: [{"labels": dict(key), **hist.snapshot(self.quantiles)} for key, hist in series.items()]
+                    for name, series in self._histograms.items()
+                },
+                "counters": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._counters.items()
+                },
+                "gauges": {
+                    name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                    for name, series in self._gauges.items()
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Render all series in the Prometheus text exposition format.
+
+        Histograms are exposed as summaries (quantiles, `_sum`, `_count`) in seconds.
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._histograms.items()):
+                lines.append(f"# TYPE {name} summary")
+                for key, hist in series.items():
+                    for quantile in self.quantiles:
+                        labels = _format_labels(key, (("quantile", f"{quantile:g}"),))
+                        lines.append(f"{name}{labels} {hist.percentile(quantile):.9g}")
+                    lines.append(f"{name}_sum{_format_labels(key)} {hist.total_ns / 1e9:.9g}")
+                    lines.append(f"{name}_count{_format_labels(key)} {hist.count}")
+            for name, counters in sorted(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                lines.extend(f"{name}{_format_labels(key)} {value:g}" for key, value in counters.items())
+            for name, gauges in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                lines.extend(f"{name}{_format_labels(key)} {value:g}" for key, value in gauges.items())
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+__all__ = ["LatencyHistogram", "MetricsRegistry", "normalize_endpoint"]
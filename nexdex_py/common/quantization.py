@@ -0,0 +1,188 @@
+"""
+Exact conversion of prices and sizes to the 8-decimal integers used on chain.
+
+Values are converted with integer arithmetic on `Decimal` (no float rounding) and,
+when validated against a market, must be a whole multiple of its `price_tick_size`
+or `order_size_increment`. Anything that cannot be represented exactly raises
+`ValueError` instead of being truncated.
+"""
+
+from collections.abc import Iterable, Sequence
+from decimal import Decimal, InvalidOperation
+from itertools import repeat
+from typing import Any
+
+CHAIN_DECIMALS = 8
+CHAIN_SCALE = 10**CHAIN_DECIMALS
+
+Number = Decimal | str | int
+
+
+def to_chain_int(value: Number, strict: bool = True) -> int:
+    """Convert a price or size to its 8-decimal chain integer.
+
+    Args:
+        value (Decimal | str | int): Value in display units
+        strict (bool, optional): Raise if `value` has more than 8 decimals. If False, truncate
+            toward zero like `int(value.scaleb(8))`. Defaults to True.
+
+    Returns:
+        int: `value * 10**8`
+
+    Examples:
+        >>> to_chain_int("65000.5")
+        6500050000000
+        >>> to_chain_int(Decimal("0.000000001"))
+        Traceback (most recent call last):
+        ValueError: 0.000000001 is not representable with 8 decimals
+    """
+    if isinstance(value, int):
+        return value * CHAIN_SCALE
+    try:
+        scaled = (value if isinstance(value, Decimal) else Decimal(value)).scaleb(CHAIN_DECIMALS)
+        units = int(scaled)
+    except (InvalidOperation, ValueError, OverflowError):
+        raise ValueError(f"{value!r} is not a finite number") from None
+    if strict and units != scaled:
+        raise ValueError(f"{value} is not representable with {CHAIN_DECIMALS} decimals")
+    return units
+
+
+def to_chain_ints(values: Iterable[Number], strict: bool = True) -> list[int]:
+    """Convert many prices or sizes to chain integers. See `to_chain_int`.
+
+    `Decimal` values are scaled in one pass and, when `strict`, checked for exactness with a
+    single list comparison; other inputs, or any invalid value, go through `to_chain_int`.
+    """
+    values = values if isinstance(values, list) else list(values)
+    try:
+        scaled = list(map(Decimal.scaleb, values, repeat(CHAIN_DECIMALS)))
+        units = list(map(int, scaled))
+    except (TypeError, ValueError, OverflowError):
+        return [to_chain_int(value, strict) for value in values]
+    if strict and units != scaled:
+        # Raise for the first value with more than 8 decimals
+        return [to_chain_int(value, strict) for value in values]
+    return units
+
+
+def from_chain_int(units: int) -> Decimal:
+    """Convert a chain integer back to a `Decimal` in display units."""
+    return Decimal(units).scaleb(-CHAIN_DECIMALS)
+
+
+def format_chain_int(units: int) -> str:
+    """Format a chain integer in display units without trailing zeros, e.g. `"0.01"`."""
+    return format(from_chain_int(units).normalize(), "f")
+
+
+def validate_multiple(units: Sequence[int], increment_units: int, name: str = "value") -> list[int]:
+    """Check that every chain integer is a whole multiple of `increment_units`.
+
+    Returns:
+        list[int]: `units` as a list
+
+    Raises:
+        ValueError: Listing the first offending values
+    """
+    if increment_units <= 0:
+        raise ValueError(f"{name} increment must be positive, got {format_chain_int(increment_units)}")
+    invalid = [u for u in units if u % increment_units]
+    if invalid:
+        shown = ", ".join(format_chain_int(u) for u in invalid[:5])
+        more = f" (+{len(invalid) - 5} more)" if len(invalid) > 5 else ""
+        raise ValueError(f"{name} not a multiple of {format_chain_int(increment_units)}: {shown}{more}")
+    return list(units)
+
+
+def _market_field(market: Any, field: str) -> str:
+    value = market.get(field) if isinstance(market, dict) else getattr(market, field, None)
+    if value is None:
+        symbol = market.get("symbol") if isinstance(market, dict) else getattr(market, "symbol", None)
+        raise ValueError(f"Market {symbol} has no {field}")
+    return value
+
+
+def quantize_prices(values: Iterable[Number], market: Any) -> list[int]:
+    """Convert prices to chain integers, rejecting values off the market's `price_tick_size`.
+
+    Args:
+        values (Iterable[Decimal | str | int]): Prices
+        market (MarketResp | dict): Market from `fetch_markets`
+
+    Returns:
+        list[int]: Chain prices
+    """
+    tick = to_chain_int(_market_field(market, "price_tick_size"))
+    return validate_multiple(to_chain_ints(values), tick, "price")
+
+
+def quantize_sizes(values: Iterable[Number], market: Any) -> list[int]:
+    """Convert sizes to chain integers, rejecting values off the market's `order_size_increment`.
+
+    Args:
+        values (Iterable[Decimal | str | int]): Sizes
+        market (MarketResp | dict): Market from `fetch_markets`
+
+    Returns:
+        list[int]: Chain sizes
+    """
+    increment = to_chain_int(_market_field(market, "order_size_increment"))
+    return validate_multiple(to_chain_ints(values), increment, "size")
+
+
+def price_ladder(start: Number, levels: int, step_ticks: int, market: Any) -> list[int]:
+    """Chain prices of a ladder `start, start + step, ...` computed in integer ticks.
+
+    Only `start` and the tick size are converted; the levels themselves are integer
+    additions, so hundreds of levels cost the same as one conversion.
+
+    Args:
+        start (Decimal | str | int): First price, on the market's tick
+        levels (int): Number of prices
+        step_ticks (int): Ticks between consecutive prices, negative for a descending ladder
+        market (MarketResp | dict): Market from `fetch_markets`
+
+    Returns:
+        list[int]: Chain prices
+
+    Examples:
+        >>> [from_chain_int(p) for p in price_ladder("100", 3, -5, {"price_tick_size": "0.1"})]
+        [Decimal('100'), Decimal('99.5'), Decimal('99')]
+    """
+    tick = to_chain_int(_market_field(market, "price_tick_size"))
+    (first,) = validate_multiple([to_chain_int(start)], tick, "price")
+    step = step_ticks * tick
+    return list(range(first, first + step * levels, step)) if step else [first] * levels
+
+
+def price_levels(start: Number, levels: int, step_ticks: int, market: Any) -> list[Decimal]:
+    """Prices of `price_ladder` as `Decimal`, e.g. for `Order.limit_price`.
+
+    Levels are exact `Decimal` additions of the tick, so each converts to the chain price
+    of the same level in `price_ladder`.
+
+    Examples:
+        >>> price_levels("100", 3, -5, {"price_tick_size": "0.1"})
+        [Decimal('100.0'), Decimal('99.5'), Decimal('99.0')]
+    """
+    tick = Decimal(_market_field(market, "price_tick_size"))
+    first = start if isinstance(start, Decimal) else Decimal(start)
+    validate_multiple([to_chain_int(first)], to_chain_int(tick), "price")
+    step = tick * step_ticks
+    return [first + step * i for i in range(levels)]
+
+
+__all__ = [
+    "CHAIN_DECIMALS",
+    "CHAIN_SCALE",
+    "format_chain_int",
+    "from_chain_int",
+    "price_ladder",
+    "price_levels",
+    "quantize_prices",
+    "quantize_sizes",
+    "to_chain_int",
+    "to_chain_ints",
+    "validate_multiple",
+]
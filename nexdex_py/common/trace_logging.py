@@ -0,0 +1,75 @@
+"""
+Level-guarded, sampled DEBUG tracing for per-message hot paths.
+
+Messages are logged with `%`-style arguments, so nothing is formatted unless a record
+is emitted, and the level check runs before any argument is built. Tracing can also be
+sampled per key (e.g. every 100th message of each WebSocket channel) or switched off,
+in which case callers hold `None` instead of a tracer and pay a single attribute check.
+
+Examples:
+    >>> trace = ChannelTracer.create(logger, sample_every=100)
+    >>> if trace is not None and trace.enabled_for("bbo.BTC-USD-PERP"):
+    ...     trace.log("bbo.BTC-USD-PERP", "%s: message:%s", "NexDexWebsocketClient", message)
+"""
+
+import logging
+
+
+class ChannelTracer:
+    """Sampled DEBUG logging keyed by channel.
+
+    Every record carries the channel and its message count as `extra` attributes
+    (`trace_channel`, `trace_count`) for structured log handlers.
+
+    Args:
+        logger (logging.Logger): Logger to trace to
+        sample_every (int, optional): Log one in `sample_every` messages of each channel. Defaults to 1 (all).
+    """
+
+    __slots__ = ("_counts", "logger", "sample_every")
+
+    def __init__(self, logger: logging.Logger, sample_every: int = 1):
+        if sample_every < 1:
+            raise ValueError(f"sample_every must be >= 1, got {sample_every}")
+        self.logger = logger
+        self.sample_every = sample_every
+        self._counts: dict[str, int] = {}
+
+    @classmethod
+    def create(cls, logger: logging.Logger, sample_every: int = 1) -> "ChannelTracer | None":
+        """Return a tracer, or None if `sample_every` is 0 (tracing disabled)."""
+        if sample_every == 0:
+            return None
+        return cls(logger, sample_every)
+
+    def enabled_for(self, channel: str) -> bool:
+        """Whether the current message of `channel` should be logged; counts the message if DEBUG is on."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return False
+        if self.sample_every == 1:
+            return True
+        count = self._counts.get(channel, 0)
+        self._counts[channel] = count + 1
+        return count % self.sample_every == 0
+
+    def _emit(self, channel: str, msg: str, args: tuple[object, ...]) -> None:
+        # stacklevel 3 attributes the record to the caller of `log` or `trace`
+        self.logger.debug(
+            msg, *args, extra={"trace_channel": channel, "trace_count": self._counts.get(channel, 0)}, stacklevel=3
+        )
+
+    def log(self, channel: str, msg: str, *args: object) -> None:
+        """Log at DEBUG with lazy `%` arguments; call after `enabled_for` returned True."""
+        self._emit(channel, msg, args)
+
+    def trace(self, channel: str, msg: str, *args: object) -> None:
+        """`enabled_for` and `log` in one call, for arguments that are cheap to pass."""
+        if self.enabled_for(channel):
+            self._emit(channel, msg, args)
+
+    def reset(self) -> None:
+        """Forget the per-channel message counts."""
+        self._counts.clear()
+
+
+__all__ = ["ChannelTracer"]
@@ -0,0 +1,27 @@
+from .book import LevelBook
+from .funding import DEFAULT_FUNDING_PERIOD_HOURS, FundingPayments, FundingSeries, FundingTracker
+from .klines import RESOLUTIONS, CandleRing, Kline, KlineAggregator
+from .pnl import PRICE_SOURCES, MarketPnL, PnLEngine
+from .prices import NUMPY_AVAILABLE, PriceMatrix
+from .shared import MarketDataPublisher, MarketDataReader, SharedBBO, SharedBook
+
+__all__ = [
+    "DEFAULT_FUNDING_PERIOD_HOURS",
+    "NUMPY_AVAILABLE",
+    "PRICE_SOURCES",
+    "RESOLUTIONS",
+    "CandleRing",
+    "FundingPayments",
+    "FundingSeries",
+    "FundingTracker",
+    "Kline",
+    "KlineAggregator",
+    "LevelBook",
+    "MarketDataPublisher",
+    "MarketDataReader",
+    "MarketPnL",
+    "PnLEngine",
+    "PriceMatrix",
+    "SharedBBO",
+    "SharedBook",
+]
@@ -0,0 +1,75 @@
+"""
+Local order book rebuilt from `ORDER_BOOK` WebSocket updates.
+"""
+
+from typing import Any
+
+from nexdex_py.common.quantization import to_chain_int
+
+
+def units(value: Any) -> int:
+    """Chain integer of a price or size string; 0 for empty values."""
+    return to_chain_int(value, strict=False) if value not in (None, "") else 0
+
+
+def field(data: Any, name: str) -> Any:
+    """Field of a WS payload: dicts, or typed structs when `typed_messages` is enabled."""
+    return data.get(name) if isinstance(data, dict) else getattr(data, name, None)
+
+
+class LevelBook:
+    """Price levels of one market in chain units, kept from `ORDER_BOOK` snapshots and deltas.
+
+    Attributes:
+        bids (dict[int, int]): Price to size of the bids
+        asks (dict[int, int]): Price to size of the asks
+        last_updated_at (int): Server time of the last update, ms
+        seq_no (int): Sequence number of the last update
+    """
+
+    __slots__ = ("asks", "bids", "last_updated_at", "seq_no")
+
+    def __init__(self) -> None:
+        self.bids: dict[int, int] = {}
+        self.asks: dict[int, int] = {}
+        self.last_updated_at = 0
+        self.seq_no = 0
+
+    def apply(self, data: Any) -> None:
+        """Apply an `ORDER_BOOK` payload (dict or `WsOrderBook`); a snapshot (`update_type` "s") replaces the book."""
+        bids, asks = self.bids, self.asks
+        if field(data, "update_type") == "s":
+            bids.clear()
+            asks.clear()
+        for name in ("inserts", "updates", "deletes"):
+            for level in field(data, name) or ():
+                side = bids if field(level, "side") == "BUY" else asks
+                price = units(field(level, "price"))
+                size = units(field(level, "size"))
+                if name == "deletes" or size == 0:
+                    side.pop(price, None)
+                else:
+                    side[price] = size
+        self.last_updated_at = field(data, "last_updated_at") or 0
+        self.seq_no = field(data, "seq_no") or 0
+
+    def best_bid(self) -> tuple[int, int] | None:
+        """(price, size) of the best bid, or None."""
+        if not self.bids:
+            return None
+        price = max(self.bids)
+        return price, self.bids[price]
+
+    def best_ask(self) -> tuple[int, int] | None:
+        """(price, size) of the best ask, or None."""
+        if not self.asks:
+            return None
+        price = min(self.asks)
+        return price, self.asks[price]
+
+    def top(self, depth: int) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """Best `depth` bids and asks as (price, size), best first."""
+        return sorted(self.bids.items(), reverse=True)[:depth], sorted(self.asks.items())[:depth]
+
+
+__all__ = ["LevelBook"]
@@ -0,0 +1,400 @@
+"""
+Funding rate and funding payment analytics.
+
+`FundingTracker` keeps, per market, the funding data history (`fetch_funding_data` and
+`FUNDING_DATA`) and the account's funding payments (`fetch_funding_payments` and
+`FUNDING_PAYMENTS`) in columnar `array` series. Running totals are extended as rows
+arrive, so cumulative funding, time-weighted and annualized rates and position funding
+PnL over any window are answered with two binary searches instead of re-aggregating
+the history.
+
+The funding index is cumulative funding per unit of position, in the quote asset; it
+rises while longs pay shorts. The funding PnL of a position of signed `size` between
+two times is therefore `-size x (index_end - index_start)`.
+
+Examples:
+    >>> funding = FundingTracker.from_markets(NexDex.api_client.fetch_markets())
+    >>> now = int(time.time() * 1000)
+    >>> funding.backfill_from(NexDex.api_client, start_at=now - 30 * 86_400_000, end_at=now, payments=True)
+    >>> await funding.subscribe(NexDex.ws_client, payments=True)
+    >>> funding.annualized_rate("BTC-USD-PERP", window_ms=7 * 86_400_000)
+    >>> funding.position_funding_pnl("BTC-USD-PERP", size=-0.5, start_at=opened_at)
+    >>> funding.funding_paid("BTC-USD-PERP", start_at=now - 86_400_000)
+"""
+
+import logging
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping, Sequence
+from typing import Any
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.marketdata.book import field
+
+DEFAULT_FUNDING_PERIOD_HOURS = 8.0
+
+HOUR_MS = 3_600_000
+YEAR_MS = 365 * 24 * HOUR_MS
+
+
+def _float(value: Any) -> float:
+    return float(value) if value not in (None, "") else 0.0
+
+
+class FundingSeries:
+    """Funding data of one market as time-ordered columns.
+
+    Attributes:
+        created_at (array): Sample times in ms
+        rate (array): Funding rate per funding period
+        premium (array): Funding premium
+        index (array): Funding index
+        rate_time (array): Running integral of the rate over time (rate x ms) up to each sample
+    """
+
+    __slots__ = ("created_at", "index", "premium", "rate", "rate_time")
+
+    def __init__(self) -> None:
+        self.created_at = array("q")
+        self.rate = array("d")
+        self.premium = array("d")
+        self.index = array("d")
+        self.rate_time = array("d")
+
+    def __len__(self) -> int:
+        return len(self.created_at)
+
+    def append(self, created_at: int, rate: float, premium: float, index: float) -> bool:
+        """Add a sample; older or duplicate times are inserted by `extend` instead. Returns False if not newer."""
+        if self.created_at and created_at <= self.created_at[-1]:
+            return False
+        area = self.rate_time[-1] + self.rate[-1] * (created_at - self.created_at[-1]) if self.created_at else 0.0
+        self.created_at.append(created_at)
+        self.rate.append(rate)
+        self.premium.append(premium)
+        self.index.append(index)
+        self.rate_time.append(area)
+        return True
+
+    def extend(self, rows: Iterable[tuple[int, float, float, float]]) -> int:
+        """Merge `(created_at, rate, premium, index)` rows in any order; returns the number of new samples."""
+        rows = sorted(rows)
+        if not rows:
+            return 0
+        if not self.created_at or rows[0][0] > self.created_at[-1]:
+            return sum(self.append(*row) for row in rows)
+        # Rows overlap the history (backfill after streaming started): rebuild once
+        merged = dict(zip(self.created_at, zip(self.rate, self.premium, self.index, strict=True), strict=True))
+        before = len(merged)
+        for created_at, rate, premium, index in rows:
+            merged.setdefault(created_at, (rate, premium, index))
+        for column in (self.created_at, self.rate, self.premium, self.index, self.rate_time):
+            del column[:]
+        for created_at in sorted(merged):
+            self.append(created_at, *merged[created_at])
+        return len(merged) - before
+
+    def at(self, ts: int) -> int:
+        """Position of the newest sample at or before `ts`, -1 if none."""
+        return bisect_right(self.created_at, ts) - 1
+
+    def index_at(self, ts: int) -> float | None:
+        """Funding index at `ts` (latest sample at or before it), None before the first sample."""
+        i = self.at(ts)
+        return self.index[i] if i >= 0 else None
+
+    def rate_integral(self, ts: int) -> float:
+        """Integral of the rate over time from the first sample to `ts`."""
+        i = self.at(ts)
+        if i < 0:
+            return 0.0
+        return self.rate_time[i] + self.rate[i] * (ts - self.created_at[i])
+
+
+class FundingPayments:
+    """Funding payments of one market as time-ordered columns, deduplicated by id.
+
+    Attributes:
+        created_at (array): Payment times in ms
+        payment (array): Payment amounts in the settlement asset, negative when paid
+        total (array): Running sum of `payment`
+    """
+
+    __slots__ = ("_ids", "created_at", "payment", "total")
+
+    def __init__(self) -> None:
+        self.created_at = array("q")
+        self.payment = array("d")
+        self.total = array("d")
+        self._ids: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.created_at)
+
+    def add(self, payment_id: str | None, created_at: int, payment: float) -> bool:
+        """Record a payment; False if its id was already recorded."""
+        if payment_id is not None:
+            if payment_id in self._ids:
+                return False
+            self._ids.add(payment_id)
+        if self.created_at and created_at < self.created_at[-1]:
+            # Older than the newest payment: insert and fix the running sum after it
+            i = bisect_right(self.created_at, created_at)
+            self.created_at.insert(i, created_at)
+            self.payment.insert(i, payment)
+            self.total.insert(i, (self.total[i - 1] if i else 0.0) + payment)
+            for j in range(i + 1, len(self.total)):
+                self.total[j] += payment
+            return True
+        self.created_at.append(created_at)
+        self.payment.append(payment)
+        self.total.append((self.total[-1] if self.total else 0.0) + payment)
+        return True
+
+    def total_at(self, ts: int) -> float:
+        """Sum of the payments up to and including `ts`."""
+        i = bisect_right(self.created_at, ts)
+        return self.total[i - 1] if i else 0.0
+
+
+class FundingTracker:
+    """Funding history and analytics of several markets, from REST backfill and WebSocket streams.
+
+    Attributes:
+        data (dict[str, FundingSeries]): Funding data per market
+        payments (dict[str, FundingPayments]): Funding payments of the account per market
+        comparisons (dict[str, Any]): Latest `FUNDING_RATE_COMPARISON` payload per market
+
+    Args:
+        markets (Sequence[str]): Market symbols
+        funding_periods (Mapping[str, float], optional): Funding period in hours per market.
+            Defaults to None (`DEFAULT_FUNDING_PERIOD_HOURS` for every market).
+        logger (logging.Logger, optional): Logger. Defaults to None.
+    """
+
+    classname: str = "FundingTracker"
+
+    def __init__(
+        self,
+        markets: Sequence[str],
+        funding_periods: Mapping[str, float] | None = None,
+        logger: logging.Logger | None = None,
+    ):
+        self.logger = logger or logging.getLogger(__name__)
+        self.markets = list(markets)
+        periods = funding_periods or {}
+        self.funding_periods = {market: float(periods.get(market, DEFAULT_FUNDING_PERIOD_HOURS)) for market in markets}
+        self.data = {market: FundingSeries() for market in self.markets}
+        self.payments = {market: FundingPayments() for market in self.markets}
+        self.comparisons: dict[str, Any] = {}
+
+    @classmethod
+    def from_markets(cls, response: Any, **kwargs: Any) -> "FundingTracker":
+        """Build from a `fetch_markets` response (dict or `ResponsePage`), taking each market's funding period."""
+        markets = response.get("results", []) if hasattr(response, "get") else response
+        periods = {
+            field(market, "symbol"): field(market, "funding_period_hours") or DEFAULT_FUNDING_PERIOD_HOURS
+            for market in markets
+            if field(market, "symbol") and field(market, "asset_kind") in (None, "PERP")
+        }
+        return cls(list(periods), funding_periods=periods, **kwargs)
+
+    def _series(self, market: str) -> FundingSeries:
+        series = self.data.get(market)
+        if series is None:
+            raise ValueError(f"{self.classname}: Unknown market {market}")
+        return series
+
+    def add_funding_data(self, rows: Any) -> int:
+        """Apply `FUNDING_DATA` payloads or `fetch_funding_data` rows, one or a list; returns new samples."""
+        by_market: dict[str, list[tuple[int, float, float, float]]] = {}
+        for row in rows if isinstance(rows, list) else (rows,):
+            market, created_at = field(row, "market"), field(row, "created_at")
+            if market not in self.data or not created_at:
+                continue
+            by_market.setdefault(market, []).append(
+                (
+                    int(created_at),
+                    _float(field(row, "funding_rate")),
+                    _float(field(row, "funding_premium")),
+                    _float(field(row, "funding_index")),
+                )
+            )
+        return sum(self.data[market].extend(samples) for market, samples in by_market.items())
+
+    def add_funding_payments(self, rows: Any) -> int:
+        """Apply `FUNDING_PAYMENTS` payloads or `fetch_funding_payments` rows, one or a list; returns new payments."""
+        added = 0
+        for row in rows if isinstance(rows, list) else (rows,):
+            payments = self.payments.get(field(row, "market"))
+            created_at = field(row, "created_at")
+            if payments is None or not created_at:
+                continue
+            added += payments.add(field(row, "id"), int(created_at), _float(field(row, "payment")))
+        return added
+
+    def backfill_from(
+        self,
+        api_client: NexDexApiClient,
+        start_at: int,
+        end_at: int,
+        markets: Iterable[str] | None = None,
+        payments: bool = False,
+        page_size: int = 5000,
+    ) -> None:
+        """Load funding data, and optionally the account's funding payments, between `start_at` and `end_at` (ms).
+
+        Args:
+            api_client (NexDexApiClient): REST client; authenticated when `payments` is True
+            start_at (int): Start time in ms
+            end_at (int): End time in ms
+            markets (Iterable[str], optional): Markets to load. Defaults to None (all markets).
+            payments (bool, optional): Also load funding payments (private). Defaults to False.
+            page_size (int, optional): Rows per page. Defaults to 5000.
+        """
+        fetches = [("funding data", api_client.fetch_funding_data, self.add_funding_data)]
+        if payments:
+            fetches.append(("funding payments", api_client.fetch_funding_payments, self.add_funding_payments))
+        for market in self.markets if markets is None else markets:
+            for kind, fetch, add in fetches:
+                params: dict[str, Any] = {
+                    "market": market,
+                    "start_at": start_at,
+                    "end_at": end_at,
+                    "page_size": page_size,
+                }
+                added = 0
+                while True:
+                    response = fetch(params=params)
+                    added += add(response.get("results") or [])
+                    cursor = response.get("next")
+                    if not cursor:
+                        break
+                    params["cursor"] = cursor
+                self.logger.debug(f"{self.classname}: Backfilled {added} {kind} rows of {market}")
+
+    async def on_message(self, ws_channel: NexDexWebsocketChannel, message: dict) -> None:
+        """WebSocket callback for `FUNDING_DATA`, `FUNDING_PAYMENTS` and `FUNDING_RATE_COMPARISON` channels."""
+        data = message["params"]["data"]
+        if ws_channel == NexDexWebsocketChannel.FUNDING_DATA:
+            self.add_funding_data(data)
+        elif ws_channel == NexDexWebsocketChannel.FUNDING_PAYMENTS:
+            self.add_funding_payments(data)
+        elif ws_channel == NexDexWebsocketChannel.FUNDING_RATE_COMPARISON:
+            for row in data if isinstance(data, list) else (data,):
+                self.comparisons[field(row, "market")] = row
+
+    async def subscribe(
+        self,
+        ws_client: NexDexWebsocketClient,
+        data: bool = True,
+        payments: bool = False,
+        comparison: bool = False,
+    ) -> None:
+        """Subscribe `ws_client` to the funding channels of every market.
+
+        Args:
+            ws_client (NexDexWebsocketClient): Connected client; authenticated when `payments` is True
+            data (bool, optional): Subscribe to `FUNDING_DATA`. Defaults to True.
+            payments (bool, optional): Subscribe to `FUNDING_PAYMENTS` (private). Defaults to False.
+            comparison (bool, optional): Subscribe to `FUNDING_RATE_COMPARISON`. Defaults to False.
+        """
+        channels = [
+            channel
+            for channel, wanted in (
+                (NexDexWebsocketChannel.FUNDING_DATA, data),
+                (NexDexWebsocketChannel.FUNDING_PAYMENTS, payments),
+                (NexDexWebsocketChannel.FUNDING_RATE_COMPARISON, comparison),
+            )
+            if wanted
+        ]
+        for market in self.markets:
+            for channel in channels:
+                await ws_client.subscribe(channel, self.on_message, {"market": market})
+
+    def latest(self, market: str) -> dict[str, float] | None:
+        """Newest funding sample of a market, None before the first one."""
+        series = self._series(market)
+        if not series:
+            return None
+        return {
+            "created_at": series.created_at[-1],
+            "funding_rate": series.rate[-1],
+            "funding_premium": series.premium[-1],
+            "funding_index": series.index[-1],
+        }
+
+    def cumulative_funding(self, market: str, start_at: int, end_at: int | None = None) -> float | None:
+        """Change of the funding index between two times, i.e. funding per unit of a long position paid.
+
+        Returns None if there is no sample at or before `start_at`.
+        """
+        series = self._series(market)
+        if not series:
+            return None
+        end = series.index[-1] if end_at is None else series.index_at(end_at)
+        start = series.index_at(start_at)
+        if start is None or end is None:
+            return None
+        return end - start
+
+    def average_rate(self, market: str, window_ms: int, end_at: int | None = None) -> float | None:
+        """Time-weighted funding rate per period over `window_ms` ending at `end_at` (default: newest sample).
+
+        Returns None if the window starts before the first sample.
+        """
+        series = self._series(market)
+        if not series:
+            return None
+        end = series.created_at[-1] if end_at is None else end_at
+        start = end - window_ms
+        if window_ms <= 0 or start < series.created_at[0]:
+            return None
+        return (series.rate_integral(end) - series.rate_integral(start)) / window_ms
+
+    def annualized_rate(self, market: str, window_ms: int | None = None) -> float | None:
+        """Funding rate as a yearly fraction: the latest rate, or the average over `window_ms`."""
+        if window_ms is not None:
+            rate = self.average_rate(market, window_ms)
+        else:
+            series = self._series(market)
+            rate = series.rate[-1] if series else None
+        if rate is None:
+            return None
+        return rate * YEAR_MS / (self.funding_periods[market] * HOUR_MS)
+
+    def projected_payment(self, market: str, size: float, price: float, horizon_ms: int | None = None) -> float | None:
+        """Funding a position of signed `size` receives over `horizon_ms` at the latest rate; negative when paid.
+
+        Args:
+            market (str): Market symbol
+            size (float): Position size, negative for shorts
+            price (float): Mark price used as the position value
+            horizon_ms (int, optional): Projection horizon. Defaults to None (one funding period).
+        """
+        series = self._series(market)
+        if not series:
+            return None
+        period_ms = self.funding_periods[market] * HOUR_MS
+        horizon = period_ms if horizon_ms is None else horizon_ms
+        return -size * price * series.rate[-1] * horizon / period_ms
+
+    def position_funding_pnl(self, market: str, size: float, start_at: int, end_at: int | None = None) -> float | None:
+        """Funding PnL of a position of signed `size` held from `start_at` to `end_at` (default: newest sample)."""
+        funding = self.cumulative_funding(market, start_at, end_at)
+        return None if funding is None else -size * funding
+
+    def funding_paid(self, market: str, start_at: int = 0, end_at: int | None = None) -> float:
+        """Sum of the account's funding payments of a market in [`start_at`, `end_at`]; negative when paid."""
+        payments = self.payments.get(market)
+        if payments is None:
+            raise ValueError(f"{self.classname}: Unknown market {market}")
+        if not payments:
+            return 0.0
+        end = payments.total[-1] if end_at is None else payments.total_at(end_at)
+        i = bisect_left(payments.created_at, start_at)
+        return end - (payments.total[i - 1] if i else 0.0)
+
+
+__all__ = ["DEFAULT_FUNDING_PERIOD_HOURS", "FundingPayments", "FundingSeries", "FundingTracker"]
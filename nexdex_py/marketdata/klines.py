@@ -0,0 +1,304 @@
+"""
+Streaming OHLCV candles built from the `TRADES` channel.
+
+`KlineAggregator` folds every trade into the open candle of each resolution supported by
+`fetch_klines` (1, 3, 5, 15, 30 and 60 minutes). Candles live in preallocated ring buffers
+(`array` columns), so the history kept per market and resolution is bounded and updating
+a candle never allocates.
+
+A REST backfill seeds the history. Subscribe first: trades received before the backfill of
+a market and resolution completes are held back, then the ones at or after the backfill
+`end_at` are replayed on top of the REST candles, extending the last one. Older trades are
+already counted by the REST candles and are dropped, which stitches both sources at the
+boundary without gaps or double counting.
+
+Examples:
+    >>> klines = KlineAggregator(["BTC-USD-PERP"])
+    >>> await klines.subscribe(NexDex.ws_client)
+    >>> now = int(time.time() * 1000)
+    >>> klines.backfill_from(NexDex.api_client, start_at=now - 86_400_000, end_at=now)
+    >>> klines.last("BTC-USD-PERP", 5)
+    Kline(start=..., open=65000.5, high=65010.0, low=64990.0, close=65002.0, volume=3.2)
+"""
+
+import logging
+from array import array
+from collections.abc import Iterable, Sequence
+from typing import Any, NamedTuple
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.marketdata.book import field
+
+RESOLUTIONS = (1, 3, 5, 15, 30, 60)
+
+MINUTE_MS = 60_000
+
+
+class Kline(NamedTuple):
+    """One candle; `start` is the open time in ms."""
+
+    start: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+class CandleRing:
+    """Fixed-capacity ring of candles of one resolution, oldest overwritten first.
+
+    Args:
+        resolution (int): Candle width in minutes
+        capacity (int): Candles kept
+    """
+
+    __slots__ = ("capacity", "close", "count", "head", "high", "low", "open", "start", "volume", "width")
+
+    def __init__(self, resolution: int, capacity: int):
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.width = resolution * MINUTE_MS
+        self.capacity = capacity
+        self.start = array("q", bytes(8 * capacity))
+        self.open = array("d", bytes(8 * capacity))
+        self.high = array("d", bytes(8 * capacity))
+        self.low = array("d", bytes(8 * capacity))
+        self.close = array("d", bytes(8 * capacity))
+        self.volume = array("d", bytes(8 * capacity))
+        # Slot of the newest candle and number of candles held
+        self.head = -1
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def bucket(self, ts: int) -> int:
+        """Open time of the candle containing `ts`."""
+        return ts - ts % self.width
+
+    def _slot(self, age: int) -> int:
+        """Slot of the candle `age` candles older than the newest."""
+        return (self.head - age) % self.capacity
+
+    def _push(self, start: int, o: float, h: float, low: float, c: float, v: float) -> None:
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        i = self.head
+        self.start[i], self.open[i], self.high[i], self.low[i], self.close[i], self.volume[i] = start, o, h, low, c, v
+
+    def put(self, kline: Kline) -> None:
+        """Store a complete candle (backfill); replaces the newest candle if it has the same start."""
+        start = self.bucket(kline.start)
+        if self.count and start < self.start[self.head]:
+            raise ValueError(f"Candle {start} is older than the newest candle {self.start[self.head]}")
+        if self.count and start == self.start[self.head]:
+            i = self.head
+            self.open[i], self.high[i], self.low[i], self.close[i], self.volume[i] = kline[1:]
+            return
+        self._fill_gap(start)
+        self._push(start, *kline[1:])
+
+    def _fill_gap(self, start: int) -> None:
+        """Add flat, zero-volume candles between the newest candle and `start`."""
+        if not self.count:
+            return
+        last_start = self.start[self.head]
+        close = self.close[self.head]
+        missing = (start - last_start) // self.width - 1
+        # Only the newest `capacity` candles survive, skip the rest
+        first = last_start + max(1, missing - self.capacity + 2) * self.width
+        for gap_start in range(first, start, self.width):
+            self._push(gap_start, close, close, close, close, 0.0)
+
+    def add_trade(self, ts: int, price: float, size: float) -> bool:
+        """Fold a trade into its candle; False if the candle already left the ring."""
+        start = self.bucket(ts)
+        if not self.count or start > self.start[self.head]:
+            self._fill_gap(start)
+            self._push(start, price, price, price, price, size)
+            return True
+        age = (self.start[self.head] - start) // self.width
+        if age >= self.count:
+            return False
+        i = self._slot(age)
+        if price > self.high[i]:
+            self.high[i] = price
+        if price < self.low[i]:
+            self.low[i] = price
+        if age == 0:
+            self.close[i] = price
+        self.volume[i] += size
+        return True
+
+    def get(self, age: int = 0) -> Kline | None:
+        """Candle `age` candles older than the newest, None if not held."""
+        if age >= self.count:
+            return None
+        i = self._slot(age)
+        return Kline(self.start[i], self.open[i], self.high[i], self.low[i], self.close[i], self.volume[i])
+
+    def to_list(self, count: int | None = None) -> list[Kline]:
+        """Newest `count` candles (all by default), oldest first."""
+        count = self.count if count is None else min(count, self.count)
+        return [self.get(age) for age in range(count - 1, -1, -1)]  # type: ignore[misc]
+
+
+def parse_kline(row: Any) -> Kline:
+    """`Kline` of a `fetch_klines` row: `[start, open, high, low, close, volume]` or a dict with those keys."""
+    if isinstance(row, dict):
+        row = [row.get(name) for name in ("timestamp", "open", "high", "low", "close", "volume")]
+    start, o, h, low, c, v = row[:6]
+    return Kline(int(start), float(o), float(h), float(low), float(c), float(v or 0))
+
+
+class KlineAggregator:
+    """Rolling candles of several markets at several resolutions, from REST backfill and `TRADES`.
+
+    Args:
+        markets (Sequence[str]): Market symbols
+        resolutions (Sequence[int], optional): Resolutions in minutes. Defaults to all of `RESOLUTIONS`.
+        capacity (int, optional): Candles kept per market and resolution. Defaults to 1440.
+        backfill (bool, optional): Hold back trades of each market and resolution until `backfill` (or
+            `finish_backfill`) is called for it. False folds trades in as they arrive and disables
+            backfilling. Defaults to True.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+    """
+
+    classname: str = "KlineAggregator"
+
+    def __init__(
+        self,
+        markets: Sequence[str],
+        resolutions: Sequence[int] = RESOLUTIONS,
+        capacity: int = 1440,
+        backfill: bool = True,
+        logger: logging.Logger | None = None,
+    ):
+        unsupported = set(resolutions) - set(RESOLUTIONS)
+        if unsupported:
+            raise ValueError(f"{self.classname}: Unsupported resolutions {sorted(unsupported)}, expected {RESOLUTIONS}")
+        self.logger = logger or logging.getLogger(__name__)
+        self.markets = list(markets)
+        self.resolutions = tuple(sorted(resolutions))
+        self._rings = {
+            market: {resolution: CandleRing(resolution, capacity) for resolution in self.resolutions}
+            for market in self.markets
+        }
+        # Backfill cutoff per market and resolution: trades before it are counted by REST candles
+        self._cutoff: dict[tuple[str, int], int] = {}
+        # Trades held back per market and resolution until its backfill completes, as (ts, price, size)
+        self._pending: dict[tuple[str, int], list[tuple[int, float, float]]] = (
+            {(market, resolution): [] for market in self.markets for resolution in self.resolutions}
+            if backfill
+            else {}
+        )
+
+    def ring(self, market: str, resolution: int) -> CandleRing:
+        """Ring buffer of one market and resolution.
+
+        Raises:
+            KeyError: For an unknown market or resolution
+        """
+        return self._rings[market][resolution]
+
+    def backfill(self, market: str, resolution: int, rows: Iterable[Any], end_at: int) -> int:
+        """Seed candles from `fetch_klines` rows, then replay the trades held back since; returns candles stored.
+
+        Args:
+            market (str): Market symbol
+            resolution (int): Resolution of the rows in minutes
+            rows (Iterable): `results` of a `fetch_klines` response
+            end_at (int): `end_at` of the request in ms; earlier trades are counted by the rows
+
+        Raises:
+            ValueError: If the market and resolution is not waiting for a backfill
+        """
+        ring = self.ring(market, resolution)
+        if (market, resolution) not in self._pending:
+            raise ValueError(f"{self.classname}: {market} {resolution}m is not waiting for a backfill")
+        klines = sorted((parse_kline(row) for row in rows), key=lambda kline: kline.start)
+        for kline in klines:
+            ring.put(kline)
+        self.finish_backfill(market, resolution, end_at)
+        return len(klines)
+
+    def finish_backfill(self, market: str, resolution: int, end_at: int = 0) -> int:
+        """Stop holding back trades of a market and resolution and fold in those at or after `end_at`.
+
+        Called by `backfill`; call it directly to start from live trades only. Returns the trades replayed.
+        """
+        pending = self._pending.pop((market, resolution), None)
+        if pending is None:
+            return 0
+        self._cutoff[market, resolution] = end_at
+        ring = self.ring(market, resolution)
+        replayed = 0
+        for ts, price, size in sorted(pending):
+            if ts >= end_at:
+                ring.add_trade(ts, price, size)
+                replayed += 1
+        return replayed
+
+    def backfill_from(
+        self,
+        api_client: NexDexApiClient,
+        start_at: int,
+        end_at: int,
+        markets: Iterable[str] | None = None,
+    ) -> None:
+        """Backfill every market and resolution with `fetch_klines` between `start_at` and `end_at` (ms)."""
+        for market in self.markets if markets is None else markets:
+            for resolution in self.resolutions:
+                response = api_client.fetch_klines(
+                    symbol=market, resolution=str(resolution), start_at=start_at, end_at=end_at
+                )
+                rows = response.get("results", []) if hasattr(response, "get") else response
+                stored = self.backfill(market, resolution, rows, end_at)
+                self.logger.debug(f"{self.classname}: Backfilled {stored} {resolution}m candles of {market}")
+
+    def add_trade(self, data: Any) -> bool:
+        """Apply a `TRADES` payload (dict or `WsTrade`); False for unknown markets or missing fields."""
+        rings = self._rings.get(field(data, "market"))
+        ts = field(data, "created_at")
+        price = field(data, "price")
+        if rings is None or not ts or price in (None, ""):
+            return False
+        market = field(data, "market")
+        price = float(price)
+        size = float(field(data, "size") or 0)
+        for resolution, ring in rings.items():
+            pending = self._pending.get((market, resolution))
+            if pending is not None:
+                pending.append((ts, price, size))
+                continue
+            if ts < self._cutoff.get((market, resolution), 0):
+                continue
+            if not ring.add_trade(ts, price, size):
+                self.logger.debug(f"{self.classname}: Dropped trade at {ts} older than the {resolution}m history")
+        return True
+
+    async def on_message(self, ws_channel: NexDexWebsocketChannel, message: dict) -> None:
+        """WebSocket callback for the `TRADES` channel."""
+        if ws_channel != NexDexWebsocketChannel.TRADES:
+            return
+        data = message["params"]["data"]
+        for trade in data if isinstance(data, list) else (data,):
+            self.add_trade(trade)
+
+    async def subscribe(self, ws_client: NexDexWebsocketClient) -> None:
+        """Subscribe `ws_client` to `TRADES` of every market."""
+        for market in self.markets:
+            await ws_client.subscribe(NexDexWebsocketChannel.TRADES, self.on_message, {"market": market})
+
+    def candles(self, market: str, resolution: int, count: int | None = None) -> list[Kline]:
+        """Newest `count` candles (all by default) of a market, oldest first; the last one may still be open."""
+        return self.ring(market, resolution).to_list(count)
+
+    def last(self, market: str, resolution: int) -> Kline | None:
+        """Newest, possibly still open, candle of a market."""
+        return self.ring(market, resolution).get()
+
+
+__all__ = ["RESOLUTIONS", "CandleRing", "Kline", "KlineAggregator", "parse_kline"]
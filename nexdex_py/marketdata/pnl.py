@@ -0,0 +1,318 @@
+"""
+Local mark-to-market PnL over the account's fills.
+
+`PnLEngine` keeps, per market, the position and its entry cost in chain integers
+(price and size scaled by 10^8, see `nexdex_py.common.quantization`) and updates them with
+each fill using average-entry accounting: fills that grow a position add to its cost,
+fills that reduce it realize `closed x (price - average entry)`. Unrealized PnL is
+`position x mark - cost` at the latest price from `BBO` or `MARKETS_SUMMARY`. Every event
+is O(1); nothing is recomputed over the fill history, and integer arithmetic keeps
+round trips exact.
+
+Examples:
+    >>> pnl = PnLEngine()
+    >>> pnl.seed_positions(NexDex.api_client.fetch_positions())       # positions opened before the backfill
+    >>> pnl.backfill_from(NexDex.api_client, start_at=positions_time)
+    >>> await pnl.subscribe(NexDex.ws_client, ["BTC-USD-PERP", "ETH-USD-PERP"])
+    >>> pnl.summary("BTC-USD-PERP")
+    {'position': Decimal('0.5'), 'average_entry': Decimal('65000'), 'realized': ..., 'unrealized': ..., ...}
+    >>> pnl.total_unrealized()
+"""
+
+import logging
+from collections import deque
+from collections.abc import Iterable
+from decimal import Decimal
+from typing import Any
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.common.quantization import CHAIN_DECIMALS, from_chain_int
+from nexdex_py.marketdata.book import field, units
+
+PRICE_SOURCES = ("mark", "mid", "last")
+
+
+def _notional(value: int) -> Decimal:
+    """Display value of a price x size product of chain integers."""
+    return Decimal(value).scaleb(-2 * CHAIN_DECIMALS)
+
+
+class MarketPnL:
+    """Position and PnL state of one market, in chain integers.
+
+    Attributes:
+        position (int): Signed position size, negative when short
+        cost (int): Entry notional of the position, price x size (10^16 scale), signed like `position`
+        realized (int): Realized PnL, price x size (10^16 scale), before fees
+        fees (int): Fees paid (10^8 scale), negative for rebates
+        price (int): Latest price used for marking, 0 until known
+        last_fill_at (int): Time of the latest fill applied, ms
+    """
+
+    __slots__ = ("cost", "fees", "last_fill_at", "position", "price", "realized")
+
+    def __init__(self) -> None:
+        self.position = 0
+        self.cost = 0
+        self.realized = 0
+        self.fees = 0
+        self.price = 0
+        self.last_fill_at = 0
+
+    def fill(self, size: int, price: int, fee: int = 0) -> int:
+        """Apply a fill of signed `size` (positive buys) at `price`; returns the PnL it realized."""
+        realized = 0
+        position = self.position
+        if position and (position > 0) != (size > 0):
+            # Reduce toward flat: `closed` has the sign of the position
+            closed = -size if abs(size) < abs(position) else position
+            released = self.cost * closed // position if closed != position else self.cost
+            realized = closed * price - released
+            self.position = position = position - closed
+            self.cost -= released
+            size += closed
+        if size:
+            # Open, increase, or the remainder of a flip
+            self.position = position + size
+            self.cost += size * price
+        self.realized += realized
+        self.fees += fee
+        return realized
+
+    def unrealized(self) -> int:
+        """Unrealized PnL at `price` (10^16 scale); 0 while flat or before a price is known."""
+        if not self.position or not self.price:
+            return 0
+        return self.position * self.price - self.cost
+
+
+class PnLEngine:
+    """Realized and unrealized PnL per market from fills and prices.
+
+    Fills are applied in arrival order and deduplicated by id, so a REST backfill and the
+    `FILLS` stream can overlap. Average-entry accounting depends on fill order, hence the
+    backfill is applied oldest first and should precede streaming.
+
+    Only ids of fills within `dedup_window_ms` of the newest fill are kept. Fills older than
+    that window can no longer be told apart from replays and are dropped.
+
+    Args:
+        price_source (str, optional): Price used for marking: "mark" (`MARKETS_SUMMARY` mark price),
+            "mid" (`BBO` mid) or "last" (`MARKETS_SUMMARY` last traded price). Defaults to "mark".
+        dedup_window_ms (int, optional): Age, relative to the newest fill, of the fills deduplicated by id.
+            Defaults to 3_600_000 (one hour).
+        logger (logging.Logger, optional): Logger. Defaults to None.
+    """
+
+    classname: str = "PnLEngine"
+
+    def __init__(
+        self,
+        price_source: str = "mark",
+        dedup_window_ms: int = 3_600_000,
+        logger: logging.Logger | None = None,
+    ):
+        if price_source not in PRICE_SOURCES:
+            raise ValueError(
+                f"{self.classname}: Unknown price source {price_source!r}, expected one of {PRICE_SOURCES}"
+            )
+        self.logger = logger or logging.getLogger(__name__)
+        self.price_source = price_source
+        self.dedup_window_ms = dedup_window_ms
+        self.markets: dict[str, MarketPnL] = {}
+        # Ids of the fills applied within the dedup window, and their (created_at, id) oldest first
+        self._fill_ids: set[str] = set()
+        self._fill_times: deque[tuple[int, str]] = deque()
+        self._last_fill_at = 0
+
+    def market(self, market: str) -> MarketPnL:
+        """State of a market, created flat on first use."""
+        state = self.markets.get(market)
+        if state is None:
+            state = self.markets[market] = MarketPnL()
+        return state
+
+    def seed_position(self, market: str, size: Any, average_entry_price: Any) -> None:
+        """Start a market from an existing position, e.g. one opened before the fill backfill.
+
+        Args:
+            market (str): Market symbol
+            size (Any): Signed position size, negative when short
+            average_entry_price (Any): Average entry price of the position
+        """
+        state = self.market(market)
+        state.position = units(size)
+        state.cost = state.position * units(average_entry_price)
+
+    def seed_positions(self, response: Any) -> None:
+        """Seed every open position of a `fetch_positions` response (dict or `ResponsePage`)."""
+        positions = response.get("results", []) if hasattr(response, "get") else response
+        for position in positions:
+            size = from_chain_int(units(field(position, "size")))
+            if not size or field(position, "status") == "CLOSED":
+                continue
+            if field(position, "side") == "SHORT" and size > 0:
+                size = -size
+            self.seed_position(field(position, "market"), size, field(position, "average_entry_price"))
+
+    def add_fill(self, data: Any) -> bool:
+        """Apply a `FILLS` payload or a `fetch_fills` row (dict or typed); False if already applied or invalid."""
+        fill_id = field(data, "id")
+        created_at = field(data, "created_at") or 0
+        if fill_id is not None and fill_id in self._fill_ids:
+            return False
+        if created_at and created_at < self._last_fill_at - self.dedup_window_ms:
+            self.logger.debug(f"{self.classname}: Dropped fill {fill_id} older than the dedup window")
+            return False
+        size = units(field(data, "size"))
+        price = units(field(data, "price"))
+        if not size or not price:
+            return False
+        side = field(data, "side")
+        state = self.market(field(data, "market"))
+        state.fill(size if side == "BUY" else -size, price, units(field(data, "fee")))
+        state.last_fill_at = max(state.last_fill_at, created_at)
+        if fill_id is not None:
+            self._remember(fill_id, created_at)
+        return True
+
+    def _remember(self, fill_id: str, created_at: int) -> None:
+        """Record an applied fill id and forget the ids that left the dedup window."""
+        self._fill_ids.add(fill_id)
+        self._fill_times.append((created_at, fill_id))
+        if created_at <= self._last_fill_at:
+            return
+        self._last_fill_at = created_at
+        cutoff = created_at - self.dedup_window_ms
+        while self._fill_times and self._fill_times[0][0] < cutoff:
+            self._fill_ids.discard(self._fill_times.popleft()[1])
+
+    def add_fills(self, rows: Iterable[Any]) -> int:
+        """Apply fills oldest first; returns the number applied."""
+        return sum(self.add_fill(row) for row in sorted(rows, key=lambda row: field(row, "created_at") or 0))
+
+    def backfill_from(
+        self,
+        api_client: NexDexApiClient,
+        start_at: int,
+        end_at: int | None = None,
+        market: str | None = None,
+        page_size: int = 5000,
+    ) -> int:
+        """Apply the account's fills since `start_at` (ms) from `fetch_fills`; returns the number applied.
+
+        Args:
+            api_client (NexDexApiClient): Authenticated REST client
+            start_at (int): Start time in ms
+            end_at (int, optional): End time in ms. Defaults to None (now).
+            market (str, optional): Only fills of this market. Defaults to None (all markets).
+            page_size (int, optional): Fills per page. Defaults to 5000.
+        """
+        params: dict[str, Any] = {"start_at": start_at, "page_size": page_size}
+        if end_at is not None:
+            params["end_at"] = end_at
+        if market is not None:
+            params["market"] = market
+        rows: list[Any] = []
+        while True:
+            response = api_client.fetch_fills(params=params)
+            rows.extend(response.get("results") or [])
+            cursor = response.get("next")
+            if not cursor:
+                break
+            params["cursor"] = cursor
+        applied = self.add_fills(rows)
+        self.logger.debug(f"{self.classname}: Backfilled {applied} fills")
+        return applied
+
+    def update_price(self, market: str, price: Any) -> bool:
+        """Set the marking price of a market; False for markets without fills or an empty price."""
+        state = self.markets.get(market)
+        if state is None or price in (None, ""):
+            return False
+        state.price = units(price)
+        return True
+
+    def update_bbo(self, data: Any) -> bool:
+        """Mark at the mid of a `BBO` payload when `price_source` is "mid"."""
+        if self.price_source != "mid":
+            return False
+        state = self.markets.get(field(data, "market"))
+        bid, ask = units(field(data, "bid")), units(field(data, "ask"))
+        if state is None or not bid or not ask:
+            return False
+        state.price = (bid + ask) // 2
+        return True
+
+    def update_summary(self, data: Any) -> int:
+        """Mark at the mark or last price of a `MARKETS_SUMMARY` payload, one or a list; returns markets updated."""
+        name = {"mark": "mark_price", "last": "last_traded_price"}.get(self.price_source)
+        if name is None:
+            return 0
+        return sum(
+            self.update_price(field(summary, "symbol"), field(summary, name))
+            for summary in (data if isinstance(data, list) else (data,))
+        )
+
+    async def on_message(self, ws_channel: NexDexWebsocketChannel, message: dict) -> None:
+        """WebSocket callback for `FILLS`, `BBO` and `MARKETS_SUMMARY` channels."""
+        data = message["params"]["data"]
+        if ws_channel == NexDexWebsocketChannel.FILLS:
+            for fill in data if isinstance(data, list) else (data,):
+                self.add_fill(fill)
+        elif ws_channel == NexDexWebsocketChannel.BBO:
+            self.update_bbo(data)
+        elif ws_channel == NexDexWebsocketChannel.MARKETS_SUMMARY:
+            self.update_summary(data)
+
+    async def subscribe(self, ws_client: NexDexWebsocketClient, markets: Iterable[str]) -> None:
+        """Subscribe an authenticated `ws_client` to `FILLS` of all markets and to the prices of `markets`."""
+        await ws_client.subscribe(NexDexWebsocketChannel.FILLS, self.on_message, {"market": "ALL"})
+        if self.price_source == "mid":
+            for market in markets:
+                await ws_client.subscribe(NexDexWebsocketChannel.BBO, self.on_message, {"market": market})
+        else:
+            await ws_client.subscribe(NexDexWebsocketChannel.MARKETS_SUMMARY, self.on_message, {"market": "ALL"})
+
+    def realized(self, market: str) -> Decimal:
+        """Realized PnL of a market before fees."""
+        return _notional(self.market(market).realized)
+
+    def unrealized(self, market: str) -> Decimal:
+        """Unrealized PnL of a market at its latest price."""
+        return _notional(self.market(market).unrealized())
+
+    def average_entry(self, market: str) -> Decimal | None:
+        """Average entry price of the open position, None while flat."""
+        state = self.market(market)
+        if not state.position:
+            return None
+        return _notional(state.cost * 10**CHAIN_DECIMALS // state.position)
+
+    def summary(self, market: str) -> dict[str, Decimal | None]:
+        """Position, average entry, price, realized, unrealized, fees and net PnL of a market."""
+        state = self.market(market)
+        realized = _notional(state.realized)
+        unrealized = _notional(state.unrealized())
+        fees = from_chain_int(state.fees)
+        return {
+            "position": from_chain_int(state.position),
+            "average_entry": self.average_entry(market),
+            "price": from_chain_int(state.price) if state.price else None,
+            "realized": realized,
+            "unrealized": unrealized,
+            "fees": fees,
+            "net": realized + unrealized - fees,
+        }
+
+    def total_realized(self) -> Decimal:
+        """Realized PnL of all markets before fees."""
+        return _notional(sum(state.realized for state in self.markets.values()))
+
+    def total_unrealized(self) -> Decimal:
+        """Unrealized PnL of all markets."""
+        return _notional(sum(state.unrealized() for state in self.markets.values()))
+
+
+__all__ = ["PRICE_SOURCES", "MarketPnL", "PnLEngine"]
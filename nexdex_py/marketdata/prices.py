@@ -0,0 +1,281 @@
+"""
+Cross-market price matrix with vectorized queries.
+
+`PriceMatrix` keeps the latest bid, ask, mark and last price of every market in NumPy
+arrays, one row per market symbol of `fetch_markets`. WebSocket updates write a single
+row; mids, spreads, staleness and basket valuations are computed for all markets at
+once instead of looping over per-market dicts.
+
+Requires `numpy`, an optional dependency of the SDK (`pip install "nexdex_py[numpy]"`).
+
+Examples:
+    >>> prices = PriceMatrix.from_markets(NexDex.api_client.fetch_markets())
+    >>> await prices.subscribe(NexDex.ws_client)
+    >>> prices.mids()                      # one float per market, NaN if a side is missing
+    >>> prices.spreads_bps()[prices.stale(max_age_ms=2_000)]
+    >>> prices.basket_value({"BTC-USD-PERP": 0.5, "ETH-USD-PERP": -8})
+"""
+
+import logging
+import time
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import Any
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.common.quantization import CHAIN_SCALE
+from nexdex_py.marketdata.book import LevelBook, field
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore[assignment]
+    NUMPY_AVAILABLE = False
+
+PRICE_FIELDS = ("bid", "ask", "mark", "last")
+
+# Missing side of a derived BBO, as (price, size)
+_EMPTY_LEVEL = (float("nan"), float("nan"))
+
+
+def _price(value: Any) -> float:
+    return float(value) if value not in (None, "") else float("nan")
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class PriceMatrix:
+    """Latest prices of many markets as NumPy arrays, one row per market.
+
+    Attributes:
+        markets (list[str]): Market of each row
+        bid, bid_size, ask, ask_size, mark, last (np.ndarray): float64 columns, NaN until first seen
+        updated_at (np.ndarray): int64 time of the last bid and ask update of each row in ms, 0 until first seen
+
+    Args:
+        markets (Sequence[str]): Market symbols
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        clock (Callable[[], int], optional): Current time in ms, used when a payload has no timestamp.
+            Defaults to None (wall clock).
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+
+    classname: str = "PriceMatrix"
+
+    def __init__(
+        self,
+        markets: Sequence[str],
+        logger: logging.Logger | None = None,
+        clock: Callable[[], int] | None = None,
+    ):
+        if not NUMPY_AVAILABLE:
+            raise ImportError(f"{self.classname} requires numpy: pip install numpy")
+        self.logger = logger or logging.getLogger(__name__)
+        self.clock = clock or _now_ms
+        self.markets = list(markets)
+        self.index = {market: row for row, market in enumerate(self.markets)}
+        size = len(self.markets)
+        self.bid = np.full(size, np.nan)
+        self.bid_size = np.full(size, np.nan)
+        self.ask = np.full(size, np.nan)
+        self.ask_size = np.full(size, np.nan)
+        self.mark = np.full(size, np.nan)
+        self.last = np.full(size, np.nan)
+        self.updated_at = np.zeros(size, dtype=np.int64)
+        # Rows priced by a BBO or ORDER_BOOK feed; their bid and ask are not overwritten by summaries
+        self._quoted = np.zeros(size, dtype=bool)
+        # Books for BBOs derived from ORDER_BOOK
+        self._books: dict[str, LevelBook] = {}
+
+    @classmethod
+    def from_markets(cls, response: Any, **kwargs: Any) -> "PriceMatrix":
+        """Build from a `fetch_markets` response (dict or `ResponsePage`), or an iterable of markets."""
+        markets = response.get("results", []) if hasattr(response, "get") else response
+        return cls([field(market, "symbol") for market in markets if field(market, "symbol")], **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.markets)
+
+    def rows(self, markets: Iterable[str]) -> "np.ndarray":
+        """Row indices of `markets`.
+
+        Raises:
+            KeyError: For a market without a row
+        """
+        return np.fromiter((self.index[market] for market in markets), dtype=np.intp)
+
+    def _touch(self, row: int, data: Any, *time_fields: str) -> None:
+        for name in time_fields:
+            value = field(data, name)
+            if value:
+                self.updated_at[row] = value
+                return
+        self.updated_at[row] = self.clock()
+
+    def update_bbo(self, data: Any) -> bool:
+        """Apply a `BBO` payload (dict or `WsBBO`); returns False for markets without a row."""
+        row = self.index.get(field(data, "market"))
+        if row is None:
+            return False
+        self.bid[row] = _price(field(data, "bid"))
+        self.bid_size[row] = _price(field(data, "bid_size"))
+        self.ask[row] = _price(field(data, "ask"))
+        self.ask_size[row] = _price(field(data, "ask_size"))
+        self._quoted[row] = True
+        self._touch(row, data, "last_updated_at")
+        return True
+
+    def update_order_book(self, data: Any) -> bool:
+        """Derive the BBO from an `ORDER_BOOK` snapshot or delta (dict or `WsOrderBook`)."""
+        market = field(data, "market")
+        row = self.index.get(market)
+        if row is None:
+            return False
+        book = self._books.get(market)
+        if book is None:
+            book = self._books[market] = LevelBook()
+        book.apply(data)
+        for (price, size), (prices, sizes) in (
+            (book.best_bid() or _EMPTY_LEVEL, (self.bid, self.bid_size)),
+            (book.best_ask() or _EMPTY_LEVEL, (self.ask, self.ask_size)),
+        ):
+            prices[row] = price / CHAIN_SCALE
+            sizes[row] = size / CHAIN_SCALE
+        self._quoted[row] = True
+        self._touch(row, data, "last_updated_at")
+        return True
+
+    def update_summary(self, data: Any) -> int:
+        """Apply a `MARKETS_SUMMARY` payload, one summary or a list; returns the number of rows updated.
+
+        Mark and last prices are always taken; bid and ask only for rows without a BBO or book feed.
+        """
+        updated = 0
+        for summary in data if isinstance(data, list) else (data,):
+            row = self.index.get(field(summary, "symbol"))
+            if row is None:
+                continue
+            mark = field(summary, "mark_price")
+            if mark not in (None, ""):
+                self.mark[row] = float(mark)
+            last = field(summary, "last_traded_price")
+            if last not in (None, ""):
+                self.last[row] = float(last)
+            if not self._quoted[row]:
+                self.bid[row] = _price(field(summary, "bid"))
+                self.ask[row] = _price(field(summary, "ask"))
+                # Quoted rows keep the time of their quote, so a stale BBO does not look fresh
+                self._touch(row, summary, "created_at")
+            updated += 1
+        return updated
+
+    async def on_message(self, ws_channel: NexDexWebsocketChannel, message: dict) -> None:
+        """WebSocket callback for `BBO`, `ORDER_BOOK` and `MARKETS_SUMMARY` channels."""
+        data = message["params"]["data"]
+        if ws_channel == NexDexWebsocketChannel.BBO:
+            self.update_bbo(data)
+        elif ws_channel == NexDexWebsocketChannel.ORDER_BOOK:
+            self.update_order_book(data)
+        elif ws_channel == NexDexWebsocketChannel.MARKETS_SUMMARY:
+            self.update_summary(data)
+
+    async def subscribe(
+        self,
+        ws_client: NexDexWebsocketClient,
+        bbo: bool = True,
+        order_book: bool = False,
+        summary: bool = True,
+        depth: int = 15,
+        refresh_rate: str = "100ms",
+    ) -> None:
+        """Subscribe `ws_client` to the price channels of every market.
+
+        Args:
+            ws_client (NexDexWebsocketClient): Connected client
+            bbo (bool, optional): Subscribe to `BBO` of each market. Defaults to True.
+            order_book (bool, optional): Derive BBOs from `ORDER_BOOK` of each market instead. Defaults to False.
+            summary (bool, optional): Subscribe to `MARKETS_SUMMARY` of all markets for mark and last prices.
+                Defaults to True.
+            depth (int, optional): Order book depth. Defaults to 15.
+            refresh_rate (str, optional): Order book refresh rate. Defaults to "100ms".
+        """
+        channels = []
+        for market in self.markets:
+            if bbo:
+                channels.append(f"bbo.{market}")
+            if order_book:
+                channels.append(f"order_book.{market}.snapshot@{depth}@{refresh_rate}")
+        if summary:
+            channels.append("markets_summary.ALL")
+        for channel_name in channels:
+            await ws_client.subscribe_by_name(channel_name, self.on_message)
+
+    def mids(self) -> "np.ndarray":
+        """(bid + ask) / 2 of every market; NaN if either side is missing."""
+        return (self.bid + self.ask) / 2
+
+    def spreads(self) -> "np.ndarray":
+        """ask - bid of every market."""
+        return self.ask - self.bid
+
+    def spreads_bps(self) -> "np.ndarray":
+        """Spread of every market in basis points of the mid."""
+        return self.spreads() / self.mids() * 10_000
+
+    def prices(self, price: str = "mid") -> "np.ndarray":
+        """Column of one price kind: "mid", "bid", "ask", "mark" or "last"."""
+        if price == "mid":
+            return self.mids()
+        if price not in PRICE_FIELDS:
+            raise ValueError(f"{self.classname}: Unknown price {price!r}, expected 'mid' or one of {PRICE_FIELDS}")
+        return getattr(self, price)
+
+    def staleness_ms(self, now_ms: int | None = None) -> "np.ndarray":
+        """Age of every row in ms; infinite for markets never updated."""
+        now = self.clock() if now_ms is None else now_ms
+        age = (now - self.updated_at).astype(np.float64)
+        age[self.updated_at == 0] = np.inf
+        return age
+
+    def stale(self, max_age_ms: float, now_ms: int | None = None) -> "np.ndarray":
+        """Boolean mask of markets not updated within `max_age_ms`."""
+        return self.staleness_ms(now_ms) > max_age_ms
+
+    def weights(self, weights: Mapping[str, float]) -> "np.ndarray":
+        """Dense weight vector aligned with the rows from a market -> weight mapping."""
+        vector = np.zeros(len(self.markets))
+        vector[self.rows(weights.keys())] = np.fromiter(weights.values(), dtype=np.float64, count=len(weights))
+        return vector
+
+    def basket_value(self, weights: "Mapping[str, float] | np.ndarray", price: str = "mid") -> float:
+        """Sum of weight x price over the basket; NaN if a weighted market has no price.
+
+        Args:
+            weights (Mapping[str, float] | np.ndarray): Quantity per market, or a vector aligned with the rows
+            price (str, optional): Price kind, see `prices`. Defaults to "mid".
+        """
+        vector = self.weights(weights) if isinstance(weights, Mapping) else np.asarray(weights, dtype=np.float64)
+        values = self.prices(price)
+        held = vector != 0
+        return float(np.dot(vector[held], values[held]))
+
+    def to_dict(self, market: str) -> dict[str, float]:
+        """Prices of one market."""
+        row = self.index[market]
+        return {
+            "bid": float(self.bid[row]),
+            "bid_size": float(self.bid_size[row]),
+            "ask": float(self.ask[row]),
+            "ask_size": float(self.ask_size[row]),
+            "mark": float(self.mark[row]),
+            "last": float(self.last[row]),
+            "updated_at": int(self.updated_at[row]),
+        }
+
+
+__all__ = ["NUMPY_AVAILABLE", "PriceMatrix"]
@@ -0,0 +1,320 @@
+"""
+Market data fan-out to local processes through shared memory.
+
+One `MarketDataPublisher` owns the WebSocket subscriptions and writes the latest BBO and
+top-of-book levels of each market into a fixed-layout shared memory block. Any number
+of `MarketDataReader` instances in other processes on the host attach to the block by
+name and read the values straight out of the mapping: no socket, no JSON.
+
+Each market has one slot guarded by a seqlock: the writer makes the slot's sequence
+number odd while it writes and even when done, and a reader retries if the number was
+odd or changed while it read. Readers never block the writer. All prices and sizes are
+8-decimal chain integers (see `nexdex_py.common.quantization`).
+
+Layout::
+
+    header   magic (8s) | markets (I) | depth (I) | slot size (I)
+    symbols  markets x 32-byte UTF-8 names
+    slots    seq (Q) | bid, bid size, ask, ask size, bbo time, bbo seq_no (6q)
+             | book time, book seq_no (2q) | bid levels, ask levels (2i)
+             | depth x (price, size) bids (2q each) | depth x (price, size) asks
+
+Examples:
+    >>> # Process owning the connection
+    >>> publisher = MarketDataPublisher(["BTC-USD-PERP", "ETH-USD-PERP"], name="nexdex-md")
+    >>> await publisher.subscribe(NexDex.ws_client)
+    >>> # Any other local process
+    >>> reader = MarketDataReader("nexdex-md")
+    >>> reader.bbo("BTC-USD-PERP").bid
+    6500050000000
+"""
+
+import logging
+import struct
+from collections.abc import Iterable, Sequence
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, NamedTuple
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.marketdata.book import LevelBook, field, units
+
+MAGIC = b"NXDXMD01"
+SYMBOL_SIZE = 32
+DEFAULT_DEPTH = 15
+
+_HEADER = struct.Struct("<8sIII")
+_SEQ = struct.Struct("<Q")
+_BBO = struct.Struct("<6q")
+_BOOK_HEAD = struct.Struct("<2q2i")
+_LEVEL = struct.Struct("<2q")
+
+_BBO_OFFSET = _SEQ.size
+_BOOK_OFFSET = _BBO_OFFSET + _BBO.size
+_LEVELS_OFFSET = _BOOK_OFFSET + _BOOK_HEAD.size
+
+# Attempts before a read gives up on a slot that is being rewritten continuously
+MAX_READ_SPINS = 10_000
+
+
+class SharedBBO(NamedTuple):
+    """Best bid and offer in chain units; prices and sizes are None when the side is empty."""
+
+    bid: int | None
+    bid_size: int | None
+    ask: int | None
+    ask_size: int | None
+    last_updated_at: int
+    seq_no: int
+
+
+class SharedBook(NamedTuple):
+    """Top levels of the book in chain units, best first."""
+
+    bids: list[tuple[int, int]]
+    asks: list[tuple[int, int]]
+    last_updated_at: int
+    seq_no: int
+
+
+def _slot_size(depth: int) -> int:
+    return _LEVELS_OFFSET + 2 * depth * _LEVEL.size
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    # The publisher owns the block: readers must not register it with the resource tracker,
+    # which would unlink it when the reading process exits
+    register = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _buffer(shm: shared_memory.SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise ValueError(f"Shared memory block {shm.name} is closed")
+    return buf
+
+
+class MarketDataPublisher:
+    """Writes the latest BBO and book of each market into a named shared memory block.
+
+    Args:
+        markets (Sequence[str]): Market symbols, one slot each
+        name (str, optional): Shared memory name readers attach to. Defaults to None (generated, see `name`).
+        depth (int, optional): Book levels kept per side. Defaults to 15.
+        logger (logging.Logger, optional): Logger. Defaults to None.
+    """
+
+    classname: str = "MarketDataPublisher"
+
+    def __init__(
+        self,
+        markets: Sequence[str],
+        name: str | None = None,
+        depth: int = DEFAULT_DEPTH,
+        logger: logging.Logger | None = None,
+    ):
+        if not markets:
+            raise ValueError(f"{self.classname}: At least one market is required")
+        if depth < 1:
+            raise ValueError(f"{self.classname}: depth must be >= 1, got {depth}")
+        self.logger = logger or logging.getLogger(__name__)
+        self.markets = list(markets)
+        self.depth = depth
+        self.slot_size = _slot_size(depth)
+        self._slots_offset = _HEADER.size + SYMBOL_SIZE * len(self.markets)
+        size = self._slots_offset + self.slot_size * len(self.markets)
+        self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._buf = _buffer(self._shm)
+        self._offsets = {market: self._slots_offset + i * self.slot_size for i, market in enumerate(self.markets)}
+        # Full books from which the top `depth` levels are published
+        self._books = {market: LevelBook() for market in self.markets}
+
+        _HEADER.pack_into(self._buf, 0, MAGIC, len(self.markets), depth, self.slot_size)
+        for i, market in enumerate(self.markets):
+            encoded = market.encode()
+            if len(encoded) > SYMBOL_SIZE:
+                self.close()
+                raise ValueError(f"{self.classname}: Market symbol too long: {market}")
+            start = _HEADER.size + i * SYMBOL_SIZE
+            self._buf[start : start + len(encoded)] = encoded
+        self.logger.info(f"{self.classname}: Publishing {len(self.markets)} markets to {self.name} ({size} bytes)")
+
+    @property
+    def name(self) -> str:
+        """Shared memory name to pass to `MarketDataReader`."""
+        return self._shm.name
+
+    def _bump(self, offset: int) -> None:
+        _SEQ.pack_into(self._buf, offset, _SEQ.unpack_from(self._buf, offset)[0] + 1)
+
+    def write_bbo(self, data: Any) -> bool:
+        """Publish a `BBO` payload (dict or `WsBBO`); returns False for markets without a slot."""
+        offset = self._offsets.get(field(data, "market"))
+        if offset is None:
+            return False
+        values = (
+            units(field(data, "bid")),
+            units(field(data, "bid_size")),
+            units(field(data, "ask")),
+            units(field(data, "ask_size")),
+            field(data, "last_updated_at") or 0,
+            field(data, "seq_no") or 0,
+        )
+        self._bump(offset)  # odd: slot being written
+        _BBO.pack_into(self._buf, offset + _BBO_OFFSET, *values)
+        self._bump(offset)  # even: slot consistent
+        return True
+
+    def write_order_book(self, data: Any) -> bool:
+        """Apply an `ORDER_BOOK` snapshot or delta (dict or `WsOrderBook`) and publish the top levels."""
+        market = field(data, "market")
+        book = self._books.get(market)
+        if book is None:
+            return False
+        book.apply(data)
+        bids, asks = book.top(self.depth)
+        self.write_levels(market, bids, asks, book.last_updated_at, book.seq_no)
+        return True
+
+    def write_levels(
+        self,
+        market: str,
+        bids: Sequence[tuple[int, int]],
+        asks: Sequence[tuple[int, int]],
+        last_updated_at: int = 0,
+        seq_no: int = 0,
+    ) -> None:
+        """Publish book levels already in chain units, best first; extra levels beyond `depth` are dropped."""
+        offset = self._offsets[market]
+        bids, asks = bids[: self.depth], asks[: self.depth]
+        buf = self._buf
+        self._bump(offset)  # odd: slot being written
+        _BOOK_HEAD.pack_into(buf, offset + _BOOK_OFFSET, last_updated_at, seq_no, len(bids), len(asks))
+        level_offset = offset + _LEVELS_OFFSET
+        for price, size in bids:
+            _LEVEL.pack_into(buf, level_offset, price, size)
+            level_offset += _LEVEL.size
+        level_offset = offset + _LEVELS_OFFSET + self.depth * _LEVEL.size
+        for price, size in asks:
+            _LEVEL.pack_into(buf, level_offset, price, size)
+            level_offset += _LEVEL.size
+        self._bump(offset)  # even: slot consistent
+
+    async def on_message(self, ws_channel: NexDexWebsocketChannel, message: dict) -> None:
+        """WebSocket callback for `BBO` and `ORDER_BOOK` channels."""
+        data = message["params"]["data"]
+        if ws_channel == NexDexWebsocketChannel.BBO:
+            self.write_bbo(data)
+        elif ws_channel == NexDexWebsocketChannel.ORDER_BOOK:
+            self.write_order_book(data)
+
+    async def subscribe(
+        self,
+        ws_client: NexDexWebsocketClient,
+        bbo: bool = True,
+        order_book: bool = True,
+        refresh_rate: str = "50ms",
+        price_tick: str | None = None,
+    ) -> None:
+        """Subscribe `ws_client` to the channels of every market and publish what they deliver.
+
+        Args:
+            ws_client (NexDexWebsocketClient): Connected client owning the subscriptions
+            bbo (bool, optional): Subscribe to `BBO`. Defaults to True.
+            order_book (bool, optional): Subscribe to `ORDER_BOOK` at the publisher's depth. Defaults to True.
+            refresh_rate (str, optional): Order book refresh rate, "50ms" or "100ms". Defaults to "50ms".
+            price_tick (str, optional): Order book price grouping, e.g. "0_1". Defaults to None (ungrouped).
+        """
+        channels: dict[str, Any] = {}
+        for market in self.markets:
+            if bbo:
+                channels[f"bbo.{market}"] = self.on_message
+            if order_book:
+                name = f"order_book.{market}.snapshot@{self.depth}@{refresh_rate}"
+                channels[f"{name}@{price_tick}" if price_tick else name] = self.on_message
+        for channel_name, callback in channels.items():
+            await ws_client.subscribe_by_name(channel_name, callback)
+
+    def close(self, unlink: bool = True) -> None:
+        """Release the mapping and, by default, remove the block (attached readers keep their mapping)."""
+        self._shm.close()
+        if unlink:
+            self._shm.unlink()
+
+
+class MarketDataReader:
+    """Reads BBOs and books published by a `MarketDataPublisher` in another process.
+
+    Args:
+        name (str): Shared memory name of the publisher
+    """
+
+    classname: str = "MarketDataReader"
+
+    def __init__(self, name: str):
+        self._shm = _attach(name)
+        self._buf = _buffer(self._shm)
+        magic, count, depth, slot_size = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.classname}: {name} is not a market data block")
+        self.depth = depth
+        self.slot_size = slot_size
+        slots_offset = _HEADER.size + SYMBOL_SIZE * count
+        self.markets: list[str] = []
+        self._offsets: dict[str, int] = {}
+        for i in range(count):
+            start = _HEADER.size + i * SYMBOL_SIZE
+            market = bytes(self._buf[start : start + SYMBOL_SIZE]).rstrip(b"\0").decode()
+            self.markets.append(market)
+            self._offsets[market] = slots_offset + i * slot_size
+
+    def version(self, market: str) -> int:
+        """Sequence number of the market's slot; changes on every write, for cheap change detection."""
+        return _SEQ.unpack_from(self._buf, self._offsets[market])[0]
+
+    def bbo(self, market: str) -> SharedBBO:
+        """Consistent read of the market's BBO."""
+        offset = self._offsets[market]
+        buf = self._buf
+        for _ in range(MAX_READ_SPINS):
+            seq = _SEQ.unpack_from(buf, offset)[0]
+            if seq & 1:
+                continue
+            bid, bid_size, ask, ask_size, last_updated_at, seq_no = _BBO.unpack_from(buf, offset + _BBO_OFFSET)
+            if _SEQ.unpack_from(buf, offset)[0] == seq:
+                return SharedBBO(bid or None, bid_size or None, ask or None, ask_size or None, last_updated_at, seq_no)
+        raise TimeoutError(f"{self.classname}: No consistent read of {market} after {MAX_READ_SPINS} attempts")
+
+    def book(self, market: str) -> SharedBook:
+        """Consistent read of the market's book levels."""
+        offset = self._offsets[market]
+        buf = self._buf
+        asks_offset = offset + _LEVELS_OFFSET + self.depth * _LEVEL.size
+        for _ in range(MAX_READ_SPINS):
+            seq = _SEQ.unpack_from(buf, offset)[0]
+            if seq & 1:
+                continue
+            last_updated_at, seq_no, n_bids, n_asks = _BOOK_HEAD.unpack_from(buf, offset + _BOOK_OFFSET)
+            if n_bids > self.depth or n_asks > self.depth:
+                continue
+            bids_offset = offset + _LEVELS_OFFSET
+            bids = list(_LEVEL.iter_unpack(buf[bids_offset : bids_offset + n_bids * _LEVEL.size]))
+            asks = list(_LEVEL.iter_unpack(buf[asks_offset : asks_offset + n_asks * _LEVEL.size]))
+            if _SEQ.unpack_from(buf, offset)[0] == seq:
+                return SharedBook(bids, asks, last_updated_at, seq_no)
+        raise TimeoutError(f"{self.classname}: No consistent read of {market} after {MAX_READ_SPINS} attempts")
+
+    def bbos(self, markets: Iterable[str] | None = None) -> dict[str, SharedBBO]:
+        """BBOs of `markets`, or of every published market."""
+        return {market: self.bbo(market) for market in (markets if markets is not None else self.markets)}
+
+    def close(self) -> None:
+        self._shm.close()
+
+
+__all__ = ["MarketDataPublisher", "MarketDataReader", "SharedBBO", "SharedBook"]
@@ -4,12 +4,20 @@ from typing import TYPE_CHECKING
 
 from nexdex_py.account.account import NexDexAccount
 from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.token_refresher import TokenRefresher
 from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_options import WsConnectionOptions
+from nexdex_py.api.ws_reconnect import ReconnectPolicy
 from nexdex_py.environment import Environment
 from nexdex_py.utils import raise_value_error
  
 if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from nexdex_py.account.contract_cache import ContractAbiCache
+    from nexdex_py.account.keystore import L2KeyStore
     from nexdex_py.api.http_client import HttpClient
+    from nexdex_py.api.models import SystemConfig
     from nexdex_py.api.protocols import (
         AuthProvider,
         RequestHook,
@@ -17,6 +25,7 @@ if TYPE_CHECKING:
         Signer,
         WebSocketConnector,
     )
+    from nexdex_py.common.metrics import MetricsRegistry
 
 
 class NexDex:
@@ -40,12 +49,33 @@ class NexDex:
         ws_reader_sleep_on_error (float, optional): WebSocket reader sleep duration after errors. Defaults to 1.0.
         ws_reader_sleep_on_no_connection (float, optional): WebSocket reader sleep when no connection. Defaults to 1.0.
         validate_ws_messages (bool, optional): Enable JSON-RPC message validation. Defaults to False.
+        typed_ws_messages (bool, optional): Decode high-rate WebSocket channel payloads into typed structs.
+            Defaults to False.
+        ws_trace_sample_every (int, optional): Log one in N WebSocket messages per channel at DEBUG; 0 disables.
+            Defaults to 1.
         ping_interval (float, optional): WebSocket ping interval in seconds. Defaults to None.
         disable_reconnect (bool, optional): Disable automatic WebSocket reconnection. Defaults to False.
+        ws_reconnect_policy (ReconnectPolicy, optional): WebSocket reconnect backoff. Defaults to None.
+        ws_warm_standby (bool, optional): Keep a subscribed standby WebSocket connection for instant failover.
+            Defaults to False.
+        ws_concurrent_callbacks (bool, optional): Run WebSocket callbacks concurrently across channels, in order
+            within each channel. Defaults to False.
+        ws_connection_options (WsConnectionOptions, optional): WebSocket compression, frame and queue limits.
+            Defaults to None.
         auto_auth (bool, optional): Whether to automatically handle onboarding/auth. Defaults to True.
         auth_provider (AuthProvider, optional): Custom authentication provider. Defaults to None.
         signer (Signer, optional): Custom order signer for submit/modify/batch operations. Defaults to None.
         rpc_version (str, optional): RPC version (e.g., "v0_9"). If provided, constructs URL as {base_url}/rpc/{rpc_version}. Defaults to None.
+        metrics (MetricsRegistry, optional): Registry collecting REST, signing and WebSocket latency metrics. Defaults to None.
+        background_auth_refresh (bool, optional): Renew the JWT on a background thread ahead of expiry instead of
+            inline on the first request after it ages out. Requires auto_auth. Defaults to False.
+        config (SystemConfig, optional): Preloaded system config; skips `fetch_system_config`. Defaults to None.
+        fullnode_session (aiohttp.ClientSession, optional): Session reused for the account's fullnode RPC requests.
+            Defaults to None.
+        keystore (L2KeyStore, optional): Encrypted cache of the L2 key derived from `l1_private_key`.
+            Defaults to None.
+        contract_cache (ContractAbiCache, optional): Cache of resolved contract ABIs for on-chain operations.
+            Defaults to None.
 
     Examples:
         >>> from nexdex_py import NexDex
@@ -80,8 +110,14 @@ class NexDex:
         ws_reader_sleep_on_error: float = 1.0,
         ws_reader_sleep_on_no_connection: float = 1.0,
         validate_ws_messages: bool = False,
+        typed_ws_messages: bool = False,
+        ws_trace_sample_every: int = 1,
         ping_interval: float | None = None,
         disable_reconnect: bool = False,
+        ws_reconnect_policy: ReconnectPolicy | None = None,
+        ws_warm_standby: bool = False,
+        ws_concurrent_callbacks: bool = False,
+        ws_connection_options: WsConnectionOptions | None = None,
         # Auth configuration
         auto_auth: bool = True,
         auth_provider: "AuthProvider | None" = None,
@@ -89,11 +125,25 @@ class NexDex:
         signer: "Signer | None" = None,
         # RPC configuration
         rpc_version: str | None = None,
+        # Observability
+        metrics: "MetricsRegistry | None" = None,
+        background_auth_refresh: bool = False,
+        # Shared resources, e.g. from `NexDexAccountPool`
+        config: "SystemConfig | None" = None,
+        fullnode_session: "ClientSession | None" = None,
+        keystore: "L2KeyStore | None" = None,
+        contract_cache: "ContractAbiCache | None" = None,
     ):
         if env is None:
             return raise_value_error("NexDex: Invalid environment")
         self.env = env
         self.logger: logging.Logger = logger or logging.getLogger(__name__)
+        self.metrics = metrics
+        self.background_auth_refresh = background_auth_refresh
+        self.token_refresher: TokenRefresher | None = None
+        self.fullnode_session = fullnode_session
+        self.keystore = keystore
+        self.contract_cache = contract_cache
 
         # Create enhanced HTTP client if needed
         if http_client is None and (default_timeout or retry_strategy or request_hook):
@@ -114,6 +164,7 @@ class NexDex:
             auto_auth=auto_auth,
             auth_provider=auth_provider,
             signer=signer,
+            metrics=metrics,
         )
 
         # Initialize WebSocket client with all optional injection
@@ -127,11 +178,18 @@ class NexDex:
             reader_sleep_on_error=ws_reader_sleep_on_error,
             reader_sleep_on_no_connection=ws_reader_sleep_on_no_connection,
             validate_messages=validate_ws_messages,
+            typed_messages=typed_ws_messages,
+            trace_sample_every=ws_trace_sample_every,
             ping_interval=ping_interval,
             disable_reconnect=disable_reconnect,
+            reconnect_policy=ws_reconnect_policy,
+            warm_standby=ws_warm_standby,
+            concurrent_callbacks=ws_concurrent_callbacks,
+            connection_options=ws_connection_options,
+            metrics=metrics,
         )
 
-        self.config = self.api_client.fetch_system_config()
+        self.config = config if config is not None else self.api_client.fetch_system_config()
         self.account: NexDexAccount | None = None
 
         # Initialize account if private key is provided
@@ -167,10 +225,21 @@ class NexDex:
             l1_private_key=l1_private_key,
             l2_private_key=l2_private_key,
             rpc_version=rpc_version,
+            fullnode_session=self.fullnode_session,
+            keystore=self.keystore,
+            contract_cache=self.contract_cache,
         )
         self.api_client.init_account(self.account)
         self.ws_client.init_account(self.account)
 
+        if self.background_auth_refresh and self.api_client.auto_auth:
+            self.token_refresher = TokenRefresher(
+                self.api_client,
+                on_refresh=[self.ws_client.reauthenticate_threadsafe],
+                logger=self.logger,
+            )
+            self.token_refresher.start()
+
     async def close(self):
         """Close all connections and clean up resources.
 
@@ -190,6 +259,9 @@ class NexDex:
             ...         await NexDex.close()
             >>> asyncio.run(main())
         """
+        if self.token_refresher:
+            self.token_refresher.stop()
+
         if self.ws_client:
             await self.ws_client.close()
 
@@ -0,0 +1,241 @@
+import logging
+from collections.abc import Iterator
+from typing import TYPE_CHECKING
+
+import httpx
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.http_client import HttpClient
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.environment import Environment
+from nexdex_py.nexdex import NexDex
+from nexdex_py.utils import raise_value_error
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from nexdex_py.account.contract_cache import ContractAbiCache
+    from nexdex_py.account.keystore import L2KeyStore
+    from nexdex_py.api.models import SystemConfig
+    from nexdex_py.api.protocols import RequestHook, RetryStrategy, WebSocketConnector
+    from nexdex_py.common.metrics import MetricsRegistry
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Transport handed to each account's `httpx.Client`.
+
+    Closing an account's client must not tear down the connection pool used by
+    every other account, so `close` is a no-op; the pool closes the wrapped
+    transport once.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class NexDexAccountPool:
+    """Many NexDex accounts sharing one system config, HTTP connection pool and public WebSocket.
+
+    Every account keeps its own `NexDex` instance with its own JWT, signer and
+    private WebSocket client, so tokens and signatures never leak between
+    accounts. What is shared:
+
+    - system config: fetched once instead of once per account
+    - HTTP connections: one `httpx` transport (and its keep-alive pool) behind every account's client
+    - fullnode RPC: an optional `aiohttp.ClientSession` reused by every account's `FullNodeClient`
+    - public market data: `public_ws_client` carries BBO/trades/orderbook subscriptions for all accounts;
+      per-account WebSocket clients only connect when used for private channels
+
+    Args:
+        env (Environment): Environment
+        logger (logging.Logger, optional): Logger. Defaults to None.
+        transport (httpx.BaseTransport, optional): Transport shared by all accounts. Defaults to an
+            `httpx.HTTPTransport` with `max_connections` connections.
+        max_connections (int, optional): Size of the default transport's connection pool. Defaults to 100.
+        api_base_url (str, optional): Custom API base URL override. Defaults to None.
+        default_timeout (float, optional): Default HTTP request timeout in seconds. Defaults to None.
+        retry_strategy (RetryStrategy, optional): Custom retry/backoff strategy. Defaults to None.
+        request_hook (RequestHook, optional): Hook for request/response observability. Defaults to None.
+        ws_connector (WebSocketConnector, optional): Custom WebSocket connector for injection. Defaults to None.
+        ws_url_override (str, optional): Custom WebSocket URL override. Defaults to None.
+        ws_timeout (int, optional): WebSocket read timeout in seconds. Defaults to None (uses default).
+        auto_start_ws_reader (bool, optional): Whether WS clients start their reader automatically. Defaults to True.
+        metrics (MetricsRegistry, optional): Registry shared by all accounts. Defaults to None.
+        config (SystemConfig, optional): Preloaded system config. Defaults to None (fetched once).
+        fullnode_session (aiohttp.ClientSession, optional): Session shared by all accounts for fullnode RPC
+            requests. The caller closes it. Defaults to None.
+        background_auth_refresh (bool, optional): Renew each account's JWT in the background. Defaults to False.
+        keystore (L2KeyStore, optional): Encrypted cache of L2 keys derived from L1 keys. Defaults to None.
+        contract_cache (ContractAbiCache, optional): Contract ABI cache shared by all accounts. Defaults to None.
+
+    Examples:
+        >>> from nexdex_py import NexDexAccountPool
+        >>> from nexdex_py.environment import Environment
+        >>> pool = NexDexAccountPool(env=Environment.TESTNET)
+        >>> for l1_address, l2_private_key in subaccounts:
+        ...     pool.add_account(l1_address=l1_address, l2_private_key=l2_private_key)
+        >>> pool[l1_address].api_client.fetch_orders()
+        >>> await pool.public_ws_client.connect()
+        >>> await pool.close()
+    """
+
+    classname: str = "NexDexAccountPool"
+
+    def __init__(
+        self,
+        env: Environment,
+        logger: logging.Logger | None = None,
+        transport: httpx.BaseTransport | None = None,
+        max_connections: int = 100,
+        api_base_url: str | None = None,
+        default_timeout: float | None = None,
+        retry_strategy: "RetryStrategy | None" = None,
+        request_hook: "RequestHook | None" = None,
+        ws_connector: "WebSocketConnector | None" = None,
+        ws_url_override: str | None = None,
+        ws_timeout: int | None = None,
+        auto_start_ws_reader: bool = True,
+        metrics: "MetricsRegistry | None" = None,
+        config: "SystemConfig | None" = None,
+        fullnode_session: "ClientSession | None" = None,
+        background_auth_refresh: bool = False,
+        keystore: "L2KeyStore | None" = None,
+        contract_cache: "ContractAbiCache | None" = None,
+    ):
+        if env is None:
+            return raise_value_error(f"{self.classname}: Invalid environment")
+        self.env = env
+        self.logger = logger or logging.getLogger(__name__)
+        self.transport = transport or httpx.HTTPTransport(limits=httpx.Limits(max_connections=max_connections))
+        self._shared_transport = _SharedTransport(self.transport)
+        self.api_base_url = api_base_url
+        self.default_timeout = default_timeout
+        self.retry_strategy = retry_strategy
+        self.request_hook = request_hook
+        self.ws_connector = ws_connector
+        self.ws_url_override = ws_url_override
+        self.ws_timeout = ws_timeout
+        self.auto_start_ws_reader = auto_start_ws_reader
+        self.metrics = metrics
+        self.fullnode_session = fullnode_session
+        self.background_auth_refresh = background_auth_refresh
+        self.keystore = keystore
+        self.contract_cache = contract_cache
+        self.accounts: dict[str, NexDex] = {}
+
+        # Unauthenticated client for public endpoints and the shared config
+        self.public_api_client = NexDexApiClient(
+            env=env,
+            logger=logger,
+            http_client=self._http_client(),
+            api_base_url=api_base_url,
+            auto_auth=False,
+            metrics=metrics,
+        )
+        self.public_ws_client = NexDexWebsocketClient(
+            env=env,
+            logger=logger,
+            ws_timeout=ws_timeout,
+            auto_start_reader=auto_start_ws_reader,
+            connector=ws_connector,
+            ws_url_override=ws_url_override,
+            metrics=metrics,
+        )
+        self.config = config if config is not None else self.public_api_client.fetch_system_config()
+
+    def _http_client(self) -> HttpClient:
+        # Each account gets its own httpx.Client (and so its own Authorization header)
+        # on top of the shared transport
+        return HttpClient(
+            http_client=httpx.Client(transport=self._shared_transport),
+            default_timeout=self.default_timeout,
+            retry_strategy=self.retry_strategy,
+            request_hook=self.request_hook,
+            metrics=self.metrics,
+        )
+
+    def add_account(
+        self,
+        l1_address: str,
+        l1_private_key: str | None = None,
+        l2_private_key: str | None = None,
+        name: str | None = None,
+        rpc_version: str | None = None,
+    ) -> NexDex:
+        """Create an account sharing the pool's config and connections.
+
+        Args:
+            l1_address (str): L1 address
+            l1_private_key (str, optional): L1 private key. Defaults to None.
+            l2_private_key (str, optional): L2 private key. Defaults to None.
+            name (str, optional): Key of the account in the pool. Defaults to `l1_address`.
+            rpc_version (str, optional): RPC version (e.g., "v0_9"). Defaults to None.
+
+        Returns:
+            NexDex: Authenticated NexDex instance for the account
+        """
+        key = name or l1_address
+        if key in self.accounts:
+            return raise_value_error(f"{self.classname}: Account {key} already in pool")
+        if l1_private_key is None and l2_private_key is None:
+            return raise_value_error(f"{self.classname}: Provide Ethereum or NexDex private key")
+        account = NexDex(
+            env=self.env,
+            l1_address=l1_address,
+            l1_private_key=l1_private_key,
+            l2_private_key=l2_private_key,
+            logger=self.logger,
+            ws_timeout=self.ws_timeout,
+            http_client=self._http_client(),
+            api_base_url=self.api_base_url,
+            auto_start_ws_reader=self.auto_start_ws_reader,
+            ws_connector=self.ws_connector,
+            ws_url_override=self.ws_url_override,
+            rpc_version=rpc_version,
+            metrics=self.metrics,
+            background_auth_refresh=self.background_auth_refresh,
+            config=self.config,
+            fullnode_session=self.fullnode_session,
+            keystore=self.keystore,
+            contract_cache=self.contract_cache,
+        )
+        self.accounts[key] = account
+        self.logger.info(f"{self.classname}: Added account {key} ({len(self.accounts)} in pool)")
+        return account
+
+    async def remove_account(self, name: str) -> None:
+        """Close an account's private connections and drop it from the pool."""
+        account = self.accounts.pop(name, None)
+        if account is None:
+            return raise_value_error(f"{self.classname}: Account {name} not in pool")
+        await account.close()
+
+    def __getitem__(self, name: str) -> NexDex:
+        return self.accounts[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.accounts
+
+    def __iter__(self) -> Iterator[NexDex]:
+        return iter(self.accounts.values())
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    async def close(self) -> None:
+        """Close every account, the public WebSocket and the shared connection pool."""
+        for account in self.accounts.values():
+            await account.close()
+        self.accounts.clear()
+        await self.public_ws_client.close()
+        self.public_api_client.client.close()
+        self.transport.close()
+
+
+__all__ = ["NexDexAccountPool"]
@@ -0,0 +1,14 @@
+from .engine import MatchingEngine, SimFill, SimOrder, SimulatorError
+from .exchange import DEFAULT_MARKETS, DEFAULT_SYSTEM_CONFIG, ExchangeSimulator
+from .ws import SimulatorConnection
+
+__all__ = [
+    "DEFAULT_MARKETS",
+    "DEFAULT_SYSTEM_CONFIG",
+    "ExchangeSimulator",
+    "MatchingEngine",
+    "SimFill",
+    "SimOrder",
+    "SimulatorConnection",
+    "SimulatorError",
+]
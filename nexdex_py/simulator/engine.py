@@ -0,0 +1,512 @@
+"""
+Price-time priority matching engine used by the exchange simulator.
+
+Prices and sizes are kept as integers scaled by 10**8 (the same quantum used
+for order signing) so matching never touches `Decimal` on the hot path.
+"""
+
+import bisect
+import functools
+from collections import deque
+from collections.abc import Callable
+from decimal import Decimal
+
+from nexdex_py.utils import time_now_milli_secs
+
+SCALE = 10**8
+
+BUY = "BUY"
+SELL = "SELL"
+
+STP_MODES = ("EXPIRE_MAKER", "EXPIRE_TAKER", "EXPIRE_BOTH")
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _str_to_units(value: str) -> int:
+    whole, _, frac = value.partition(".")
+    if len(frac) <= 8 and whole.lstrip("-").isdigit() and (not frac or frac.isdigit()):
+        units = int(whole) * SCALE + int(frac.ljust(8, "0") or 0) * (-1 if whole.startswith("-") else 1)
+        return units
+    return int(Decimal(value).scaleb(8))
+
+
+def to_units(value: str | int | Decimal | None) -> int:
+    """Convert a decimal string/number to an integer scaled by 10**8."""
+    if value is None or value == "":
+        return 0
+    if isinstance(value, str):
+        # Wire values repeat heavily (ladders, load tests), so parsing is memoized
+        return _str_to_units(value)
+    return int(Decimal(str(value)).scaleb(8))
+
+
+def from_units(units: int) -> str:
+    """Convert an integer scaled by 10**8 back to a normalized decimal string."""
+    sign = "-" if units < 0 else ""
+    whole, frac = divmod(abs(units), SCALE)
+    if not frac:
+        return f"{sign}{whole}"
+    return f"{sign}{whole}." + f"{frac:08d}".rstrip("0")
+
+
+class SimulatorError(Exception):
+    """Order rejected by the simulator with an API error code."""
+
+    def __init__(self, error: str, message: str):
+        super().__init__(f"{error}: {message}")
+        self.error = error
+        self.message = message
+
+
+class SimOrder:
+    __slots__ = (
+        "account",
+        "cancel_reason",
+        "client_id",
+        "created_at",
+        "filled",
+        "filled_notional",
+        "flags",
+        "id",
+        "instruction",
+        "last_updated_at",
+        "market",
+        "order_type",
+        "price",
+        "remaining",
+        "seq_no",
+        "side",
+        "size",
+        "status",
+        "stp",
+        "timestamp",
+        "trigger_price",
+    )
+
+    def __init__(
+        self,
+        order_id: str,
+        account: str,
+        market: str,
+        side: str,
+        order_type: str,
+        price: int,
+        size: int,
+        client_id: str,
+        instruction: str,
+        stp: str | None,
+        flags: list[str],
+        timestamp: int,
+        trigger_price: int,
+        now: int,
+    ):
+        self.id = order_id
+        self.account = account
+        self.market = market
+        self.side = side
+        self.order_type = order_type
+        self.price = price
+        self.size = size
+        self.remaining = size
+        self.client_id = client_id
+        self.instruction = instruction
+        self.stp = stp
+        self.flags = flags
+        self.timestamp = timestamp
+        self.trigger_price = trigger_price
+        self.status = "NEW"
+        self.cancel_reason = ""
+        self.filled = 0
+        self.filled_notional = 0
+        self.created_at = now
+        self.last_updated_at = now
+        self.seq_no = 0
+
+    def to_dict(self) -> dict:
+        """Serialize to the REST/WS `OrderResp` shape."""
+        avg_fill_price = from_units(self.filled_notional // self.filled) if self.filled else ""
+        return {
+            "id": self.id,
+            "account": self.account,
+            "market": self.market,
+            "side": self.side,
+            "type": self.order_type,
+            "size": from_units(self.size),
+            "remaining_size": from_units(self.remaining),
+            "price": from_units(self.price),
+            "trigger_price": from_units(self.trigger_price) if self.trigger_price else "",
+            "status": self.status,
+            "cancel_reason": self.cancel_reason,
+            "client_id": self.client_id,
+            "instruction": self.instruction,
+            "stp": self.stp,
+            "flags": self.flags,
+            "avg_fill_price": avg_fill_price,
+            "timestamp": self.timestamp,
+            "created_at": self.created_at,
+            "last_updated_at": self.last_updated_at,
+            "seq_no": self.seq_no,
+        }
+
+
+class SimFill:
+    __slots__ = (
+        "account",
+        "client_id",
+        "created_at",
+        "id",
+        "liquidity",
+        "market",
+        "order_id",
+        "price",
+        "remaining_size",
+        "side",
+        "size",
+    )
+
+    def __init__(
+        self,
+        fill_id: str,
+        order: SimOrder,
+        price: int,
+        size: int,
+        liquidity: str,
+        now: int,
+    ):
+        self.id = fill_id
+        self.account = order.account
+        self.market = order.market
+        self.order_id = order.id
+        self.client_id = order.client_id
+        self.side = order.side
+        self.price = price
+        self.size = size
+        self.remaining_size = order.remaining
+        self.liquidity = liquidity
+        self.created_at = now
+
+    def to_dict(self) -> dict:
+        """Serialize to the REST/WS `FillResult` shape."""
+        return {
+            "id": self.id,
+            "account": self.account,
+            "market": self.market,
+            "order_id": self.order_id,
+            "client_id": self.client_id,
+            "side": self.side,
+            "price": from_units(self.price),
+            "size": from_units(self.size),
+            "remaining_size": from_units(self.remaining_size),
+            "liquidity": self.liquidity,
+            "fill_type": "FILL",
+            "fee": "0",
+            "fee_currency": "USDC",
+            "realized_pnl": "0",
+            "realized_funding": "0",
+            "created_at": self.created_at,
+        }
+
+
+def trade_to_dict(trade: tuple[str, str, str, int, int, int]) -> dict:
+    """Serialize a public trade tuple to the REST/WS `TradeResult` shape."""
+    trade_id, market, side, price, size, created_at = trade
+    return {
+        "id": trade_id,
+        "market": market,
+        "side": side,
+        "price": from_units(price),
+        "size": from_units(size),
+        "trade_type": "FILL",
+        "created_at": created_at,
+    }
+
+
+class MatchResult:
+    """Outcome of a single engine mutation, consumed by the simulator for publishing."""
+
+    __slots__ = ("book_changed", "fills", "orders", "trades")
+
+    def __init__(self) -> None:
+        self.orders: list[SimOrder] = []
+        self.fills: list[SimFill] = []
+        # (trade_id, market, taker_side, price, size, created_at)
+        self.trades: list[tuple[str, str, str, int, int, int]] = []
+        self.book_changed = False
+
+
+class MatchingEngine:
+    """Limit order book with price-time priority for a single market.
+
+    Args:
+        market (str): Market symbol
+        price_tick (int): Price tick scaled by 10**8. 0 disables tick validation.
+        size_increment (int): Size increment scaled by 10**8. 0 disables increment validation.
+        id_factory (Callable[[], str]): Generator for order, fill and trade ids.
+        clock (Callable[[], int], optional): Millisecond clock. Defaults to wall clock.
+
+    Examples:
+        >>> engine = MatchingEngine("BTC-USD-PERP", price_tick=10**7, size_increment=10**5, id_factory=ids)
+        >>> result = engine.submit("0x1", BUY, "LIMIT", to_units("65000"), to_units("0.1"))
+    """
+
+    def __init__(
+        self,
+        market: str,
+        price_tick: int,
+        size_increment: int,
+        id_factory: Callable[[], str],
+        clock: Callable[[], int] | None = None,
+    ):
+        self.market = market
+        self.price_tick = price_tick
+        self.size_increment = size_increment
+        self._next_id = id_factory
+        self._clock = clock or time_now_milli_secs
+        # price -> FIFO of resting orders; price lists are kept sorted ascending
+        self._bids: dict[int, deque[SimOrder]] = {}
+        self._asks: dict[int, deque[SimOrder]] = {}
+        self._bid_prices: list[int] = []
+        self._ask_prices: list[int] = []
+        self._level_size: dict[tuple[str, int], int] = {}
+        self.orders: dict[str, SimOrder] = {}
+        self.seq_no = 0
+        self.last_updated_at = 0
+
+    # Book inspection
+    def best_bid(self) -> tuple[int, int] | None:
+        if not self._bid_prices:
+            return None
+        price = self._bid_prices[-1]
+        return price, self._level_size[(BUY, price)]
+
+    def best_ask(self) -> tuple[int, int] | None:
+        if not self._ask_prices:
+            return None
+        price = self._ask_prices[0]
+        return price, self._level_size[(SELL, price)]
+
+    def depth(self, levels: int) -> tuple[list[tuple[int, int]], list[tuple[int, int]]]:
+        """Return up to `levels` aggregated (price, size) levels per side, best first."""
+        bids = [(p, self._level_size[(BUY, p)]) for p in reversed(self._bid_prices[-levels:])]
+        asks = [(p, self._level_size[(SELL, p)]) for p in self._ask_prices[:levels]]
+        return bids, asks
+
+    def open_orders(self, account: str | None = None) -> list[SimOrder]:
+        return [o for o in self.orders.values() if account is None or o.account == account]
+
+    # Mutations
+    def submit(
+        self,
+        account: str,
+        side: str,
+        order_type: str,
+        price: int,
+        size: int,
+        client_id: str = "",
+        instruction: str = "GTC",
+        stp: str | None = None,
+        flags: list[str] | None = None,
+        timestamp: int = 0,
+        trigger_price: int = 0,
+    ) -> MatchResult:
+        """Validate, match and (if applicable) rest a new order."""
+        self._validate(side, order_type, price, size, stp)
+        now = self._clock()
+        order = SimOrder(
+            order_id=self._next_id(),
+            account=account,
+            market=self.market,
+            side=side,
+            order_type=order_type,
+            price=price if order_type != "MARKET" else 0,
+            size=size,
+            client_id=client_id,
+            instruction=instruction,
+            stp=stp,
+            flags=flags or [],
+            timestamp=timestamp or now,
+            trigger_price=trigger_price,
+            now=now,
+        )
+        result = MatchResult()
+        self._execute(order, result, now)
+        return result
+
+    def cancel(self, order_id: str, reason: str = "USER_CANCELED") -> MatchResult:
+        order = self.orders.get(order_id)
+        if order is None:
+            raise SimulatorError("ORDER_ID_NOT_FOUND", f"order {order_id} not found")
+        now = self._clock()
+        result = MatchResult()
+        self._remove_resting(order)
+        self._close(order, reason, now)
+        result.orders.append(order)
+        result.book_changed = True
+        self._bump(result, now)
+        return result
+
+    def modify(self, order_id: str, price: int, size: int) -> MatchResult:
+        """Replace price/size of a resting order. Priority is lost, id is kept."""
+        order = self.orders.get(order_id)
+        if order is None:
+            raise SimulatorError("ORDER_ID_NOT_FOUND", f"order {order_id} not found")
+        self._validate(order.side, order.order_type, price, size)
+        if size < order.filled:
+            raise SimulatorError("VALIDATION_ERROR", "size below filled quantity")
+        now = self._clock()
+        self._remove_resting(order)
+        order.price = price
+        order.size = size
+        order.remaining = size - order.filled
+        order.last_updated_at = now
+        result = MatchResult()
+        self._execute(order, result, now)
+        return result
+
+    def _validate(self, side: str, order_type: str, price: int, size: int, stp: str | None = None) -> None:
+        if side not in (BUY, SELL):
+            raise SimulatorError("VALIDATION_ERROR", f"invalid side {side}")
+        if stp is not None and stp not in STP_MODES:
+            raise SimulatorError("VALIDATION_ERROR", f"invalid stp {stp}")
+        if size <= 0:
+            raise SimulatorError("VALIDATION_ERROR", "size must be positive")
+        if self.size_increment and size % self.size_increment:
+            raise SimulatorError("VALIDATION_ERROR", f"size {from_units(size)} is not a multiple of increment")
+        if order_type == "MARKET":
+            return
+        if price <= 0:
+            raise SimulatorError("VALIDATION_ERROR", "limit price must be positive")
+        if self.price_tick and price % self.price_tick:
+            raise SimulatorError("VALIDATION_ERROR", f"price {from_units(price)} is not a multiple of tick size")
+
+    def _execute(self, order: SimOrder, result: MatchResult, now: int) -> None:
+        crosses = self._crosses(order)
+        if order.instruction == "POST_ONLY" and crosses:
+            self._close(order, "POST_ONLY_WOULD_CROSS", now)
+            result.orders.append(order)
+            self._bump(result, now)
+            return
+
+        if crosses:
+            self._match(order, result, now)
+
+        if order.status == "CLOSED":
+            pass
+        elif order.remaining == 0:
+            self._close(order, "", now)
+        elif order.order_type == "MARKET" or order.instruction == "IOC":
+            self._close(order, "IOC_ORDER_NOT_FULLY_FILLED" if order.filled else "NO_LIQUIDITY", now)
+        else:
+            order.status = "OPEN"
+            self._rest(order)
+            result.book_changed = True
+        result.orders.append(order)
+        self._bump(result, now)
+
+    def _crosses(self, order: SimOrder) -> bool:
+        if order.side == BUY:
+            if not self._ask_prices:
+                return False
+            return order.order_type == "MARKET" or self._ask_prices[0] <= order.price
+        if not self._bid_prices:
+            return False
+        return order.order_type == "MARKET" or self._bid_prices[-1] >= order.price
+
+    def _match(self, taker: SimOrder, result: MatchResult, now: int) -> None:
+        is_buy = taker.side == BUY
+        book = self._asks if is_buy else self._bids
+        prices = self._ask_prices if is_buy else self._bid_prices
+        maker_side = SELL if is_buy else BUY
+
+        while taker.remaining and prices:
+            level_price = prices[0] if is_buy else prices[-1]
+            if taker.order_type != "MARKET" and (level_price > taker.price if is_buy else level_price < taker.price):
+                break
+            queue = book[level_price]
+            while taker.remaining and queue:
+                maker = queue[0]
+                if maker.account == taker.account:
+                    self._self_trade(maker, taker, queue, now, result)
+                    if taker.status == "CLOSED":
+                        break
+                    continue
+                qty = min(taker.remaining, maker.remaining)
+                maker.remaining -= qty
+                taker.remaining -= qty
+                maker.filled += qty
+                taker.filled += qty
+                maker.filled_notional += qty * level_price
+                taker.filled_notional += qty * level_price
+                maker.last_updated_at = now
+                self._level_size[(maker_side, level_price)] -= qty
+                result.fills.append(SimFill(self._next_id(), maker, level_price, qty, "MAKER", now))
+                result.fills.append(SimFill(self._next_id(), taker, level_price, qty, "TAKER", now))
+                result.trades.append((self._next_id(), self.market, taker.side, level_price, qty, now))
+                if maker.remaining == 0:
+                    queue.popleft()
+                    self._close(maker, "", now)
+                result.orders.append(maker)
+                result.book_changed = True
+            if not queue:
+                self._drop_level(maker_side, level_price)
+            if taker.status == "CLOSED":
+                return
+
+    def _self_trade(self, maker: SimOrder, taker: SimOrder, queue: deque, now: int, result: MatchResult) -> None:
+        mode = taker.stp or "EXPIRE_TAKER"
+        expire_maker = mode in ("EXPIRE_MAKER", "EXPIRE_BOTH")
+        if expire_maker:
+            queue.popleft()
+            self._level_size[(maker.side, maker.price)] -= maker.remaining
+            self._close(maker, "SELF_TRADE", now)
+            result.orders.append(maker)
+            result.book_changed = True
+        # Anything else expires the taker, so matching never stalls on its own maker
+        if not expire_maker or mode == "EXPIRE_BOTH":
+            self._close(taker, "SELF_TRADE", now)
+
+    def _rest(self, order: SimOrder) -> None:
+        if order.side == BUY:
+            book, prices = self._bids, self._bid_prices
+        else:
+            book, prices = self._asks, self._ask_prices
+        queue = book.get(order.price)
+        if queue is None:
+            queue = book[order.price] = deque()
+            bisect.insort(prices, order.price)
+            self._level_size[(order.side, order.price)] = 0
+        queue.append(order)
+        self._level_size[(order.side, order.price)] += order.remaining
+        self.orders[order.id] = order
+
+    def _remove_resting(self, order: SimOrder) -> None:
+        book = self._bids if order.side == BUY else self._asks
+        queue = book.get(order.price)
+        if queue is None or order not in queue:
+            return
+        queue.remove(order)
+        self._level_size[(order.side, order.price)] -= order.remaining
+        if not queue:
+            self._drop_level(order.side, order.price)
+
+    def _drop_level(self, side: str, price: int) -> None:
+        if side == BUY:
+            del self._bids[price]
+            prices = self._bid_prices
+        else:
+            del self._asks[price]
+            prices = self._ask_prices
+        del prices[bisect.bisect_left(prices, price)]
+        del self._level_size[(side, price)]
+
+    def _close(self, order: SimOrder, reason: str, now: int) -> None:
+        order.status = "CLOSED"
+        order.cancel_reason = reason
+        order.last_updated_at = now
+        self.orders.pop(order.id, None)
+
+    def _bump(self, result: MatchResult, now: int) -> None:
+        self.seq_no += 1
+        self.last_updated_at = now
+        for order in result.orders:
+            order.seq_no = self.seq_no
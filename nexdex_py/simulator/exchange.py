@@ -0,0 +1,404 @@
+import itertools
+import secrets
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+from nexdex_py.api.http_client import HttpClient
+from nexdex_py.simulator.engine import (
+    MatchingEngine,
+    MatchResult,
+    SimFill,
+    SimOrder,
+    SimulatorError,
+    from_units,
+    to_units,
+    trade_to_dict,
+)
+from nexdex_py.simulator.rest import RestRouter
+from nexdex_py.simulator.ws import SimulatorConnection
+from nexdex_py.utils import time_now_milli_secs
+
+DEFAULT_API_URL = "https://simulator.nexdex.local/v1"
+DEFAULT_WS_URL = "wss://simulator.nexdex.local/v1"
+
+DEFAULT_SYSTEM_CONFIG: dict[str, Any] = {
+    "starknet_gateway_url": "https://simulator.nexdex.local/gateway",
+    "starknet_fullnode_rpc_url": "https://simulator.nexdex.local/rpc/v0_9",
+    "starknet_fullnode_rpc_base_url": "https://simulator.nexdex.local",
+    "starknet_chain_id": "PRIVATE_SN_POTC_SEPOLIA",
+    "block_explorer_url": "https://simulator.nexdex.local/explorer/",
+    "paraclear_address": "0x286003f7c7bfc3f94e8f0af48b48302e7aee2fb13c23b141479ba00832ef2c6",
+    "paraclear_decimals": 8,
+    "paraclear_account_proxy_hash": "0x3530cc4759d78042f1b543bf797f5f3d647cde0388c33734cf91b7f7b9314a9",
+    "paraclear_account_hash": "0x41cb0280ebadaa75f996d8d92c6f265f6d040bb3ba442e5f86a554f1765244e",
+    "oracle_address": "0x2c6a867917ef858d6b193a0ff9e62b46d0dc760366920d631715d58baeaca1f",
+    "bridged_tokens": [
+        {
+            "name": "TEST USDC",
+            "symbol": "USDC",
+            "decimals": 6,
+            "l1_token_address": "0x29A873159D5e14AcBd63913D4A7E2df04570c666",
+            "l1_bridge_address": "0x8586e05adc0C35aa11609023d4Ae6075Cb813b4C",
+            "l2_token_address": "0x6f373b346561036d98ea10fb3e60d2f459c872b1933b50b21fe6ef4fda3b75e",
+            "l2_bridge_address": "0x46e9237f5408b5f899e72125dd69bd55485a287aaf24663d3ebe00d237fc7ef",
+        }
+    ],
+    "l1_core_contract_address": "0x582CC5d9b509391232cd544cDF9da036e55833Af",
+    "l1_operator_address": "0x11bACdFbBcd3Febe5e8CEAa75E0Ef6444d9B45FB",
+    "l1_chain_id": "11155111",
+    "liquidation_fee": "0.2",
+}
+
+DEFAULT_MARKETS: list[dict[str, Any]] = [
+    {
+        "symbol": "BTC-USD-PERP",
+        "base_currency": "BTC",
+        "quote_currency": "USD",
+        "settlement_currency": "USDC",
+        "asset_kind": "PERP",
+        "price_tick_size": "0.1",
+        "order_size_increment": "0.001",
+        "min_notional": "3",
+        "max_order_size": "100",
+        "max_open_orders": 100,
+        "funding_period_hours": 8,
+    },
+    {
+        "symbol": "ETH-USD-PERP",
+        "base_currency": "ETH",
+        "quote_currency": "USD",
+        "settlement_currency": "USDC",
+        "asset_kind": "PERP",
+        "price_tick_size": "0.01",
+        "order_size_increment": "0.001",
+        "min_notional": "3",
+        "max_order_size": "1000",
+        "max_open_orders": 100,
+        "funding_period_hours": 8,
+    },
+]
+
+
+class ExchangeSimulator:
+    """In-process NexDex exchange simulator.
+
+    Runs one price-time priority matching engine per market and serves the REST
+    API through an `httpx.MockTransport` and the WS JSON-RPC API through an
+    injectable connector, so the regular SDK clients can be pointed at it.
+    Orders are not signature-checked.
+
+    Args:
+        markets (list[dict], optional): Market definitions in `MarketResp` shape. Defaults to BTC and ETH perps.
+        system_config (dict, optional): Payload served by `system/config`. Defaults to a testnet-like config.
+        api_url (str, optional): Base URL the REST transport answers on. Defaults to DEFAULT_API_URL.
+        ws_url (str, optional): URL to pass as `ws_url_override`. Defaults to DEFAULT_WS_URL.
+        clock (Callable[[], int], optional): Millisecond clock for deterministic runs. Defaults to wall clock.
+
+    Examples:
+        >>> from nexdex_py import NexDex
+        >>> from nexdex_py.simulator import ExchangeSimulator
+        >>> sim = ExchangeSimulator()
+        >>> NexDex = NexDex(env="testnet", l1_address="0x...", l2_private_key="0x...", **sim.client_kwargs())
+        >>> await NexDex.ws_client.connect()
+        >>> # Direct engine access for load tests, bypassing HTTP
+        >>> order = {"market": "BTC-USD-PERP", "side": "BUY", "type": "LIMIT", "size": "0.1", "price": "65000"}
+        >>> sim.submit_order("0x1", order)
+    """
+
+    def __init__(
+        self,
+        markets: list[dict[str, Any]] | None = None,
+        system_config: dict[str, Any] | None = None,
+        api_url: str = DEFAULT_API_URL,
+        ws_url: str = DEFAULT_WS_URL,
+        clock: Callable[[], int] | None = None,
+    ):
+        self.api_url = api_url
+        self.ws_url = ws_url
+        self.system_config = dict(system_config or DEFAULT_SYSTEM_CONFIG)
+        self.now = clock or time_now_milli_secs
+        self._ids = itertools.count(1)
+
+        self._markets: dict[str, dict[str, Any]] = {}
+        self.engines: dict[str, MatchingEngine] = {}
+        for market in markets or DEFAULT_MARKETS:
+            self.add_market(market)
+
+        self._tokens: dict[str, str] = {}
+        self._order_index: dict[str, SimOrder] = {}
+        self._client_ids: dict[tuple[str, str], str] = {}
+        self.orders_history: dict[str, list[SimOrder]] = {}
+        self.fills_history: dict[str, list[SimFill]] = {}
+        self.trades_history: dict[str, list[tuple]] = {}
+
+        self._connections: set[SimulatorConnection] = set()
+        self._subscribers: dict[str, set[SimulatorConnection]] = {}
+        self._last_bbo: dict[str, tuple] = {}
+        self.router = RestRouter(self, httpx.URL(api_url).path)
+
+    def _next_id(self) -> str:
+        return str(next(self._ids))
+
+    # Market configuration
+    def add_market(self, market: dict[str, Any]) -> None:
+        symbol = market["symbol"]
+        self._markets[symbol] = market
+        self.engines[symbol] = MatchingEngine(
+            market=symbol,
+            price_tick=to_units(market.get("price_tick_size")),
+            size_increment=to_units(market.get("order_size_increment")),
+            id_factory=self._next_id,
+            clock=self.now,
+        )
+
+    def markets(self) -> list[dict[str, Any]]:
+        return list(self._markets.values())
+
+    def _engine(self, market: str) -> MatchingEngine:
+        engine = self.engines.get(market)
+        if engine is None:
+            raise SimulatorError("MARKET_NOT_FOUND", f"market {market} not found")
+        return engine
+
+    # Injection helpers
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.router.handle)
+
+    def http_client(self) -> HttpClient:
+        """HTTP client routed to the simulator, for `http_client=` injection."""
+        return HttpClient(http_client=httpx.Client(transport=self.transport()))
+
+    async def ws_connector(self, url: str, headers: dict[str, str]) -> SimulatorConnection:
+        """WebSocket connector for `ws_connector=` / `connector=` injection."""
+        bearer = headers.get("Authorization", "")[len("Bearer ") :]
+        connection = SimulatorConnection(self, account=self.account_for_token(bearer))
+        self._connections.add(connection)
+        return connection
+
+    def client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments wiring a `NexDex` instance to this simulator."""
+        return {
+            "http_client": self.http_client(),
+            "api_base_url": self.api_url,
+            "ws_connector": self.ws_connector,
+            "ws_url_override": self.ws_url,
+        }
+
+    # Auth
+    def issue_token(self, account: str) -> str:
+        token = f"sim.{secrets.token_hex(8)}"
+        self._tokens[token] = account
+        return token
+
+    def account_for_token(self, token: str) -> str | None:
+        return self._tokens.get(token)
+
+    # Orders
+    def submit_order(self, account: str, payload: dict[str, Any]) -> SimOrder:
+        """Submit an order payload in `Order.dump_to_dict()` shape on behalf of `account`."""
+        engine = self._engine(payload.get("market", ""))
+        client_id = payload.get("client_id") or ""
+        if client_id and (account, client_id) in self._client_ids:
+            raise SimulatorError("DUPLICATED_CLIENT_ID", f"client_id {client_id} already used")
+        result = engine.submit(
+            account=account,
+            side=payload.get("side", ""),
+            order_type=payload.get("type", "LIMIT"),
+            price=to_units(payload.get("price")),
+            size=to_units(payload.get("size")),
+            client_id=client_id,
+            instruction=payload.get("instruction") or "GTC",
+            stp=payload.get("stp"),
+            flags=payload.get("flags"),
+            timestamp=payload.get("signature_timestamp") or 0,
+            trigger_price=to_units(payload.get("trigger_price")),
+        )
+        order = result.orders[-1]
+        self._order_index[order.id] = order
+        if client_id:
+            self._client_ids[(account, client_id)] = order.id
+        history = self.orders_history.get(account)
+        if history is None:
+            history = self.orders_history[account] = []
+        history.append(order)
+        self._apply(engine, result)
+        return order
+
+    def get_order(self, account: str, order_id: str | None = None, client_id: str | None = None) -> SimOrder:
+        if client_id is not None:
+            order_id = self._client_ids.get((account, client_id))
+        order = self._order_index.get(order_id or "")
+        if order is None or order.account != account:
+            raise SimulatorError("ORDER_ID_NOT_FOUND", f"order {order_id or client_id} not found")
+        return order
+
+    def open_orders(self, account: str, market: str | None = None) -> list[SimOrder]:
+        engines = [self._engine(market)] if market else list(self.engines.values())
+        return [order for engine in engines for order in engine.open_orders(account)]
+
+    def modify_order(self, account: str, order_id: str, payload: dict[str, Any]) -> SimOrder:
+        order = self.get_order(account, order_id=order_id)
+        engine = self._engine(order.market)
+        result = engine.modify(order_id, to_units(payload.get("price")), to_units(payload.get("size")))
+        self._apply(engine, result)
+        return order
+
+    def cancel_order(self, account: str, order_id: str | None = None, client_id: str | None = None) -> SimOrder:
+        order = self.get_order(account, order_id=order_id, client_id=client_id)
+        engine = self._engine(order.market)
+        self._apply(engine, engine.cancel(order.id))
+        return order
+
+    def cancel_all_orders(self, account: str, market: str | None = None) -> int:
+        orders = self.open_orders(account, market)
+        for order in orders:
+            engine = self.engines[order.market]
+            self._apply(engine, engine.cancel(order.id))
+        return len(orders)
+
+    # Market data
+    def bbo(self, market: str) -> dict[str, Any]:
+        engine = self._engine(market)
+        bid, ask = engine.best_bid(), engine.best_ask()
+        return {
+            "market": market,
+            "bid": from_units(bid[0]) if bid else "",
+            "bid_size": from_units(bid[1]) if bid else "",
+            "ask": from_units(ask[0]) if ask else "",
+            "ask_size": from_units(ask[1]) if ask else "",
+            "last_updated_at": engine.last_updated_at,
+            "seq_no": engine.seq_no,
+        }
+
+    def orderbook(self, market: str, depth: int) -> dict[str, Any]:
+        engine = self._engine(market)
+        bids, asks = engine.depth(depth)
+        return {
+            "market": market,
+            "bids": [[from_units(p), from_units(s)] for p, s in bids],
+            "asks": [[from_units(p), from_units(s)] for p, s in asks],
+            "last_updated_at": engine.last_updated_at,
+            "seq_no": engine.seq_no,
+        }
+
+    def order_book_snapshot(self, market: str, depth: int) -> dict[str, Any]:
+        """Snapshot in the `ORDER_BOOK` WS channel shape."""
+        engine = self._engine(market)
+        bids, asks = engine.depth(depth)
+        inserts = [{"side": "BUY", "price": from_units(p), "size": from_units(s)} for p, s in bids]
+        inserts += [{"side": "SELL", "price": from_units(p), "size": from_units(s)} for p, s in asks]
+        return {
+            "market": market,
+            "update_type": "s",
+            "inserts": inserts,
+            "updates": [],
+            "deletes": [],
+            "last_updated_at": engine.last_updated_at,
+            "seq_no": engine.seq_no,
+        }
+
+    def markets_summary(self, market: str = "ALL") -> list[dict[str, Any]]:
+        symbols = list(self.engines) if market == "ALL" else [market]
+        summaries = []
+        for symbol in symbols:
+            bbo = self.bbo(symbol)
+            trades = self.trades_history.get(symbol)
+            summaries.append(
+                {
+                    "symbol": symbol,
+                    "bid": bbo["bid"],
+                    "ask": bbo["ask"],
+                    "last_traded_price": from_units(trades[-1][3]) if trades else "",
+                    "created_at": self.now(),
+                }
+            )
+        return summaries
+
+    # WS subscriptions and publishing
+    def register_subscription(self, connection: SimulatorConnection, channel: str) -> None:
+        self._subscribers.setdefault(channel, set()).add(connection)
+        if channel.startswith("order_book."):
+            market, depth = _parse_order_book_channel(channel)
+            if market in self.engines:
+                connection.push(channel, self.order_book_snapshot(market, depth))
+        elif channel.startswith("bbo."):
+            market = channel[len("bbo.") :]
+            if market in self.engines:
+                connection.push(channel, self.bbo(market))
+
+    def unregister_subscription(self, connection: SimulatorConnection, channel: str) -> None:
+        subscribers = self._subscribers.get(channel)
+        if subscribers is not None:
+            subscribers.discard(connection)
+            if not subscribers:
+                del self._subscribers[channel]
+
+    def disconnect(self, connection: SimulatorConnection) -> None:
+        self._connections.discard(connection)
+        for channel in list(connection.subscriptions):
+            self.unregister_subscription(connection, channel)
+
+    def _publish(self, channel: str, data: Any, account: str | None = None) -> None:
+        for connection in self._subscribers.get(channel, ()):
+            if account is None or connection.account == account:
+                connection.push(channel, data)
+
+    def _apply(self, engine: MatchingEngine, result: MatchResult) -> None:
+        market = engine.market
+        for fill in result.fills:
+            history = self.fills_history.get(fill.account)
+            if history is None:
+                history = self.fills_history[fill.account] = []
+            history.append(fill)
+        if result.trades:
+            self.trades_history.setdefault(market, []).extend(result.trades)
+
+        if not self._subscribers:
+            return
+        self._publish_orders(market, result)
+        self._publish_fills(market, result)
+        self._publish_trades(market, result)
+        if result.book_changed:
+            self._publish_book(engine)
+
+    def _publish_orders(self, market: str, result: MatchResult) -> None:
+        for order in result.orders:
+            for channel in (f"orders.{market}", "orders.ALL"):
+                if channel in self._subscribers:
+                    self._publish(channel, order.to_dict(), account=order.account)
+
+    def _publish_fills(self, market: str, result: MatchResult) -> None:
+        for fill in result.fills:
+            for channel in (f"fills.{market}", "fills.ALL"):
+                if channel in self._subscribers:
+                    self._publish(channel, fill.to_dict(), account=fill.account)
+
+    def _publish_trades(self, market: str, result: MatchResult) -> None:
+        channel = f"trades.{market}"
+        if result.trades and channel in self._subscribers:
+            for trade in result.trades:
+                self._publish(channel, trade_to_dict(trade))
+
+    def _publish_book(self, engine: MatchingEngine) -> None:
+        market = engine.market
+        bbo_channel = f"bbo.{market}"
+        if bbo_channel in self._subscribers:
+            top = (engine.best_bid(), engine.best_ask())
+            if self._last_bbo.get(market) != top:
+                self._last_bbo[market] = top
+                self._publish(bbo_channel, self.bbo(market))
+        prefix = f"order_book.{market}."
+        for channel in [c for c in self._subscribers if c.startswith(prefix)]:
+            _, depth = _parse_order_book_channel(channel)
+            self._publish(channel, self.order_book_snapshot(market, depth))
+
+
+def _parse_order_book_channel(channel: str) -> tuple[str, int]:
+    # order_book.{market}.snapshot@{depth}@{refresh_rate}[@{price_tick}]
+    _, rest = channel.split(".", 1)
+    market, _, spec = rest.partition(".")
+    parts = spec.split("@")
+    depth = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 15
+    return market, depth
@@ -0,0 +1,238 @@
+"""
+REST routing for the exchange simulator.
+
+`RestRouter.handle` is an `httpx.MockTransport` handler that maps NexDex REST
+paths to `ExchangeSimulator` operations.
+"""
+
+import base64
+import json
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from nexdex_py.simulator.engine import SimulatorError, trade_to_dict
+
+if TYPE_CHECKING:
+    from nexdex_py.simulator.exchange import ExchangeSimulator
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 5000
+
+
+def encode_cursor(position: int) -> str:
+    return base64.urlsafe_b64encode(str(position).encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode()).decode())
+    except ValueError as e:
+        raise SimulatorError("VALIDATION_ERROR", f"invalid cursor {cursor}") from e
+
+
+def _int_param(params: httpx.QueryParams, key: str) -> int | None:
+    value = params.get(key)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError as e:
+        raise SimulatorError("VALIDATION_ERROR", f"invalid {key} {value}") from e
+
+
+def paginate(
+    records: list[Any],
+    params: httpx.QueryParams,
+    filters: tuple[str, ...],
+    serialize: Callable[[Any], dict],
+) -> dict:
+    """Cursor pagination over an append-only record list, newest first.
+
+    The cursor is the (exclusive) index into `records` where the next page starts,
+    so it stays valid while new records are appended. Records are serialized
+    lazily so the matching hot path only appends objects.
+    """
+    page_size = min(_int_param(params, "page_size") or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+    position = decode_cursor(params["cursor"]) if params.get("cursor") else len(records)
+    start_at = _int_param(params, "start_at")
+    end_at = _int_param(params, "end_at")
+    wanted = {key: params[key] for key in filters if params.get(key)}
+
+    results: list[dict] = []
+    index = position
+    while index > 0 and len(results) < page_size:
+        index -= 1
+        record = serialize(records[index])
+        created_at = record.get("created_at", 0)
+        if start_at is not None and created_at < start_at:
+            continue
+        if end_at is not None and created_at > end_at:
+            continue
+        if any(str(record.get(key)) != value for key, value in wanted.items()):
+            continue
+        results.append(record)
+
+    return {
+        "next": encode_cursor(index) if index > 0 and len(results) == page_size else None,
+        "prev": encode_cursor(position) if position < len(records) else None,
+        "results": results,
+    }
+
+
+def _to_dict(record: Any) -> dict:
+    return record.to_dict()
+
+
+def _error(status_code: int, error: str, message: str) -> httpx.Response:
+    return httpx.Response(status_code, json={"error": error, "message": message, "data": None})
+
+
+class RestRouter:
+    """Route REST requests to the simulator.
+
+    Args:
+        exchange (ExchangeSimulator): Simulator state
+        base_path (str): Path prefix of the simulated API (e.g. "/v1")
+    """
+
+    def __init__(self, exchange: "ExchangeSimulator", base_path: str):
+        self.exchange = exchange
+        self.base_path = base_path.rstrip("/")
+        # (method, compiled path, handler, requires_auth)
+        self._routes: list[tuple[str, re.Pattern, Callable[..., Any], bool]] = []
+        self._add("GET", r"system/config", self._system_config, False)
+        self._add("GET", r"system/state", lambda r, a: {"status": "ok"}, False)
+        self._add("GET", r"system/time", lambda r, a: {"server_time": str(self.exchange.now())}, False)
+        self._add("GET", r"markets", lambda r, a: {"results": self.exchange.markets()}, False)
+        self._add("GET", r"markets/summary", self._markets_summary, False)
+        self._add("GET", r"bbo/(?P<market>[^/]+)", self._bbo, False)
+        self._add("GET", r"orderbook/(?P<market>[^/]+)", self._orderbook, False)
+        self._add("GET", r"trades", self._trades, False)
+        self._add("POST", r"onboarding", lambda r, a: {}, False)
+        self._add("POST", r"auth/(?P<public_key>[^/]+)", self._auth, False)
+        self._add("GET", r"orders", self._open_orders, True)
+        self._add("POST", r"orders", self._submit, True)
+        self._add("DELETE", r"orders", self._cancel_all, True)
+        self._add("POST", r"orders/batch", self._submit_batch, True)
+        self._add("DELETE", r"orders/batch", self._cancel_batch, True)
+        self._add("GET", r"orders/by_client_id/(?P<client_id>[^/]+)", self._order_by_client_id, True)
+        self._add("DELETE", r"orders/by_client_id/(?P<client_id>[^/]+)", self._cancel_by_client_id, True)
+        self._add("GET", r"orders/(?P<order_id>[^/]+)", self._order, True)
+        self._add("PUT", r"orders/(?P<order_id>[^/]+)", self._modify, True)
+        self._add("DELETE", r"orders/(?P<order_id>[^/]+)", self._cancel, True)
+        self._add("GET", r"orders-history", self._orders_history, True)
+        self._add("GET", r"fills", self._fills, True)
+
+    def _add(self, method: str, pattern: str, handler: Callable[..., Any], requires_auth: bool) -> None:
+        self._routes.append((method, re.compile(f"{re.escape(self.base_path)}/{pattern}$"), handler, requires_auth))
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        for method, pattern, handler, requires_auth in self._routes:
+            if method != request.method:
+                continue
+            match = pattern.match(path)
+            if match is None:
+                continue
+            account = None
+            if requires_auth:
+                account = self.exchange.account_for_token(request.headers.get("Authorization", "")[len("Bearer ") :])
+                if account is None:
+                    return _error(401, "UNAUTHORIZED", "Invalid or missing JWT")
+            try:
+                body = handler(request, account, **match.groupdict())
+            except SimulatorError as e:
+                return _error(404 if e.error == "ORDER_ID_NOT_FOUND" else 400, e.error, e.message)
+            return httpx.Response(200, json=body)
+        return _error(404, "NOT_FOUND", f"{request.method} {path} not found")
+
+    @staticmethod
+    def _json(request: httpx.Request) -> Any:
+        if not request.content:
+            return None
+        try:
+            return json.loads(request.content)
+        except ValueError as e:
+            raise SimulatorError("VALIDATION_ERROR", "invalid JSON body") from e
+
+    def _system_config(self, request: httpx.Request, account: str | None) -> dict:
+        return self.exchange.system_config
+
+    def _markets_summary(self, request: httpx.Request, account: str | None) -> dict:
+        return {"results": self.exchange.markets_summary(request.url.params.get("market", "ALL"))}
+
+    def _bbo(self, request: httpx.Request, account: str | None, market: str) -> dict:
+        return self.exchange.bbo(market)
+
+    def _orderbook(self, request: httpx.Request, account: str | None, market: str) -> dict:
+        return self.exchange.orderbook(market, _int_param(request.url.params, "depth") or 20)
+
+    def _trades(self, request: httpx.Request, account: str | None) -> dict:
+        market = request.url.params.get("market", "")
+        return paginate(self.exchange.trades_history.get(market, []), request.url.params, (), trade_to_dict)
+
+    def _auth(self, request: httpx.Request, account: str | None, public_key: str) -> dict:
+        l2_account = request.headers.get("NexDex-STARKNET-ACCOUNT") or public_key
+        return {"jwt_token": self.exchange.issue_token(l2_account)}
+
+    def _open_orders(self, request: httpx.Request, account: str) -> dict:
+        market = request.url.params.get("market")
+        return {"results": [o.to_dict() for o in self.exchange.open_orders(account, market)]}
+
+    def _submit(self, request: httpx.Request, account: str) -> dict:
+        return self.exchange.submit_order(account, self._json(request)).to_dict()
+
+    def _submit_batch(self, request: httpx.Request, account: str) -> dict:
+        orders: list[dict | None] = []
+        errors: list[dict | None] = []
+        for payload in self._json(request) or []:
+            try:
+                orders.append(self.exchange.submit_order(account, payload).to_dict())
+                errors.append(None)
+            except SimulatorError as e:
+                orders.append(None)
+                errors.append({"error": e.error, "message": e.message})
+        return {"orders": orders, "errors": errors}
+
+    def _order(self, request: httpx.Request, account: str, order_id: str) -> dict:
+        return self.exchange.get_order(account, order_id=order_id).to_dict()
+
+    def _order_by_client_id(self, request: httpx.Request, account: str, client_id: str) -> dict:
+        return self.exchange.get_order(account, client_id=client_id).to_dict()
+
+    def _modify(self, request: httpx.Request, account: str, order_id: str) -> dict:
+        return self.exchange.modify_order(account, order_id, self._json(request)).to_dict()
+
+    def _cancel(self, request: httpx.Request, account: str, order_id: str) -> dict:
+        self.exchange.cancel_order(account, order_id=order_id)
+        return {}
+
+    def _cancel_by_client_id(self, request: httpx.Request, account: str, client_id: str) -> dict:
+        self.exchange.cancel_order(account, client_id=client_id)
+        return {}
+
+    def _cancel_all(self, request: httpx.Request, account: str) -> dict:
+        self.exchange.cancel_all_orders(account, request.url.params.get("market"))
+        return {}
+
+    def _cancel_batch(self, request: httpx.Request, account: str) -> dict:
+        payload = self._json(request) or {}
+        results = []
+        for key, field in (("order_ids", "order_id"), ("client_order_ids", "client_id")):
+            for identifier in payload.get(key, []):
+                try:
+                    self.exchange.cancel_order(account, **{field: identifier})
+                    results.append({field: identifier, "status": "QUEUED_FOR_CANCELLATION"})
+                except SimulatorError as e:
+                    results.append({field: identifier, "status": "FAILED", "error": e.error})
+        return {"results": results}
+
+    def _orders_history(self, request: httpx.Request, account: str) -> dict:
+        records = self.exchange.orders_history.get(account, [])
+        return paginate(records, request.url.params, ("market", "client_id", "side", "status", "type"), _to_dict)
+
+    def _fills(self, request: httpx.Request, account: str) -> dict:
+        return paginate(self.exchange.fills_history.get(account, []), request.url.params, ("market",), _to_dict)
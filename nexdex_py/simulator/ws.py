@@ -0,0 +1,102 @@
+"""
+In-process WebSocket connection speaking the NexDex JSON-RPC protocol.
+
+`SimulatorConnection` satisfies the `WebSocketConnection` protocol so it can be
+returned from a `ws_connector` injected into `NexDexWebsocketClient`.
+"""
+
+import asyncio
+import json
+from typing import TYPE_CHECKING, Any
+
+from websockets import State
+from websockets.exceptions import ConnectionClosedOK
+
+if TYPE_CHECKING:
+    from nexdex_py.simulator.exchange import ExchangeSimulator
+
+# Channels only delivered to the authenticated owner of the data
+PRIVATE_CHANNEL_PREFIXES = ("orders.", "fills.", "positions", "account", "balance_events", "tradebusts")
+
+
+class SimulatorConnection:
+    """WebSocket-like connection backed by an in-memory queue.
+
+    Args:
+        exchange (ExchangeSimulator): Simulator publishing events to this connection
+        account (str, optional): Pre-authenticated account (from the `Authorization` header). Defaults to None.
+    """
+
+    def __init__(self, exchange: "ExchangeSimulator", account: str | None = None):
+        self.exchange = exchange
+        self.account = account
+        self.state = State.OPEN
+        self.subscriptions: set[str] = set()
+        self._inbox: asyncio.Queue[str | None] = asyncio.Queue()
+
+    async def send(self, data: str | bytes) -> None:
+        if self.state != State.OPEN:
+            raise ConnectionClosedOK(None, None)
+        try:
+            request = json.loads(data)
+        except ValueError:
+            self._error(None, -32700, "Parse error")
+            return
+
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params") or {}
+        if method == "auth":
+            account = self.exchange.account_for_token(params.get("bearer", ""))
+            if account is None:
+                self._error(request_id, 40111, "Invalid Bearer Token")
+                return
+            self.account = account
+            self._reply(request_id, {})
+        elif method == "subscribe":
+            channel = params.get("channel", "")
+            if channel.startswith(PRIVATE_CHANNEL_PREFIXES) and self.account is None:
+                self._error(request_id, 40110, "Unauthorized: subscription requires authentication")
+                return
+            self.subscriptions.add(channel)
+            self.exchange.register_subscription(self, channel)
+            self._reply(request_id, {"channel": channel})
+        elif method == "unsubscribe":
+            channel = params.get("channel", "")
+            self.subscriptions.discard(channel)
+            self.exchange.unregister_subscription(self, channel)
+            self._reply(request_id, {"channel": channel})
+        else:
+            self._error(request_id, -32601, f"Method not found: {method}")
+
+    async def recv(self) -> str:
+        if self.state != State.OPEN and self._inbox.empty():
+            raise ConnectionClosedOK(None, None)
+        message = await self._inbox.get()
+        if message is None:
+            raise ConnectionClosedOK(None, None)
+        return message
+
+    async def close(self) -> None:
+        if self.state == State.CLOSED:
+            return
+        self.state = State.CLOSED
+        self.exchange.disconnect(self)
+        self._inbox.put_nowait(None)
+
+    def pending(self) -> int:
+        """Number of frames queued for this connection and not yet received."""
+        return self._inbox.qsize()
+
+    def push(self, channel: str, data: Any) -> None:
+        self._inbox.put_nowait(
+            json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+        )
+
+    def _reply(self, request_id: Any, result: Any) -> None:
+        self._inbox.put_nowait(json.dumps({"jsonrpc": "2.0", "id": request_id, "result": result}))
+
+    def _error(self, request_id: Any, code: int, message: str) -> None:
+        self._inbox.put_nowait(
+            json.dumps({"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}})
+        )
@@ -0,0 +1,94 @@
+"""Tests for NexDexAccountPool sharing config and connections across accounts."""
+
+import httpx
+import pytest
+
+from nexdex_py import NexDexAccountPool
+from nexdex_py.api.ws_client import NexDexWebsocketChannel
+from nexdex_py.environment import TESTNET
+from nexdex_py.simulator import ExchangeSimulator
+
+L1_ADDRESSES = [f"0x{i:040x}" for i in range(1, 3)]
+L2_PRIVATE_KEYS = [hex(0x543B6CF6C91817A87174AAEA4FB370AC1C694E864D7740D728F8344D53E815 + i) for i in range(2)]
+
+
+class RecordingTransport(httpx.BaseTransport):
+    def __init__(self, transport: httpx.BaseTransport):
+        self.transport = transport
+        self.requests: list[httpx.Request] = []
+        self.closed = False
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestNexDexAccountPool:
+    def setup_method(self):
+        self.sim = ExchangeSimulator()
+        self.transport = RecordingTransport(self.sim.transport())
+        self.pool = NexDexAccountPool(
+            env=TESTNET,
+            transport=self.transport,
+            api_base_url=self.sim.api_url,
+            ws_connector=self.sim.ws_connector,
+            ws_url_override=self.sim.ws_url,
+            auto_start_ws_reader=False,
+        )
+        for l1_address, l2_private_key in zip(L1_ADDRESSES, L2_PRIVATE_KEYS, strict=True):
+            self.pool.add_account(l1_address=l1_address, l2_private_key=l2_private_key)
+
+    def _paths(self, suffix: str) -> list[httpx.Request]:
+        return [r for r in self.transport.requests if r.url.path.endswith(suffix)]
+
+    def test_config_fetched_once(self):
+        assert len(self.pool) == 2
+        assert len(self._paths("system/config")) == 1
+        assert all(account.config is self.pool.config for account in self.pool)
+
+    def test_accounts_keep_separate_tokens(self):
+        tokens = {account.account.jwt_token for account in self.pool}
+        assert len(tokens) == 2
+
+        self.transport.requests.clear()
+        for account in self.pool:
+            account.api_client.fetch_orders()
+        sent = [r.headers["Authorization"] for r in self._paths("/orders")]
+        assert sent == [f"Bearer {account.account.jwt_token}" for account in self.pool]
+
+    def test_duplicate_and_keyless_accounts_rejected(self):
+        with pytest.raises(ValueError, match="already in pool"):
+            self.pool.add_account(l1_address=L1_ADDRESSES[0], l2_private_key=L2_PRIVATE_KEYS[0])
+        with pytest.raises(ValueError, match="private key"):
+            self.pool.add_account(l1_address="0xabc")
+
+    @pytest.mark.asyncio
+    async def test_removing_account_keeps_shared_transport_open(self):
+        await self.pool.remove_account(L1_ADDRESSES[0])
+
+        assert L1_ADDRESSES[0] not in self.pool
+        assert not self.transport.closed
+        assert self.pool[L1_ADDRESSES[1]].api_client.fetch_orders()["results"] == []
+
+        await self.pool.close()
+        assert self.transport.closed
+        assert len(self.pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_public_ws_client_is_shared(self):
+        received = []
+
+        async def on_bbo(ws_channel, message):
+            received.append(message["params"]["data"]["market"])
+
+        assert await self.pool.public_ws_client.connect()
+        await self.pool.public_ws_client.subscribe(NexDexWebsocketChannel.BBO, on_bbo, {"market": "BTC-USD-PERP"})
+        while await self.pool.public_ws_client.pump_once():
+            pass
+
+        assert received == ["BTC-USD-PERP"]
+        assert all(account.ws_client.ws is None for account in self.pool)
+        await self.pool.close()
@@ -0,0 +1,138 @@
+"""Tests for the contract ABI cache used by on-chain operations."""
+
+import pytest
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import DeprecatedContractClass
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+from nexdex_py.account.contract_cache import ContractAbiCache
+from nexdex_py.account.starknet import Account, get_proxy_config
+
+CHAIN_ID = 0x534E5F5345504F4C4941
+PROXY_ADDRESS = 0x1000
+PROXY_CLASS_HASH = 0xAAA
+IMPLEMENTATION_HASH = 0xBBB
+
+PROXY_ABI = [
+    {"type": "function", "name": "implementation", "inputs": [], "outputs": [{"name": "hash", "type": "felt"}]},
+]
+ACCOUNT_ABI = [
+    {
+        "type": "function",
+        "name": "getSigner",
+        "inputs": [],
+        "outputs": [{"name": "signer", "type": "felt"}],
+        "stateMutability": "view",
+    },
+]
+
+
+def _contract_class(abi: list) -> DeprecatedContractClass:
+    return DeprecatedContractClass(program={}, entry_points_by_type={}, abi=abi)
+
+
+class FakeClient:
+    """Fullnode with a Starkware-style proxy at PROXY_ADDRESS."""
+
+    def __init__(self):
+        self.class_hashes = {PROXY_ADDRESS: PROXY_CLASS_HASH}
+        self.classes = {PROXY_CLASS_HASH: _contract_class(PROXY_ABI), IMPLEMENTATION_HASH: _contract_class(ACCOUNT_ABI)}
+        self.implementation = IMPLEMENTATION_HASH
+        self.calls: list[str] = []
+
+    async def get_chain_id(self):
+        return hex(CHAIN_ID)
+
+    async def get_class_hash_at(self, contract_address, block_hash=None, block_number=None):
+        self.calls.append("get_class_hash_at")
+        if contract_address not in self.class_hashes:
+            raise ClientError(code=20, message="Contract not found")
+        return self.class_hashes[contract_address]
+
+    async def get_class_by_hash(self, class_hash, block_hash=None, block_number=None):
+        self.calls.append("get_class_by_hash")
+        return self.classes[class_hash]
+
+    async def call_contract(self, call, block_hash=None, block_number=None):
+        self.calls.append("call_contract")
+        if call.selector == get_selector_from_name("implementation"):
+            return [self.implementation]
+        raise ClientError(code=40, message="Entry point 0x1 not found in contract")
+
+    async def get_storage_at(self, contract_address, key, block_hash=None, block_number=None):
+        self.calls.append("get_storage_at")
+        return 0
+
+
+class TestContractAbiCache:
+    def setup_method(self):
+        self.client = FakeClient()
+
+    def _account(self, cache: ContractAbiCache) -> Account:
+        return Account(
+            address=0x1, client=self.client, key_pair=KeyPair.from_private_key(1), chain=CHAIN_ID, contract_cache=cache
+        )
+
+    @pytest.mark.asyncio
+    async def test_proxy_resolved_once_then_validated_cheaply(self, tmp_path):
+        account = self._account(ContractAbiCache(path=tmp_path))
+
+        contract = await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+        assert "getSigner" in contract.functions
+        assert "get_class_by_hash" in self.client.calls
+
+        self.client.calls.clear()
+        contract = await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+        assert "getSigner" in contract.functions
+        assert self.client.calls == ["get_class_hash_at", "call_contract"]
+
+    @pytest.mark.asyncio
+    async def test_entries_persist_across_instances(self, tmp_path):
+        await self._account(ContractAbiCache(path=tmp_path)).load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+
+        self.client.calls.clear()
+        fresh = self._account(ContractAbiCache(path=tmp_path))
+        await fresh.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+        assert "get_class_by_hash" not in self.client.calls
+
+    @pytest.mark.asyncio
+    async def test_implementation_upgrade_invalidates(self):
+        account = self._account(ContractAbiCache(path=None))
+        await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+
+        upgraded = 0xCCC
+        self.client.classes[upgraded] = _contract_class(
+            [*ACCOUNT_ABI, {**ACCOUNT_ABI[0], "name": "getGuardian", "outputs": [{"name": "guardian", "type": "felt"}]}]
+        )
+        self.client.implementation = upgraded
+
+        contract = await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+        assert "getGuardian" in contract.functions
+
+    @pytest.mark.asyncio
+    async def test_class_hash_change_invalidates(self):
+        cache = ContractAbiCache(path=None)
+        account = self._account(cache)
+        await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=False)
+
+        self.client.class_hashes[PROXY_ADDRESS] = IMPLEMENTATION_HASH
+        contract = await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=False)
+        assert "getSigner" in contract.functions
+        assert len(cache._entries) == 2
+
+    @pytest.mark.asyncio
+    async def test_unresolvable_proxy_raises(self):
+        self.client.implementation = 0
+        self.client.call_contract = _raise_entry_point_not_found
+        account = self._account(ContractAbiCache(path=None))
+        with pytest.raises(Exception, match="resolve proxy"):
+            await account.load_contract(PROXY_ADDRESS, is_cairo0_contract=True)
+
+    def test_default_proxy_checks_have_stable_names(self):
+        names = [type(check).__name__ for check in get_proxy_config()["proxy_checks"]]
+        assert names == ["StarkwareETHProxyCheck", "ArgentProxyCheck", "OpenZeppelinProxyCheck"]
+
+
+async def _raise_entry_point_not_found(call, block_hash=None, block_number=None):
+    raise ClientError(code=40, message="Entry point 0x1 not found in contract")
@@ -0,0 +1,113 @@
+"""Tests for fullnode RPC signed-header reuse and batched JSON-RPC."""
+
+import json
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import Call
+
+from nexdex_py.account import account as account_module
+from nexdex_py.account.account import FULLNODE_SIGNATURE_REUSE_SECONDS, NexDexAccount
+from tests.mocks.api_client import MockApiClient
+
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+L2_PRIVATE_KEY = "0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815"
+
+
+def _session(response_body) -> AsyncMock:
+    response = Mock()
+    response.json = AsyncMock(return_value=response_body)
+    session = AsyncMock()
+    session.request.return_value = response
+    return session
+
+
+class TestFullnodeRpc:
+    def setup_method(self):
+        config = MockApiClient().fetch_system_config()
+        self.account = NexDexAccount(config=config, l1_address=L1_ADDRESS, l2_private_key=L2_PRIVATE_KEY)
+        self.rpc_client = self.account.starknet.client._client
+        self.rpc_client.handle_request_error = AsyncMock(return_value=None)
+
+    def _headers(self, payload: str) -> dict:
+        return self.account.fullnode_request_headers(self.account.starknet, self.account.l2_chain_id, payload)
+
+    def test_identical_payload_reuses_signature_within_window(self):
+        with patch.object(self.account.starknet, "sign_message", wraps=self.account.starknet.sign_message) as sign:
+            first = self._headers('{"id": 0}')
+            second = self._headers('{"id": 0}')
+            assert sign.call_count == 1
+            assert first == second
+
+            self._headers('{"id": 1}')
+            assert sign.call_count == 2
+
+    def test_signature_renewed_after_window(self):
+        now = 1_700_000_000
+        with (
+            patch.object(self.account.starknet, "sign_message", wraps=self.account.starknet.sign_message) as sign,
+            patch.object(account_module.time, "time", return_value=now),
+        ):
+            self._headers('{"id": 0}')
+        with (
+            patch.object(self.account.starknet, "sign_message", wraps=self.account.starknet.sign_message) as sign,
+            patch.object(account_module.time, "time", return_value=now + FULLNODE_SIGNATURE_REUSE_SECONDS),
+        ):
+            headers = self._headers('{"id": 0}')
+        assert sign.call_count == 1
+        assert headers["NexDex-STARKNET-SIGNATURE-TIMESTAMP"] == str(now + FULLNODE_SIGNATURE_REUSE_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_rpc_batch_sends_one_signed_request(self):
+        # Responses may come back in any order
+        self.rpc_client.session = _session([
+            {"jsonrpc": "2.0", "id": 1, "result": "0x2"},
+            {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+        ])
+
+        results = await self.account.starknet.rpc_batch([("blockNumber", {}), ("chainId", {})])
+
+        assert results == ["0x1", "0x2"]
+        self.rpc_client.session.request.assert_called_once()
+        kwargs = self.rpc_client.session.request.call_args.kwargs
+        assert [r["method"] for r in kwargs["json"]] == ["starknet_blockNumber", "starknet_chainId"]
+        assert "NexDex-STARKNET-SIGNATURE" in kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_rpc_batch_raises_on_error_entry(self):
+        self.rpc_client.session = _session([
+            {"jsonrpc": "2.0", "id": 0, "result": "0x1"},
+            {"jsonrpc": "2.0", "id": 1, "error": {"code": 40, "message": "Contract error"}},
+        ])
+        with pytest.raises(ClientError, match="Contract error"):
+            await self.account.starknet.rpc_batch([("call", {}), ("call", {})])
+
+    @pytest.mark.asyncio
+    async def test_check_multisig_required_batches_getters(self):
+        self.rpc_client.session = _session([
+            {"jsonrpc": "2.0", "id": 0, "result": ["0x123"]},
+            {"jsonrpc": "2.0", "id": 1, "result": ["0x0"]},
+            {"jsonrpc": "2.0", "id": 2, "result": ["0x456"]},
+        ])
+        contract = Mock(address=self.account.l2_address)
+
+        assert await self.account.starknet.check_multisig_required(contract) is True
+
+        self.rpc_client.session.request.assert_called_once()
+        batch = self.rpc_client.session.request.call_args.kwargs["json"]
+        selectors = [int(r["params"]["request"]["entry_point_selector"], 16) for r in batch]
+        assert selectors == [get_selector_from_name(n) for n in ("getSigner", "getGuardian", "getGuardianBackup")]
+
+    @pytest.mark.asyncio
+    async def test_call_contracts_encodes_calls(self):
+        self.rpc_client.session = _session([{"jsonrpc": "2.0", "id": 0, "result": ["0xa", "0xb"]}])
+        call = Call(to_addr=0x1234, selector=get_selector_from_name("balanceOf"), calldata=[5])
+
+        assert await self.account.starknet.call_contracts([call]) == [[10, 11]]
+
+        request = self.rpc_client.session.request.call_args.kwargs["json"][0]
+        assert request["params"]["request"]["contract_address"] == "0x1234"
+        assert request["params"]["request"]["calldata"] == ["0x5"]
+        assert json.dumps(request["params"]["block_id"]) == '"pre_confirmed"'
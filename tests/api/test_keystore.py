@@ -0,0 +1,130 @@
+"""Tests for the encrypted L2 key cache."""
+
+import json
+import os
+import time
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+
+from nexdex_py.account import account as account_module
+from nexdex_py.account.account import NexDexAccount
+from nexdex_py.account.keystore import DerivedL2Key, L2KeyStore
+from nexdex_py.account.utils import derive_stark_key
+from nexdex_py.message.stark_key import build_stark_key_message
+from tests.mocks.api_client import MockApiClient
+
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+L1_PRIVATE_KEY = "0xf8e4d1d772cdd44e5e77615ad11cc071c94e4c06dc21150d903f28e6aa6abdff"
+OTHER_L1_PRIVATE_KEY = "0x" + "11" * 32
+KDF_ITERATIONS = 2**4
+
+
+class TestL2KeyStore:
+    def setup_method(self):
+        self.config = MockApiClient().fetch_system_config()
+
+    def _keystore(self, tmp_path, password="secret"):  # noqa: S107
+        return L2KeyStore(password=password, path=tmp_path, kdf_iterations=KDF_ITERATIONS)
+
+    def _account(self, keystore):
+        return NexDexAccount(
+            config=self.config, l1_address=L1_ADDRESS, l1_private_key=L1_PRIVATE_KEY, keystore=keystore
+        )
+
+    def test_requires_password(self, tmp_path):
+        with pytest.raises(ValueError):
+            L2KeyStore(password="", path=tmp_path)
+
+    def test_cached_key_skips_derivation(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        first = self._account(keystore)
+
+        with (
+            patch.object(account_module, "derive_stark_key", side_effect=AssertionError("derived")),
+            patch.object(account_module, "compute_account_address", side_effect=AssertionError("address")),
+            patch.object(account_module.KeyPair, "from_private_key", side_effect=AssertionError("public key")),
+        ):
+            second = self._account(keystore)
+
+        assert second.l2_private_key == first.l2_private_key
+        assert second.l2_public_key == first.l2_public_key
+        assert second.l2_address == first.l2_address
+        assert second.starknet.signer.public_key == first.l2_public_key
+
+    def test_entry_is_encrypted_and_private(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        account = self._account(keystore)
+        entry_path = keystore.entry_path(self.config, L1_ADDRESS)
+
+        content = entry_path.read_text()
+        assert hex(account.l2_private_key)[2:] not in content
+        assert json.loads(content)["key"]["l1_address"] == L1_ADDRESS.lower()
+        assert os.stat(entry_path).st_mode & 0o777 == 0o600
+
+    def test_wrong_password_is_a_miss(self, tmp_path):
+        account = self._account(self._keystore(tmp_path))
+        keystore = self._keystore(tmp_path, password="other")  # noqa: S106
+        assert keystore.load(self.config, L1_ADDRESS, account.l1_private_key) is None
+
+    def test_entry_is_bound_to_the_l1_key(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        account = self._account(keystore)
+        assert keystore.load(self.config, L1_ADDRESS, int(OTHER_L1_PRIVATE_KEY, 16)) is None
+
+        # A mismatched key/address pair derives from its own L1 key instead of reusing the cached L2 key
+        mismatched = NexDexAccount(
+            config=self.config, l1_address=L1_ADDRESS, l1_private_key=OTHER_L1_PRIVATE_KEY, keystore=keystore
+        )
+        stark_key_msg = build_stark_key_message(int(self.config.l1_chain_id))
+        expected = derive_stark_key(int(OTHER_L1_PRIVATE_KEY, 16), stark_key_msg)
+        assert mismatched.l2_private_key == expected != account.l2_private_key
+
+    def test_password_only_entries(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        key = DerivedL2Key(0x1234, 0x5678, 0x9ABC)
+        keystore.save(self.config, L1_ADDRESS, key)
+
+        assert keystore.load(self.config, L1_ADDRESS) == key
+        # Not usable in place of an entry wrapped with the L1 key, and vice versa
+        assert keystore.load(self.config, L1_ADDRESS, int(L1_PRIVATE_KEY, 16)) is None
+
+    def test_changed_class_hash_is_a_miss(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        self._account(keystore)
+        upgraded = replace(self.config, paraclear_account_hash=hex(int(self.config.paraclear_account_hash, 16) + 1))
+        assert keystore.load(upgraded, L1_ADDRESS) is None
+
+    def test_tampered_entry_fails_verification(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        account = self._account(keystore)
+        entry_path = keystore.entry_path(self.config, L1_ADDRESS)
+        entry = json.loads(entry_path.read_text())
+        entry["l2_address"] = hex(account.l2_address + 1)
+        entry_path.write_text(json.dumps(entry))
+        assert keystore.load(self.config, L1_ADDRESS, account.l1_private_key) is None
+
+        # Re-derived and rewritten on the next start
+        assert self._account(keystore).l2_address == account.l2_address
+        assert keystore.load(self.config, L1_ADDRESS, account.l1_private_key) is not None
+
+    def test_l2_private_key_is_not_cached(self, tmp_path):
+        keystore = self._keystore(tmp_path)
+        NexDexAccount(config=self.config, l1_address=L1_ADDRESS, l2_private_key=hex(0x1234), keystore=keystore)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_hit_is_cheaper_than_derivation(self, tmp_path):
+        # Default cost settings, as used outside the tests
+        keystore = L2KeyStore(password="secret", path=tmp_path)  # noqa: S106
+        self._account(keystore)
+
+        def best_of(create, runs=3):
+            timings = []
+            for _ in range(runs):
+                start = time.perf_counter()
+                create()
+                timings.append(time.perf_counter() - start)
+            return min(timings)
+
+        assert best_of(lambda: self._account(keystore)) * 4 < best_of(lambda: self._account(None))
@@ -0,0 +1,160 @@
+"""Tests for REST and WebSocket metrics instrumentation."""
+
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.http_client import HttpClient, HttpMethod
+from nexdex_py.api.protocols import DefaultRetryStrategy, NoOpSigner
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.common.metrics import MetricsRegistry
+from nexdex_py.common.order import Order, OrderSide, OrderType
+from nexdex_py.environment import TESTNET
+from nexdex_py.simulator import ExchangeSimulator
+
+
+class RecordingHook:
+    def __init__(self):
+        self.durations = []
+
+    def on_request(self, method, url, headers):
+        pass
+
+    def on_response(self, method, url, status_code, duration_ms):
+        self.durations.append((status_code, duration_ms))
+
+
+def _flaky_transport(statuses: list[int]) -> httpx.MockTransport:
+    remaining = list(statuses)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = remaining.pop(0)
+        if status >= 300:
+            return httpx.Response(status, json={"error": "INTERNAL_ERROR", "message": "boom", "data": None})
+        return httpx.Response(status, json={"ok": True})
+
+    return httpx.MockTransport(handler)
+
+
+class TestHttpMetrics:
+    def test_attempts_retries_and_call_duration(self):
+        metrics = MetricsRegistry()
+        hook = RecordingHook()
+        client = HttpClient(
+            http_client=httpx.Client(transport=_flaky_transport([503, 200])),
+            retry_strategy=DefaultRetryStrategy(base_delay=0.05),
+            request_hook=hook,
+            metrics=metrics,
+        )
+
+        assert client.request("https://example.com/v1/orders/12345", HttpMethod.GET) == {"ok": True}
+
+        labels = {"method": "GET", "endpoint": "/v1/orders/{id}"}
+        assert metrics.histogram("nexdex_http_request_duration_seconds", **labels, status=503).count == 1
+        assert metrics.histogram("nexdex_http_request_duration_seconds", **labels, status=200).count == 1
+        assert metrics.counter("nexdex_http_retries_total", **labels) == 1
+        call = metrics.histogram("nexdex_http_call_duration_seconds", **labels, status=200)
+        assert call.count == 1
+        # The call includes the 50ms backoff, individual attempts do not
+        assert call.max_ns >= 50_000_000
+        assert [status for status, _ in hook.durations] == [503, 200]
+        assert all(duration_ms < 50 for _, duration_ms in hook.durations)
+
+    def test_transport_error_is_recorded(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("down")
+
+        metrics = MetricsRegistry()
+        client = HttpClient(http_client=httpx.Client(transport=httpx.MockTransport(handler)), metrics=metrics)
+
+        with pytest.raises(httpx.ConnectError):
+            client.request("https://example.com/v1/markets", HttpMethod.GET)
+
+        labels = {"method": "GET", "endpoint": "/v1/markets", "status": "error"}
+        assert metrics.histogram("nexdex_http_request_duration_seconds", **labels).count == 1
+        assert metrics.histogram("nexdex_http_call_duration_seconds", **labels).count == 1
+
+    def test_api_client_keeps_injected_http_client_configuration(self):
+        metrics = MetricsRegistry()
+        retry_strategy = DefaultRetryStrategy()
+        hook = RecordingHook()
+        http_client = HttpClient(retry_strategy=retry_strategy, request_hook=hook, metrics=metrics)
+
+        api_client = NexDexApiClient(env=TESTNET, http_client=http_client)
+
+        assert api_client.retry_strategy is retry_strategy
+        assert api_client.request_hook is hook
+        assert api_client.metrics is metrics
+
+    def test_signing_time_is_separate_from_network_time(self):
+        sim = ExchangeSimulator()
+        metrics = MetricsRegistry()
+        api_client = NexDexApiClient(
+            env=TESTNET,
+            http_client=sim.http_client(),
+            api_base_url=sim.api_url,
+            auto_auth=False,
+            signer=NoOpSigner(),
+            metrics=metrics,
+        )
+        api_client.set_token(sim.issue_token("0xa"))
+
+        order = Order("BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, size=Decimal("1"), limit_price=Decimal("100"))
+        api_client.submit_order(order)
+
+        assert metrics.histogram("nexdex_sign_duration_seconds", operation="submit_order").count == 1
+        network = metrics.histogram(
+            "nexdex_http_request_duration_seconds", method="POST", endpoint="/v1/orders", status=200
+        )
+        assert network.count == 1
+
+
+class TestWebsocketMetrics:
+    @pytest.mark.asyncio
+    async def test_dispatch_lag_and_queue_depth(self):
+        sim = ExchangeSimulator()
+        metrics = MetricsRegistry()
+        ws_client = NexDexWebsocketClient(
+            env=TESTNET,
+            auto_start_reader=False,
+            connector=sim.ws_connector,
+            ws_url_override=sim.ws_url,
+            metrics=metrics,
+        )
+        await ws_client.connect()
+
+        async def on_message(ws_channel, message):
+            pass
+
+        await ws_client.subscribe(NexDexWebsocketChannel.BBO, on_message, {"market": "BTC-USD-PERP"})
+        sim.submit_order("0xa", {"market": "BTC-USD-PERP", "side": "BUY", "type": "LIMIT", "size": "1", "price": "1"})
+        sim.submit_order("0xa", {"market": "BTC-USD-PERP", "side": "BUY", "type": "LIMIT", "size": "1", "price": "2"})
+        while await ws_client.pump_once():
+            pass
+
+        channel = "bbo.BTC-USD-PERP"
+        # Initial snapshot plus two updates
+        assert metrics.counter("nexdex_ws_messages_total", channel=channel) == 3
+        assert metrics.histogram("nexdex_ws_recv_to_callback_seconds", channel=channel).count == 3
+        assert metrics.histogram("nexdex_ws_callback_duration_seconds", channel=channel).count == 3
+        # The empty initial snapshot carries no server timestamp
+        assert metrics.histogram("nexdex_ws_server_lag_seconds", channel=channel).count == 2
+        assert metrics.gauge("nexdex_ws_recv_queue_depth") == 0
+
+    @pytest.mark.asyncio
+    async def test_no_metrics_by_default(self):
+        ws_client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False)
+        received = []
+
+        async def on_message(ws_channel, message):
+            received.append(message)
+
+        ws_client.callbacks["bbo.BTC-USD-PERP"] = on_message
+        await ws_client.inject(
+            '{"jsonrpc":"2.0","method":"subscription","params":{"channel":"bbo.BTC-USD-PERP","data":{}}}'
+        )
+
+        assert ws_client.metrics is None
+        assert len(received) == 1
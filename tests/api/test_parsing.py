@@ -0,0 +1,66 @@
+"""Tests for the shared response parsing layer."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.generated.responses import BlockTradeDetailFullResponse, BlockTradeType, MarketResp
+from nexdex_py.api.models import AuthSchema
+from nexdex_py.api.parsing import load_schema, parse, parse_results, schema, type_adapter
+from nexdex_py.environment import TESTNET
+
+ROWS = [
+    {"block_id": "b1", "block_type": "OFFER_BASED", "created_at": 1640995200000},
+    {"block_id": "b2", "block_type": "DIRECT", "created_at": 1640995200001},
+]
+
+
+class TestParsing:
+    def test_validators_are_built_once(self):
+        assert type_adapter(list[MarketResp]) is type_adapter(list[MarketResp])
+        assert schema(AuthSchema) is schema(AuthSchema)
+
+    def test_load_schema_ignores_unknown_fields(self):
+        assert load_schema(AuthSchema, {"jwt_token": "abc", "extra": 1}).jwt_token == "abc"  # noqa: S105
+
+    def test_api_error_raises_value_error(self):
+        with pytest.raises(ValueError, match="API Error NOT_FOUND: missing"):
+            parse(MarketResp, {"error": "NOT_FOUND", "message": "missing"})
+
+    def test_validation_error_is_value_error(self):
+        with pytest.raises(ValidationError):
+            parse(MarketResp, {"max_open_orders": "many"})
+
+    @pytest.mark.parametrize("response_format", ["dict", "model", "raw"])
+    def test_parse_results_formats(self, response_format):
+        results = parse_results(BlockTradeDetailFullResponse, ROWS, response_format)
+        if response_format == "raw":
+            assert results is ROWS
+        elif response_format == "model":
+            assert results[1].block_type == BlockTradeType.block_trade_type_direct
+        else:
+            assert results[0]["block_id"] == "b1" and isinstance(results[0], dict)
+
+
+class TestListBlockTradesFormats:
+    def setup_method(self):
+        self.api_client = NexDexApiClient(env=TESTNET)
+        self.api_client.account = Mock()
+        self.api_client._validate_auth = Mock()
+
+    def test_model_format_skips_dump(self):
+        with patch.object(self.api_client, "get", return_value={"next": "n", "results": ROWS}):
+            page = self.api_client.list_block_trades(response_format="model")
+        assert page.next == "n"
+        assert all(isinstance(row, BlockTradeDetailFullResponse) for row in page.results)
+
+    def test_default_format_unchanged(self):
+        with patch.object(self.api_client, "get", return_value={"results": ROWS}):
+            page = self.api_client.list_block_trades()
+        assert page.results == [BlockTradeDetailFullResponse.model_validate(row).model_dump() for row in ROWS]
+
+    def test_invalid_format(self):
+        with pytest.raises(ValueError, match="response_format"):
+            self.api_client.list_block_trades(response_format="xml")
@@ -0,0 +1,160 @@
+"""Tests for background JWT renewal."""
+
+import asyncio
+import base64
+import json
+import threading
+import time
+
+import pytest
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.protocols import NoOpSigner
+from nexdex_py.api.token_refresher import JWT_REFRESH_AGE, TokenRefresher, jwt_expiry
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.environment import TESTNET
+from nexdex_py.simulator import ExchangeSimulator
+
+
+def _jwt(exp: float | None) -> str:
+    claims = {"sub": "0xa"} if exp is None else {"sub": "0xa", "exp": exp}
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJub25lIn0.{payload}.sig"
+
+
+class FakeAccount:
+    def __init__(self):
+        self.jwt_token = ""
+
+    def set_jwt_token(self, token: str) -> None:
+        self.jwt_token = token
+
+
+class TestJwtExpiry:
+    def test_reads_exp_claim(self):
+        assert jwt_expiry(_jwt(1_700_000_300)) == 1_700_000_300
+
+    @pytest.mark.parametrize("token", ["", "not-a-jwt", "a.!!!.c", _jwt(None)])
+    def test_unknown_expiry(self, token):
+        assert jwt_expiry(token) is None
+
+
+class TestTokenRefresher:
+    def setup_method(self):
+        self.sim = ExchangeSimulator()
+        self.client = NexDexApiClient(
+            env=TESTNET,
+            http_client=self.sim.http_client(),
+            api_base_url=self.sim.api_url,
+            signer=NoOpSigner(),
+        )
+        self.client.account = FakeAccount()
+        self.fetch_calls = 0
+
+        def fetch_auth_token() -> str:
+            self.fetch_calls += 1
+            return self.sim.issue_token("0xa")
+
+        self.client.fetch_auth_token = fetch_auth_token
+
+    def test_rejects_interval_beyond_inline_refresh_age(self):
+        with pytest.raises(ValueError):
+            TokenRefresher(self.client, refresh_interval=JWT_REFRESH_AGE)
+
+    def test_next_refresh_uses_expiry_margin(self):
+        now = time.time()
+        self.client.apply_auth_token(_jwt(now + 90))
+        refresher = TokenRefresher(self.client, refresh_interval=180, refresh_margin=60)
+        assert refresher.next_refresh_at() == pytest.approx(now + 30, abs=1)
+
+        self.client.apply_auth_token(_jwt(None))
+        assert refresher.next_refresh_at() == self.client.auth_timestamp + 180
+
+    def test_refresh_swaps_header_and_notifies(self):
+        received = []
+        refresher = TokenRefresher(self.client, on_refresh=[received.append])
+
+        token = refresher.refresh_now()
+
+        assert self.client.client.headers["Authorization"] == f"Bearer {token}"
+        assert self.client.account.jwt_token == token
+        assert received == [token]
+        assert self.client.fetch_orders()["results"] == []
+
+    def test_failing_callback_does_not_abort_refresh(self):
+        received = []
+
+        def broken(_token: str) -> None:
+            raise RuntimeError("boom")
+
+        refresher = TokenRefresher(self.client, on_refresh=[broken, received.append])
+        token = refresher.refresh_now()
+        assert received == [token]
+
+    def test_background_thread_renews_ahead_of_requests(self):
+        refreshed = threading.Event()
+        refresher = TokenRefresher(self.client, refresh_interval=0.05, on_refresh=[lambda _: refreshed.set()])
+        refresher.start()
+        try:
+            assert self.client.token_refresher is refresher
+            assert refreshed.wait(2)
+            assert self.fetch_calls >= 1
+        finally:
+            refresher.stop()
+        assert not refresher.is_running
+        assert self.client.token_refresher is None
+
+    def test_validate_auth_does_not_block_while_refresher_runs(self):
+        self.client.apply_auth_token(_jwt(time.time() + 3600))
+        self.client.auth_timestamp -= JWT_REFRESH_AGE + 1
+        refresher = TokenRefresher(self.client, refresh_interval=60, refresh_margin=0)
+        # Keep the thread alive without letting it refresh
+        refresher.next_refresh_at = lambda: time.time() + 3600
+        refresher.start()
+        try:
+            calls_before = self.fetch_calls
+            self.client._validate_auth()
+            assert self.fetch_calls == calls_before
+        finally:
+            refresher.stop()
+
+    def test_validate_auth_reauths_inline_when_token_expired(self):
+        self.client.apply_auth_token(_jwt(time.time() - 1))
+        refresher = TokenRefresher(self.client)
+        refresher.next_refresh_at = lambda: time.time() + 3600
+        refresher.start()
+        try:
+            self.client._validate_auth()
+            assert self.fetch_calls == 1
+        finally:
+            refresher.stop()
+
+
+class TestWebsocketReauthentication:
+    @pytest.mark.asyncio
+    async def test_reauthenticate_sends_new_token_on_open_connection(self):
+        sim = ExchangeSimulator()
+        ws_client = NexDexWebsocketClient(
+            env=TESTNET, auto_start_reader=False, connector=sim.ws_connector, ws_url_override=sim.ws_url
+        )
+        await ws_client.connect()
+        connection = ws_client.ws
+        assert connection.account is None
+
+        thread = threading.Thread(target=ws_client.reauthenticate_threadsafe, args=(sim.issue_token("0xa"),))
+        thread.start()
+        thread.join()
+        for _ in range(10):
+            if connection.account is not None:
+                break
+            await asyncio.sleep(0)
+
+        assert connection.account == "0xa"
+        assert ws_client.ws is connection
+
+    @pytest.mark.asyncio
+    async def test_reauthenticate_without_connection(self):
+        ws_client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False)
+        assert await ws_client.reauthenticate("token") is False
+        # Never connected: no loop to schedule on
+        ws_client.reauthenticate_threadsafe("token")
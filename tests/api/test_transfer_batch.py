@@ -0,0 +1,172 @@
+"""Tests for batched L2 transfers."""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, Mock
+
+import pytest
+
+from nexdex_py.account.account import BatchTransferError, L2TransferChunk, NexDexAccount
+from tests.mocks.api_client import MockApiClient
+
+L1_ADDRESS = "0xd2c7314539dCe7752c8120af4eC2AA750Cf2035e"
+L2_PRIVATE_KEY = "0x543b6cf6c91817a87174aaea4fb370ac1c694e864d7740d728f8344d53e815"
+
+
+class FakeStarknet:
+    """Stands in for the Starknet account: records invokes and controls acceptance."""
+
+    def __init__(self, chain_nonce: int = 7, need_multisig: bool = False):
+        self.chain_nonce = chain_nonce
+        self.need_multisig = need_multisig
+        self.prepared: list[dict] = []
+        self.acceptance: dict[int, asyncio.Event] = {}
+        self.waiting = 0
+        self.max_waiting = 0
+        self.signer = Mock(sign_transaction=Mock(return_value=[1, 2]))
+
+        self.paraclear = MagicMock()
+        self.paraclear.functions["getTokenAssetBalance"].call = AsyncMock(return_value=[10**12])
+        self.paraclear.functions["transfer"].prepare_invoke_v3 = lambda **kwargs: kwargs
+
+    async def load_contract(self, address, is_cairo0_contract=False):
+        return Mock(address=address) if is_cairo0_contract else self.paraclear
+
+    async def check_multisig_required(self, contract):
+        return self.need_multisig
+
+    async def get_nonce(self):
+        return self.chain_nonce
+
+    async def prepare_invoke(self, calls, resource_bounds=None, auto_estimate=False, nonce=None):
+        prepared = {"calls": calls, "nonce": nonce, "auto_estimate": auto_estimate}
+        self.prepared.append(prepared)
+        return prepared
+
+    async def invoke(self, contract, prepared_invoke, signature):
+        tx_hash = 0x1000 + prepared_invoke["nonce"]
+        accepted = self.acceptance.setdefault(tx_hash, asyncio.Event())
+
+        async def wait_for_acceptance():
+            self.waiting += 1
+            self.max_waiting = max(self.max_waiting, self.waiting)
+            await accepted.wait()
+            self.waiting -= 1
+
+        return Mock(hash=tx_hash, wait_for_acceptance=wait_for_acceptance)
+
+
+class TestTransferOnL2Batch:
+    def setup_method(self):
+        config = MockApiClient().fetch_system_config()
+        self.account = NexDexAccount(config=config, l1_address=L1_ADDRESS, l2_private_key=L2_PRIVATE_KEY)
+        self.starknet = FakeStarknet()
+        self.account.starknet = self.starknet
+        self.transfers = [(hex(0x100 + i), Decimal("1.5")) for i in range(5)]
+
+    def _accept_all(self):
+        for event in self.starknet.acceptance.values():
+            event.set()
+
+    async def _run(self, **kwargs) -> list[int]:
+        task = asyncio.create_task(self.account.transfer_on_l2_batch(self.transfers, **kwargs))
+        while not task.done():
+            await asyncio.sleep(0)
+            self._accept_all()
+        return await task
+
+    @pytest.mark.asyncio
+    async def test_packs_transfers_into_multicalls_with_consecutive_nonces(self):
+        tx_hashes = await self._run(max_transfers_per_tx=2)
+
+        assert [len(p["calls"]) for p in self.starknet.prepared] == [2, 2, 1]
+        assert [p["nonce"] for p in self.starknet.prepared] == [7, 8, 9]
+        assert tx_hashes == [0x1007, 0x1008, 0x1009]
+        amounts = [call["amount"] for p in self.starknet.prepared for call in p["calls"]]
+        assert amounts == [int(Decimal("1.5") * 10**self.account.config.paraclear_decimals)] * 5
+
+    @pytest.mark.asyncio
+    async def test_local_nonces_continue_across_batches(self):
+        await self._run(max_transfers_per_tx=5)
+        # Chain nonce not yet updated by the node
+        await self._run(max_transfers_per_tx=5)
+        assert [p["nonce"] for p in self.starknet.prepared] == [7, 8]
+
+    @pytest.mark.asyncio
+    async def test_transactions_sent_before_previous_accepted(self):
+        task = asyncio.create_task(
+            self.account.transfer_on_l2_batch(self.transfers, max_transfers_per_tx=1, max_in_flight=3)
+        )
+        for _ in range(50):
+            await asyncio.sleep(0)
+        # Three sent and awaiting acceptance, the fourth blocked on the in-flight limit
+        assert len(self.starknet.prepared) == 3
+        assert self.starknet.waiting == 3
+
+        while not task.done():
+            await asyncio.sleep(0)
+            self._accept_all()
+        assert len(await task) == 5
+        assert self.starknet.max_waiting == 3
+
+    @pytest.mark.asyncio
+    async def test_send_failure_resyncs_nonce(self):
+        self.starknet.invoke = AsyncMock(side_effect=RuntimeError("rejected"))
+        with pytest.raises(BatchTransferError) as exc_info:
+            await self.account.transfer_on_l2_batch(self.transfers)
+        assert self.account._next_nonce is None
+        assert isinstance(exc_info.value.__cause__, RuntimeError)
+        assert exc_info.value.sent == []
+
+    @pytest.mark.asyncio
+    async def test_send_failure_reports_transactions_already_sent(self):
+        invoke = self.starknet.invoke
+
+        async def fail_third(contract, prepared_invoke, signature):
+            if prepared_invoke["nonce"] == 9:
+                raise RuntimeError("node unavailable")
+            return await invoke(contract, prepared_invoke, signature)
+
+        self.starknet.invoke = fail_third
+        with pytest.raises(BatchTransferError) as exc_info:
+            await self._run(max_transfers_per_tx=2)
+
+        error = exc_info.value
+        assert [chunk.tx_hash for chunk in error.accepted] == [0x1007, 0x1008]
+        assert error.chunks[2] == L2TransferChunk(4, 5, None, error.__cause__)
+        # Retrying the unaccepted transfers starts from the chain nonce
+        assert self.account._next_nonce is None
+
+    @pytest.mark.asyncio
+    async def test_acceptance_failure_stops_sending_and_resyncs_nonce(self):
+        invoke = self.starknet.invoke
+
+        async def reject_first(contract, prepared_invoke, signature):
+            result = await invoke(contract, prepared_invoke, signature)
+            if prepared_invoke["nonce"] == 7:
+                result.wait_for_acceptance = AsyncMock(side_effect=RuntimeError("REJECTED"))
+            return result
+
+        self.starknet.invoke = reject_first
+        with pytest.raises(BatchTransferError, match=r"transfers \[0, 1\)") as exc_info:
+            await self._run(max_transfers_per_tx=1, max_in_flight=2)
+
+        error = exc_info.value
+        sent = [chunk.tx_hash for chunk in error.sent]
+        assert sent == [0x1007, 0x1008]
+        assert [chunk.tx_hash for chunk in error.accepted] == [0x1008]
+        assert [chunk.tx_hash for chunk in error.chunks[2:]] == [None, None, None]
+        assert self.account._next_nonce is None
+
+        # The next batch is signed from the chain nonce, not after the rejected transaction
+        self.starknet.invoke = invoke
+        self.starknet.prepared.clear()
+        await self._run(max_transfers_per_tx=5)
+        assert [p["nonce"] for p in self.starknet.prepared] == [7]
+
+    @pytest.mark.asyncio
+    async def test_multisig_accounts_rejected(self):
+        self.starknet.need_multisig = True
+        with pytest.raises(ValueError, match="multisig"):
+            await self.account.transfer_on_l2_batch(self.transfers)
+        assert self.starknet.prepared == []
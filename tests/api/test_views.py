@@ -0,0 +1,72 @@
+"""Tests for lazily validated response views."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from pydantic import ValidationError
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.generated.responses import OrderFlag, OrderResp
+from nexdex_py.api.views import ModelView, ResponsePage, page
+from nexdex_py.environment import TESTNET
+
+ROWS = [
+    {"id": f"order-{i}", "market": "ETH-USD-PERP", "flags": ["REDUCE_ONLY"], "created_at": 1681493746016 + i}
+    for i in range(1000)
+]
+
+
+class TestViews:
+    def test_fields_validated_on_access_only(self):
+        rows = [dict(row) for row in ROWS]
+        rows[500]["created_at"] = "not a timestamp"
+        result = page(OrderResp, {"next": "cursor", "results": rows})
+
+        assert len(result) == 1000 and result.next == "cursor"
+        assert result.results[0].flags == [OrderFlag.flags_reduce_only]
+        # Invalid rows only fail when the invalid field is read
+        assert result.results[500].id == "order-500"
+        with pytest.raises(ValidationError):
+            _ = result.results[500].created_at
+
+    def test_defaults_extras_and_raw_access(self):
+        row = ModelView(OrderResp, {"id": "1", "unknown_field": 5})
+        assert row.price is None
+        assert row.unknown_field == 5
+        assert row["id"] == "1" and "price" not in row
+        with pytest.raises(AttributeError):
+            _ = row.not_a_field
+
+    def test_to_model_matches_eager_validation(self):
+        result = page(OrderResp, {"results": ROWS[:3]})
+        assert result.results.to_models() == [OrderResp.model_validate(row) for row in ROWS[:3]]
+        assert result.results[-1].to_model() == OrderResp.model_validate(ROWS[2])
+
+    def test_api_error_raises(self):
+        with pytest.raises(ValueError, match="API Error"):
+            page(OrderResp, {"error": "NOT_FOUND", "message": "missing"})
+
+
+class TestTypedResponses:
+    def setup_method(self):
+        self.api_client = NexDexApiClient(env=TESTNET)
+        self.api_client.account = Mock()
+        self.api_client._validate_auth = Mock()
+
+    def test_fetch_orders_typed_returns_page(self):
+        with patch.object(self.api_client, "get", return_value={"results": ROWS[:2]}):
+            orders = self.api_client.fetch_orders_typed()
+        assert isinstance(orders, ResponsePage)
+        assert [order.id for order in orders] == ["order-0", "order-1"]
+        # Dict-style access keeps working
+        assert orders["results"][0]["id"] == "order-0"
+
+    def test_fetch_order_typed_returns_view(self):
+        with patch.object(self.api_client, "get", return_value=ROWS[0]):
+            order = self.api_client.fetch_order_typed("order-0")
+        assert order.created_at == 1681493746016
+
+    def test_default_returns_dicts(self):
+        response = {"results": ROWS[:2]}
+        with patch.object(self.api_client, "get", return_value=response):
+            assert self.api_client.fetch_orders() is response
@@ -0,0 +1,150 @@
+"""Tests for concurrent and offloaded WebSocket callback dispatch."""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_dispatch import ChannelDispatcher
+from nexdex_py.common.metrics import MetricsRegistry
+from nexdex_py.environment import TESTNET
+
+
+def _frame(channel: str, seq_no: int) -> str:
+    return json.dumps(
+        {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": {"seq_no": seq_no}}}
+    )
+
+
+class TestChannelDispatcher:
+    @pytest.mark.asyncio
+    async def test_slow_channel_does_not_block_others(self):
+        dispatcher = ChannelDispatcher()
+        release = asyncio.Event()
+        delivered: list[tuple[str, int]] = []
+
+        async def slow(ws_channel, message):
+            await release.wait()
+            delivered.append(("trades", message["seq_no"]))
+
+        async def fast(ws_channel, message):
+            delivered.append(("orders", message["seq_no"]))
+
+        for i in range(3):
+            await dispatcher.dispatch("trades.BTC-USD-PERP", slow, None, {"seq_no": i})
+            await dispatcher.dispatch("orders.BTC-USD-PERP", fast, None, {"seq_no": i})
+        await asyncio.sleep(0)
+        assert delivered == [("orders", 0), ("orders", 1), ("orders", 2)]
+        assert dispatcher.pending("trades.BTC-USD-PERP") == 2
+
+        release.set()
+        await dispatcher.drain()
+        # In order within the channel
+        assert [seq for name, seq in delivered if name == "trades"] == [0, 1, 2]
+        assert dispatcher.pending() == 0
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_failing_callback_keeps_channel_running(self):
+        dispatcher = ChannelDispatcher()
+        delivered = []
+
+        async def callback(ws_channel, message):
+            if message["seq_no"] == 0:
+                raise RuntimeError("boom")
+            delivered.append(message["seq_no"])
+
+        for i in range(3):
+            await dispatcher.dispatch("bbo.BTC-USD-PERP", callback, None, {"seq_no": i})
+        await dispatcher.drain()
+        assert delivered == [1, 2]
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_applies_backpressure(self):
+        dispatcher = ChannelDispatcher(queue_size=1)
+        release = asyncio.Event()
+
+        async def blocked(ws_channel, message):
+            await release.wait()
+
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", blocked, None, {})
+        await asyncio.sleep(0)  # first message taken by the worker
+        await dispatcher.dispatch("bbo.BTC-USD-PERP", blocked, None, {})
+        third = asyncio.create_task(dispatcher.dispatch("bbo.BTC-USD-PERP", blocked, None, {}))
+        await asyncio.sleep(0.01)
+        assert not third.done()
+
+        release.set()
+        await third
+        await dispatcher.drain()
+        await dispatcher.close()
+
+    @pytest.mark.asyncio
+    async def test_offloaded_in_flight_is_bounded(self):
+        dispatcher = ChannelDispatcher(max_in_flight=2)
+        lock = threading.Lock()
+        running = 0
+        peak = 0
+        threads = set()
+
+        def cpu_bound(ws_channel, message):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+                threads.add(threading.get_ident())
+            sum(range(20_000))
+            with lock:
+                running -= 1
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for i in range(6):
+                channel = f"trades.M{i}-USD-PERP"
+                dispatcher.offload(channel, executor)
+                await dispatcher.dispatch(channel, cpu_bound, None, {})
+            await dispatcher.drain()
+        assert 1 <= peak <= 2
+        assert threading.get_ident() not in threads
+        await dispatcher.close()
+
+    def test_invalid_sizes(self):
+        with pytest.raises(ValueError):
+            ChannelDispatcher(queue_size=0)
+
+
+class TestWebsocketClientDispatch:
+    @pytest.mark.asyncio
+    async def test_concurrent_callbacks(self):
+        metrics = MetricsRegistry()
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, concurrent_callbacks=True, metrics=metrics)
+        received = []
+
+        async def callback(ws_channel, message):
+            received.append(message["params"]["data"]["seq_no"])
+
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        for i in range(5):
+            await client._process_message(_frame("bbo.BTC-USD-PERP", i))
+        await client.drain_callbacks()
+        assert received == [0, 1, 2, 3, 4]
+        assert metrics.counter("nexdex_ws_messages_total", channel="bbo.BTC-USD-PERP") == 5
+        assert metrics.histogram("nexdex_ws_callback_duration_seconds", channel="bbo.BTC-USD-PERP").count == 5
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_offload_channel_in_serial_mode(self):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False)
+        threads = []
+
+        def callback(ws_channel, message):
+            threads.append(threading.get_ident())
+
+        client.callbacks["trades.BTC-USD-PERP"] = callback
+        client.offload_channel("trades.BTC-USD-PERP")
+        await client._process_message(_frame("trades.BTC-USD-PERP", 1))
+        assert len(threads) == 1
+        assert threads[0] != threading.get_ident()
@@ -0,0 +1,73 @@
+"""Tests for WebSocket transport options and bytes frame parsing."""
+
+import json
+from typing import ClassVar
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_options import WsConnectionOptions
+from nexdex_py.environment import TESTNET
+
+
+class TestConnectionOptions:
+    def test_defaults_pass_nothing(self):
+        assert WsConnectionOptions().connect_kwargs() == {}
+
+    def test_limits_and_compression(self):
+        kwargs = WsConnectionOptions(compression=None, max_size=None, max_queue=256, write_limit=2**16).connect_kwargs()
+        assert kwargs == {"compression": None, "max_size": None, "max_queue": 256, "write_limit": 2**16}
+
+    def test_deflate_options(self):
+        kwargs = WsConnectionOptions(deflate_options={"client_max_window_bits": 12}).connect_kwargs()
+        assert kwargs["compression"] is None
+        (extension,) = kwargs["extensions"]
+        assert isinstance(extension, ClientPerMessageDeflateFactory)
+        assert extension.client_max_window_bits == 12
+
+    def test_unsupported_compression(self):
+        with pytest.raises(ValueError, match="compression"):
+            WsConnectionOptions(compression="zstd")
+
+    @pytest.mark.asyncio
+    @patch("websockets.connect", new_callable=AsyncMock)
+    async def test_passed_to_connect(self, mock_connect):
+        options = WsConnectionOptions(max_size=2**24, max_queue=64)
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, connection_options=options)
+        await client.connect()
+        mock_connect.assert_called_once_with(client.api_url, additional_headers={}, max_size=2**24, max_queue=64)
+
+
+class TestBytesFrames:
+    @pytest.mark.asyncio
+    async def test_bytes_frame_parsed_directly(self):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False)
+        received = []
+
+        async def callback(ws_channel, message):
+            received.append(message)
+
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        frame = {"jsonrpc": "2.0", "method": "subscription", "params": {"channel": "bbo.BTC-USD-PERP", "data": {}}}
+        await client.inject(json.dumps(frame).encode())
+        assert received == [frame]
+
+    @pytest.mark.asyncio
+    async def test_raw_frames_recv_without_decode(self):
+        class FakeConnection:
+            decode_args: ClassVar[list[bool | None]] = []
+
+            async def recv(self, decode=None):
+                self.decode_args.append(decode)
+                return b'{"jsonrpc": "2.0", "id": 1, "result": {"channel": "bbo.BTC-USD-PERP"}}'
+
+        client = NexDexWebsocketClient(
+            env=TESTNET, auto_start_reader=False, connection_options=WsConnectionOptions(raw_frames=True)
+        )
+        client.ws = FakeConnection()
+        with patch("nexdex_py.api.ws_client.ClientConnection", FakeConnection):
+            await client._receive_and_process_message()
+        assert FakeConnection.decode_args == [False]
+        assert client.subscribed_channels == {"bbo.BTC-USD-PERP": True}
@@ -0,0 +1,221 @@
+"""Tests for WebSocket reconnect backoff, pipelined resubscription and the warm standby connection."""
+
+import asyncio
+import json
+import random
+
+import pytest
+from websockets import State
+
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_reconnect import ReconnectPolicy
+from nexdex_py.environment import TESTNET
+
+
+class BlockingConnection:
+    """Connection whose `recv` waits until messages are queued or it is closed."""
+
+    def __init__(self):
+        self.state = State.OPEN
+        self.sent_messages: list[str] = []
+        self.incoming: asyncio.Queue = asyncio.Queue()
+
+    async def send(self, data: str):
+        self.sent_messages.append(data)
+
+    async def recv(self) -> str:
+        message = await self.incoming.get()
+        if message is None:
+            raise ConnectionError("closed")
+        return message
+
+    async def close(self):
+        self.state = State.CLOSED
+        self.incoming.put_nowait(None)
+
+    def subscribed(self) -> list[str]:
+        return [json.loads(m)["params"]["channel"] for m in self.sent_messages if '"subscribe"' in m]
+
+
+class Connector:
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.connections: list[BlockingConnection] = []
+
+    async def __call__(self, url: str, headers: dict):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("exchange down")
+        connection = BlockingConnection()
+        self.connections.append(connection)
+        return connection
+
+
+async def _noop(ws_channel, message):
+    pass
+
+
+async def _settle():
+    """Let background standby tasks run."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestReconnectPolicy:
+    def test_exponential_delays(self):
+        policy = ReconnectPolicy(base_delay=1.0, max_delay=8.0, jitter=False)
+        assert [policy.get_delay(attempt) for attempt in range(5)] == [1.0, 2.0, 4.0, 8.0, 8.0]
+        assert policy.get_delay(10_000) == 8.0
+
+    def test_jitter_within_bounds(self):
+        policy = ReconnectPolicy(base_delay=1.0, max_delay=8.0, rng=random.Random(7))  # noqa: S311
+        delays = [policy.get_delay(3) for _ in range(100)]
+        assert all(0 <= delay <= 8.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_max_attempts(self):
+        policy = ReconnectPolicy(max_attempts=2)
+        assert policy.should_retry(1)
+        assert not policy.should_retry(2)
+        assert ReconnectPolicy().should_retry(1_000)
+
+    def test_invalid_delays(self):
+        with pytest.raises(ValueError):
+            ReconnectPolicy(base_delay=5.0, max_delay=1.0)
+
+
+class TestReconnect:
+    @pytest.mark.asyncio
+    async def test_backs_off_until_connected_and_resubscribes(self):
+        connector = Connector()
+        client = NexDexWebsocketClient(
+            env=TESTNET,
+            auto_start_reader=False,
+            connector=connector,
+            reconnect_policy=ReconnectPolicy(base_delay=0.0, max_delay=0.0),
+        )
+        assert await client.connect()
+        channels = ["bbo.BTC-USD-PERP", "bbo.ETH-USD-PERP", "trades.BTC-USD-PERP"]
+        for channel in channels:
+            await client.subscribe_by_name(channel, _noop)
+
+        connector.failures = 2
+        await client._reconnect()
+
+        assert len(connector.connections) == 2
+        assert client.ws is connector.connections[1]
+        assert connector.connections[0].state == State.CLOSED
+        assert connector.connections[1].subscribed() == channels
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self):
+        connector = Connector(failures=10)
+        client = NexDexWebsocketClient(
+            env=TESTNET,
+            auto_start_reader=False,
+            connector=connector,
+            reconnect_policy=ReconnectPolicy(base_delay=0.0, max_delay=0.0, max_attempts=3),
+        )
+        await client._reconnect()
+        assert connector.failures == 7
+        assert client.ws is None
+        assert not client._reconnecting
+
+    @pytest.mark.asyncio
+    async def test_stops_when_closed(self):
+        connector = Connector(failures=1_000)
+        client = NexDexWebsocketClient(
+            env=TESTNET,
+            auto_start_reader=False,
+            connector=connector,
+            reconnect_policy=ReconnectPolicy(base_delay=0.01, max_delay=0.01, jitter=False),
+        )
+        reconnect = asyncio.create_task(client._reconnect())
+        await asyncio.sleep(0.05)
+        await client.close()
+        await asyncio.wait_for(reconnect, timeout=1.0)
+
+
+class TestWarmStandby:
+    @pytest.mark.asyncio
+    async def test_standby_promoted_on_failure(self):
+        connector = Connector()
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, connector=connector, warm_standby=True)
+        await client.subscribe_by_name("bbo.BTC-USD-PERP", _noop)
+        assert await client.connect()
+        await _settle()
+        primary, standby = connector.connections
+        assert client._standby is standby
+        assert standby.subscribed() == ["bbo.BTC-USD-PERP"]
+
+        # Subscriptions made later reach the standby too; its acks are tracked
+        await client.subscribe_by_name("trades.BTC-USD-PERP", _noop)
+        assert standby.subscribed() == ["bbo.BTC-USD-PERP", "trades.BTC-USD-PERP"]
+        standby.incoming.put_nowait(json.dumps({"id": 1, "result": {"channel": "bbo.BTC-USD-PERP"}}))
+        await _settle()
+
+        await client._reconnect()
+        assert client.ws is standby
+        assert primary.state == State.CLOSED
+        assert client.subscribed_channels == {"bbo.BTC-USD-PERP": True}
+        # Only the unacknowledged channel is sent again
+        assert standby.subscribed() == ["bbo.BTC-USD-PERP", "trades.BTC-USD-PERP", "trades.BTC-USD-PERP"]
+
+        # A new standby is opened in the background
+        await _settle()
+        assert len(connector.connections) == 3
+        assert client._standby is connector.connections[2]
+
+        await client.close()
+        assert connector.connections[2].state == State.CLOSED
+        assert client._standby is None
+
+    @pytest.mark.asyncio
+    async def test_market_data_on_standby_is_not_parsed(self, monkeypatch):
+        connector = Connector()
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, connector=connector, warm_standby=True)
+        assert await client.connect()
+        await _settle()
+        standby = connector.connections[1]
+        parsed = []
+        loads = json.loads
+        monkeypatch.setattr("nexdex_py.api.ws_client.json.loads", lambda frame: parsed.append(frame) or loads(frame))
+        standby.incoming.put_nowait('{"jsonrpc":"2.0","method":"subscription","params":{"data":{}}}')
+        standby.incoming.put_nowait(b'{"id":1,"result":{"channel":"bbo.BTC-USD-PERP"}}')
+        await _settle()
+        assert parsed == [b'{"id":1,"result":{"channel":"bbo.BTC-USD-PERP"}}']
+        assert client._standby_channels == {"bbo.BTC-USD-PERP": True}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_reauthenticate_reaches_standby(self):
+        connector = Connector()
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, connector=connector, warm_standby=True)
+        assert await client.connect()
+        await _settle()
+        primary, standby = connector.connections
+        assert await client.reauthenticate("renewed")
+        for connection in (primary, standby):
+            auth = [json.loads(m) for m in connection.sent_messages if '"auth"' in m]
+            assert auth[-1]["params"] == {"bearer": "renewed"}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_lost_standby_falls_back_to_reconnect(self):
+        connector = Connector()
+        client = NexDexWebsocketClient(
+            env=TESTNET,
+            auto_start_reader=False,
+            connector=connector,
+            warm_standby=True,
+            reconnect_policy=ReconnectPolicy(base_delay=0.0, max_delay=0.0),
+        )
+        assert await client.connect()
+        await _settle()
+        await connector.connections[1].close()
+        await _settle()
+        assert client._standby is None
+
+        await client._reconnect()
+        assert client.ws is connector.connections[2]
+        await client.close()
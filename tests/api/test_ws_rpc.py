@@ -0,0 +1,119 @@
+"""Tests for JSON-RPC id correlation and bulk subscription of the WebSocket client."""
+
+import asyncio
+import json
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_rpc import RpcCorrelator, RpcError
+from nexdex_py.environment import TESTNET
+from nexdex_py.simulator import ExchangeSimulator
+
+
+async def _noop(ws_channel, message):
+    pass
+
+
+async def _simulated_client(**kwargs) -> tuple[NexDexWebsocketClient, ExchangeSimulator]:
+    sim = ExchangeSimulator()
+    client = NexDexWebsocketClient(
+        env=TESTNET, connector=sim.ws_connector, ws_url_override=sim.ws_url, reader_sleep_on_no_connection=0, **kwargs
+    )
+    assert await client.connect()
+    return client, sim
+
+
+class TestRpcCorrelator:
+    @pytest.mark.asyncio
+    async def test_ids_are_unique_and_increasing(self):
+        rpc = RpcCorrelator()
+        ids = [rpc.next_id() for _ in range(1000)]
+        assert ids == sorted(set(ids))
+
+    @pytest.mark.asyncio
+    async def test_resolves_by_id(self):
+        rpc = RpcCorrelator()
+        first, second = rpc.next_id(), rpc.next_id()
+        first_reply, second_reply = rpc.expect(first), rpc.expect(second)
+        assert rpc.resolve({"id": second, "result": {"channel": "b"}})
+        assert rpc.resolve({"id": first, "result": {"channel": "a"}})
+        assert not rpc.resolve({"id": 999, "result": {}})
+        assert await rpc.wait(first, first_reply, 1.0) == {"channel": "a"}
+        assert await rpc.wait(second, second_reply, 1.0) == {"channel": "b"}
+        assert len(rpc) == 0
+
+    @pytest.mark.asyncio
+    async def test_error_and_timeout(self):
+        rpc = RpcCorrelator()
+        request_id = rpc.next_id()
+        reply = rpc.expect(request_id)
+        rpc.resolve({"id": request_id, "error": {"code": 40110, "message": "Unauthorized"}})
+        with pytest.raises(RpcError, match="40110"):
+            await rpc.wait(request_id, reply, 1.0)
+
+        request_id = rpc.next_id()
+        with pytest.raises(asyncio.TimeoutError):
+            await rpc.wait(request_id, rpc.expect(request_id), 0.01)
+        assert len(rpc) == 0
+
+    @pytest.mark.asyncio
+    async def test_fail_all(self):
+        rpc = RpcCorrelator()
+        request_id = rpc.next_id()
+        reply = rpc.expect(request_id)
+        rpc.fail_all(ConnectionError("closed"))
+        with pytest.raises(ConnectionError):
+            await rpc.wait(request_id, reply, 1.0)
+
+
+class TestSubscriptionAcks:
+    @pytest.mark.asyncio
+    async def test_subscribe_waits_for_ack(self):
+        client, _ = await _simulated_client()
+        await client.subscribe_by_name("bbo.BTC-USD-PERP", _noop, ack_timeout=1.0)
+        assert client.get_subscriptions() == {"bbo.BTC-USD-PERP": True}
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_rejected_subscription_raises(self):
+        client, _ = await _simulated_client()
+        # Private channel without an authenticated account
+        with pytest.raises(RpcError, match="40110"):
+            await client.subscribe_by_name("orders.BTC-USD-PERP", _noop, ack_timeout=1.0)
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_subscribe_many(self):
+        client, _ = await _simulated_client()
+        sent: list[dict] = []
+        send = client.ws.send
+
+        async def recording_send(data):
+            sent.append(json.loads(data))
+            await send(data)
+
+        client.ws.send = recording_send
+        channels = {f"bbo.M{i}-USD-PERP": _noop for i in range(300)}
+        channels["orders.BTC-USD-PERP"] = _noop
+
+        acks = await client.subscribe_many(channels, ack_timeout=2.0)
+
+        assert sum(acks.values()) == 300
+        assert acks["orders.BTC-USD-PERP"] is False
+        assert len(client.get_subscriptions()) == 300
+        ids = [message["id"] for message in sent]
+        assert len(set(ids)) == len(ids) == 301
+        assert len(client._rpc) == 0
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_no_ack_without_reader(self):
+        sim = ExchangeSimulator()
+        client = NexDexWebsocketClient(
+            env=TESTNET, auto_start_reader=False, connector=sim.ws_connector, ws_url_override=sim.ws_url
+        )
+        await client.connect()
+        acks = await client.subscribe_many({"bbo.BTC-USD-PERP": _noop}, ack_timeout=0.01)
+        assert acks == {"bbo.BTC-USD-PERP": False}
+        await client.close()
@@ -0,0 +1,122 @@
+"""Tests for typed WebSocket channel payloads."""
+
+import json
+from decimal import Decimal
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.api.ws_structs import WsBBO, WsBookLevel, WsFill, WsOrder, WsOrderBook, WsTrade, decode_ws_data
+from nexdex_py.common.metrics import MetricsRegistry
+from nexdex_py.environment import TESTNET
+
+BBO = {
+    "market": "BTC-USD-PERP",
+    "bid": "50000.5",
+    "bid_size": "1.2",
+    "ask": "",
+    "ask_size": "",
+    "last_updated_at": 1700000000000,
+    "seq_no": 7,
+}
+
+
+def _frame(channel: str, data) -> str:
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+class TestDecode:
+    def test_bbo(self):
+        bbo = decode_ws_data("bbo", BBO)
+        assert bbo == WsBBO("BTC-USD-PERP", Decimal("50000.5"), Decimal("1.2"), None, None, 1700000000000, 7)
+        assert not hasattr(bbo, "__dict__")
+
+    def test_numeric_zero_kept(self):
+        data = {"market": "ETH-USD-PERP", "fee": 0, "realized_pnl": "0", "realized_funding": None}
+        fill = decode_ws_data("fills", data)
+        assert (fill.fee, fill.realized_pnl, fill.realized_funding) == (Decimal(0), Decimal(0), None)
+
+    def test_order_book(self):
+        book = decode_ws_data(
+            "order_book",
+            {
+                "market": "ETH-USD-PERP",
+                "update_type": "s",
+                "inserts": [
+                    {"side": "BUY", "price": "99", "size": "1"},
+                    {"side": "BUY", "price": "100", "size": "2"},
+                    {"side": "SELL", "price": "101", "size": "3"},
+                ],
+                "updates": [],
+                "deletes": [],
+                "seq_no": 1,
+            },
+        )
+        assert isinstance(book, WsOrderBook) and book.is_snapshot
+        assert book.inserts[0] == WsBookLevel("BUY", Decimal("99"), Decimal("1"))
+        assert book.bids() == [(Decimal("100"), Decimal("2")), (Decimal("99"), Decimal("1"))]
+        assert book.asks() == [(Decimal("101"), Decimal("3"))]
+
+    def test_trade_fill_order(self):
+        trade = decode_ws_data("trades", {"id": "1", "market": "ETH-USD-PERP", "price": "2000", "size": "0.5"})
+        assert isinstance(trade, WsTrade) and trade.price == Decimal("2000")
+        fill = decode_ws_data("fills", {"market": "ETH-USD-PERP", "fee": "0.01", "realized_pnl": "-1"})
+        assert isinstance(fill, WsFill) and fill.realized_pnl == Decimal("-1")
+        order = decode_ws_data("orders", {"market": "ETH-USD-PERP", "remaining_size": "0.1", "trigger_price": ""})
+        assert isinstance(order, WsOrder) and order.trigger_price is None
+
+    def test_channels_without_struct_unchanged(self):
+        data = {"symbol": "ETH-USD-PERP"}
+        assert decode_ws_data("markets_summary", data) is data
+
+
+class TestTypedMessages:
+    @pytest.mark.asyncio
+    async def test_callback_receives_struct(self):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, typed_messages=True)
+        received = []
+
+        async def on_message(ws_channel, message):
+            received.append((ws_channel, message["params"]["data"]))
+
+        client.callbacks["bbo.BTC-USD-PERP"] = on_message
+        await client._process_message(_frame("bbo.BTC-USD-PERP", BBO))
+
+        assert received[0][0] == NexDexWebsocketChannel.BBO
+        assert received[0][1].bid == Decimal("50000.5")
+
+    @pytest.mark.asyncio
+    async def test_server_lag_recorded_for_structs(self):
+        metrics = MetricsRegistry()
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, typed_messages=True, metrics=metrics)
+
+        async def on_message(ws_channel, message):
+            pass
+
+        client.callbacks["bbo.BTC-USD-PERP"] = on_message
+        await client._process_message(_frame("bbo.BTC-USD-PERP", BBO))
+        assert "nexdex_ws_server_lag_seconds" in json.dumps(metrics.snapshot())
+
+    @pytest.mark.asyncio
+    async def test_undecodable_payload_passed_raw(self):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, typed_messages=True)
+        received = []
+
+        async def on_message(ws_channel, message):
+            received.append(message["params"]["data"])
+
+        client.callbacks["trades.BTC-USD-PERP"] = on_message
+        await client._process_message(_frame("trades.BTC-USD-PERP", {"price": "not a number"}))
+        assert received == [{"price": "not a number"}]
+
+    @pytest.mark.asyncio
+    async def test_validation_keeps_message_unchanged(self):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, validate_messages=True)
+        received = []
+
+        async def on_message(ws_channel, message):
+            received.append(message)
+
+        client.callbacks["bbo.BTC-USD-PERP"] = on_message
+        await client._process_message(_frame("bbo.BTC-USD-PERP", BBO))
+        assert received == [json.loads(_frame("bbo.BTC-USD-PERP", BBO))]
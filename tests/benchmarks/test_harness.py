@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from benchmarks.harness import Benchmark, build_report, compare_reports, run_benchmark
+
+
+def _report(**medians: float) -> dict:
+    return {"results": [{"name": name, "median": median} for name, median in medians.items()]}
+
+
+class TestRunBenchmark:
+    def test_sync_benchmark(self):
+        calls = []
+        result = run_benchmark(Benchmark("t.sync", "t", lambda: lambda: calls.append(1)), rounds=3, min_time=0.001)
+
+        row = result.to_dict()
+        assert row["rounds"] == 3
+        assert len(result.samples) == 3
+        assert row["ops_per_sec"] > 0
+        assert len(calls) >= result.iterations * 3
+
+    def test_async_benchmark(self):
+        async def noop():
+            pass
+
+        result = run_benchmark(Benchmark("t.async", "t", lambda: noop, is_async=True), rounds=2, min_time=0.001)
+
+        assert result.iterations >= 1
+        assert all(sample > 0 for sample in result.samples)
+
+    def test_self_timed_benchmark(self):
+        result = run_benchmark(Benchmark("t.self", "t", lambda: lambda: 0.5, self_timed=True), rounds=2)
+
+        assert result.samples == [0.5, 0.5]
+
+    def test_report_is_json_serializable(self):
+        result = run_benchmark(Benchmark("t.sync", "t", lambda: lambda: None), rounds=2, min_time=0.001)
+        report = json.loads(json.dumps(build_report([result])))
+
+        assert report["schema_version"] == 1
+        assert report["results"][0]["name"] == "t.sync"
+        assert "python" in report["environment"]
+
+
+class TestCompareReports:
+    def test_flags_regressions_above_threshold(self):
+        rows = compare_reports(_report(a=1.0, b=1.0), _report(a=1.05, b=1.5), max_regression=0.1)
+
+        assert [(row["name"], row["regressed"]) for row in rows] == [("a", False), ("b", True)]
+        assert rows[1]["change"] == pytest.approx(0.5)
+
+    def test_ignores_benchmarks_missing_from_baseline(self):
+        assert compare_reports(_report(a=1.0), _report(c=2.0), max_regression=0.1) == []
@@ -0,0 +1,131 @@
+"""Tests for client-side order validation against market constraints."""
+
+from decimal import Decimal
+from unittest.mock import Mock, patch
+
+import pytest
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.generated.responses import MarketResp
+from nexdex_py.common.market_constraints import MarketConstraintIndex, MarketConstraints, count_open_orders
+from nexdex_py.common.order import Order, OrderSide, OrderType
+from nexdex_py.environment import TESTNET
+
+MARKETS = {
+    "results": [
+        {
+            "symbol": "ETH-USD-PERP",
+            "price_tick_size": "0.01",
+            "order_size_increment": "0.001",
+            "min_notional": "10",
+            "max_order_size": "100",
+            "max_open_orders": 3,
+        },
+        {"symbol": "BTC-USD-PERP", "price_tick_size": "0.1", "order_size_increment": "0.0001"},
+    ]
+}
+
+
+def _limit(size: str, price: str, side: OrderSide = OrderSide.Buy, market: str = "ETH-USD-PERP") -> Order:
+    return Order(market, OrderType.Limit, side, Decimal(size), Decimal(price))
+
+
+class TestMarketConstraintIndex:
+    def setup_method(self):
+        self.index = MarketConstraintIndex.from_response(MARKETS)
+
+    def test_valid_order(self):
+        assert self.index.check(_limit("0.01", "2000.01")) is None
+        self.index.validate(_limit("0.01", "2000.01"))
+
+    @pytest.mark.parametrize(
+        "order, error",
+        [
+            (_limit("0.0105", "2000"), "size 0.0105 not a multiple of 0.001"),
+            (_limit("101", "2000"), "above max_order_size 100"),
+            (_limit("0.01", "2000.005"), "not a multiple of 0.01"),
+            (_limit("0.001", "2000"), "notional below min_notional 10"),
+            (_limit("0", "2000"), "must be positive"),
+            (_limit("1", "2000", market="SOL-USD-PERP"), "unknown market"),
+        ],
+    )
+    def test_invalid_orders(self, order, error):
+        assert error in self.index.check(order)
+        with pytest.raises(ValueError, match=error):
+            self.index.validate(order)
+
+    def test_market_order_notional_needs_reference_price(self):
+        order = Order("ETH-USD-PERP", OrderType.Market, OrderSide.Buy, Decimal("0.001"))
+        assert self.index.check(order) is None
+        assert "min_notional" in self.index.check(order, reference_price=Decimal("2000"))
+
+    def test_round_order(self):
+        buy = self.index.round_order(_limit("0.01234", "2000.019"))
+        assert (buy.size, buy.limit_price) == (Decimal("0.012"), Decimal("2000.01"))
+        sell = self.index.round_order(_limit("0.01234", "2000.011", side=OrderSide.Sell))
+        assert sell.limit_price == Decimal("2000.02")
+        assert self.index.check(sell) is None
+
+    def test_batch_counts_open_orders(self):
+        orders = [_limit("0.01", "2000"), _limit("0.01", "2000.005"), _limit("0.01", "2001"), _limit("0.01", "2002")]
+        errors = self.index.check_batch(orders, open_orders={"ETH-USD-PERP": 1})
+        assert list(errors) == [1, 3]
+        assert "max_open_orders 3" in errors[3]
+        with pytest.raises(ValueError, match="2 invalid orders"):
+            self.index.validate_batch(orders, open_orders={"ETH-USD-PERP": 1})
+
+    def test_single_order_counts_open_orders(self):
+        order = _limit("0.01", "2000")
+        assert self.index.check(order, open_orders={"ETH-USD-PERP": 2}) is None
+        assert "max_open_orders 3" in self.index.check(order, open_orders={"ETH-USD-PERP": 3})
+        # Markets without a limit and calls without counts are not checked
+        btc_order = _limit("0.01", "2000", market="BTC-USD-PERP")
+        assert self.index.check(btc_order, open_orders={"BTC-USD-PERP": 500}) is None
+        assert self.index.check(order) is None
+
+    def test_count_open_orders(self):
+        response = {
+            "results": [
+                {"id": "1", "market": "ETH-USD-PERP", "status": "OPEN"},
+                {"id": "2", "market": "ETH-USD-PERP", "status": "NEW"},
+                {"id": "3", "market": "BTC-USD-PERP", "status": "OPEN"},
+                {"id": "4", "market": "BTC-USD-PERP", "status": "CLOSED"},
+            ]
+        }
+        assert count_open_orders(response) == {"ETH-USD-PERP": 2, "BTC-USD-PERP": 1}
+
+    def test_from_market_resp(self):
+        constraints = MarketConstraints.from_market(
+            MarketResp(symbol="BTC-USD-PERP", price_tick_size="0.5", order_size_increment="0.0001")
+        )
+        assert (constraints.price_tick, constraints.size_increment, constraints.min_notional) == (50000000, 10000, None)
+
+
+class TestApiClientValidation:
+    def setup_method(self):
+        self.api_client = NexDexApiClient(env=TESTNET)
+        self.api_client.account = Mock()
+        self.api_client._validate_auth = Mock()
+        with patch.object(self.api_client, "get", return_value=MARKETS):
+            self.api_client.load_market_constraints()
+
+    def test_invalid_batch_rejected_before_signing(self):
+        with patch.object(self.api_client, "post") as mock_post, pytest.raises(ValueError, match="invalid orders"):
+            self.api_client.submit_orders_batch([_limit("0.01", "2000"), _limit("0.0105", "2000")])
+        self.api_client.account.sign_order.assert_not_called()
+        mock_post.assert_not_called()
+
+    def test_valid_order_submitted(self):
+        with patch.object(self.api_client, "post", return_value={}) as mock_post:
+            self.api_client.submit_order(_limit("0.01", "2000"))
+        self.api_client.account.sign_order.assert_called_once()
+        mock_post.assert_called_once()
+
+    def test_order_above_max_open_orders_rejected(self):
+        open_orders = count_open_orders({"results": [{"market": "ETH-USD-PERP", "status": "OPEN"}] * 3})
+        with patch.object(self.api_client, "post") as mock_post, pytest.raises(ValueError, match="max_open_orders"):
+            self.api_client.submit_order(_limit("0.01", "2000"), open_orders=open_orders)
+        with pytest.raises(ValueError, match="max_open_orders"):
+            self.api_client.submit_orders_batch([_limit("0.01", "2000")], open_orders=open_orders)
+        self.api_client.account.sign_order.assert_not_called()
+        mock_post.assert_not_called()
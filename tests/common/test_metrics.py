@@ -0,0 +1,130 @@
+"""Tests for latency histograms and the metrics registry."""
+
+import random
+
+import pytest
+
+from nexdex_py.common.metrics import LatencyHistogram, MetricsRegistry, normalize_endpoint
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        hist = LatencyHistogram()
+        assert hist.percentile(0.99) == 0.0
+        assert hist.snapshot()["count"] == 0
+
+    def test_small_values_are_exact(self):
+        hist = LatencyHistogram()
+        for value in range(1, 101):
+            hist.record_ns(value)
+
+        assert hist.percentile(0.5) == pytest.approx(50e-9)
+        assert hist.percentile(1.0) == pytest.approx(100e-9)
+        assert hist.min_ns == 1
+        assert hist.max_ns == 100
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(7)  # noqa: S311
+        values = sorted(int(rng.lognormvariate(13, 1.5)) for _ in range(20_000))
+        hist = LatencyHistogram()
+        for value in values:
+            hist.record_ns(value)
+
+        for quantile in (0.5, 0.9, 0.99, 0.999):
+            exact = values[int(quantile * len(values) + 0.5) - 1] / 1e9
+            assert hist.percentile(quantile) == pytest.approx(exact, rel=0.02)
+        assert len(hist.counts) < 1_500
+
+    def test_record_seconds_and_merge(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.001)
+        second.record(0.003)
+        second.record(0.005)
+
+        first.merge(second)
+
+        snapshot = first.snapshot()
+        assert snapshot["count"] == 3
+        assert snapshot["sum"] == pytest.approx(0.009)
+        assert snapshot["min"] == pytest.approx(0.001)
+        assert snapshot["max"] == pytest.approx(0.005)
+        assert snapshot["p50"] == pytest.approx(0.003, rel=0.02)
+
+    def test_negative_values_clamp_to_zero(self):
+        hist = LatencyHistogram()
+        hist.record_ns(-5)
+        assert hist.max_ns == 0
+
+
+class TestNormalizeEndpoint:
+    @pytest.mark.parametrize(
+        "path,expected",
+        [
+            ("/v1/orders/1700000000000201709104000000", "/v1/orders/{id}"),
+            ("/v1/auth/0x2c144d2f2d4fc61b6f8967f3ba0012a87d90140bcfe5a3e92e8df83258c960f", "/v1/auth/{id}"),
+            ("/v1/orders/by_client_id/my-order", "/v1/orders/by_client_id/{client_id}"),
+            ("/v1/bbo/BTC-USD-PERP", "/v1/bbo/BTC-USD-PERP"),
+            ("/v1/markets/summary", "/v1/markets/summary"),
+        ],
+    )
+    def test_normalize(self, path, expected):
+        assert normalize_endpoint(path) == expected
+
+
+class TestMetricsRegistry:
+    def test_series_are_keyed_by_labels(self):
+        metrics = MetricsRegistry()
+        metrics.observe("latency", 0.001, endpoint="/v1/orders", status=200)
+        metrics.observe("latency", 0.002, status=200, endpoint="/v1/orders")
+        metrics.observe("latency", 0.5, endpoint="/v1/orders", status=500)
+
+        assert metrics.histogram("latency", endpoint="/v1/orders", status=200).count == 2
+        assert metrics.histogram("latency", endpoint="/v1/orders", status="500").count == 1
+        assert metrics.histogram("latency", endpoint="/v1/fills", status=200) is None
+
+    def test_counters_gauges_and_timer(self):
+        metrics = MetricsRegistry()
+        metrics.inc("retries", endpoint="/v1/orders")
+        metrics.inc("retries", 2, endpoint="/v1/orders")
+        metrics.set_gauge("depth", 3)
+        with metrics.time("block"):
+            pass
+
+        assert metrics.counter("retries", endpoint="/v1/orders") == 3
+        assert metrics.counter("retries", endpoint="/v1/fills") == 0
+        assert metrics.gauge("depth") == 3
+        assert metrics.histogram("block").count == 1
+
+    def test_snapshot(self):
+        metrics = MetricsRegistry(quantiles=(0.5, 0.99))
+        metrics.observe("latency", 0.004, endpoint="/v1/orders")
+        metrics.inc("retries", endpoint="/v1/orders")
+
+        snapshot = metrics.snapshot()
+
+        (series,) = snapshot["histograms"]["latency"]
+        assert series["labels"] == {"endpoint": "/v1/orders"}
+        assert set(series) >= {"count", "sum", "min", "max", "mean", "p50", "p99"}
+        assert snapshot["counters"]["retries"] == [{"labels": {"endpoint": "/v1/orders"}, "value": 1}]
+        assert snapshot["gauges"] == {}
+
+    def test_prometheus_text(self):
+        metrics = MetricsRegistry(quantiles=(0.99,))
+        metrics.observe("nexdex_http_request_duration_seconds", 0.25, endpoint='/v1/"x"', status=200)
+        metrics.inc("nexdex_http_retries_total", endpoint="/v1/orders")
+        metrics.set_gauge("nexdex_ws_recv_queue_depth", 4)
+
+        text = metrics.to_prometheus()
+
+        assert "# TYPE nexdex_http_request_duration_seconds summary" in text
+        assert 'nexdex_http_request_duration_seconds{endpoint="/v1/\\"x\\"",status="200",quantile="0.99"} 0.25' in text
+        assert 'nexdex_http_request_duration_seconds_count{endpoint="/v1/\\"x\\"",status="200"} 1' in text
+        assert 'nexdex_http_retries_total{endpoint="/v1/orders"} 1' in text
+        assert "nexdex_ws_recv_queue_depth 4" in text
+        assert text.endswith("\n")
+
+    def test_reset(self):
+        metrics = MetricsRegistry()
+        metrics.observe("latency", 0.1)
+        metrics.reset()
+        assert metrics.to_prometheus() == ""
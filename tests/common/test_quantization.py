@@ -0,0 +1,98 @@
+"""Tests for exact chain quantization of prices and sizes."""
+
+from decimal import Decimal
+
+import pytest
+
+from nexdex_py.api.generated.responses import MarketResp
+from nexdex_py.common.order import Order, OrderSide, OrderType
+from nexdex_py.common.quantization import (
+    from_chain_int,
+    price_ladder,
+    price_levels,
+    quantize_prices,
+    quantize_sizes,
+    to_chain_int,
+    to_chain_ints,
+)
+
+MARKET = {"symbol": "ETH-USD-PERP", "price_tick_size": "0.01", "order_size_increment": "0.001"}
+
+
+class TestToChainInt:
+    def test_exact_conversion(self):
+        assert to_chain_int(Decimal("65000.12")) == 6500012000000
+        assert to_chain_int("0.00000001") == 1
+        assert to_chain_int(3) == 300000000
+        assert to_chain_int(Decimal("-1.5")) == -150000000
+
+    def test_rejects_unrepresentable(self):
+        with pytest.raises(ValueError, match="8 decimals"):
+            to_chain_int(Decimal("0.000000001"))
+        with pytest.raises(ValueError, match="finite"):
+            to_chain_int("nan")
+        with pytest.raises(ValueError, match="finite"):
+            to_chain_int("abc")
+
+    def test_non_strict_truncates_like_scaleb(self):
+        value = Decimal("1.123456789")
+        assert to_chain_int(value, strict=False) == int(value.scaleb(8))
+
+    def test_bulk_matches_per_value(self):
+        values = [Decimal("65000.12"), Decimal("-1.5"), Decimal("0.00000001"), Decimal("1.000000000")]
+        assert to_chain_ints(values) == [to_chain_int(v) for v in values]
+        assert to_chain_ints(["1.5", 2, Decimal("3")]) == [150000000, 200000000, 300000000]
+
+    def test_bulk_rejects_unrepresentable(self):
+        with pytest.raises(ValueError, match="8 decimals"):
+            to_chain_ints([Decimal("1"), Decimal("0.000000001")])
+        with pytest.raises(ValueError, match="finite"):
+            to_chain_ints([Decimal("1"), Decimal("nan")])
+        values = [Decimal("1.123456789")]
+        assert to_chain_ints(values, strict=False) == [int(values[0].scaleb(8))]
+
+    def test_round_trip(self):
+        values = ["0.1", "123.45678901", "99999"]
+        assert [from_chain_int(u) for u in to_chain_ints(values)] == [Decimal(v) for v in values]
+
+
+class TestMarketQuantization:
+    def test_prices_and_sizes_on_grid(self):
+        assert quantize_prices(["100.01", Decimal("99.5")], MARKET) == [10001000000, 9950000000]
+        assert quantize_sizes(["0.123"], MARKET) == [12300000]
+
+    def test_off_grid_rejected(self):
+        with pytest.raises(ValueError, match=r"price not a multiple of 0.01: 100.005"):
+            quantize_prices(["100.005"], MARKET)
+        with pytest.raises(ValueError, match="size not a multiple"):
+            quantize_sizes(["0.0001", "1"], MARKET)
+
+    def test_accepts_market_resp(self):
+        market = MarketResp(symbol="BTC-USD-PERP", price_tick_size="0.5", order_size_increment="0.0001")
+        assert quantize_prices(["100.5"], market) == [10050000000]
+
+    def test_missing_increment(self):
+        with pytest.raises(ValueError, match="BTC-USD-PERP has no order_size_increment"):
+            quantize_sizes(["1"], {"symbol": "BTC-USD-PERP"})
+
+    def test_price_ladder_matches_per_level_conversion(self):
+        ladder = price_ladder("2000", 300, -3, MARKET)
+        expected = [to_chain_int(Decimal("2000") - Decimal("0.03") * i) for i in range(300)]
+        assert ladder == expected
+
+    def test_price_levels_feed_orders(self):
+        levels = price_levels("2000", 300, -3, MARKET)
+        orders = [Order("ETH-USD-PERP", OrderType.Limit, OrderSide.Buy, Decimal("1"), price) for price in levels]
+        assert [int(order.chain_price()) for order in orders] == price_ladder("2000", 300, -3, MARKET)
+        assert str(levels[1]) == "1999.97"
+
+    def test_price_ladder_start_off_tick(self):
+        with pytest.raises(ValueError):
+            price_ladder("2000.001", 3, 1, MARKET)
+
+
+class TestOrderChainValues:
+    def test_order_chain_values_unchanged(self):
+        order = Order("ETH-USD-PERP", OrderType.Limit, OrderSide.Buy, Decimal("0.123"), Decimal("1999.99"))
+        assert order.chain_price() == str(int(Decimal("1999.99").scaleb(8)))
+        assert order.chain_size() == "12300000"
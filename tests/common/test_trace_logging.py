@@ -0,0 +1,124 @@
+"""Tests for sampled, level-guarded message tracing."""
+
+import json
+import logging
+
+import pytest
+
+from nexdex_py.api.http_client import HttpClient, HttpMethod
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.common.trace_logging import ChannelTracer
+from nexdex_py.environment import TESTNET
+
+
+class ExplodingRepr:
+    """Fails the test if anything formats it."""
+
+    def __repr__(self) -> str:
+        raise AssertionError("formatted while logging is disabled")
+
+    __str__ = __repr__
+
+
+def _frame(channel: str, data) -> str:
+    return json.dumps({"jsonrpc": "2.0", "method": "subscription", "params": {"channel": channel, "data": data}})
+
+
+class TestChannelTracer:
+    def test_disabled_when_sample_every_is_zero(self):
+        assert ChannelTracer.create(logging.getLogger("trace-test"), 0) is None
+
+    def test_rejects_negative_sampling(self):
+        with pytest.raises(ValueError, match="sample_every"):
+            ChannelTracer(logging.getLogger("trace-test"), -1)
+
+    def test_not_enabled_above_debug(self):
+        logger = logging.getLogger("trace-test-info")
+        logger.setLevel(logging.INFO)
+        tracer = ChannelTracer(logger, 2)
+        assert not tracer.enabled_for("bbo.BTC-USD-PERP")
+        # Nothing is formatted or counted while DEBUG is off
+        tracer.trace("bbo.BTC-USD-PERP", "%s", ExplodingRepr())
+        assert tracer._counts == {}
+
+    def test_records_point_at_the_caller(self, caplog):
+        tracer = ChannelTracer(logging.getLogger("trace-test-caller"))
+        with caplog.at_level(logging.DEBUG, logger="trace-test-caller"):
+            tracer.trace("bbo.BTC-USD-PERP", "trace")
+            if tracer.enabled_for("bbo.BTC-USD-PERP"):
+                tracer.log("bbo.BTC-USD-PERP", "log")
+        assert [(r.funcName, r.filename) for r in caplog.records] == [
+            ("test_records_point_at_the_caller", "test_trace_logging.py")
+        ] * 2
+
+    def test_samples_per_channel(self, caplog):
+        logger = logging.getLogger("trace-test-debug")
+        tracer = ChannelTracer(logger, 3)
+        with caplog.at_level(logging.DEBUG, logger="trace-test-debug"):
+            for i in range(7):
+                tracer.trace("bbo.BTC-USD-PERP", "btc %d", i)
+                tracer.trace("bbo.ETH-USD-PERP", "eth %d", i)
+        assert [r.getMessage() for r in caplog.records] == ["btc 0", "eth 0", "btc 3", "eth 3", "btc 6", "eth 6"]
+        assert caplog.records[2].trace_channel == "bbo.BTC-USD-PERP"
+        assert caplog.records[2].trace_count == 4
+
+
+class TestWebsocketTracing:
+    @pytest.mark.asyncio
+    async def test_no_debug_call_without_debug(self, monkeypatch):
+        logger = logging.getLogger("trace-test-ws")
+        logger.setLevel(logging.INFO)
+        client = NexDexWebsocketClient(env=TESTNET, logger=logger, auto_start_reader=False, validate_messages=True)
+        received = []
+
+        async def callback(ws_channel, message):
+            received.append(message)
+
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        monkeypatch.setattr(client.logger, "debug", lambda *args, **kwargs: pytest.fail("debug called"))
+        await client._process_message(_frame("bbo.BTC-USD-PERP", {"market": "BTC-USD-PERP"}))
+        await client._process_message(_frame("unknown.channel", {}))
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_debug_trace(self, caplog):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, trace_sample_every=2)
+
+        async def callback(ws_channel, message):
+            pass
+
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        with caplog.at_level(logging.DEBUG, logger=client.logger.name):
+            for i in range(4):
+                await client._process_message(_frame("bbo.BTC-USD-PERP", {"seq_no": i}))
+        traces = [r for r in caplog.records if getattr(r, "trace_channel", None) == "bbo.BTC-USD-PERP"]
+        assert len(traces) == 2
+        assert "'seq_no': 2" in traces[1].getMessage()
+
+    @pytest.mark.asyncio
+    async def test_tracing_disabled(self, caplog):
+        client = NexDexWebsocketClient(env=TESTNET, auto_start_reader=False, trace_sample_every=0)
+
+        async def callback(ws_channel, message):
+            pass
+
+        client.callbacks["bbo.BTC-USD-PERP"] = callback
+        with caplog.at_level(logging.DEBUG, logger=client.logger.name):
+            await client._process_message(_frame("bbo.BTC-USD-PERP", {}))
+        assert client._trace is None
+        assert caplog.records == []
+
+
+class TestHttpRedaction:
+    def test_headers_not_redacted_without_hook(self, monkeypatch):
+        client = HttpClient()
+        monkeypatch.setattr(client, "_redact_headers", lambda headers: pytest.fail("redacted without a hook"))
+        monkeypatch.setattr(client.client, "request", lambda **kwargs: _Response())
+        assert client.request("https://example.com/x", HttpMethod.GET, headers={"Authorization": "Bearer t"}) == {}
+
+
+class _Response:
+    status_code = 200
+
+    def json(self):
+        return {}
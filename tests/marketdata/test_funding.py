@@ -0,0 +1,110 @@
+"""Tests for funding analytics."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel
+from nexdex_py.marketdata import FundingPayments, FundingSeries, FundingTracker
+
+MARKET = "BTC-USD-PERP"
+HOUR = 3_600_000
+T0 = 1_700_000_000_000
+
+
+def _data(ts: int, rate: str, index: str, market: str = MARKET) -> dict:
+    return {"market": market, "created_at": ts, "funding_rate": rate, "funding_premium": "0", "funding_index": index}
+
+
+def _payment(payment_id: str, ts: int, payment: str) -> dict:
+    return {"id": payment_id, "market": MARKET, "created_at": ts, "payment": payment, "index": "0"}
+
+
+@pytest.fixture
+def funding() -> FundingTracker:
+    tracker = FundingTracker([MARKET, "ETH-USD-PERP"])
+    tracker.add_funding_data(
+        [_data(T0, "0.0001", "10"), _data(T0 + HOUR, "0.0003", "12"), _data(T0 + 2 * HOUR, "0", "15")]
+    )
+    return tracker
+
+
+class TestFundingSeries:
+    def test_out_of_order_rows_are_merged(self):
+        series = FundingSeries()
+        assert series.extend([(T0 + HOUR, 0.2, 0, 2), (T0 + 2 * HOUR, 0.3, 0, 3)]) == 2
+        assert series.extend([(T0, 0.1, 0, 1), (T0 + HOUR, 9, 9, 9)]) == 1
+        assert list(series.created_at) == [T0, T0 + HOUR, T0 + 2 * HOUR]
+        assert list(series.index) == [1, 2, 3]
+        assert series.rate_integral(T0 + 2 * HOUR) == pytest.approx(0.1 * HOUR + 0.2 * HOUR)
+
+    def test_payments_dedupe_and_running_total(self):
+        payments = FundingPayments()
+        assert payments.add("a", T0 + 2, -1.0)
+        assert payments.add("b", T0, 3.0)
+        assert not payments.add("a", T0 + 2, -1.0)
+        assert list(payments.total) == [3.0, 2.0]
+        assert payments.total_at(T0 + 1) == 3.0
+
+
+class TestFundingTracker:
+    def test_from_markets(self):
+        tracker = FundingTracker.from_markets(
+            {
+                "results": [
+                    {"symbol": MARKET, "asset_kind": "PERP", "funding_period_hours": 4},
+                    {"symbol": "BTC-USD-OPTION", "asset_kind": "PERP_OPTION"},
+                ]
+            }
+        )
+        assert tracker.markets == [MARKET]
+        assert tracker.funding_periods == {MARKET: 4.0}
+
+    def test_rates(self, funding):
+        assert funding.latest(MARKET)["funding_index"] == 15.0
+        assert funding.latest("ETH-USD-PERP") is None
+        assert funding.average_rate(MARKET, window_ms=2 * HOUR) == pytest.approx(0.0002)
+        assert funding.average_rate(MARKET, window_ms=3 * HOUR) is None
+        assert funding.annualized_rate(MARKET, window_ms=2 * HOUR) == pytest.approx(0.0002 * 365 * 3)
+        assert funding.annualized_rate(MARKET) == 0.0
+        with pytest.raises(ValueError, match="Unknown market"):
+            funding.latest("DOGE-USD-PERP")
+
+    def test_position_funding(self, funding):
+        assert funding.cumulative_funding(MARKET, T0, T0 + HOUR + 1) == 2.0
+        assert funding.position_funding_pnl(MARKET, size=-0.5, start_at=T0) == 2.5
+        assert funding.position_funding_pnl(MARKET, size=1, start_at=T0 - 1) is None
+        funding.add_funding_data(_data(T0 + 3 * HOUR, "0.001", "16"))
+        assert funding.projected_payment(MARKET, size=2, price=100) == pytest.approx(-0.2)
+        assert funding.projected_payment(MARKET, size=2, price=100, horizon_ms=4 * HOUR) == pytest.approx(-0.1)
+
+    def test_backfill_pages(self):
+        tracker = FundingTracker([MARKET])
+        api_client = MagicMock()
+        api_client.fetch_funding_data.side_effect = [
+            {"results": [_data(T0 + HOUR, "0", "2")], "next": "c1"},
+            {"results": [_data(T0, "0", "1")], "next": None},
+        ]
+        api_client.fetch_funding_payments.return_value = {"results": [_payment("p1", T0, "-4")], "next": None}
+        tracker.backfill_from(api_client, start_at=T0, end_at=T0 + HOUR, payments=True)
+
+        assert list(tracker.data[MARKET].index) == [1.0, 2.0]
+        assert api_client.fetch_funding_data.call_args.kwargs["params"]["cursor"] == "c1"
+        assert tracker.funding_paid(MARKET) == -4.0
+
+    @pytest.mark.asyncio
+    async def test_on_message(self, funding):
+        async def send(channel: NexDexWebsocketChannel, data: dict) -> None:
+            await funding.on_message(channel, {"params": {"channel": channel.value, "data": data}})
+
+        comparison = {"market": MARKET, "funding_rate": "0.0001"}
+        await send(NexDexWebsocketChannel.FUNDING_PAYMENTS, _payment("1", T0, "-2"))
+        await send(NexDexWebsocketChannel.FUNDING_PAYMENTS, _payment("2", T0 + HOUR, "1"))
+        await send(NexDexWebsocketChannel.FUNDING_DATA, _data(T0 + 5 * HOUR, "0", "20"))
+        await send(NexDexWebsocketChannel.FUNDING_RATE_COMPARISON, comparison)
+
+        assert funding.funding_paid(MARKET) == -1.0
+        assert funding.funding_paid(MARKET, start_at=T0 + 1) == 1.0
+        assert funding.funding_paid(MARKET, end_at=T0) == -2.0
+        assert funding.latest(MARKET)["funding_index"] == 20.0
+        assert funding.comparisons[MARKET] == comparison
@@ -0,0 +1,129 @@
+"""Tests for streaming kline aggregation."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel
+from nexdex_py.marketdata import CandleRing, Kline, KlineAggregator
+
+MARKET = "BTC-USD-PERP"
+T0 = 1_699_999_200_000  # multiple of 60 minutes
+MIN = 60_000
+
+
+def _trade(ts: int, price: str, size: str = "1", market: str = MARKET) -> dict:
+    return {"id": str(ts), "market": market, "side": "BUY", "price": price, "size": size, "created_at": ts}
+
+
+class TestCandleRing:
+    def test_trades_build_candles(self):
+        ring = CandleRing(resolution=1, capacity=4)
+        for ts, price in ((T0 + 1, 10), (T0 + 2, 12), (T0 + 3, 9), (T0 + 4, 11)):
+            ring.add_trade(ts, price, 1)
+        assert ring.get() == Kline(T0, 10, 12, 9, 11, 4)
+
+    def test_gaps_are_flat_candles(self):
+        ring = CandleRing(resolution=1, capacity=4)
+        ring.add_trade(T0, 10, 1)
+        ring.add_trade(T0 + 2 * MIN, 11, 2)
+        assert ring.to_list() == [
+            Kline(T0, 10, 10, 10, 10, 1),
+            Kline(T0 + MIN, 10, 10, 10, 10, 0),
+            Kline(T0 + 2 * MIN, 11, 11, 11, 11, 2),
+        ]
+
+    def test_wraps_and_drops_oldest(self):
+        ring = CandleRing(resolution=1, capacity=3)
+        ring.add_trade(T0, 1, 1)
+        ring.add_trade(T0 + 100 * MIN, 2, 1)
+        assert len(ring) == 3
+        assert [kline.start for kline in ring.to_list()] == [T0 + 98 * MIN, T0 + 99 * MIN, T0 + 100 * MIN]
+        assert not ring.add_trade(T0, 3, 1)
+
+    def test_late_trade_updates_older_candle(self):
+        ring = CandleRing(resolution=1, capacity=3)
+        ring.add_trade(T0, 10, 1)
+        ring.add_trade(T0 + MIN, 10, 1)
+        assert ring.add_trade(T0 + 5, 20, 1)
+        assert ring.get(1) == Kline(T0, 10, 20, 10, 10, 2)
+
+
+class TestKlineAggregator:
+    def test_unsupported_resolution(self):
+        with pytest.raises(ValueError, match="Unsupported resolutions"):
+            KlineAggregator([MARKET], resolutions=(2,))
+
+    def test_all_resolutions(self):
+        klines = KlineAggregator([MARKET], backfill=False)
+        for minute in range(7):
+            klines.add_trade(_trade(T0 + minute * MIN, str(100 + minute)))
+        assert len(klines.candles(MARKET, 1)) == 7
+        assert klines.candles(MARKET, 5) == [
+            Kline(T0, 100, 104, 100, 104, 5),
+            Kline(T0 + 5 * MIN, 105, 106, 105, 106, 2),
+        ]
+        assert klines.last(MARKET, 60) == Kline(T0, 100, 106, 100, 106, 7)
+        assert not klines.add_trade(_trade(T0, "1", market="ETH-USD-PERP"))
+
+    def test_backfill_stitch(self):
+        klines = KlineAggregator([MARKET], resolutions=(1, 5))
+        api_client = MagicMock()
+        api_client.fetch_klines.side_effect = lambda symbol, resolution, start_at, end_at: {
+            "results": {
+                "1": [[T0, 100, 101, 99, 100, 3], [T0 + MIN, 100, 102, 100, 101, 2]],
+                "5": [[T0, 100, 102, 99, 101, 5]],
+            }[resolution]
+        }
+        cutoff = T0 + MIN + 30_000
+        klines.backfill_from(api_client, start_at=T0, end_at=cutoff)
+
+        # Already counted by the REST candles
+        klines.add_trade(_trade(cutoff - 1, "500"))
+        # Extends the open backfilled candle
+        klines.add_trade(_trade(cutoff + 1, "103", "0.5"))
+        klines.add_trade(_trade(T0 + 2 * MIN, "98"))
+
+        assert klines.candles(MARKET, 1) == [
+            Kline(T0, 100, 101, 99, 100, 3),
+            Kline(T0 + MIN, 100, 103, 100, 103, 2.5),
+            Kline(T0 + 2 * MIN, 98, 98, 98, 98, 1),
+        ]
+        assert klines.candles(MARKET, 5) == [Kline(T0, 100, 103, 98, 98, 6.5)]
+        assert api_client.fetch_klines.call_count == 2
+
+    def test_trades_before_backfill_are_replayed_after_it(self):
+        klines = KlineAggregator([MARKET], resolutions=(1,))
+        end_at = T0 + 10 * MIN + 30_000
+        # Subscribed before the backfill: one trade counted by the REST candles, two after them
+        klines.add_trade(_trade(end_at - 1, "500"))
+        klines.add_trade(_trade(end_at + 1, "111", "2"))
+        klines.add_trade(_trade(T0 + 11 * MIN, "112"))
+        assert klines.candles(MARKET, 1) == []
+
+        rows = [[T0 + minute * MIN, 100, 101, 99, 100, 1] for minute in range(11)]
+        assert klines.backfill(MARKET, 1, rows, end_at) == 11
+
+        candles = klines.candles(MARKET, 1)
+        assert len(candles) == 12
+        assert candles[:10] == [Kline(T0 + minute * MIN, 100, 101, 99, 100, 1) for minute in range(10)]
+        assert candles[10] == Kline(T0 + 10 * MIN, 100, 111, 99, 111, 3)
+        assert candles[11] == Kline(T0 + 11 * MIN, 112, 112, 112, 112, 1)
+
+        with pytest.raises(ValueError, match="not waiting for a backfill"):
+            klines.backfill(MARKET, 1, rows, end_at)
+
+    def test_finish_backfill_without_rest_candles(self):
+        klines = KlineAggregator([MARKET], resolutions=(1,))
+        klines.add_trade(_trade(T0, "100"))
+        assert klines.finish_backfill(MARKET, 1) == 1
+        klines.add_trade(_trade(T0 + 1, "101"))
+        assert klines.last(MARKET, 1) == Kline(T0, 100, 101, 100, 101, 2)
+
+    @pytest.mark.asyncio
+    async def test_on_message(self):
+        klines = KlineAggregator([MARKET], resolutions=(1,), backfill=False)
+        message = {"params": {"channel": f"trades.{MARKET}", "data": _trade(T0, "100", "2")}}
+        await klines.on_message(NexDexWebsocketChannel.TRADES, message)
+        await klines.on_message(NexDexWebsocketChannel.BBO, message)
+        assert klines.last(MARKET, 1) == Kline(T0, 100, 100, 100, 100, 2)
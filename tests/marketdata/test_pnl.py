@@ -0,0 +1,129 @@
+"""Tests for the mark-to-market PnL engine."""
+
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel
+from nexdex_py.api.ws_structs import WsFill
+from nexdex_py.marketdata import PnLEngine
+
+MARKET = "BTC-USD-PERP"
+
+
+def _fill(fill_id: str, side: str, size: str, price: str, fee: str = "0", created_at: int = 1) -> dict:
+    return {
+        "id": fill_id,
+        "market": MARKET,
+        "side": side,
+        "size": size,
+        "price": price,
+        "fee": fee,
+        "created_at": created_at,
+    }
+
+
+class TestPnLEngine:
+    def test_average_entry_and_realized(self):
+        pnl = PnLEngine()
+        pnl.add_fill(_fill("1", "BUY", "1", "100"))
+        pnl.add_fill(_fill("2", "BUY", "3", "120"))
+        assert pnl.average_entry(MARKET) == Decimal("115")
+
+        pnl.add_fill(_fill("3", "SELL", "2", "130", fee="0.5"))
+        assert pnl.realized(MARKET) == Decimal("30")
+        assert pnl.average_entry(MARKET) == Decimal("115")
+
+        pnl.update_price(MARKET, "110")
+        summary = pnl.summary(MARKET)
+        assert summary["position"] == Decimal("2")
+        assert summary["unrealized"] == Decimal("-10")
+        assert summary["net"] == Decimal("19.5")
+
+    def test_flip_and_short(self):
+        pnl = PnLEngine()
+        pnl.add_fill(_fill("1", "BUY", "1", "100"))
+        pnl.add_fill(_fill("2", "SELL", "3", "110"))
+        assert pnl.realized(MARKET) == Decimal("10")
+        assert pnl.summary(MARKET)["position"] == Decimal("-2")
+        assert pnl.average_entry(MARKET) == Decimal("110")
+
+        pnl.add_fill(_fill("3", "BUY", "2", "90"))
+        assert pnl.realized(MARKET) == Decimal("50")
+        assert pnl.average_entry(MARKET) is None
+        assert pnl.unrealized(MARKET) == 0
+
+    def test_round_trip_is_exact(self):
+        pnl = PnLEngine()
+        for i, (side, size, price) in enumerate(
+            [("BUY", "0.3", "100.01"), ("BUY", "0.7", "99.97"), ("SELL", "0.11", "101"), ("SELL", "0.89", "98.3")]
+        ):
+            pnl.add_fill(_fill(str(i), side, size, price))
+        expected = Decimal("0.11") * 101 + Decimal("0.89") * Decimal("98.3") - Decimal("0.3") * Decimal("100.01")
+        assert pnl.realized(MARKET) == expected - Decimal("0.7") * Decimal("99.97")
+
+    def test_duplicates_and_typed_fills(self):
+        pnl = PnLEngine()
+        assert pnl.add_fill(WsFill.from_data(_fill("1", "BUY", "1", "100")))
+        assert not pnl.add_fill(_fill("1", "BUY", "1", "100"))
+        assert pnl.summary(MARKET)["position"] == Decimal("1")
+
+    def test_invalid_fill_does_not_block_its_id(self):
+        pnl = PnLEngine()
+        assert not pnl.add_fill(_fill("1", "BUY", "0", "100"))
+        assert pnl.add_fill(_fill("1", "BUY", "1", "100"))
+        assert pnl.market("BTC-USD-PERP").position == 10**8
+
+    def test_dedup_window_bounds_ids(self):
+        pnl = PnLEngine(dedup_window_ms=1_000)
+        for i in range(100):
+            assert pnl.add_fill(_fill(str(i), "BUY", "1", "100", created_at=1 + i * 100))
+        # Only the ids of the last second are kept
+        assert len(pnl._fill_ids) == len(pnl._fill_times) == 11
+        assert not pnl.add_fill(_fill("99", "BUY", "1", "100", created_at=9_901))
+        # Older fills cannot be deduplicated any more and are dropped
+        assert not pnl.add_fill(_fill("0", "BUY", "1", "100", created_at=1))
+        assert pnl.summary("BTC-USD-PERP")["position"] == 100
+
+    def test_seed_positions(self):
+        pnl = PnLEngine(price_source="last")
+        position = {"market": MARKET, "side": "SHORT", "size": "2", "average_entry_price": "50", "status": "OPEN"}
+        pnl.seed_positions({"results": [position]})
+        pnl.update_summary([{"symbol": MARKET, "mark_price": "1", "last_traded_price": "45"}])
+        assert pnl.unrealized(MARKET) == Decimal("10")
+
+    def test_unknown_price_source(self):
+        with pytest.raises(ValueError, match="Unknown price source"):
+            PnLEngine(price_source="index")
+
+    def test_backfill_applies_oldest_first(self):
+        pnl = PnLEngine()
+        api_client = MagicMock()
+        api_client.fetch_fills.side_effect = [
+            {"results": [_fill("2", "SELL", "1", "110", created_at=2)], "next": "c1"},
+            {"results": [_fill("1", "BUY", "1", "100", created_at=1)], "next": None},
+        ]
+        assert pnl.backfill_from(api_client, start_at=0) == 2
+        assert pnl.realized(MARKET) == Decimal("10")
+        assert api_client.fetch_fills.call_args.kwargs["params"]["cursor"] == "c1"
+
+    @pytest.mark.asyncio
+    async def test_stream(self):
+        pnl = PnLEngine(price_source="mid")
+
+        async def send(channel: NexDexWebsocketChannel, data: dict) -> None:
+            await pnl.on_message(channel, {"params": {"channel": channel.value, "data": data}})
+
+        await send(NexDexWebsocketChannel.FILLS, _fill("1", "BUY", "0.5", "100"))
+        await send(NexDexWebsocketChannel.BBO, {"market": MARKET, "bid": "103", "ask": "105"})
+        await send(NexDexWebsocketChannel.MARKETS_SUMMARY, [{"symbol": MARKET, "mark_price": "1"}])
+        assert pnl.unrealized(MARKET) == Decimal("2")
+        assert pnl.total_unrealized() == Decimal("2")
+
+        ws_client = MagicMock(subscribe=AsyncMock())
+        await pnl.subscribe(ws_client, [MARKET])
+        assert [call.args[0] for call in ws_client.subscribe.call_args_list] == [
+            NexDexWebsocketChannel.FILLS,
+            NexDexWebsocketChannel.BBO,
+        ]
@@ -0,0 +1,108 @@
+"""Tests for the cross-market price matrix."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from nexdex_py.api.ws_client import NexDexWebsocketChannel  # noqa: E402
+from nexdex_py.marketdata import PriceMatrix  # noqa: E402
+
+MARKETS = {"results": [{"symbol": "BTC-USD-PERP"}, {"symbol": "ETH-USD-PERP"}, {"symbol": "SOL-USD-PERP"}]}
+
+
+def _bbo(market: str, bid: str, ask: str, ts: int = 1_000) -> dict:
+    return {"market": market, "bid": bid, "bid_size": "1", "ask": ask, "ask_size": "2", "last_updated_at": ts}
+
+
+@pytest.fixture
+def prices() -> PriceMatrix:
+    return PriceMatrix.from_markets(MARKETS, clock=lambda: 5_000)
+
+
+class TestPriceMatrix:
+    def test_rows_from_markets(self, prices):
+        assert prices.markets == ["BTC-USD-PERP", "ETH-USD-PERP", "SOL-USD-PERP"]
+        assert list(prices.rows(["SOL-USD-PERP", "BTC-USD-PERP"])) == [2, 0]
+        assert np.isnan(prices.mids()).all()
+
+    def test_mids_and_spreads(self, prices):
+        prices.update_bbo(_bbo("BTC-USD-PERP", "100", "102"))
+        prices.update_bbo(_bbo("ETH-USD-PERP", "10", "10.1"))
+        assert not prices.update_bbo(_bbo("DOGE-USD-PERP", "1", "2"))
+
+        mids = prices.mids()
+        assert mids[:2].tolist() == [101.0, 10.05]
+        assert math.isnan(mids[2])
+        assert prices.spreads()[0] == 2.0
+        assert prices.spreads_bps()[0] == pytest.approx(2 / 101 * 10_000)
+
+    def test_derived_bbo_from_order_book(self, prices):
+        prices.update_order_book(
+            {
+                "market": "ETH-USD-PERP",
+                "update_type": "s",
+                "inserts": [
+                    {"side": "BUY", "price": "99", "size": "1"},
+                    {"side": "BUY", "price": "100", "size": "3"},
+                    {"side": "SELL", "price": "101", "size": "2"},
+                ],
+                "last_updated_at": 2_000,
+            }
+        )
+        assert prices.to_dict("ETH-USD-PERP")["bid"] == 100.0
+        assert prices.to_dict("ETH-USD-PERP")["bid_size"] == 3.0
+        prices.update_order_book(
+            {"market": "ETH-USD-PERP", "update_type": "d", "deletes": [{"side": "SELL", "price": "101", "size": "0"}]}
+        )
+        assert math.isnan(prices.ask[1])
+        assert prices.updated_at[1] == 5_000  # no server time in the delta
+
+    def test_summary(self, prices):
+        summaries = [
+            {"symbol": "BTC-USD-PERP", "mark_price": "101.5", "last_traded_price": "101", "bid": "1", "ask": "2"},
+            {"symbol": "SOL-USD-PERP", "mark_price": "20", "bid": "19.9", "ask": "20.1", "created_at": 4_000},
+        ]
+        prices.update_bbo(_bbo("BTC-USD-PERP", "100", "102"))
+        assert prices.update_summary(summaries) == 2
+        assert prices.mark.tolist()[0] == 101.5
+        assert prices.last[0] == 101.0
+        # BBO feed wins over summary quotes
+        assert prices.bid[0] == 100.0
+        assert prices.bid[2] == 19.9
+
+    def test_summary_does_not_refresh_quoted_rows(self, prices):
+        prices.update_bbo(_bbo("BTC-USD-PERP", "100", "102", ts=1_000))
+        prices.update_summary(
+            [
+                {"symbol": "BTC-USD-PERP", "mark_price": "101", "created_at": 4_000},
+                {"symbol": "ETH-USD-PERP", "mark_price": "10", "bid": "9", "ask": "11", "created_at": 4_000},
+            ]
+        )
+        assert prices.mark[0] == 101.0
+        assert prices.updated_at[:2].tolist() == [1_000, 4_000]
+        assert prices.stale(max_age_ms=1_000, now_ms=4_500).tolist() == [True, False, True]
+
+    def test_staleness(self, prices):
+        prices.update_bbo(_bbo("BTC-USD-PERP", "100", "102", ts=4_500))
+        prices.update_bbo(_bbo("ETH-USD-PERP", "10", "11", ts=1_000))
+        age = prices.staleness_ms()
+        assert age[:2].tolist() == [500.0, 4_000.0]
+        assert math.isinf(age[2])
+        assert prices.stale(max_age_ms=1_000).tolist() == [False, True, True]
+
+    def test_basket_value(self, prices):
+        prices.update_bbo(_bbo("BTC-USD-PERP", "100", "102"))
+        prices.update_bbo(_bbo("ETH-USD-PERP", "10", "12"))
+        assert prices.basket_value({"BTC-USD-PERP": 0.5, "ETH-USD-PERP": -2}) == pytest.approx(50.5 - 22)
+        assert prices.basket_value(np.array([1.0, 0.0, 0.0]), price="bid") == 100.0
+        assert math.isnan(prices.basket_value({"SOL-USD-PERP": 1}))
+        with pytest.raises(ValueError, match="Unknown price"):
+            prices.prices("vwap")
+
+    @pytest.mark.asyncio
+    async def test_on_message(self, prices):
+        message = {"params": {"channel": "bbo.BTC-USD-PERP", "data": _bbo("BTC-USD-PERP", "1", "3")}}
+        await prices.on_message(NexDexWebsocketChannel.BBO, message)
+        assert prices.mids()[0] == 2.0
@@ -0,0 +1,143 @@
+"""Tests for the shared memory market data publisher and reader."""
+
+import multiprocessing
+import uuid
+
+import pytest
+
+from nexdex_py.api.ws_client import NexDexWebsocketClient
+from nexdex_py.api.ws_structs import decode_ws_data
+from nexdex_py.common.quantization import to_chain_int
+from nexdex_py.environment import TESTNET
+from nexdex_py.marketdata import MarketDataPublisher, MarketDataReader, SharedBBO
+from nexdex_py.simulator import ExchangeSimulator
+
+BBO = {
+    "market": "BTC-USD-PERP",
+    "bid": "65000.5",
+    "bid_size": "1.2",
+    "ask": "65001",
+    "ask_size": "0.4",
+    "last_updated_at": 1700000000000,
+    "seq_no": 7,
+}
+
+
+def _book(update_type: str, inserts=(), updates=(), deletes=(), seq_no: int = 1) -> dict:
+    def levels(rows):
+        return [{"side": side, "price": price, "size": size} for side, price, size in rows]
+
+    return {
+        "market": "BTC-USD-PERP",
+        "update_type": update_type,
+        "inserts": levels(inserts),
+        "updates": levels(updates),
+        "deletes": levels(deletes),
+        "last_updated_at": 1700000000000 + seq_no,
+        "seq_no": seq_no,
+    }
+
+
+def _read_bid_in_child(name: str, queue) -> None:
+    reader = MarketDataReader(name)
+    queue.put(reader.bbo("BTC-USD-PERP").bid)
+    reader.close()
+
+
+@pytest.fixture
+def publisher():
+    name = f"nexdex-test-{uuid.uuid4().hex[:8]}"
+    publisher = MarketDataPublisher(["BTC-USD-PERP", "ETH-USD-PERP"], name=name, depth=3)
+    yield publisher
+    publisher.close()
+
+
+class TestSharedMarketData:
+    def test_bbo_round_trip(self, publisher):
+        reader = MarketDataReader(publisher.name)
+        assert reader.markets == ["BTC-USD-PERP", "ETH-USD-PERP"]
+        assert reader.bbo("ETH-USD-PERP") == SharedBBO(None, None, None, None, 0, 0)
+
+        before = reader.version("BTC-USD-PERP")
+        assert publisher.write_bbo(BBO)
+        assert reader.version("BTC-USD-PERP") == before + 2
+        assert reader.bbo("BTC-USD-PERP") == SharedBBO(
+            to_chain_int("65000.5"), to_chain_int("1.2"), to_chain_int("65001"), to_chain_int("0.4"), 1700000000000, 7
+        )
+        # Typed structs are accepted too; unknown markets are ignored
+        assert publisher.write_bbo(decode_ws_data("bbo", {**BBO, "bid": "65000"}))
+        assert reader.bbo("BTC-USD-PERP").bid == to_chain_int("65000")
+        assert not publisher.write_bbo({**BBO, "market": "SOL-USD-PERP"})
+        reader.close()
+
+    def test_order_book_snapshot_and_delta(self, publisher):
+        reader = MarketDataReader(publisher.name)
+        publisher.write_order_book(
+            _book(
+                "s",
+                inserts=[
+                    ("BUY", "100", "1"),
+                    ("BUY", "99", "2"),
+                    ("BUY", "98", "3"),
+                    ("BUY", "97", "4"),
+                    ("SELL", "101", "1"),
+                    ("SELL", "102", "2"),
+                ],
+            )
+        )
+        book = reader.book("BTC-USD-PERP")
+        # Truncated to depth 3, best first
+        assert [price for price, _ in book.bids] == [to_chain_int(p) for p in ("100", "99", "98")]
+        assert [price for price, _ in book.asks] == [to_chain_int(p) for p in ("101", "102")]
+
+        publisher.write_order_book(_book("d", updates=[("SELL", "101", "5")], deletes=[("BUY", "100", "0")], seq_no=2))
+        book = reader.book("BTC-USD-PERP")
+        assert book.bids[0] == (to_chain_int("99"), to_chain_int("2"))
+        assert book.bids[-1][0] == to_chain_int("97")
+        assert book.asks[0] == (to_chain_int("101"), to_chain_int("5"))
+        assert book.seq_no == 2
+        reader.close()
+
+    def test_read_from_other_process(self, publisher):
+        publisher.write_bbo(BBO)
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=_read_bid_in_child, args=(publisher.name, queue))
+        child.start()
+        child.join(timeout=30)
+        assert queue.get(timeout=5) == to_chain_int("65000.5")
+
+    def test_not_a_market_data_block(self):
+        from multiprocessing import shared_memory
+
+        block = shared_memory.SharedMemory(create=True, size=64)
+        try:
+            with pytest.raises(ValueError, match="not a market data block"):
+                MarketDataReader(block.name)
+        finally:
+            block.close()
+            block.unlink()
+
+    def test_symbol_too_long(self):
+        with pytest.raises(ValueError, match="too long"):
+            MarketDataPublisher(["X" * 40])
+
+    @pytest.mark.asyncio
+    async def test_publishes_from_websocket(self, publisher):
+        sim = ExchangeSimulator()
+        client = NexDexWebsocketClient(
+            env=TESTNET, auto_start_reader=False, connector=sim.ws_connector, ws_url_override=sim.ws_url
+        )
+        await client.connect()
+        await publisher.subscribe(client)
+        while await client.pump_once():
+            pass
+        await client.inject(
+            '{"jsonrpc": "2.0", "method": "subscription", "params": {"channel": "bbo.BTC-USD-PERP", "data": '
+            '{"market": "BTC-USD-PERP", "bid": "1", "bid_size": "2", "ask": "3", "ask_size": "4"}}}'
+        )
+        reader = MarketDataReader(publisher.name)
+        assert reader.bbo("BTC-USD-PERP").ask == to_chain_int("3")
+        assert "order_book.ETH-USD-PERP.snapshot@3@50ms" in client.callbacks
+        reader.close()
+        await client.close()
@@ -1,8 +1,13 @@
 from decimal import Decimal
+from unittest.mock import patch
 
+from nexdex_py.account import typed_data
+from nexdex_py.account.utils import typed_data_to_message_hash
 from nexdex_py.common.order import Order, OrderSide, OrderType
 from nexdex_py.message.block_trades import BlockTrade, Trade, build_block_trade_message
 
+EXPECTED_BLOCK_TRADE_HASH = 0x23A2FB5EF3FCFB869F32270722E878DE5763E7A7C4F37EF8A3BB6051DDC2CAB
+
  
 def test_trade_class():
     # Create test orders
@@ -266,3 +271,50 @@ def test_build_block_trade_message_multiple_trades():
     assert trade2["taker_order"]["side"] == "1"  # Buy
 
 
+
+
+def test_block_trade_message_hash():
+    maker_order = Order(
+        market="ETH-USD-PERP",
+        order_type=OrderType.Limit,
+        order_side=OrderSide.Buy,
+        size=Decimal("0.1"),
+        limit_price=Decimal("1500"),
+        signature_timestamp=1634736000000,
+    )
+    taker_order = Order(
+        market="ETH-USD-PERP",
+        order_type=OrderType.Limit,
+        order_side=OrderSide.Sell,
+        size=Decimal("0.1"),
+        limit_price=Decimal("1500"),
+        signature_timestamp=1634736000001,
+    )
+    trade = Trade(price=Decimal("1500.50"), size=Decimal("0.1"), maker_order=maker_order, taker_order=taker_order)
+
+    # `shortstring` version field must hash like a felt-encoded short string
+    message_hash = typed_data_to_message_hash(build_block_trade_message(1, BlockTrade("1.0", [trade])), 1)
+    other_version = typed_data_to_message_hash(build_block_trade_message(1, BlockTrade("2.0", [trade])), 1)
+
+    assert message_hash == EXPECTED_BLOCK_TRADE_HASH
+    assert other_version != message_hash
+
+
+def test_resigning_after_changing_one_leg_rehashes_only_that_leg():
+    def leg(i: int) -> Trade:
+        maker = Order("ETH-USD-PERP", OrderType.Limit, OrderSide.Buy, Decimal("0.1"), Decimal(1500 + i), 1634736000000)
+        taker = Order("ETH-USD-PERP", OrderType.Limit, OrderSide.Sell, Decimal("0.1"), Decimal(1500 + i), 1634736000001)
+        return Trade(price=Decimal(1500 + i), size=Decimal("0.1"), maker_order=maker, taker_order=taker)
+
+    block_trade = BlockTrade("1.0", [leg(i) for i in range(20)])
+    typed_data._hash_struct_elements.cache_clear()
+    typed_data_to_message_hash(build_block_trade_message(1, block_trade), 1)
+
+    block_trade.trades[7].taker_order.size = Decimal("0.2")
+    with patch.object(typed_data, "compute_hash_on_elements", wraps=typed_data.compute_hash_on_elements) as hashed:
+        cached = typed_data_to_message_hash(build_block_trade_message(1, block_trade), 1)
+    # Changed order, its trade, the trades array, the block trade and the message
+    assert hashed.call_count == 5
+
+    typed_data._hash_struct_elements.cache_clear()
+    assert cached == typed_data_to_message_hash(build_block_trade_message(1, block_trade), 1)
@@ -1,5 +1,8 @@
 from decimal import Decimal
 
+from starknet_py.utils.typed_data import TypedData as StarknetTypedData
+
+from nexdex_py.account.utils import typed_data_to_message_hash
 from nexdex_py.common.order import Order, OrderSide, OrderType
 from nexdex_py.message.order import build_order_message
 
@@ -42,3 +45,16 @@ def test_build_onboarding_message():
         },
     }
 
+
+def test_order_message_hash_matches_starknet_py():
+    order = Order(
+        market="ETH-USD-PERP",
+        order_type=OrderType.Limit,
+        order_side=OrderSide.Sell,
+        size=Decimal("0.25"),
+        limit_price=Decimal("1999.5"),
+        signature_timestamp=1634736000000,
+    )
+    message = build_order_message(1, order)
+    # Hashing through the NexDex TypedData subclass must not change hashes of standard messages
+    assert typed_data_to_message_hash(message, 0x1234) == StarknetTypedData.from_dict(message).message_hash(0x1234)
@@ -0,0 +1,238 @@
+"""Tests for the in-process exchange simulator."""
+
+import json
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from nexdex_py.api.api_client import NexDexApiClient
+from nexdex_py.api.protocols import NoOpSigner
+from nexdex_py.api.ws_client import NexDexWebsocketChannel, NexDexWebsocketClient
+from nexdex_py.common.order import Order, OrderSide, OrderType
+from nexdex_py.environment import TESTNET
+from nexdex_py.simulator import ExchangeSimulator, MatchingEngine, SimulatorError
+from nexdex_py.simulator.engine import BUY, SELL, from_units, to_units
+
+
+def _engine() -> MatchingEngine:
+    ids = iter(range(1, 10_000))
+    return MatchingEngine("BTC-USD-PERP", to_units("0.1"), to_units("0.001"), lambda: str(next(ids)), clock=lambda: 1)
+
+
+def _limit(side: str, size: str, price: str, **kwargs) -> dict:
+    return {"market": "BTC-USD-PERP", "side": side, "type": "LIMIT", "size": size, "price": price, **kwargs}
+
+
+class TestUnits:
+    @pytest.mark.parametrize("value", ["0", "0.1", "65000", "-1.5", "0.00000001", "3000.19"])
+    def test_round_trip(self, value):
+        assert from_units(to_units(value)) == value
+
+    def test_non_canonical_strings_use_decimal(self):
+        assert to_units("1e3") == 1000 * 10**8
+        assert to_units(".5") == 5 * 10**7
+
+
+class TestMatchingEngine:
+    def test_price_time_priority(self):
+        engine = _engine()
+        first = engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1")).orders[-1]
+        second = engine.submit("0xb", SELL, "LIMIT", to_units("100"), to_units("1")).orders[-1]
+
+        result = engine.submit("0xc", BUY, "LIMIT", to_units("100"), to_units("1.5"))
+
+        makers = [f for f in result.fills if f.liquidity == "MAKER"]
+        assert [f.order_id for f in makers] == [first.id, second.id]
+        assert [f.size for f in makers] == [to_units("1"), to_units("0.5")]
+        assert first.status == "CLOSED"
+        assert second.remaining == to_units("0.5")
+        assert engine.best_ask() == (to_units("100"), to_units("0.5"))
+
+    def test_taker_gets_maker_price_and_rests_remainder(self):
+        engine = _engine()
+        engine.submit("0xa", SELL, "LIMIT", to_units("99"), to_units("1"))
+
+        taker = engine.submit("0xc", BUY, "LIMIT", to_units("101"), to_units("2")).orders[-1]
+
+        assert taker.status == "OPEN"
+        assert taker.to_dict()["avg_fill_price"] == "99"
+        assert engine.best_bid() == (to_units("101"), to_units("1"))
+        assert engine.best_ask() is None
+
+    def test_ioc_and_post_only(self):
+        engine = _engine()
+        engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1"))
+
+        ioc = engine.submit("0xc", BUY, "LIMIT", to_units("100"), to_units("2"), instruction="IOC").orders[-1]
+        assert ioc.status == "CLOSED"
+        assert ioc.cancel_reason == "IOC_ORDER_NOT_FULLY_FILLED"
+        assert engine.best_bid() is None
+
+        engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1"))
+        post_only = engine.submit("0xc", BUY, "LIMIT", to_units("100"), to_units("1"), instruction="POST_ONLY")
+        assert post_only.orders[-1].cancel_reason == "POST_ONLY_WOULD_CROSS"
+        assert not post_only.fills
+
+    def test_self_trade_expires_taker_by_default(self):
+        engine = _engine()
+        maker = engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1")).orders[-1]
+
+        taker = engine.submit("0xa", BUY, "MARKET", 0, to_units("1")).orders[-1]
+
+        assert taker.cancel_reason == "SELF_TRADE"
+        assert maker.status == "OPEN"
+
+    @pytest.mark.parametrize("stp", ["EXPIRE_MAKER", "EXPIRE_BOTH"])
+    def test_self_trade_expires_maker(self, stp):
+        engine = _engine()
+        maker = engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1")).orders[-1]
+
+        taker = engine.submit("0xa", BUY, "LIMIT", to_units("100"), to_units("1"), stp=stp).orders[-1]
+
+        assert maker.cancel_reason == "SELF_TRADE"
+        assert (taker.status == "CLOSED") is (stp == "EXPIRE_BOTH")
+
+    def test_rejects_unknown_stp(self):
+        engine = _engine()
+        engine.submit("0xa", SELL, "LIMIT", to_units("100"), to_units("1"))
+        with pytest.raises(SimulatorError, match="stp"):
+            engine.submit("0xa", BUY, "MARKET", 0, to_units("1"), stp="NONE")
+
+    def test_rejects_off_tick_price(self):
+        engine = _engine()
+        with pytest.raises(SimulatorError, match="tick"):
+            engine.submit("0xa", BUY, "LIMIT", to_units("100.05"), to_units("1"))
+
+    def test_cancel_and_modify(self):
+        engine = _engine()
+        order = engine.submit("0xa", BUY, "LIMIT", to_units("100"), to_units("1")).orders[-1]
+
+        engine.modify(order.id, to_units("101"), to_units("2"))
+        assert engine.best_bid() == (to_units("101"), to_units("2"))
+
+        engine.cancel(order.id)
+        assert order.status == "CLOSED"
+        assert engine.best_bid() is None
+        with pytest.raises(SimulatorError):
+            engine.cancel(order.id)
+
+
+class TestSimulatorRest:
+    def setup_method(self):
+        self.sim = ExchangeSimulator(clock=lambda: 1_700_000_000_000)
+        self.client = NexDexApiClient(
+            env=TESTNET,
+            http_client=self.sim.http_client(),
+            api_base_url=self.sim.api_url,
+            auto_auth=False,
+            signer=NoOpSigner(),
+        )
+        self.client.set_token(self.sim.issue_token("0xa"))
+
+    def test_system_config_and_markets(self):
+        config = self.client.fetch_system_config()
+        assert config.paraclear_decimals == 8
+        symbols = [m["symbol"] for m in self.client.fetch_markets()["results"]]
+        assert symbols == ["BTC-USD-PERP", "ETH-USD-PERP"]
+
+    def test_order_lifecycle(self):
+        order = Order("BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, size=Decimal("0.5"), limit_price=Decimal("65000"))
+        created = self.client.submit_order(order)
+        assert created["status"] == "OPEN"
+
+        assert self.client.fetch_bbo("BTC-USD-PERP")["bid"] == "65000"
+        assert [o["id"] for o in self.client.fetch_orders()["results"]] == [created["id"]]
+
+        self.client.cancel_order(created["id"])
+        assert self.client.fetch_order(created["id"])["status"] == "CLOSED"
+        assert self.client.fetch_orders()["results"] == []
+
+    def test_rejected_order_raises(self):
+        order = Order(
+            "BTC-USD-PERP", OrderType.Limit, OrderSide.Buy, size=Decimal("0.5"), limit_price=Decimal("65000.05")
+        )
+        with pytest.raises(ValueError, match="VALIDATION_ERROR"):
+            self.client.submit_order(order)
+
+    def test_unauthorized_without_token(self):
+        self.client.client.headers.pop("Authorization")
+        with pytest.raises(ValueError, match="UNAUTHORIZED"):
+            self.client.fetch_orders()
+
+    def test_malformed_params_and_body_return_400(self):
+        with pytest.raises(ValueError, match="VALIDATION_ERROR"):
+            self.client.fetch_fills({"page_size": "ten"})
+
+        token = self.sim.issue_token("0xa")
+        with httpx.Client(transport=self.sim.transport()) as client:
+            response = client.post(
+                f"{self.sim.api_url}/orders", content=b"{not json", headers={"Authorization": f"Bearer {token}"}
+            )
+        assert response.status_code == 400
+        assert response.json()["error"] == "VALIDATION_ERROR"
+
+    def test_fills_cursor_pagination(self):
+        for _ in range(5):
+            self.sim.submit_order("0xb", _limit("SELL", "0.1", "65000"))
+            self.sim.submit_order("0xa", _limit("BUY", "0.1", "65000"))
+
+        pages, cursor = [], None
+        while True:
+            params = {"page_size": 2, **({"cursor": cursor} if cursor else {})}
+            page = self.client.fetch_fills(params)
+            pages.append(page["results"])
+            cursor = page["next"]
+            if cursor is None:
+                break
+
+        fills = [fill for page in pages for fill in page]
+        assert [len(page) for page in pages] == [2, 2, 1]
+        assert all(fill["account"] == "0xa" and fill["liquidity"] == "TAKER" for fill in fills)
+        assert len({fill["id"] for fill in fills}) == 5
+
+
+class TestSimulatorWebsocket:
+    @pytest.mark.asyncio
+    async def test_subscribe_ack_and_market_data(self):
+        sim = ExchangeSimulator()
+        ws_client = NexDexWebsocketClient(
+            env=TESTNET, auto_start_reader=False, connector=sim.ws_connector, ws_url_override=sim.ws_url
+        )
+        await ws_client.connect()
+        received = []
+
+        async def on_message(ws_channel, message):
+            received.append((ws_channel, message["params"]["data"]))
+
+        await ws_client.subscribe(NexDexWebsocketChannel.BBO, on_message, {"market": "BTC-USD-PERP"})
+        sim.submit_order("0xa", _limit("BUY", "1", "64999.9"))
+        while await ws_client.pump_once():
+            pass
+
+        assert ws_client.get_subscriptions() == {"bbo.BTC-USD-PERP": True}
+        # Initial (empty) BBO on subscribe, then the update
+        assert [data["bid"] for _, data in received] == ["", "64999.9"]
+        assert received[-1][0] == NexDexWebsocketChannel.BBO
+
+    @pytest.mark.asyncio
+    async def test_private_channels_require_auth_and_are_scoped(self):
+        sim = ExchangeSimulator()
+        connection = await sim.ws_connector(sim.ws_url, {})
+
+        subscribe = {"jsonrpc": "2.0", "method": "subscribe", "params": {"channel": "orders.ALL"}}
+        await connection.send(json.dumps({"id": 1, **subscribe}))
+        assert "error" in json.loads(await connection.recv())
+
+        auth = {"jsonrpc": "2.0", "method": "auth", "params": {"bearer": sim.issue_token("0xa")}}
+        await connection.send(json.dumps({"id": 2, **auth}))
+        await connection.send(json.dumps({"id": 3, **subscribe}))
+        assert json.loads(await connection.recv())["id"] == 2
+        assert json.loads(await connection.recv())["result"] == {"channel": "orders.ALL"}
+
+        sim.submit_order("0xb", _limit("BUY", "1", "100"))
+        sim.submit_order("0xa", _limit("BUY", "1", "100"))
+
+        assert connection.pending() == 1
+        update = json.loads(await connection.recv())
+        assert update["params"]["data"]["account"] == "0xa"